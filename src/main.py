@@ -1,56 +1,336 @@
 import sys
 import os
-import subprocess
 import logging
+import time
+import shlex
+import threading
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QTextEdit, QPushButton, QCheckBox, QFileDialog, QMessageBox,
     QGroupBox, QFrame, QProgressBar, QSizePolicy, QTabWidget, QComboBox,
-    QSpinBox, QListWidget, QListWidgetItem, QAbstractItemView, QSplitter, QToolButton
+    QSpinBox, QListWidget, QListWidgetItem, QAbstractItemView, QSplitter, QToolButton,
+    QTableWidget, QTableWidgetItem, QTableView, QStackedWidget
 )
 from PySide6.QtCore import Qt, QThread, Signal, QSettings
-from PySide6.QtGui import QFont, QIcon, QTextCursor, QPalette, QColor
+from PySide6.QtGui import QFont, QIcon, QPalette, QColor
+
+from packager.artifact_cache import ArtifactCache
+from packager.benchmark import cold_cache_supported, speedup, startup_benchmark
+from packager.ccache import Ccache, find_ccache
+from packager.command import ProfileError, build_command, load_profile, profile_name, save_profile, split_list
+from packager.compression import SETTINGS, SETTING_CONFIG, sweep, sweep_commands
+from packager.daemon import DaemonClient, DaemonError, daemon_supported, job_options, start_daemon
+from packager.distsize import SUGGESTION_OPTIONS, analyze_output_dir
+from packager.history import BuildHistory
+from packager.imports import IMPORT_OPTIONS, scan_imports
+from packager.interpreter import detect_interpreter, discover_interpreters, load_index
+from packager.memory import MemoryGovernor, read_meminfo
+from packager.nuitka_cache import NuitkaCache
+from packager.progress import format_duration, format_latency, format_phase_summary, format_size
+from packager.paths import option_value, option_values, state_dir
+from packager.preflight import ERROR, describe_finding, estimate_output_size, preflight
+from packager.qt import BackgroundTask, HistoryModel, LogView, SizeTableModel, TrendChart
+from packager.runner import BuildRunner
+from packager.scheduler import BuildScheduler, CANCELLED, SUCCEEDED
+from packager.toolchain import compare_compilers, compiler_configs, detect_toolchain, load_toolchain, toolchain_variables
+from packager.variants import VARIANTS, compare_variants, variant_configs
+from packager.warm_build import WarmBuildDirs
+from packager.watcher import SourceWatcher
 
 # Set log format
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 
+# Minimum interval between status bar updates from build output (seconds)
+STATUS_BAR_INTERVAL = 0.25
+
+# Display names for the build phases reported by ProgressTracker
+PHASE_LABELS = {
+    "starting": "Starting",
+    "python": "Python optimization",
+    "codegen": "C code generation",
+    "c_compile": "C compilation",
+    "link": "Linking",
+    "postprocess": "Post-processing",
+    "onefile": "Onefile compression",
+    "done": "Done",
+}
+
+# Display names for build queue job states
+QUEUE_STATUS_LABELS = {
+    "queued": "Queued",
+    "running": "Running",
+    "succeeded": "Succeeded",
+    "failed": "Failed",
+    "cancelled": "Cancelled",
+}
+
+# Column captions of the build summary table
+SUMMARY_HEADINGS = ("Phase", "Time", "Share", "Total")
+
+# Column captions of the build history table
+HISTORY_HEADERS = ["Started", "Project", "Duration", "Peak Memory", "Startup", "Artifact Size", "Result", "Command"]
+HISTORY_RESULTS = {"succeeded": "Succeeded", "failed": "Failed", "cached": "Restored from cache"}
+
+# Display names of the process categories reported by ProcessTreeMonitor
+CPU_CATEGORY_LABELS = {
+    "nuitka": "Nuitka front-end",
+    "scons": "Scons",
+    "compilers": "C compilers",
+    "other": "Other",
+}
+
+# Column captions and labels of the standalone folder size analysis
+DIST_SIZE_HEADERS = ["Contributor", "Type", "Files", "Size", "Share"]
+DIST_LIBRARY_HEADERS = ["Library", "Package", "Size", "Share"]
+DIST_KIND_LABELS = {
+    "package": "Python package",
+    "library": "Shared library",
+    "program": "Program",
+    "stdlib": "Standard library extensions",
+    "other": "Other files",
+}
+DIST_SUGGESTION_REASONS = {
+    "tests": "Test suite {subject}",
+    "library": "Large shared library {subject}",
+    "data": "Package data in {subject}",
+    "package": "Largest package {subject}",
+}
+
+# Column captions and labels of the import graph scan
+IMPORT_PACKAGE_HEADERS = ["Package", "Origin", "Modules", "Size", "Share"]
+IMPORT_MODULE_HEADERS = ["Module", "Origin", "Imported By", "Size", "Share", "First Imported By"]
+IMPORT_KIND_LABELS = {
+    "project": "Project",
+    "stdlib": "Standard library",
+    "third_party": "Third-party",
+    "builtin": "Built-in",
+    "missing": "Not found",
+}
+IMPORT_SUGGESTION_REASONS = {
+    "dynamic": "Imported by computed names in {subject}",
+    "plugin": "{subject} needs its plugin",
+}
+
+# Column captions and labels of the compile cost of a build
+COMPILE_PACKAGE_HEADERS = ["Package", "Modules", "Compiled", "C Size", "Share", "Optimization"]
+COMPILE_MODULE_HEADERS = ["Module", "Kind", "C Size", "Share", "Optimization", "Reason"]
+COMPILE_KIND_LABELS = {
+    "PythonMainModule": "Main",
+    "CompiledPythonModule": "Compiled",
+    "CompiledPythonPackage": "Compiled package",
+    "UncompiledPythonModule": "Bytecode",
+    "UncompiledPythonPackage": "Bytecode package",
+    "PythonExtensionModule": "Extension",
+}
+
+# Labels and messages of the pre-flight checks
+PREFLIGHT_CHECK_LABELS = {
+    "paths": "Paths",
+    "compiler": "Compiler",
+    "disk": "Disk space",
+    "nuitka": "Nuitka",
+    "options": "Options",
+}
+PREFLIGHT_ICONS = {"ok": "✓", "warning": "⚠️", "error": "❌"}
+PREFLIGHT_MESSAGES = {
+    "paths_ok": "{count} paths found",
+    "missing_interpreter": "Python interpreter not found: {path}",
+    "missing_main": "Main file not found: {path}",
+    "missing_path": "{option} source not found: {path}",
+    "output_not_writable": "Output directory cannot be created or written: {path}",
+    "compiler_ok": "{compiler}, linker {linker}",
+    "compiler_download": "No C compiler found, Nuitka will offer to download MinGW64",
+    "no_compiler": "No C compiler found (install gcc or clang, or set CC)",
+    "no_clang": "--clang is set but clang is not installed",
+    "missing_linker": "The {linker} linker (ld.{linker}) is not installed",
+    "no_linker": "No linker (ld) found",
+    "no_patchelf": "patchelf not found, standalone builds on Linux need it",
+    "disk_ok": "{free} free on {path}, about {needed} needed",
+    "disk_low": "{free} free on {path}, the build needs about {needed}",
+    "disk_full": "Only {free} free on {path}, the build needs about {needed}",
+    "disk_guess": "{free} free on {path}, a first build like this can take up to {needed}",
+    "probe_failed": "Cannot run {path}: {error}",
+    "no_nuitka": "Nuitka is not installed for {path} (pip install nuitka)",
+    "nuitka_ok": "Nuitka {nuitka} on Python {python}",
+    "python_prerelease": "Nuitka {nuitka} does not build with Python {python} pre-releases ({release})",
+    "python_not_yet_supported": "Nuitka {nuitka} does not support Python {python} yet",
+    "python_unsupported": "Python {python} is only experimentally supported by Nuitka {nuitka}",
+    "no_zstandard": "zstandard is not installed, the onefile payload will not be compressed",
+    "options_ok": "No conflicting options",
+    "module_standalone": "--module cannot be combined with {option}",
+    "onefile_option": "{option} has no effect without --onefile",
+    "qt_plugins": "Only one Qt plugin can be enabled: {plugins}",
+    "include_nofollow": "{name} is both included and excluded by --nofollow-import-to",
+    "main_suffix": "Main file is not a .py or .pyw file: {path}",
+    "check_failed": "Check failed: {error}",
+}
+
+
+# Display names of the places interpreters are discovered in
+INTERPRETER_SOURCE_LABELS = {
+    "project": "Project venv",
+    "pyenv": "pyenv",
+    "conda": "conda",
+    "uv": "uv",
+    "path": "PATH",
+}
+
+# Why a build starts from an empty warm build directory
+BUILD_DIR_REASONS = {
+    "new": "first build",
+    "clean": "clean build requested",
+    "arguments": "the Nuitka arguments changed",
+    "interpreter": "the interpreter or its Nuitka changed",
+    "toolchain": "the C compiler or linker changed",
+    "incomplete": "the last build did not finish",
+}
+
+
+def describe_preflight(report):
+    """Describe pre-flight check results for the log, one line per finding"""
+    return [
+        f"    {PREFLIGHT_ICONS[finding['severity']]} {PREFLIGHT_CHECK_LABELS[finding['check']]}: "
+        f"{describe_finding(finding, PREFLIGHT_MESSAGES)}"
+        for finding in report["findings"]
+    ]
+
+
+def describe_build_event(event, info):
+    """Describe a BuildRunner event for the log"""
+    if event == "cache_hit":
+        return (f"♻️ Artifact cache hit ({info['key'][:12]}): restored {', '.join(info['artifacts'])} "
+                f"({info['size'] / 1024 ** 2:.1f} MB) in {info['seconds']:.1f} s")
+    if event == "cache_miss":
+        return f"Artifact cache miss ({info['key'][:12]}, keyed in {info['seconds']:.1f} s)"
+    if event == "cache_stored":
+        evicted = f", evicted {info['evicted']} old entries" if info["evicted"] else ""
+        return f"📦 Stored {info['size'] / 1024 ** 2:.1f} MB in the artifact cache{evicted}"
+    if event == "cache_skipped":
+        return f"⚠️ Artifact cache skipped: {info['reason']}"
+    if event == "ccache_stats":
+        return (f"🧮 ccache: {info['hits']}/{info['hits'] + info['misses']} hits ({info['hit_rate']:.0%}), "
+                f"≈{info['bytes_saved'] / 1024 ** 2:.1f} MB and ≈{format_duration(info['seconds_saved'])} saved")
+    if event == "nuitka_cache":
+        if info["removed"]:
+            return (f"🗄 Nuitka cache: {format_size(info['total'])} of {format_size(info['quota'])} quota, "
+                    f"evicted {info['removed']} files ({format_size(info['freed'])}) in {info['seconds']:.1f} s")
+        return f"🗄 Nuitka cache: {format_size(info['total'])} of {format_size(info['quota'])} quota"
+    if event == "memory_plan":
+        basis = "measured" if info["measured"] else "assumed"
+        message = f"🧠 Memory governor: {format_size(info['available'])} available, ~{format_size(info['compiler_rss'])} per compiler ({basis}) → --jobs={info['jobs']}"
+        if info["jobs"] != info["requested"]:
+            message += f" (was {info['requested']})"
+        if info["low_memory"]:
+            message += " with --low-memory"
+        return message
+    if event == "compilers_paused":
+        return f"⏸ Memory low ({format_size(info['available'])} available): paused a compiler, {info['paused']} paused"
+    if event == "compilers_resumed":
+        return f"▶ Memory recovered ({format_size(info['available'])} available): resumed a compiler, {info['paused']} still paused"
+    if event == "resource_summary":
+        total = sum(info["cpu_seconds"].values())
+        parts = [
+            f"{CPU_CATEGORY_LABELS.get(category, category)} {seconds:.1f} s ({seconds / total:.0%})"
+            for category, seconds in info["cpu_seconds"].items() if seconds >= 0.05
+        ]
+        message = f"🧮 CPU time {total:.1f} s"
+        if parts:
+            message += f" ({', '.join(parts)})"
+        if info["peak_rss"]:
+            message += f" · peak memory {format_size(info['peak_rss'])}"
+        return message + f" · I/O {format_size(info['read_bytes'])} read, {format_size(info['write_bytes'])} written"
+    if event == "build_summary":
+        table = format_phase_summary(info["phases"], info["total"], PHASE_LABELS, SUMMARY_HEADINGS)
+        lines = ["📊 Build summary:"] + ["    " + line for line in table]
+        if info["artifact_size"] is not None:
+            lines.append(f"    Artifact size: {format_size(info['artifact_size'])}")
+        if info["peak_rss"] is not None:
+            lines.append(f"    Peak memory: {format_size(info['peak_rss'])}")
+        return "\n".join(lines)
+    if event == "compilation_report":
+        totals = info["report"]["totals"]
+        return (f"🧾 Compilation report: {totals['modules']} modules ({totals['compiled']} compiled), "
+                f"{format_size(totals['size'])} of C, {totals['seconds']:.1f} s optimizing")
+    if event == "report_skipped":
+        return f"⚠️ Compilation report not read: {info['reason']}"
+    if event == "build_dir":
+        if info["warm"]:
+            last = f" (last cold build {format_duration(info['cold_seconds'])})" if info["cold_seconds"] else ""
+            message = f"🔥 Warm build directory: {info['directory']}{last}"
+        else:
+            message = f"🧊 Cold build directory: {info['directory']} ({BUILD_DIR_REASONS[info['reason']]})"
+        if not info.get("ccache", True):
+            message += ", without ccache every C file is compiled again"
+        return message
+    if event == "build_dir_summary":
+        if info["warm"] and info["cold_seconds"]:
+            message = (f"🔥 Warm build took {format_duration(info['seconds'])}, "
+                       f"{info['seconds'] / info['cold_seconds']:.0%} of the last cold build "
+                       f"({format_duration(info['cold_seconds'])})")
+        else:
+            message = f"{'🔥 Warm' if info['warm'] else '🧊 Cold'} build took {format_duration(info['seconds'])}"
+        if info["moved_seconds"] is not None:
+            message += f", artifacts moved to the output directory in {info['moved_seconds']:.1f} s"
+        return message
+    if event == "build_dir_skipped":
+        return f"⚠️ Warm build directory not used: {info['reason']}"
+    if event == "history_skipped":
+        return f"⚠️ Build history not recorded: {info['reason']}"
+    return None
+
 
 class PackageThread(QThread):
     """Thread for executing packaging commands"""
     log_signal = Signal(str)
+    log_batch_signal = Signal(list)
+    throughput_signal = Signal(float)
+    resources_signal = Signal(dict)
     progress_signal = Signal(int)
+    phase_signal = Signal(str, float)
+    event_signal = Signal(str, dict)
     finished_signal = Signal(bool)
 
-    def __init__(self, command, parent=None):
+    def __init__(self, command, artifact_cache=None, env=None, ccache=None, nuitka_cache=None,
+                 history=None, governor=None, warm_dirs=None, parent=None):
         super().__init__(parent)
         self.command = command
         self.running = True
-        self.process = None  # Reference to subprocess
+        self.job_id = None  # Set for build queue jobs
+        # Runs the subprocess and parses its output
+        self.runner = BuildRunner(
+            command,
+            env=env,
+            on_lines=self.log_batch_signal.emit,
+            on_rate=self.throughput_signal.emit,
+            on_progress=self._emit_progress,
+            on_event=self.event_signal.emit,
+            artifact_cache=artifact_cache,
+            ccache=ccache,
+            nuitka_cache=nuitka_cache,
+            history=history,
+            on_resources=self.resources_signal.emit,
+            governor=governor,
+            warm_dirs=warm_dirs,
+        )
+
+    def _emit_progress(self, percent, phase, eta):
+        self.progress_signal.emit(percent)
+        self.phase_signal.emit(phase, -1.0 if eta is None else eta)
 
     def run(self):
         """Execute packaging command and capture output"""
         self.log_signal.emit(f"Starting packaging command: {' '.join(self.command)}\n")
         try:
-            # Create subprocess to execute command
-            self.process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1
-            )
-
-            # Read output in real-time
-            for line in iter(self.process.stdout.readline, ''):
-                if not self.running:
-                    break
-                self.log_signal.emit(line.strip())
+            return_code = self.runner.run()
+            batcher = self.runner.batcher
+            elapsed = self.runner.elapsed
+            if batcher:
+                self.log_signal.emit(
+                    f"Log pipeline: {batcher.total_lines} lines in {elapsed:.1f} s "
+                    f"({batcher.average_rate:,.0f} lines/s average)"
+                )
 
-            # Wait for process to finish
-            return_code = self.process.wait()
             if return_code == 0:
                 self.log_signal.emit("\n✅ Packaging completed successfully!")
                 self.finished_signal.emit(True)
@@ -67,14 +347,127 @@ class PackageThread(QThread):
         self.log_signal.emit("\n🛑 User requested packaging stop...")
 
         # Attempt to terminate subprocess
-        if self.process:
-            try:
-                self.process.terminate()
-            except Exception as e:
-                self.log_signal.emit(f"⚠️ Failed to terminate process: {str(e)}")
+        try:
+            self.runner.stop()
+        except Exception as e:
+            self.log_signal.emit(f"⚠️ Failed to terminate process: {str(e)}")
+
+
+class DaemonBuildThread(QThread):
+    """Thread following a build run by the build daemon
+
+    Has the signals of PackageThread. Without ``daemon_job`` the command is
+    submitted to the daemon, which is started with ``daemon_argv`` unless it
+    is running; otherwise the thread attaches to that daemon job and replays
+    its log. ``detach`` stops following without stopping the build.
+    """
+    log_signal = Signal(str)
+    log_batch_signal = Signal(list)
+    throughput_signal = Signal(float)
+    resources_signal = Signal(dict)
+    progress_signal = Signal(int)
+    phase_signal = Signal(str, float)
+    event_signal = Signal(str, dict)
+    finished_signal = Signal(bool)
+
+    def __init__(self, daemon_argv, name, command, options=None, daemon_job=None, parent=None):
+        super().__init__(parent)
+        self.daemon_argv = daemon_argv
+        self.name = name
+        self.command = command
+        self.options = options
+        self.daemon_job = daemon_job
+        self.job_id = None  # Set for build queue jobs
+        self.client = DaemonClient()
+        self.attachment = None
+        self.stop_requested = False
+        self.detached = False
+
+    def run(self):
+        """Submit or attach to the build and relay its messages"""
+        try:
+            if self.daemon_job is None:
+                self.client = start_daemon(self.daemon_argv)
+                self.daemon_job = self.client.submit(self.name, self.command, self.options)["id"]
+                self.log_signal.emit(f"Starting packaging command in the build daemon (job {self.daemon_job}): {' '.join(self.command)}\n")
+                if self.stop_requested:
+                    # Stopped before the build was submitted
+                    self.client.cancel(self.daemon_job)
+            else:
+                self.log_signal.emit(f"Attached to build daemon job {self.daemon_job}, replaying its log")
+            self.attachment = self.client.attach(self.daemon_job)
+            if self.detached:
+                self.attachment.close()
+            for message in self.attachment:
+                kind = message["type"]
+                if kind == "lines":
+                    self.log_batch_signal.emit(message["lines"])
+                elif kind == "event":
+                    self.event_signal.emit(message["event"], message["info"])
+                elif kind == "progress":
+                    self.progress_signal.emit(message["percent"])
+                    if message["phase"]:
+                        self.phase_signal.emit(message["phase"], -1.0 if message["eta"] is None else message["eta"])
+                elif kind == "rate":
+                    self.throughput_signal.emit(message["rate"])
+                elif kind == "resources":
+                    self.resources_signal.emit(message["sample"])
+                elif kind == "finished":
+                    if message["status"] == SUCCEEDED:
+                        self.log_signal.emit("\n✅ Packaging completed successfully!")
+                    elif message["status"] == CANCELLED:
+                        self.log_signal.emit("\n🛑 Packaging stopped")
+                    else:
+                        self.log_signal.emit(f"\n❌ Packaging failed with error code: {message['return_code']}")
+                    self.finished_signal.emit(message["status"] == SUCCEEDED)
+                    return
+            if not self.detached:
+                self.log_signal.emit("\n❌ Lost the connection to the build daemon")
+                self.finished_signal.emit(False)
+        except DaemonError as e:
+            self.log_signal.emit(f"\n❌ Build daemon: {e}")
+            self.finished_signal.emit(False)
+
+    def stop(self):
+        """Stop the build in the daemon"""
+        self.stop_requested = True
+        self.log_signal.emit("\n🛑 User requested packaging stop...")
+        if self.daemon_job is None:
+            return
+        try:
+            self.client.cancel(self.daemon_job)
+        except DaemonError as e:
+            self.log_signal.emit(f"⚠️ Failed to terminate process: {e}")
+
+    def detach(self):
+        """Stop following the build, which keeps running in the daemon"""
+        self.detached = True
+        if self.attachment:
+            self.attachment.close()
+
+
+# Column captions and labels of the startup benchmark
+BENCHMARK_HEADERS = ["Program", "Cache", "Runs", "Min", "Median", "P95", "Peak Memory"]
+SWEEP_HEADERS = ["Setting", "Size", "First Launch", "Repeated Launch", "Extraction", "Pareto"]
+SWEEP_LABELS = {
+    "uncompressed": "Uncompressed (--onefile-no-compression)",
+    "zstd-3": "zstd level 3 (--low-memory)",
+    "zstd-22": "zstd level 22 (default)",
+    "archive": "Archive (--onefile-as-archive)",
+}
+LEVEL_HEADERS = ["zstd Level", "Payload Size (est.)", "Compression Time", "Decompression Time"]
+# Columns of the C compiler comparison
+COMPILER_HEADERS = ["Compiler", "Version", "Compile Time", "Size", "First Launch", "Repeated Launch"]
+COMPILER_FAMILY_LABELS = {"gcc": "GCC", "clang": "Clang", "msvc": "MSVC"}
+COMPARISON_HEADERS = ["Standalone", "Onefile"]
+COMPARISON_METRICS = ["Size on Disk", "First Launch", "Repeated Launch", "Peak Memory", "Temp Extraction", "Left in Temp"]
+BENCHMARK_LABELS = {"compiled": "Compiled", "python": "CPython", "warm": "Warm", "cold": "Cold"}
 
 
 class NuitkaPackager(QMainWindow):
+    sources_changed = Signal(list)
+    benchmark_result = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Nuitka Advanced Packager")
@@ -103,8 +496,98 @@ class NuitkaPackager(QMainWindow):
         self.main_file = ""
         self.icon_file = ""
         self.output_dir = ""
+        self.profile_path = ""
         self.package_thread = None
+        self.preflight_task = None
+        # Set when the sources change while pre-flight checks run
+        self.rebuild_pending = False
         self.plugins = []
+        self._last_status_update = 0.0
+        self.scheduler = BuildScheduler(self.core_budget_spin.value())
+        self.queue_threads = {}
+        self.queue_logs = {}
+        self.source_watcher = None
+        self.sources_changed.connect(self.rebuild_on_change)
+        self.artifact_cache = ArtifactCache(max_bytes=self.artifact_cache_size_spin.value() * 1024 ** 3)
+        self.update_artifact_cache_stats()
+        ccache_binary = find_ccache()
+        self.ccache = Ccache(ccache_binary) if ccache_binary else None
+        self.prewarm_thread = None
+        self.nuitka_cache_task = None
+        self.warm_build_task = None
+        # Phase timings and results of finished builds
+        self.history = BuildHistory()
+        # Browse recorded builds in the History tab
+        self.history_model = HistoryModel(self.history, HISTORY_HEADERS, HISTORY_RESULTS, self)
+        self.history_view.setModel(self.history_model)
+        self.history_view.setColumnWidth(0, 150)
+        self.history_view.selectionModel().currentRowChanged.connect(self.show_history_trends)
+        self.refresh_history()
+        # Size breakdown of standalone builds in the Dist Size tab
+        self.dist_reports = []
+        self.dist_size_task = None
+        self.dist_package_model = SizeTableModel(
+            ["name", "kind", "files", "size", "share"], DIST_SIZE_HEADERS, DIST_KIND_LABELS, self
+        )
+        self.dist_library_model = SizeTableModel(["name", "owner", "size", "share"], DIST_LIBRARY_HEADERS, parent=self)
+        self.dist_view.setModel(self.dist_package_model)
+        self.dist_view.setColumnWidth(0, 260)
+        # Import graph of the main file in the Imports tab
+        self.import_report = None
+        self.import_task = None
+        self.import_stop = threading.Event()
+        self.import_package_model = SizeTableModel(
+            ["name", "kind", "modules", "size", "share"], IMPORT_PACKAGE_HEADERS, IMPORT_KIND_LABELS, self
+        )
+        self.import_module_model = SizeTableModel(
+            ["name", "kind", "importers", "size", "share", "via"], IMPORT_MODULE_HEADERS, IMPORT_KIND_LABELS, self
+        )
+        self.import_view.setModel(self.import_package_model)
+        self.import_view.setColumnWidth(0, 260)
+        # Compile cost of the last build in the Compile Cost tab
+        self.compile_report = None
+        self.compile_package_model = SizeTableModel(
+            ["name", "modules", "compiled", "size", "share", "seconds"], COMPILE_PACKAGE_HEADERS, parent=self
+        )
+        self.compile_module_model = SizeTableModel(
+            ["name", "kind", "size", "share", "seconds", "reason"], COMPILE_MODULE_HEADERS, COMPILE_KIND_LABELS, self
+        )
+        self.compile_view.setModel(self.compile_package_model)
+        self.compile_view.setColumnWidth(0, 260)
+        # Startup benchmarks of the built program
+        self.benchmark_task = None
+        self.benchmark_stop = threading.Event()
+        self.benchmark_result.connect(self.add_benchmark_row)
+        # Onefile / standalone comparison: {queue job id: variant} of the
+        # builds still running and {variant: command}
+        self.comparison_jobs = {}
+        self.comparison_commands = {}
+        self.comparison_task = None
+        # Compression sweep: {queue job id: setting} of the builds still
+        # running and {setting: command}
+        self.sweep_jobs = {}
+        self.sweep_commands = {}
+        self.sweep_task = None
+        self.sweep_recommended = None
+        # Compiler comparison: {queue job id: compiler name} of the builds
+        # still running and {compiler name: command}
+        self.compiler_jobs = {}
+        self.compiler_commands = {}
+        self.compiler_task = None
+        # Compilers, linkers and ccache found on PATH
+        self.toolchain = None
+        self.update_ccache_settings()
+        self.update_nuitka_cache_settings()
+        self.refresh_warm_build_dirs()
+        self.update_memory_governor_settings()
+        # Builds of the build daemon, e.g. from before a restart
+        self.attach_daemon_jobs()
+        # Interpreters found before, then a fresh discovery
+        self.populate_interpreters(load_index())
+        self.refresh_interpreters()
+        # Toolchain found before, then a fresh probe if PATH changed
+        self.populate_toolchain(load_toolchain())
+        self.refresh_toolchain()
 
         # Apply styling
         self.set_style()
@@ -159,8 +642,12 @@ class NuitkaPackager(QMainWindow):
 
         # Python interpreter selection
         self.python_label = QLabel("Python Interpreter:")
-        self.python_input = QLineEdit()
-        self.python_input.setPlaceholderText("Select Python interpreter (e.g., venv/Scripts/python.exe)")
+        self.python_input = QComboBox()
+        self.python_input.setEditable(True)
+        self.python_input.setInsertPolicy(QComboBox.NoInsert)
+        self.python_input.lineEdit().setPlaceholderText("Select Python interpreter (e.g., venv/Scripts/python.exe)")
+        self.python_input.activated.connect(self.choose_python)
+        self.python_input.lineEdit().editingFinished.connect(self.python_edited)
         self.python_btn = QPushButton("Browse...")
         self.python_btn.clicked.connect(self.select_python)
 
@@ -203,6 +690,22 @@ class NuitkaPackager(QMainWindow):
         config_layout.addWidget(self.output_btn, 3, 2)
 
         file_config_layout.addWidget(config_group)
+
+        # Profile controls (saved configurations, also usable by main_cli.py)
+        profile_group = QGroupBox("Profile")
+        profile_layout = QHBoxLayout(profile_group)
+        profile_layout.setContentsMargins(15, 15, 15, 15)
+        self.profile_label = QLabel("No profile loaded (default)")
+        self.load_profile_btn = QPushButton("Load Profile...")
+        self.load_profile_btn.clicked.connect(self.load_profile)
+        self.save_profile_btn = QPushButton("Save Profile...")
+        self.save_profile_btn.clicked.connect(self.save_profile)
+        profile_layout.addWidget(self.profile_label)
+        profile_layout.addStretch()
+        profile_layout.addWidget(self.load_profile_btn)
+        profile_layout.addWidget(self.save_profile_btn)
+
+        file_config_layout.addWidget(profile_group)
         file_config_layout.addStretch()
 
         # Add file config tab to main tabs
@@ -402,6 +905,10 @@ class NuitkaPackager(QMainWindow):
         self.lto_check.setChecked(False)
         self.lto_check.stateChanged.connect(self.update_command)
 
+        self.low_memory_check = QCheckBox("--low-memory (Use less memory; zstd level 3 onefile payload)")
+        self.low_memory_check.setChecked(False)
+        self.low_memory_check.stateChanged.connect(self.update_command)
+
         self.disable_ccache_check = QCheckBox("--disable-ccache (Disable ccache)")
         self.disable_ccache_check.setChecked(False)
         self.disable_ccache_check.stateChanged.connect(self.update_command)
@@ -429,9 +936,75 @@ class NuitkaPackager(QMainWindow):
 
         advanced_group_layout.addWidget(self.windows_uac_admin_check, 2, 0)
         advanced_group_layout.addWidget(self.windows_uac_uiaccess_check, 2, 1)
+        advanced_group_layout.addWidget(self.low_memory_check, 2, 2)
 
         advanced_layout.addWidget(advanced_group)
 
+        # C compiler and linker of the builds
+        toolchain_group = QGroupBox("C Toolchain")
+        toolchain_layout = QGridLayout(toolchain_group)
+        toolchain_layout.setSpacing(10)
+        self.compiler_label = QLabel("C Compiler:")
+        self.compiler_combo = QComboBox()
+        self.compiler_combo.addItem("Nuitka's choice", "")
+        self.compiler_combo.setToolTip("Passed to Nuitka in CC, with --clang for clang; ccache still wraps it")
+        self.compiler_combo.currentIndexChanged.connect(self.update_command)
+        self.linker_label = QLabel("Linker:")
+        self.linker_combo = QComboBox()
+        self.linker_combo.addItem("Default", "")
+        self.linker_combo.setToolTip("Passed to the compiler as -fuse-ld in LDFLAGS")
+        self.linker_combo.currentIndexChanged.connect(self.update_command)
+        self.toolchain_refresh_btn = QPushButton("Detect Again")
+        self.toolchain_refresh_btn.clicked.connect(lambda: self.refresh_toolchain(refresh=True))
+        self.toolchain_status_label = QLabel()
+        self.toolchain_status_label.setWordWrap(True)
+        toolchain_layout.addWidget(self.compiler_label, 0, 0)
+        toolchain_layout.addWidget(self.compiler_combo, 0, 1)
+        toolchain_layout.addWidget(self.toolchain_refresh_btn, 0, 2)
+        toolchain_layout.addWidget(self.linker_label, 1, 0)
+        toolchain_layout.addWidget(self.linker_combo, 1, 1)
+        toolchain_layout.addWidget(self.toolchain_status_label, 2, 0, 1, 3)
+        toolchain_layout.setColumnStretch(1, 1)
+        advanced_layout.addWidget(toolchain_group)
+
+        # Size and police C compile parallelism by available memory
+        memory_group = QGroupBox("Memory Governor")
+        memory_layout = QGridLayout(memory_group)
+        memory_layout.setSpacing(10)
+        self.memory_governor_check = QCheckBox("Size --jobs to the available memory")
+        self.memory_governor_check.setToolTip("Before each build, lowers --jobs so the compilers fit into free RAM, using the compiler memory measured in earlier builds")
+        self.memory_governor_check.setChecked(self.settings.value("memory_governor_enabled", False, type=bool))
+        self.memory_governor_check.toggled.connect(self.update_memory_governor_settings)
+        self.low_memory_fallback_check = QCheckBox("Fall back to --low-memory when not even two compilers fit")
+        self.low_memory_fallback_check.setChecked(self.settings.value("memory_low_memory_fallback", True, type=bool))
+        self.low_memory_fallback_check.toggled.connect(self.update_memory_governor_settings)
+        self.pause_compilers_check = QCheckBox("Pause compilers (SIGSTOP) while available memory is low")
+        self.pause_compilers_check.setToolTip("The newest compiler is paused while memory stays below the threshold and resumed once twice as much is free again")
+        self.pause_compilers_check.setChecked(self.settings.value("memory_pause_compilers", True, type=bool))
+        self.pause_compilers_check.toggled.connect(self.update_memory_governor_settings)
+        self.memory_reserve_label = QLabel("Keep free for the system (GB):")
+        self.memory_reserve_spin = QSpinBox()
+        self.memory_reserve_spin.setRange(0, 256)
+        self.memory_reserve_spin.setValue(self.settings.value("memory_reserve_gb", 1, type=int))
+        self.memory_reserve_spin.valueChanged.connect(self.update_memory_governor_settings)
+        self.pause_below_label = QLabel("Pause below (MB):")
+        self.pause_below_spin = QSpinBox()
+        self.pause_below_spin.setRange(64, 65536)
+        self.pause_below_spin.setSingleStep(128)
+        self.pause_below_spin.setValue(self.settings.value("memory_pause_below_mb", 512, type=int))
+        self.pause_below_spin.valueChanged.connect(self.update_memory_governor_settings)
+        self.memory_status_label = QLabel()
+
+        memory_layout.addWidget(self.memory_governor_check, 0, 0, 1, 2)
+        memory_layout.addWidget(self.low_memory_fallback_check, 0, 2)
+        memory_layout.addWidget(self.pause_compilers_check, 1, 0, 1, 2)
+        memory_layout.addWidget(self.memory_status_label, 1, 2)
+        memory_layout.addWidget(self.memory_reserve_label, 2, 0)
+        memory_layout.addWidget(self.memory_reserve_spin, 2, 1)
+        memory_layout.addWidget(self.pause_below_label, 3, 0)
+        memory_layout.addWidget(self.pause_below_spin, 3, 1)
+        advanced_layout.addWidget(memory_group)
+
         # Include options group
         include_group = QGroupBox("Include Options")
         include_layout = QGridLayout(include_group)
@@ -501,6 +1074,14 @@ class NuitkaPackager(QMainWindow):
         self.include_raw_dir_input.setMinimumHeight(20)  # Set minimum height
         self.include_raw_dir_input.textChanged.connect(self.update_command)
 
+        # Imports not to follow
+        self.nofollow_import_label = QLabel("Don't Follow Imports To:")
+        self.nofollow_import_input = QLineEdit()
+        self.nofollow_import_input.setPlaceholderText("Module or package (e.g., numpy.tests)")
+        self.nofollow_import_input.setMinimumWidth(300)  # Prevent compression
+        self.nofollow_import_input.setMinimumHeight(20)  # Set minimum height
+        self.nofollow_import_input.textChanged.connect(self.update_command)
+
         # Add include options to layout
         include_layout.addWidget(self.include_package_label, 0, 0)
         include_layout.addWidget(self.include_package_input, 0, 1)
@@ -526,6 +1107,9 @@ class NuitkaPackager(QMainWindow):
         include_layout.addWidget(self.include_raw_dir_label, 7, 0)
         include_layout.addWidget(self.include_raw_dir_input, 7, 1)
 
+        include_layout.addWidget(self.nofollow_import_label, 8, 0)
+        include_layout.addWidget(self.nofollow_import_input, 8, 1)
+
         advanced_layout.addWidget(include_group)
         advanced_layout.addStretch()
 
@@ -578,6 +1162,50 @@ class NuitkaPackager(QMainWindow):
 
         onefile_layout.addWidget(onefile_group)
 
+        sweep_group = QGroupBox("Compression Sweep")
+        sweep_group_layout = QVBoxLayout(sweep_group)
+        sweep_group_layout.setContentsMargins(15, 15, 15, 15)
+        sweep_hint = QLabel("Builds the current configuration as a onefile program once per payload setting, in parallel through the build queue (below compression/ in the output directory), and measures size and launch times with the settings of the Benchmark tab. Other zstd levels are estimated by compressing the uncompressed program locally.")
+        sweep_hint.setWordWrap(True)
+        sweep_group_layout.addWidget(sweep_hint)
+
+        self.sweep_build_btn = QPushButton("Build and Sweep")
+        self.sweep_build_btn.clicked.connect(self.build_sweep)
+        self.sweep_measure_btn = QPushButton("Sweep Existing Builds")
+        self.sweep_measure_btn.clicked.connect(self.sweep_existing_builds)
+        self.sweep_apply_btn = QPushButton("Apply Recommended")
+        self.sweep_apply_btn.setEnabled(False)
+        self.sweep_apply_btn.clicked.connect(self.apply_recommended_compression)
+        sweep_buttons_layout = QHBoxLayout()
+        sweep_buttons_layout.addWidget(self.sweep_build_btn)
+        sweep_buttons_layout.addWidget(self.sweep_measure_btn)
+        sweep_buttons_layout.addStretch()
+        sweep_buttons_layout.addWidget(self.sweep_apply_btn)
+        sweep_group_layout.addLayout(sweep_buttons_layout)
+
+        self.sweep_table = QTableWidget(0, len(SWEEP_HEADERS))
+        self.sweep_table.setHorizontalHeaderLabels(SWEEP_HEADERS)
+        self.sweep_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.sweep_table.verticalHeader().setVisible(False)
+        self.sweep_table.horizontalHeader().setStretchLastSection(True)
+        self.sweep_table.setColumnWidth(0, 280)
+        for column in range(1, len(SWEEP_HEADERS) - 1):
+            self.sweep_table.setColumnWidth(column, 130)
+        self.level_table = QTableWidget(0, len(LEVEL_HEADERS))
+        self.level_table.setHorizontalHeaderLabels(LEVEL_HEADERS)
+        self.level_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.level_table.verticalHeader().setVisible(False)
+        self.level_table.horizontalHeader().setStretchLastSection(True)
+        for column in range(len(LEVEL_HEADERS) - 1):
+            self.level_table.setColumnWidth(column, 180)
+        self.sweep_summary_label = QLabel()
+        self.sweep_summary_label.setWordWrap(True)
+        sweep_group_layout.addWidget(self.sweep_table)
+        sweep_group_layout.addWidget(self.level_table)
+        sweep_group_layout.addWidget(self.sweep_summary_label)
+
+        onefile_layout.addWidget(sweep_group)
+
         # DLL control group
         dll_group = QGroupBox("DLL Control")
         dll_layout = QGridLayout(dll_group)
@@ -754,10 +1382,14 @@ class NuitkaPackager(QMainWindow):
         log_group_layout.setContentsMargins(15, 15, 15, 15)
         log_group.setMinimumHeight(450)  # Fixed minimum height
 
-        self.log_edit = QTextEdit()
-        self.log_edit.setReadOnly(True)
-        self.log_edit.setFont(QFont("Consolas", 9))
-        log_group_layout.addWidget(self.log_edit)
+        self.log_view = LogView()
+        self.log_view.setObjectName("log_view")
+        self.log_view.setFont(QFont("Consolas", 9))
+        log_group_layout.addWidget(self.log_view)
+
+        # Measured log pipeline throughput
+        self.log_rate_label = QLabel("Log throughput: -")
+        log_group_layout.addWidget(self.log_rate_label)
 
         # Add log box to layout
         log_layout.addWidget(log_group)
@@ -766,6 +1398,558 @@ class NuitkaPackager(QMainWindow):
         # Add log tab to main tabs
         main_tab.addTab(log_tab, "Operation Log")
 
+        # ===== History Tab =====
+        history_tab = QWidget()
+        history_layout = QVBoxLayout(history_tab)
+        history_layout.setContentsMargins(10, 10, 10, 10)
+        history_layout.setSpacing(15)
+
+        history_group = QGroupBox("Build History")
+        history_group_layout = QVBoxLayout(history_group)
+        history_group_layout.setContentsMargins(15, 15, 15, 15)
+        history_group.setMinimumHeight(450)
+
+        history_controls_layout = QHBoxLayout()
+        self.history_project_combo = QComboBox()
+        self.history_project_combo.currentIndexChanged.connect(self.select_history_project)
+        self.history_refresh_btn = QPushButton("Refresh")
+        self.history_refresh_btn.clicked.connect(self.refresh_history)
+        history_controls_layout.addWidget(QLabel("Project:"))
+        history_controls_layout.addWidget(self.history_project_combo, 1)
+        history_controls_layout.addWidget(self.history_refresh_btn)
+        history_group_layout.addLayout(history_controls_layout)
+
+        # Past builds above, trends of the selected project below
+        self.history_view = QTableView()
+        self.history_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.history_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.history_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.history_view.verticalHeader().setVisible(False)
+        self.history_view.horizontalHeader().setStretchLastSection(True)
+
+        self.duration_chart = TrendChart("Build duration", format_duration, "{count} builds, latest {latest}")
+        self.size_chart = TrendChart("Artifact size", format_size, "{count} builds, latest {latest}")
+        self.memory_chart = TrendChart("Peak memory", format_size, "{count} builds, latest {latest}")
+        charts_widget = QWidget()
+        charts_layout = QHBoxLayout(charts_widget)
+        charts_layout.setContentsMargins(0, 0, 0, 0)
+        charts_layout.addWidget(self.duration_chart)
+        charts_layout.addWidget(self.size_chart)
+        charts_layout.addWidget(self.memory_chart)
+
+        history_splitter = QSplitter(Qt.Vertical)
+        history_splitter.addWidget(self.history_view)
+        history_splitter.addWidget(charts_widget)
+        history_group_layout.addWidget(history_splitter)
+
+        history_layout.addWidget(history_group)
+        history_layout.addStretch()
+
+        # Add history tab to main tabs
+        main_tab.addTab(history_tab, "History")
+
+        # ===== Dist Size Tab =====
+        dist_size_tab = QWidget()
+        dist_size_layout = QVBoxLayout(dist_size_tab)
+        dist_size_layout.setContentsMargins(10, 10, 10, 10)
+        dist_size_layout.setSpacing(15)
+
+        dist_size_group = QGroupBox("Standalone Folder Size")
+        dist_size_group_layout = QVBoxLayout(dist_size_group)
+        dist_size_group_layout.setContentsMargins(15, 15, 15, 15)
+        dist_size_group.setMinimumHeight(450)
+
+        dist_controls_layout = QHBoxLayout()
+        self.dist_combo = QComboBox()
+        self.dist_combo.currentIndexChanged.connect(self.show_dist_report)
+        self.dist_view_combo = QComboBox()
+        self.dist_view_combo.addItems(["By package", "By shared library"])
+        self.dist_view_combo.currentIndexChanged.connect(self.show_dist_report)
+        self.dist_analyze_btn = QPushButton("Analyze")
+        self.dist_analyze_btn.clicked.connect(self.analyze_dist_size)
+        dist_controls_layout.addWidget(QLabel("Folder:"))
+        dist_controls_layout.addWidget(self.dist_combo, 1)
+        dist_controls_layout.addWidget(self.dist_view_combo)
+        dist_controls_layout.addWidget(self.dist_analyze_btn)
+        dist_size_group_layout.addLayout(dist_controls_layout)
+
+        self.dist_summary_label = QLabel("Analyze the .dist folders of the output directory (runs after every standalone build)")
+        dist_size_group_layout.addWidget(self.dist_summary_label)
+
+        # Largest contributors above, suggested exclusions below
+        self.dist_view = QTableView()
+        self.dist_view.setSortingEnabled(True)
+        self.dist_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.dist_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.dist_view.verticalHeader().setVisible(False)
+        self.dist_view.horizontalHeader().setStretchLastSection(True)
+
+        suggestions_widget = QWidget()
+        suggestions_layout = QVBoxLayout(suggestions_widget)
+        suggestions_layout.setContentsMargins(0, 0, 0, 0)
+        self.dist_suggestions_table = QTableWidget(0, 4)
+        self.dist_suggestions_table.setHorizontalHeaderLabels(["Option", "Value", "Saves up to", "Reason"])
+        self.dist_suggestions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.dist_suggestions_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.dist_suggestions_table.verticalHeader().setVisible(False)
+        self.dist_suggestions_table.horizontalHeader().setStretchLastSection(True)
+        self.dist_apply_btn = QPushButton("Apply Selected Suggestions")
+        self.dist_apply_btn.setToolTip("Excluded files may be needed at run time; test the program after rebuilding")
+        self.dist_apply_btn.clicked.connect(self.apply_dist_suggestions)
+        suggestions_layout.addWidget(QLabel("Suggestions:"))
+        suggestions_layout.addWidget(self.dist_suggestions_table)
+        suggestions_layout.addWidget(self.dist_apply_btn, 0, Qt.AlignRight)
+
+        dist_splitter = QSplitter(Qt.Vertical)
+        dist_splitter.addWidget(self.dist_view)
+        dist_splitter.addWidget(suggestions_widget)
+        dist_size_group_layout.addWidget(dist_splitter)
+
+        dist_size_layout.addWidget(dist_size_group)
+        dist_size_layout.addStretch()
+
+        # Add dist size tab to main tabs
+        main_tab.addTab(dist_size_tab, "Dist Size")
+
+        # ===== Imports Tab =====
+        imports_tab = QWidget()
+        imports_layout = QVBoxLayout(imports_tab)
+        imports_layout.setContentsMargins(10, 10, 10, 10)
+        imports_layout.setSpacing(15)
+
+        imports_group = QGroupBox("Import Graph")
+        imports_group_layout = QVBoxLayout(imports_group)
+        imports_group_layout.setContentsMargins(15, 15, 15, 15)
+        imports_group.setMinimumHeight(450)
+
+        import_controls_layout = QHBoxLayout()
+        self.import_view_combo = QComboBox()
+        self.import_view_combo.addItems(["By package", "By module"])
+        self.import_view_combo.currentIndexChanged.connect(self.show_import_view)
+        self.import_scan_btn = QPushButton("Scan")
+        self.import_scan_btn.clicked.connect(self.scan_import_graph)
+        import_controls_layout.addWidget(self.import_view_combo)
+        import_controls_layout.addStretch()
+        import_controls_layout.addWidget(self.import_scan_btn)
+        imports_group_layout.addLayout(import_controls_layout)
+
+        self.import_summary_label = QLabel("Follow the imports of the main file through the selected interpreter's sys.path")
+        self.import_summary_label.setWordWrap(True)
+        imports_group_layout.addWidget(self.import_summary_label)
+
+        # Modules or packages above, suggestions below
+        self.import_view = QTableView()
+        self.import_view.setSortingEnabled(True)
+        self.import_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.import_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.import_view.verticalHeader().setVisible(False)
+        self.import_view.horizontalHeader().setStretchLastSection(True)
+
+        import_suggestions_widget = QWidget()
+        import_suggestions_layout = QVBoxLayout(import_suggestions_widget)
+        import_suggestions_layout.setContentsMargins(0, 0, 0, 0)
+        self.import_suggestions_table = QTableWidget(0, 3)
+        self.import_suggestions_table.setHorizontalHeaderLabels(["Option", "Value", "Reason"])
+        self.import_suggestions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.import_suggestions_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.import_suggestions_table.verticalHeader().setVisible(False)
+        self.import_suggestions_table.horizontalHeader().setStretchLastSection(True)
+        self.import_apply_btn = QPushButton("Apply Selected Suggestions")
+        self.import_apply_btn.clicked.connect(self.apply_import_suggestions)
+        import_suggestions_layout.addWidget(QLabel("Suggestions:"))
+        import_suggestions_layout.addWidget(self.import_suggestions_table)
+        import_suggestions_layout.addWidget(self.import_apply_btn, 0, Qt.AlignRight)
+
+        imports_splitter = QSplitter(Qt.Vertical)
+        imports_splitter.addWidget(self.import_view)
+        imports_splitter.addWidget(import_suggestions_widget)
+        imports_group_layout.addWidget(imports_splitter)
+
+        imports_layout.addWidget(imports_group)
+        imports_layout.addStretch()
+
+        # Add imports tab to main tabs
+        main_tab.addTab(imports_tab, "Imports")
+
+        # ===== Compile Cost Tab =====
+        compile_tab = QWidget()
+        compile_layout = QVBoxLayout(compile_tab)
+        compile_layout.setContentsMargins(10, 10, 10, 10)
+        compile_layout.setSpacing(15)
+
+        compile_group = QGroupBox("Compile Cost by Module")
+        compile_group_layout = QVBoxLayout(compile_group)
+        compile_group_layout.setContentsMargins(15, 15, 15, 15)
+        compile_group.setMinimumHeight(450)
+
+        compile_controls_layout = QHBoxLayout()
+        self.compile_view_combo = QComboBox()
+        self.compile_view_combo.addItems(["By package", "By module"])
+        self.compile_view_combo.currentIndexChanged.connect(self.show_compile_view)
+        compile_controls_layout.addWidget(self.compile_view_combo)
+        compile_controls_layout.addStretch()
+        compile_group_layout.addLayout(compile_controls_layout)
+
+        self.compile_summary_label = QLabel("Nuitka's compilation report of the next build: why each module is included, its C code and optimization time")
+        self.compile_summary_label.setWordWrap(True)
+        compile_group_layout.addWidget(self.compile_summary_label)
+
+        self.compile_view = QTableView()
+        self.compile_view.setSortingEnabled(True)
+        self.compile_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.compile_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.compile_view.verticalHeader().setVisible(False)
+        self.compile_view.horizontalHeader().setStretchLastSection(True)
+        compile_group_layout.addWidget(self.compile_view)
+
+        compile_layout.addWidget(compile_group)
+
+        # Add compile cost tab to main tabs
+        main_tab.addTab(compile_tab, "Compile Cost")
+
+        # ===== Benchmark Tab =====
+        benchmark_tab = QWidget()
+        benchmark_layout = QVBoxLayout(benchmark_tab)
+        benchmark_layout.setContentsMargins(10, 10, 10, 10)
+        benchmark_layout.setSpacing(15)
+
+        benchmark_group = QGroupBox("Startup Benchmark")
+        benchmark_group_layout = QVBoxLayout(benchmark_group)
+        benchmark_group_layout.setContentsMargins(15, 15, 15, 15)
+        benchmark_group.setMinimumHeight(450)
+
+        # Benchmark settings, results below
+        benchmark_settings_layout = QGridLayout()
+        benchmark_settings_layout.setSpacing(10)
+        self.benchmark_runs_spin = QSpinBox()
+        self.benchmark_runs_spin.setRange(1, 1000)
+        self.benchmark_runs_spin.setValue(self.settings.value("benchmark_runs", 10, type=int))
+        self.benchmark_runs_spin.valueChanged.connect(self.update_benchmark_settings)
+        self.benchmark_timeout_spin = QSpinBox()
+        self.benchmark_timeout_spin.setRange(1, 3600)
+        self.benchmark_timeout_spin.setValue(self.settings.value("benchmark_timeout", 60, type=int))
+        self.benchmark_timeout_spin.valueChanged.connect(self.update_benchmark_settings)
+        self.benchmark_args_input = QLineEdit()
+        self.benchmark_args_input.setPlaceholderText("Passed to the program and to the script (e.g., --version)")
+        self.benchmark_marker_input = QLineEdit()
+        self.benchmark_marker_input.setPlaceholderText("Stop timing at the first output line containing this text (default: wait for exit)")
+        self.benchmark_warm_check = QCheckBox("Warm cache")
+        self.benchmark_warm_check.setChecked(True)
+        self.benchmark_cold_check = QCheckBox("Cold cache (drop the page cache before every run)")
+        self.benchmark_cold_check.setToolTip("Uses posix_fadvise; files still mapped by running programs stay cached")
+        self.benchmark_cold_check.setChecked(cold_cache_supported())
+        self.benchmark_cold_check.setEnabled(cold_cache_supported())
+        self.benchmark_python_check = QCheckBox("Compare with CPython running the main file")
+        self.benchmark_python_check.setChecked(True)
+        self.benchmark_auto_check = QCheckBox("Run after every successful build")
+        self.benchmark_auto_check.setChecked(self.settings.value("benchmark_after_build", False, type=bool))
+        self.benchmark_auto_check.toggled.connect(self.update_benchmark_settings)
+        self.benchmark_run_btn = QPushButton("Run Benchmark")
+        self.benchmark_run_btn.clicked.connect(self.run_benchmark)
+        self.benchmark_stop_btn = QPushButton("Stop")
+        self.benchmark_stop_btn.setEnabled(False)
+        self.benchmark_stop_btn.clicked.connect(self.stop_benchmark)
+
+        benchmark_settings_layout.addWidget(QLabel("Runs:"), 0, 0)
+        benchmark_settings_layout.addWidget(self.benchmark_runs_spin, 0, 1)
+        benchmark_settings_layout.addWidget(QLabel("Timeout (s):"), 0, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_timeout_spin, 0, 3)
+        benchmark_settings_layout.addWidget(QLabel("Arguments:"), 1, 0)
+        benchmark_settings_layout.addWidget(self.benchmark_args_input, 1, 1, 1, 3)
+        benchmark_settings_layout.addWidget(QLabel("Ready Marker:"), 2, 0)
+        benchmark_settings_layout.addWidget(self.benchmark_marker_input, 2, 1, 1, 3)
+        benchmark_settings_layout.addWidget(self.benchmark_warm_check, 3, 0, 1, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_cold_check, 3, 2, 1, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_python_check, 4, 0, 1, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_auto_check, 4, 2, 1, 2)
+        benchmark_settings_layout.setColumnStretch(1, 1)
+        benchmark_settings_layout.setColumnStretch(3, 1)
+        benchmark_group_layout.addLayout(benchmark_settings_layout)
+
+        benchmark_buttons_layout = QHBoxLayout()
+        benchmark_buttons_layout.addWidget(self.benchmark_run_btn)
+        benchmark_buttons_layout.addWidget(self.benchmark_stop_btn)
+        benchmark_buttons_layout.addStretch()
+        benchmark_group_layout.addLayout(benchmark_buttons_layout)
+
+        self.benchmark_table = QTableWidget(0, len(BENCHMARK_HEADERS))
+        self.benchmark_table.setHorizontalHeaderLabels(BENCHMARK_HEADERS)
+        self.benchmark_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.benchmark_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.benchmark_table.verticalHeader().setVisible(False)
+        self.benchmark_table.horizontalHeader().setStretchLastSection(True)
+        self.benchmark_summary_label = QLabel()
+        self.benchmark_summary_label.setWordWrap(True)
+        benchmark_group_layout.addWidget(self.benchmark_table)
+        benchmark_group_layout.addWidget(self.benchmark_summary_label)
+
+        benchmark_layout.addWidget(benchmark_group)
+
+        comparison_group = QGroupBox("Onefile vs Standalone")
+        comparison_group_layout = QVBoxLayout(comparison_group)
+        comparison_group_layout.setContentsMargins(15, 15, 15, 15)
+        comparison_hint = QLabel("Builds the current configuration both as a standalone folder and as a onefile program, in parallel through the build queue (below comparison/ in the output directory), then measures both with the settings above. Launch times are medians; the first launch runs with a cold page cache.")
+        comparison_hint.setWordWrap(True)
+        comparison_group_layout.addWidget(comparison_hint)
+
+        self.comparison_build_btn = QPushButton("Build Both and Compare")
+        self.comparison_build_btn.clicked.connect(self.build_variants)
+        self.comparison_measure_btn = QPushButton("Compare Existing Builds")
+        self.comparison_measure_btn.clicked.connect(self.compare_built_variants)
+        comparison_buttons_layout = QHBoxLayout()
+        comparison_buttons_layout.addWidget(self.comparison_build_btn)
+        comparison_buttons_layout.addWidget(self.comparison_measure_btn)
+        comparison_buttons_layout.addStretch()
+        comparison_group_layout.addLayout(comparison_buttons_layout)
+
+        # One row per metric, one column per variant
+        self.comparison_table = QTableWidget(len(COMPARISON_METRICS), len(COMPARISON_HEADERS))
+        self.comparison_table.setHorizontalHeaderLabels(COMPARISON_HEADERS)
+        self.comparison_table.setVerticalHeaderLabels(COMPARISON_METRICS)
+        self.comparison_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.comparison_table.horizontalHeader().setStretchLastSection(True)
+        self.comparison_table.setMinimumHeight(220)
+        self.comparison_summary_label = QLabel()
+        self.comparison_summary_label.setWordWrap(True)
+        comparison_group_layout.addWidget(self.comparison_table)
+        comparison_group_layout.addWidget(self.comparison_summary_label)
+
+        benchmark_layout.addWidget(comparison_group)
+
+        compiler_group = QGroupBox("C Compiler Comparison")
+        compiler_group_layout = QVBoxLayout(compiler_group)
+        compiler_group_layout.setContentsMargins(15, 15, 15, 15)
+        compiler_hint = QLabel("Builds the current configuration once with each C compiler found on PATH, in parallel through the build queue (below compilers/ in the output directory), then measures the programs with the settings above. Compile times are those of the last build of each recorded in the build history; launch times are medians.")
+        compiler_hint.setWordWrap(True)
+        compiler_group_layout.addWidget(compiler_hint)
+
+        self.compiler_build_btn = QPushButton("Build with Each and Compare")
+        self.compiler_build_btn.clicked.connect(self.build_compilers)
+        self.compiler_measure_btn = QPushButton("Compare Existing Builds")
+        self.compiler_measure_btn.clicked.connect(self.compare_built_compilers)
+        compiler_buttons_layout = QHBoxLayout()
+        compiler_buttons_layout.addWidget(self.compiler_build_btn)
+        compiler_buttons_layout.addWidget(self.compiler_measure_btn)
+        compiler_buttons_layout.addStretch()
+        compiler_group_layout.addLayout(compiler_buttons_layout)
+
+        self.compiler_table = QTableWidget(0, len(COMPILER_HEADERS))
+        self.compiler_table.setHorizontalHeaderLabels(COMPILER_HEADERS)
+        self.compiler_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.compiler_table.verticalHeader().setVisible(False)
+        self.compiler_table.horizontalHeader().setStretchLastSection(True)
+        self.compiler_table.setColumnWidth(0, 180)
+        for column in range(1, len(COMPILER_HEADERS) - 1):
+            self.compiler_table.setColumnWidth(column, 120)
+        self.compiler_summary_label = QLabel()
+        self.compiler_summary_label.setWordWrap(True)
+        compiler_group_layout.addWidget(self.compiler_table)
+        compiler_group_layout.addWidget(self.compiler_summary_label)
+
+        benchmark_layout.addWidget(compiler_group)
+        benchmark_layout.addStretch()
+
+        # Add benchmark tab to main tabs
+        main_tab.addTab(benchmark_tab, "Benchmark")
+
+        # ===== Build Queue Tab =====
+        queue_tab = QWidget()
+        queue_layout = QVBoxLayout(queue_tab)
+        queue_layout.setContentsMargins(10, 10, 10, 10)
+        queue_layout.setSpacing(15)
+
+        queue_group = QGroupBox("Build Queue")
+        queue_group_layout = QVBoxLayout(queue_group)
+        queue_group_layout.setContentsMargins(15, 15, 15, 15)
+        queue_group.setMinimumHeight(450)
+
+        # Queue controls
+        queue_controls_layout = QHBoxLayout()
+        self.enqueue_btn = QPushButton("Add Current Command")
+        self.enqueue_btn.clicked.connect(self.enqueue_current_command)
+        self.queue_run_btn = QPushButton("Start Queue")
+        self.queue_run_btn.setCheckable(True)
+        self.queue_run_btn.toggled.connect(self.toggle_queue)
+        self.queue_cancel_btn = QPushButton("Cancel Selected")
+        self.queue_cancel_btn.clicked.connect(self.cancel_queue_job)
+        self.queue_clear_btn = QPushButton("Remove Finished")
+        self.queue_clear_btn.clicked.connect(self.remove_finished_jobs)
+
+        self.daemon_check = QCheckBox("Run in Build Daemon")
+        self.daemon_check.setToolTip("Builds keep running when this window is closed; reopening it attaches to them and replays their logs")
+        self.daemon_check.setChecked(daemon_supported() and self.settings.value("daemon_builds", False, type=bool))
+        self.daemon_check.setEnabled(daemon_supported())
+        if not daemon_supported():
+            self.daemon_check.setToolTip("The build daemon needs Unix domain sockets")
+        self.daemon_check.toggled.connect(self.update_daemon_settings)
+
+        self.core_budget_label = QLabel("Core Budget:")
+        self.core_budget_spin = QSpinBox()
+        self.core_budget_spin.setRange(1, 256)
+        self.core_budget_spin.setValue(os.cpu_count() or 1)
+        self.core_budget_spin.setToolTip("Total C compile jobs shared by all running builds")
+        self.core_budget_spin.valueChanged.connect(self.update_core_budget)
+
+        queue_controls_layout.addWidget(self.enqueue_btn)
+        queue_controls_layout.addWidget(self.queue_run_btn)
+        queue_controls_layout.addWidget(self.queue_cancel_btn)
+        queue_controls_layout.addWidget(self.queue_clear_btn)
+        queue_controls_layout.addStretch()
+        queue_controls_layout.addWidget(self.daemon_check)
+        queue_controls_layout.addWidget(self.core_budget_label)
+        queue_controls_layout.addWidget(self.core_budget_spin)
+        queue_group_layout.addLayout(queue_controls_layout)
+
+        # Queued jobs and their per-job logs
+        self.queue_table = QTableWidget(0, 5)
+        self.queue_table.setHorizontalHeaderLabels(["Job", "Status", "C Jobs", "Progress", "Phase"])
+        self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.queue_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_table.verticalHeader().setVisible(False)
+        self.queue_table.horizontalHeader().setStretchLastSection(True)
+        self.queue_table.setColumnWidth(0, 260)
+        self.queue_table.itemSelectionChanged.connect(self.show_queue_job_log)
+
+        self.queue_log_stack = QStackedWidget()
+
+        queue_splitter = QSplitter(Qt.Vertical)
+        queue_splitter.addWidget(self.queue_table)
+        queue_splitter.addWidget(self.queue_log_stack)
+        queue_group_layout.addWidget(queue_splitter)
+
+        queue_layout.addWidget(queue_group)
+        queue_layout.addStretch()
+
+        # Add build queue tab to main tabs
+        main_tab.addTab(queue_tab, "Build Queue")
+
+        # ===== Caches Tab =====
+        caches_tab = QWidget()
+        caches_layout = QVBoxLayout(caches_tab)
+        caches_layout.setContentsMargins(10, 10, 10, 10)
+        caches_layout.setSpacing(15)
+
+        # Content-addressed cache of finished builds
+        artifact_group = QGroupBox("Build Artifact Cache")
+        artifact_layout = QGridLayout(artifact_group)
+        artifact_layout.setSpacing(10)
+        artifact_layout.setContentsMargins(15, 15, 15, 15)
+        self.artifact_cache_check = QCheckBox("Restore unchanged builds from the artifact cache")
+        self.artifact_cache_check.setToolTip("Builds are keyed by source contents, command, installed packages and Nuitka version")
+        self.artifact_cache_check.setChecked(self.settings.value("artifact_cache_enabled", False, type=bool))
+        self.artifact_cache_check.toggled.connect(self.update_artifact_cache_settings)
+        self.artifact_cache_size_label = QLabel("Max Size (GB):")
+        self.artifact_cache_size_spin = QSpinBox()
+        self.artifact_cache_size_spin.setRange(1, 1024)
+        self.artifact_cache_size_spin.setValue(self.settings.value("artifact_cache_max_gb", 5, type=int))
+        self.artifact_cache_size_spin.valueChanged.connect(self.update_artifact_cache_settings)
+        self.artifact_cache_stats_label = QLabel()
+        self.artifact_cache_clear_btn = QPushButton("Clear Cache")
+        self.artifact_cache_clear_btn.clicked.connect(self.clear_artifact_cache)
+
+        artifact_layout.addWidget(self.artifact_cache_check, 0, 0, 1, 3)
+        artifact_layout.addWidget(self.artifact_cache_size_label, 1, 0)
+        artifact_layout.addWidget(self.artifact_cache_size_spin, 1, 1)
+        artifact_layout.addWidget(self.artifact_cache_stats_label, 2, 0, 1, 2)
+        artifact_layout.addWidget(self.artifact_cache_clear_btn, 2, 2)
+        caches_layout.addWidget(artifact_group)
+
+        # ccache statistics and sizing for the C compilation
+        ccache_group = QGroupBox("ccache")
+        ccache_layout = QGridLayout(ccache_group)
+        ccache_layout.setSpacing(10)
+        ccache_layout.setContentsMargins(15, 15, 15, 15)
+        self.ccache_status_label = QLabel()
+        self.ccache_dir_label = QLabel("Cache Directory:")
+        self.ccache_dir_input = QLineEdit(self.settings.value("ccache_dir", "", type=str))
+        self.ccache_dir_input.setPlaceholderText("Default: Nuitka cache directory")
+        self.ccache_dir_input.editingFinished.connect(self.update_ccache_settings)
+        self.ccache_dir_btn = QPushButton("Browse...")
+        self.ccache_dir_btn.clicked.connect(self.select_ccache_dir)
+        self.ccache_size_label = QLabel("Max Size:")
+        self.ccache_size_input = QLineEdit(self.settings.value("ccache_maxsize", "", type=str))
+        self.ccache_size_input.setPlaceholderText("e.g. 5G (default: ccache setting)")
+        self.ccache_size_input.editingFinished.connect(self.update_ccache_settings)
+        self.ccache_stats_label = QLabel()
+        self.ccache_refresh_btn = QPushButton("Refresh")
+        self.ccache_refresh_btn.clicked.connect(self.update_ccache_status)
+        self.ccache_prewarm_btn = QPushButton("Prewarm")
+        self.ccache_prewarm_btn.setToolTip("Compile the current configuration once in the background to fill the cache")
+        self.ccache_prewarm_btn.clicked.connect(self.prewarm_ccache)
+
+        ccache_layout.addWidget(self.ccache_status_label, 0, 0, 1, 3)
+        ccache_layout.addWidget(self.ccache_dir_label, 1, 0)
+        ccache_layout.addWidget(self.ccache_dir_input, 1, 1)
+        ccache_layout.addWidget(self.ccache_dir_btn, 1, 2)
+        ccache_layout.addWidget(self.ccache_size_label, 2, 0)
+        ccache_layout.addWidget(self.ccache_size_input, 2, 1)
+        ccache_layout.addWidget(self.ccache_stats_label, 3, 0, 1, 2)
+        ccache_layout.addWidget(self.ccache_refresh_btn, 3, 2)
+        ccache_layout.addWidget(self.ccache_prewarm_btn, 4, 2)
+        caches_layout.addWidget(ccache_group)
+
+        # Nuitka's own caches (bytecode, dll-dependencies, ccache, ...) in a per-profile directory
+        nuitka_cache_group = QGroupBox("Nuitka Cache")
+        nuitka_cache_layout = QGridLayout(nuitka_cache_group)
+        nuitka_cache_layout.setSpacing(10)
+        nuitka_cache_layout.setContentsMargins(15, 15, 15, 15)
+        self.nuitka_cache_check = QCheckBox("Use a managed cache directory per profile")
+        self.nuitka_cache_check.setToolTip("Sets NUITKA_CACHE_DIR and evicts least-recently-used files down to the quota before each build")
+        self.nuitka_cache_check.setChecked(self.settings.value("nuitka_cache_managed", False, type=bool))
+        self.nuitka_cache_check.toggled.connect(self.update_nuitka_cache_settings)
+        self.nuitka_cache_quota_label = QLabel("Quota (GB):")
+        self.nuitka_cache_quota_spin = QSpinBox()
+        self.nuitka_cache_quota_spin.setRange(1, 1024)
+        self.nuitka_cache_quota_spin.setValue(self.settings.value("nuitka_cache_quota_gb", 10, type=int))
+        self.nuitka_cache_quota_spin.valueChanged.connect(self.update_nuitka_cache_settings)
+        self.nuitka_cache_dir_label = QLabel()
+        self.nuitka_cache_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.nuitka_cache_sizes_label = QLabel()
+        self.nuitka_cache_sizes_label.setWordWrap(True)
+        self.nuitka_cache_refresh_btn = QPushButton("Refresh")
+        self.nuitka_cache_refresh_btn.clicked.connect(self.refresh_nuitka_cache_sizes)
+
+        nuitka_cache_layout.addWidget(self.nuitka_cache_check, 0, 0, 1, 3)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_quota_label, 1, 0)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_quota_spin, 1, 1)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_dir_label, 2, 0, 1, 3)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_sizes_label, 3, 0, 1, 2)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_refresh_btn, 3, 2)
+        caches_layout.addWidget(nuitka_cache_group)
+
+        # Nuitka's build directory kept per profile, so ccache finds unchanged objects again
+        warm_build_group = QGroupBox("Warm Build Directory")
+        warm_build_layout = QGridLayout(warm_build_group)
+        warm_build_layout.setSpacing(10)
+        warm_build_layout.setContentsMargins(15, 15, 15, 15)
+        self.warm_build_check = QCheckBox("Keep a warm build directory per profile")
+        self.warm_build_check.setToolTip("Builds in a fixed directory below the packager's cache directory instead of the output directory and moves the artifacts there; it is emptied when the arguments, interpreter or toolchain change")
+        self.warm_build_check.setChecked(self.settings.value("warm_build_dirs", False, type=bool))
+        self.warm_build_check.toggled.connect(self.update_warm_build_settings)
+        self.clean_build_check = QCheckBox("Clean build (empty it before each build)")
+        self.clean_build_check.setToolTip("Starts every build from an empty directory, as after a change of its arguments")
+        self.warm_build_dir_label = QLabel()
+        self.warm_build_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.warm_build_sizes_label = QLabel()
+        self.warm_build_sizes_label.setWordWrap(True)
+        self.warm_build_refresh_btn = QPushButton("Refresh")
+        self.warm_build_refresh_btn.clicked.connect(self.refresh_warm_build_dirs)
+        self.warm_build_delete_btn = QPushButton("Delete")
+        self.warm_build_delete_btn.clicked.connect(self.delete_warm_build_dirs)
+
+        warm_build_layout.addWidget(self.warm_build_check, 0, 0, 1, 3)
+        warm_build_layout.addWidget(self.clean_build_check, 1, 0, 1, 3)
+        warm_build_layout.addWidget(self.warm_build_dir_label, 2, 0, 1, 3)
+        warm_build_layout.addWidget(self.warm_build_sizes_label, 3, 0, 1, 3)
+        warm_build_layout.addWidget(self.warm_build_refresh_btn, 4, 1)
+        warm_build_layout.addWidget(self.warm_build_delete_btn, 4, 2)
+        caches_layout.addWidget(warm_build_group)
+        caches_layout.addStretch()
+
+        # Add caches tab to main tabs
+        main_tab.addTab(caches_tab, "Caches")
+
         # Command area
         command_group = QGroupBox("Packaging Command")
         command_layout = QVBoxLayout(command_group)
@@ -780,12 +1964,21 @@ class NuitkaPackager(QMainWindow):
 
         main_layout.addWidget(command_group)
 
-        # Progress bar
+        # Progress bar with phase and ETA
+        progress_layout = QHBoxLayout()
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(10)
-        main_layout.addWidget(self.progress_bar)
+        self.progress_label = QLabel()
+        self.progress_label.setMinimumWidth(260)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.progress_label)
+        # Live CPU, memory and I/O of the build process tree
+        self.resource_label = QLabel()
+        self.resource_label.setToolTip("Aggregate over Nuitka, scons and all compiler processes")
+        progress_layout.addWidget(self.resource_label)
+        main_layout.addLayout(progress_layout)
 
 
 
@@ -833,8 +2026,15 @@ class NuitkaPackager(QMainWindow):
         self.clear_btn.setFixedHeight(40)
         self.clear_btn.clicked.connect(self.clear_log)
 
+        self.watch_btn = QPushButton("Watch Mode")
+        self.watch_btn.setFixedHeight(40)
+        self.watch_btn.setCheckable(True)
+        self.watch_btn.setToolTip("Rebuild automatically when the project sources change")
+        self.watch_btn.toggled.connect(self.toggle_watch)
+
         button_layout.addWidget(self.execute_btn)
         button_layout.addWidget(self.stop_btn)
+        button_layout.addWidget(self.watch_btn)
         button_layout.addWidget(self.clear_btn)
 
         main_layout.addLayout(button_layout)
@@ -955,14 +2155,14 @@ class NuitkaPackager(QMainWindow):
                 background-color: transparent;
                 color: #ffffff;
             }
-            QTextEdit {
+            QTextEdit, QAbstractScrollArea#log_view {
                 background-color: #1e1e1e;
                 border: 1px solid #555;
                 border-radius: 4px;
                 padding: 5px;
                 color: #ffffff;
             }
-            QLineEdit, QComboBox, QListWidget {
+            QLineEdit, QComboBox, QListWidget, QTableWidget {
                 background-color: #1e1e1e;
                 border: 1px solid #555;
                 border-radius: 4px;
@@ -1026,6 +2226,12 @@ class NuitkaPackager(QMainWindow):
                 color: white;
                 border-radius: 3px;
             }
+            QHeaderView::section {
+                background-color: #444;
+                color: #ffffff;
+                border: none;
+                padding: 4px;
+            }
             QCheckBox {
                 color: #ffffff;
             }
@@ -1128,14 +2334,14 @@ class NuitkaPackager(QMainWindow):
                 background-color: transparent;
                 color: #2c3e50;
             }
-            QTextEdit {
+            QTextEdit, QAbstractScrollArea#log_view {
                 background-color: white;
                 border: 1px solid #dcdde1;
                 border-radius: 4px;
                 padding: 5px;
                 color: #2c3e50;
             }
-            QLineEdit, QComboBox, QListWidget {
+            QLineEdit, QComboBox, QListWidget, QTableWidget {
                 background-color: white;
                 border: 1px solid #dcdde1;
                 border-radius: 4px;
@@ -1199,6 +2405,12 @@ class NuitkaPackager(QMainWindow):
                 color: white;
                 border-radius: 3px;
             }
+            QHeaderView::section {
+                background-color: #ecf0f1;
+                color: #2c3e50;
+                border: none;
+                padding: 4px;
+            }
             QCheckBox {
                 color: #2c3e50;
             }
@@ -1331,12 +2543,26 @@ class NuitkaPackager(QMainWindow):
     def log_message(self, message):
         """Add message to log box"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_edit.append(f"[{timestamp}] {message}")
-        self.log_edit.moveCursor(QTextCursor.End)
+        self.log_view.append_lines([f"[{timestamp}] {message}"])
 
         # Show last message in status bar
         self.status_bar.showMessage(message)
 
+    def append_log_batch(self, lines):
+        """Append a batch of build output lines to the log view in one model insert"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_view.append_lines([f"[{timestamp}] {line}" for line in lines])
+
+        # Throttle status bar updates
+        now = time.monotonic()
+        if now - self._last_status_update >= STATUS_BAR_INTERVAL:
+            self._last_status_update = now
+            self.status_bar.showMessage(lines[-1])
+
+    def update_log_rate(self, rate):
+        """Show measured log pipeline throughput"""
+        self.log_rate_label.setText(f"Log throughput: {rate:,.0f} lines/s")
+
     def select_python(self):
         """Select Python interpreter"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1344,10 +2570,70 @@ class NuitkaPackager(QMainWindow):
         )
         if file_path:
             self.python_path = file_path
-            self.python_input.setText(file_path)
-
-            # Check if Nuitka is installed
-            if not self.check_nuitka_installed():
+            self.python_input.setEditText(file_path)
+
+            # Detect Nuitka off the GUI thread
+            self.check_interpreter()
+
+    def choose_python(self, index):
+        """Use an interpreter from the discovered list"""
+        python_path = self.python_input.itemData(index)
+        self.python_input.setEditText(python_path)
+        if python_path != self.python_path:
+            self.python_path = python_path
+            self.check_interpreter(warn=False)
+
+    def python_edited(self):
+        """Use an interpreter path typed into the field"""
+        python_path = self.python_input.currentText().strip()
+        if python_path and python_path != self.python_path:
+            self.python_path = python_path
+            self.check_interpreter(warn=False)
+
+    def refresh_interpreters(self):
+        """Discover interpreters in the background"""
+        project_dir = os.path.dirname(os.path.abspath(self.main_file)) if self.main_file else None
+        task = BackgroundTask(discover_interpreters, project_dir, parent=self)
+        task.result_signal.connect(self.populate_interpreters)
+        task.error_signal.connect(lambda message: self.log_message(f"⚠️ Interpreter discovery failed: {message}"))
+        task.finished.connect(task.deleteLater)
+        task.start()
+
+    def populate_interpreters(self, entries):
+        """Fill the interpreter list, keeping the current path"""
+        text = self.python_input.currentText()
+        self.python_input.blockSignals(True)
+        self.python_input.clear()
+        for entry in entries:
+            info = entry["info"]
+            nuitka = f"Nuitka {info['nuitka']}" if info["nuitka"] else "no Nuitka"
+            self.python_input.addItem(
+                f"{entry['path']}  —  Python {info['version']} · {nuitka} · "
+                f"{INTERPRETER_SOURCE_LABELS[entry['source']]}",
+                entry["path"],
+            )
+        self.python_input.setCurrentIndex(-1)
+        self.python_input.setEditText(text)
+        self.python_input.blockSignals(False)
+
+    def check_interpreter(self, warn=True):
+        """Detect Python and Nuitka of the selected interpreter in a worker"""
+        python_path = self.python_path
+        self.python_input.setToolTip("")
+        task = BackgroundTask(detect_interpreter, python_path, parent=self)
+        task.result_signal.connect(lambda info: self.show_interpreter(python_path, info, warn))
+        task.error_signal.connect(lambda message: self.log_message(f"⚠️ Cannot run {python_path}: {message}"))
+        task.finished.connect(task.deleteLater)
+        task.start()
+
+    def show_interpreter(self, python_path, info, warn):
+        """Report the Nuitka installation of an interpreter"""
+        if python_path != self.python_path:
+            # Another interpreter was selected meanwhile
+            return
+        if not info["nuitka"]:
+            self.python_input.setToolTip(f"Python {info['version']}, Nuitka not installed")
+            if warn:
                 QMessageBox.warning(
                     self,
                     "Nuitka Not Installed",
@@ -1355,65 +2641,10 @@ class NuitkaPackager(QMainWindow):
                     QMessageBox.Ok
                 )
             else:
-                self.log_message("✓ Nuitka installed in selected Python environment")
-
-    def check_nuitka_installed(self):
-        """Check if Nuitka is installed in selected Python environment"""
-        try:
-            # Method 1: Check if interpreter path contains 'nuitka'
-            if "nuitka" in self.python_path.lower():
-                return True
-
-            # Method 2: Most reliable - try running nuitka --version
-            try:
-                result = subprocess.run(
-                    [self.python_path, "-m", "nuitka", "--version"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=2,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # Method 3: Check virtual environment's executable directory
-            # Get virtual environment base directory
-            env_base = os.path.dirname(os.path.dirname(self.python_path))
-
-            # Determine scripts directory name (Windows: Scripts, Unix: bin)
-            scripts_dir = "Scripts" if sys.platform.startswith("win") else "bin"
-            scripts_path = os.path.join(env_base, scripts_dir)
-
-            # Check for possible executables
-            for exe_name in ["nuitka", "nuitka.exe", "nuitka.cmd", "nuitka-script.py"]:
-                exe_path = os.path.join(scripts_path, exe_name)
-                if os.path.exists(exe_path):
-                    return True
-
-            # Method 4: Check package metadata (compatible with uv/pip)
-            # Try uv first, then pip
-            for module in ["uv", "pip"]:
-                try:
-                    result = subprocess.run(
-                        [self.python_path, "-m", module, "show", "nuitka"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=2,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    # Check if successful and contains package info
-                    if result.returncode == 0 and "Name: nuitka" in result.stdout:
-                        return True
-                except:
-                    continue
-
-            return False
-        except Exception:
-            return False
+                self.log_message("⚠️ Nuitka not detected in selected Python environment")
+            return
+        self.python_input.setToolTip(f"Python {info['version']}, Nuitka {info['nuitka']} ({info['installer']})")
+        self.log_message(f"✓ Nuitka {info['nuitka']} installed in selected Python environment (Python {info['version']}, {info['installer']})")
 
     def select_main_file(self):
         """Select main Python file"""
@@ -1423,6 +2654,8 @@ class NuitkaPackager(QMainWindow):
         if file_path:
             self.main_file = file_path
             self.file_input.setText(file_path)
+            # Virtual environments of the project
+            self.refresh_interpreters()
 
     def select_icon(self):
         """Select icon file"""
@@ -1442,6 +2675,139 @@ class NuitkaPackager(QMainWindow):
             self.output_dir = dir_path
             self.output_input.setText(dir_path)
 
+    def _config_widgets(self):
+        """Map configuration keys to the widgets holding them"""
+        return {
+            "onefile": self.onefile_check,
+            "standalone": self.standalone_check,
+            "disable_console": self.disable_console_check,
+            "remove_output": self.remove_output_check,
+            "include_qt": self.include_qt_check,
+            "show_progress": self.show_progress_check,
+            "show_memory": self.show_memory_check,
+            "follow_imports": self.follow_imports_check,
+            "follow_stdlib": self.follow_stdlib_check,
+            "module_mode": self.module_mode_check,
+            "lto": self.lto_check,
+            "low_memory": self.low_memory_check,
+            "disable_ccache": self.disable_ccache_check,
+            "assume_yes": self.assume_yes_check,
+            "windows_uac_admin": self.windows_uac_admin_check,
+            "windows_uac_uiaccess": self.windows_uac_uiaccess_check,
+            "include_package": self.include_package_input,
+            "include_package_data": self.include_package_data_input,
+            "include_module": self.include_module_input,
+            "nofollow_import": self.nofollow_import_input,
+            "include_data_files": self.include_data_input,
+            "include_data_dir": self.include_data_dir_input,
+            "noinclude_data": self.noinclude_data_input,
+            "include_onefile_ext": self.include_onefile_ext_input,
+            "include_raw_dir": self.include_raw_dir_input,
+            "onefile_tempdir": self.onefile_tempdir_input,
+            "onefile_grace_time": self.onefile_grace_time_spin,
+            "onefile_no_compression": self.onefile_no_compression_check,
+            "onefile_as_archive": self.onefile_as_archive_check,
+            "noinclude_dlls": self.noinclude_dlls_input,
+            "company": self.company_input,
+            "product": self.product_input,
+            "file_version": self.file_version_input,
+            "product_version": self.product_version_input,
+            "file_description": self.file_description_input,
+            "copyright": self.copyright_input,
+            "force_env": self.force_env_input,
+            "debug": self.debug_check,
+            "unstripped": self.unstripped_check,
+            "trace_execution": self.trace_execution_check,
+            "warn_implicit": self.warn_implicit_check,
+            "warn_unusual": self.warn_unusual_check,
+            "deployment": self.deployment_check,
+        }
+
+    def collect_config(self):
+        """Collect the current widget state into a configuration dict"""
+        config = {
+            "python_path": self.python_path,
+            "main_file": self.main_file,
+            "icon_file": self.icon_file,
+            "output_dir": self.output_dir,
+            "plugins": [item.text().split('=')[1] for item in self.plugins_list.selectedItems()],
+            "python_flags": [self.flags_list.item(i).text() for i in range(self.flags_list.count())],
+            "compiler": self.compiler_combo.currentData(),
+            "linker": self.linker_combo.currentData(),
+        }
+        for key, widget in self._config_widgets().items():
+            if isinstance(widget, QCheckBox):
+                config[key] = widget.isChecked()
+            elif isinstance(widget, QSpinBox):
+                config[key] = widget.value()
+            else:
+                config[key] = widget.text()
+        return config
+
+    def apply_config(self, config):
+        """Load a configuration dict into the widgets"""
+        self.python_path = config["python_path"]
+        self.python_input.setEditText(self.python_path)
+        if self.python_path:
+            self.check_interpreter(warn=False)
+        self.main_file = config["main_file"]
+        self.file_input.setText(self.main_file)
+        self.icon_file = config["icon_file"]
+        self.icon_input.setText(self.icon_file)
+        self.output_dir = config["output_dir"]
+        self.output_input.setText(self.output_dir)
+
+        for i in range(self.plugins_list.count()):
+            item = self.plugins_list.item(i)
+            item.setSelected(item.text().split('=')[1] in config["plugins"])
+        self.flags_list.clear()
+        self.flags_list.addItems(config["python_flags"])
+        self.select_toolchain(config["compiler"], config["linker"])
+
+        for key, widget in self._config_widgets().items():
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(bool(config[key]))
+            elif isinstance(widget, QSpinBox):
+                widget.setValue(int(config[key]))
+            else:
+                widget.setText(config[key])
+        self.update_command()
+
+    def load_profile(self):
+        """Load configuration from a profile file"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Profile", "", "Packager Profile (*.json);;All Files (*)")
+        if not file_path:
+            return
+        try:
+            config = load_profile(file_path)
+        except ProfileError as e:
+            QMessageBox.warning(self, "Profile Error", str(e))
+            return
+        self.profile_path = file_path
+        self.apply_config(config)
+        name = profile_name(file_path)
+        self.profile_label.setText(f"Profile: {name}")
+        self.log_message(f"📂 Loaded profile: {file_path}")
+        self.refresh_nuitka_cache_sizes()
+        self.refresh_warm_build_dirs()
+
+    def save_profile(self):
+        """Save current configuration to a profile file"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Profile", self.profile_path, "Packager Profile (*.json);;All Files (*)")
+        if not file_path:
+            return
+        try:
+            save_profile(file_path, self.collect_config())
+        except OSError as e:
+            QMessageBox.warning(self, "Profile Error", str(e))
+            return
+        self.profile_path = file_path
+        name = profile_name(file_path)
+        self.profile_label.setText(f"Profile: {name}")
+        self.log_message(f"💾 Saved profile: {file_path}")
+        self.refresh_nuitka_cache_sizes()
+        self.refresh_warm_build_dirs()
+
     def update_command(self):
         """Update packaging command based on user selections"""
         if not self.python_path or not self.main_file:
@@ -1449,225 +2815,7 @@ class NuitkaPackager(QMainWindow):
                 "1. Select Python interpreter and main file \n2. Configure options to update command")
             return
 
-        # Build base command
-        command = [
-            self.python_path,
-            "-m", "nuitka"
-        ]
-
-        # For uv environments, use nuitka.cmd directly
-        if self.python_path.endswith("nuitka.cmd"):
-            command = [self.python_path]
-
-        # ===== Common Options =====
-        if self.onefile_check.isChecked():
-            command.append("--onefile")
-
-        if self.standalone_check.isChecked():
-            command.append("--standalone")
-
-        if self.disable_console_check.isChecked():
-            command.append("--windows-disable-console")
-
-        if self.remove_output_check.isChecked():
-            command.append("--remove-output")
-
-        if self.include_qt_check.isChecked():
-            command.append("--include-qt-plugins=sensible,styles")
-
-        if self.show_progress_check.isChecked():
-            command.append("--show-progress")
-
-        if self.show_memory_check.isChecked():
-            command.append("--show-memory")
-
-        # Add icon
-        if self.icon_file:
-            command.append(f"--windows-icon-from-ico={self.icon_file}")
-
-        # Add output directory
-        if self.output_dir:
-            command.append(f"--output-dir={self.output_dir}")
-
-        # ===== Plugin Options =====
-        selected_plugins = [item.text().split('=')[1] for item in self.plugins_list.selectedItems()]
-        for plugin in selected_plugins:
-            command.append(f"--enable-plugin={plugin}")
-
-        # ===== Advanced Options =====
-        if self.follow_imports_check.isChecked():
-            command.append("--follow-imports")
-
-        if self.follow_stdlib_check.isChecked():
-            command.append("--follow-stdlib")
-
-        if self.module_mode_check.isChecked():
-            command.append("--module")
-
-        if self.lto_check.isChecked():
-            command.append("--lto")
-
-        if self.disable_ccache_check.isChecked():
-            command.append("--disable-ccache")
-
-        if self.assume_yes_check.isChecked():
-            command.append("--assume-yes")
-
-        if self.windows_uac_admin_check.isChecked():
-            command.append("--windows-uac-admin")
-
-        if self.windows_uac_uiaccess_check.isChecked():
-            command.append("--windows-uac-uiaccess")
-
-        # ===== Include Options =====
-        # Include packages
-        if self.include_package_input.text():
-            packages = [pkg.strip() for pkg in self.include_package_input.text().split(',') if pkg.strip()]
-            for pkg in packages:
-                command.append(f"--include-package={pkg}")
-
-        # Include package data
-        if self.include_package_data_input.text():
-            package_data = [pd.strip() for pd in self.include_package_data_input.text().split(',') if pd.strip()]
-            for pd in package_data:
-                command.append(f"--include-package-data={pd}")
-
-        # Include modules
-        if self.include_module_input.text():
-            modules = [mod.strip() for mod in self.include_module_input.text().split(',') if mod.strip()]
-            for mod in modules:
-                command.append(f"--include-module={mod}")
-
-        # Include data directories
-        if self.include_data_dir_input.text():
-            data_dirs = [dd.strip() for dd in self.include_data_dir_input.text().split(',') if dd.strip()]
-
-            # Get project base path from main file location
-            if not self.main_file:
-                QMessageBox.warning(self, "Warning", "Please select main file first")
-                return
-
-            project_base_dir = os.path.dirname(self.main_file)
-
-            for dd in data_dirs:
-                # Split source and destination paths
-                if '=' in dd:
-                    src_path, dest_path = dd.split('=', 1)
-                else:
-                    src_path = dd
-                    # Default destination is last part of source path
-                    dest_path = os.path.basename(src_path)
-
-                # Ensure source path is absolute
-                if not os.path.isabs(src_path):
-                    # Resolve relative path based on main file directory
-                    resolved_path = os.path.join(project_base_dir, src_path)
-
-                    # Verify path exists
-                    if os.path.exists(resolved_path):
-                        src_path = resolved_path
-                    else:
-                        logging.warning(f"Resource path does not exist: {resolved_path}")
-                        continue
-
-                # Verify path exists
-                if not os.path.exists(src_path):
-                    logging.warning(f"Include data directory not found: {src_path}")
-                    continue
-
-                # Add to command
-                command.append(f"--include-data-dir={src_path}={dest_path}")
-                logging.info(f"Added include directory: {src_path} -> {dest_path}")
-
-                # Detailed logging
-                logging.debug(f"Original input: {dd}")
-                logging.debug(f"Resolved source: {src_path}")
-                logging.debug(f"Resolved destination: {dest_path}")
-
-        # Exclude data files
-        if self.noinclude_data_input.text():
-            exclude_data = [ed.strip() for ed in self.noinclude_data_input.text().split(',') if ed.strip()]
-            for ed in exclude_data:
-                command.append(f"--noinclude-data-files={ed}")
-
-        # Onefile external data (only when onefile mode is enabled)
-        if self.onefile_check.isChecked() and self.include_onefile_ext_input.text():
-            onefile_ext = [oe.strip() for oe in self.include_onefile_ext_input.text().split(',') if oe.strip()]
-            for oe in onefile_ext:
-                command.append(f"--include-onefile-external-data={oe}")
-
-        # Include raw directories
-        if self.include_raw_dir_input.text():
-            raw_dirs = [rd.strip() for rd in self.include_raw_dir_input.text().split(',') if rd.strip()]
-            for rd in raw_dirs:
-                command.append(f"--include-raw-dir={rd}")
-
-        # ===== Python Flags =====
-        for i in range(self.flags_list.count()):
-            command.append(self.flags_list.item(i).text())
-
-        # ===== Onefile Options =====
-        if self.onefile_check.isChecked():
-            if self.onefile_tempdir_input.text():
-                command.append(f"--onefile-tempdir-spec={self.onefile_tempdir_input.text()}")
-
-            if self.onefile_grace_time_spin.value() != 5000:
-                command.append(f"--onefile-child-grace-time={self.onefile_grace_time_spin.value()}")
-
-            if self.onefile_no_compression_check.isChecked():
-                command.append("--onefile-no-compression")
-
-            if self.onefile_as_archive_check.isChecked():
-                command.append("--onefile-as-archive")
-
-        # ===== DLL Control =====
-        if self.noinclude_dlls_input.text():
-            command.append(f"--noinclude-dlls={self.noinclude_dlls_input.text()}")
-
-        # ===== Metadata =====
-        if self.company_input.text():
-            command.append(f"--company-name={self.company_input.text()}")
-
-        if self.product_input.text():
-            command.append(f"--product-name={self.product_input.text()}")
-
-        if self.file_version_input.text():
-            command.append(f"--file-version={self.file_version_input.text()}")
-
-        if self.product_version_input.text():
-            command.append(f"--product-version={self.product_version_input.text()}")
-
-        if self.file_description_input.text():
-            command.append(f"--file-description={self.file_description_input.text()}")
-
-        if self.copyright_input.text():
-            command.append(f"--copyright={self.copyright_input.text()}")
-
-        # ===== Environment Control =====
-        if self.force_env_input.text():
-            command.append(f"--force-runtime-environment-variable={self.force_env_input.text()}")
-
-        # ===== Debug Options =====
-        if self.debug_check.isChecked():
-            command.append("--debug")
-
-        if self.unstripped_check.isChecked():
-            command.append("--unstripped")
-
-        if self.trace_execution_check.isChecked():
-            command.append("--trace-execution")
-
-        if self.warn_implicit_check.isChecked():
-            command.append("--warn-implicit-exceptions")
-
-        if self.warn_unusual_check.isChecked():
-            command.append("--warn-unusual-code")
-
-        if self.deployment_check.isChecked():
-            command.append("--deployment")
-
-        # Add main file
-        command.append(self.main_file)
+        command = build_command(self.collect_config())
 
         # Display command
         self.command_edit.setPlainText(" ".join(command))
@@ -1678,6 +2826,9 @@ class NuitkaPackager(QMainWindow):
         if self.package_thread and self.package_thread.isRunning():
             self.log_message("⚠️ Packaging already in progress")
             return
+        if self.preflight_task and self.preflight_task.isRunning():
+            self.log_message("⚠️ Pre-flight checks already running")
+            return
 
         # Validate required inputs
         if not self.python_path:
@@ -1692,35 +2843,99 @@ class NuitkaPackager(QMainWindow):
             QMessageBox.warning(self, "Missing Configuration", "Select output directory")
             return
 
-        # Check if Nuitka is installed
-        if not self.check_nuitka_installed():
-            QMessageBox.warning(
-                self,
-                "Nuitka Not Installed",
-                "Nuitka not detected in selected Python environment.\nInstall with: pip install nuitka",
-                QMessageBox.Ok
+        # Get command
+        command = self.command_edit.toPlainText().split()
+        if self.watch_btn.isChecked() and "--remove-output" in command:
+            # Keep the build directory so Nuitka and ccache only recompile what changed
+            command.remove("--remove-output")
+
+        # Check paths, compiler, disk space, Nuitka and options before compiling
+        self.execute_btn.setEnabled(False)
+        self.log_message("🔎 Running pre-flight checks...")
+        env = self.build_environment(toolchain_variables(self.collect_config()))
+        self.preflight_task = BackgroundTask(
+            lambda: preflight(command, None, estimate_output_size(command, self.history), env)
+        )
+        self.preflight_task.result_signal.connect(lambda report: self.preflight_finished(command, report))
+        self.preflight_task.error_signal.connect(self.preflight_failed)
+        self.preflight_task.finished.connect(self.start_pending_rebuild)
+        self.preflight_task.start()
+        # Cleared only once the checks of the changed sources run
+        self.rebuild_pending = False
+
+    def preflight_finished(self, command, report):
+        """Start the build unless a pre-flight check failed"""
+        self.execute_btn.setEnabled(True)
+        self.log_message(f"🔎 Pre-flight checks: {report['errors']} errors, {report['warnings']} warnings ({report['seconds']:.1f} s)")
+        for line in describe_preflight(report):
+            self.log_message(line)
+        if self.rebuild_pending:
+            # Checked again once the task has finished, see start_pending_rebuild
+            return
+        if report["errors"] and self.watch_btn.isChecked():
+            # No dialog on every save while watching
+            self.log_message("⏹ Build skipped: pre-flight checks failed, waiting for the next change")
+            return
+        if report["errors"]:
+            problems = "\n".join(
+                describe_finding(finding, PREFLIGHT_MESSAGES)
+                for finding in report["findings"] if finding["severity"] == ERROR
+            )
+            msg_box = QMessageBox(
+                QMessageBox.Warning,
+                "Pre-flight Checks Failed",
+                f"The build is going to fail:\n\n{problems}\n\nStart it anyway?",
+                QMessageBox.Yes | QMessageBox.No,
+                self
             )
+            msg_box.setDefaultButton(QMessageBox.No)
+            msg_box.setStyleSheet(self.get_messagebox_style())
+            if msg_box.exec() != QMessageBox.Yes:
+                self.log_message("⏹ Build not started")
+                return
+        self.start_package(command)
+
+    def start_pending_rebuild(self):
+        """Start the rebuild requested while pre-flight checks ran
+
+        Connected to the finished signal of the pre-flight task: its result
+        can arrive while the thread is still running, when execute_package
+        would refuse to start new checks.
+        """
+        if not self.rebuild_pending:
             return
+        # The checked command may be outdated, check the current one
+        self.log_message("🔁 Sources changed during the pre-flight checks, checking again")
+        self.execute_package()
 
-        # Get command
-        command = self.command_edit.toPlainText().split()
+    def preflight_failed(self, message):
+        """Report pre-flight checks that could not run"""
+        self.execute_btn.setEnabled(True)
+        self.log_message(f"⚠️ Pre-flight checks failed: {message}")
 
+    def start_package(self, command):
+        """Start the packaging thread for a checked command"""
         # Create and start packaging thread
-        self.package_thread = PackageThread(command)
+        self.package_thread = self.create_package_thread(command, variables=toolchain_variables(self.collect_config()))
         self.package_thread.log_signal.connect(self.log_message)
+        self.package_thread.log_batch_signal.connect(self.append_log_batch)
+        self.package_thread.throughput_signal.connect(self.update_log_rate)
+        self.package_thread.progress_signal.connect(self.progress_bar.setValue)
+        self.package_thread.phase_signal.connect(self.update_progress_phase)
+        self.package_thread.resources_signal.connect(self.update_resource_usage)
+        self.package_thread.event_signal.connect(self.log_build_event)
         self.package_thread.finished_signal.connect(self.package_finished)
 
         # Update UI state
         self.execute_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setValue(0)
+        self.resource_label.clear()
 
         # Start thread
         self.package_thread.start()
         self.log_message("▶ Starting packaging process...")
 
-        # Simulate progress updates
-        self.progress_timer = self.startTimer(1000)
 
         # Auto-switch to log tab
         main_tab = self.findChild(QTabWidget)
@@ -1730,10 +2945,25 @@ class NuitkaPackager(QMainWindow):
                     main_tab.setCurrentIndex(i)
                     break
 
-    def timerEvent(self, event):
-        """Timer event for progress bar updates"""
-        if self.progress_bar.value() < 90:
-            self.progress_bar.setValue(self.progress_bar.value() + 5)
+    def log_build_event(self, event, info):
+        """Log a build event of the main build"""
+        message = describe_build_event(event, info)
+        if message:
+            self.log_message(message)
+
+    def update_progress_phase(self, phase, eta):
+        """Show build phase, percentage and ETA next to the progress bar"""
+        text = f"{PHASE_LABELS.get(phase, phase)} · {self.progress_bar.value()}%"
+        if eta >= 0 and phase != "done":
+            text += f" · ETA {format_duration(eta)}"
+        self.progress_label.setText(text)
+
+    def update_resource_usage(self, sample):
+        """Show CPU, memory and I/O of the build process tree next to the progress bar"""
+        self.resource_label.setText(
+            f"CPU {sample['cpu_percent']:.0f}% · RSS {format_size(sample['rss'])} (peak {format_size(sample['peak_rss'])}) · "
+            f"I/O {format_size(sample['read_bytes'])} read, {format_size(sample['write_bytes'])} written"
+        )
 
     def stop_package(self):
         """Stop packaging process"""
@@ -1751,28 +2981,39 @@ class NuitkaPackager(QMainWindow):
             # Reset button state immediately
             self.execute_btn.setEnabled(True)
             self.progress_bar.setValue(0)
-
-            # Stop progress updates
-            if hasattr(self, 'progress_timer'):
-                self.killTimer(self.progress_timer)
+            self.progress_label.clear()
 
     def package_finished(self, success):
         """Handle packaging completion"""
+        # Ignore the completion of a build cancelled by a newer one
+        if self.sender() is not self.package_thread:
+            return
+
         # Always update UI state
         self.execute_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
+        self.update_artifact_cache_stats()
+        self.update_ccache_status()
 
         # Complete progress bar
         self.progress_bar.setValue(100 if success else 0)
 
-        # Stop progress updates
-        if hasattr(self, 'progress_timer'):
-            self.killTimer(self.progress_timer)
 
         if success:
             self.log_message("✅ Packaging completed successfully!")
             self.log_message(f"Output directory: {self.output_dir}")
 
+            # Show what the standalone folder consists of
+            if self.standalone_check.isChecked():
+                self.analyze_dist_size()
+            # Measure the startup of the new program
+            if self.benchmark_auto_check.isChecked():
+                self.run_benchmark()
+
+            # Automatic rebuilds should not interrupt editing with a dialog
+            if self.watch_btn.isChecked():
+                return
+
             # Ask to open output directory
             msg_box = QMessageBox(QMessageBox.Question,  # Explicitly set icon
                                   "Packaging Success",
@@ -1787,15 +3028,1379 @@ class NuitkaPackager(QMainWindow):
         else:
             self.log_message("❌ Errors occurred during packaging, check log")
 
+    def toggle_watch(self, enabled):
+        """Start or stop rebuilding automatically when sources change"""
+        if not enabled:
+            self.stop_watch()
+            return
+        if not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select main file")
+            self.watch_btn.setChecked(False)
+            return
+
+        command = self.command_edit.toPlainText().split()
+        data_dirs = [
+            spec.split("=", 1)[0]
+            for spec in option_values(command, "--include-data-dir") + option_values(command, "--include-raw-dir")
+        ]
+        self.source_watcher = SourceWatcher(
+            self.main_file,
+            self.sources_changed.emit,
+            data_dirs=data_dirs,
+            output_dir=self.output_dir or None,
+        )
+        self.source_watcher.start()
+        self.log_message(f"👁 Watch mode: watching {', '.join(self.source_watcher.roots)} ({self.source_watcher.backend})")
+
+        if not (self.package_thread and self.package_thread.isRunning()):
+            self.execute_package()
+
+    def stop_watch(self):
+        """Stop watching the project sources"""
+        if self.source_watcher:
+            self.source_watcher.stop()
+            self.source_watcher = None
+            self.log_message("👁 Watch mode stopped")
+        self.rebuild_pending = False
+
+    def rebuild_on_change(self, paths):
+        """Cancel any running build and rebuild after a settled source change"""
+        if not self.source_watcher:
+            return
+        names = ", ".join(os.path.basename(path) for path in paths[:5])
+        more = f" (+{len(paths) - 5} more)" if len(paths) > 5 else ""
+        self.log_message(f"🔁 Sources changed: {names}{more}")
+
+        if self.package_thread and self.package_thread.isRunning():
+            self.log_message("⏹ Cancelling the running build")
+            self.stop_package()
+        if self.preflight_task and self.preflight_task.isRunning():
+            self.rebuild_pending = True
+            self.log_message("🔁 Rebuilding once the pre-flight checks finish")
+            return
+        self.execute_package()
+
     def clear_log(self):
         """Clear log"""
-        self.log_edit.clear()
+        self.log_view.clear()
         self.log_message("Log cleared")
         self.progress_bar.setValue(0)
+        self.progress_label.clear()
+
+    def enqueue_current_command(self):
+        """Snapshot the current command into the build queue"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+
+        name = os.path.basename(self.main_file)
+        if self.onefile_check.isChecked():
+            name += " (onefile)"
+        elif self.standalone_check.isChecked():
+            name += " (standalone)"
+        self.enqueue_command(name, self.command_edit.toPlainText().split(), toolchain_variables(self.collect_config()))
+        self.pump_queue()
+
+    def enqueue_command(self, name, command, env=None):
+        """Add a command to the build queue and return its job
+
+        ``env`` holds environment variables of this build only.
+        """
+        job = self.scheduler.enqueue(name, command, env)
+
+        log_view = LogView()
+        log_view.setObjectName("log_view")
+        log_view.setFont(QFont("Consolas", 9))
+        self.queue_logs[job.id] = log_view
+        self.queue_log_stack.addWidget(log_view)
+
+        self.queue_table.insertRow(self.queue_table.rowCount())
+        self.update_queue_row(job)
+        self.log_message(f"➕ Queued build #{job.id}: {job.name}")
+        return job
+
+    def toggle_queue(self, running):
+        """Start or pause launching queued builds"""
+        self.queue_run_btn.setText("Pause Queue" if running else "Start Queue")
+        if running:
+            self.pump_queue()
+
+    def update_core_budget(self, value):
+        """Apply a new core budget to the scheduler"""
+        self.scheduler.core_budget = value
+        self.pump_queue()
+
+    def pump_queue(self):
+        """Launch queued builds while the core budget allows"""
+        if not self.queue_run_btn.isChecked():
+            return
+
+        for job in self.scheduler.next_launches():
+            self.start_queue_thread(job, self.create_package_thread(job.launch_command, job.name, job.env))
+            self.log_message(f"▶ Started queued build #{job.id} ({job.name}) with --jobs={job.jobs}")
+
+    def start_queue_thread(self, job, thread):
+        """Connect a queue job's thread and start it"""
+        thread.job_id = job.id
+        thread.log_signal.connect(self.append_queue_message)
+        thread.log_batch_signal.connect(self.append_queue_log)
+        thread.progress_signal.connect(self.update_queue_progress)
+        thread.phase_signal.connect(self.update_queue_phase)
+        thread.event_signal.connect(self.append_queue_event)
+        thread.finished_signal.connect(self.queue_job_finished)
+        self.queue_threads[job.id] = thread
+        thread.start()
+        self.update_queue_row(job)
+
+    def daemon_builds_enabled(self):
+        """Whether new builds run in the build daemon"""
+        return daemon_supported() and self.daemon_check.isChecked()
+
+    def update_daemon_settings(self):
+        """Persist the build daemon setting"""
+        self.settings.setValue("daemon_builds", self.daemon_check.isChecked())
+        if self.daemon_check.isChecked():
+            self.attach_daemon_jobs()
+
+    def daemon_argv(self):
+        """Command line starting the build daemon"""
+        return [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "main_cli.py"), "--daemon"]
+
+    def attach_daemon_jobs(self):
+        """Follow the builds of the build daemon in the build queue"""
+        if not self.daemon_builds_enabled():
+            return
+        try:
+            jobs = DaemonClient().jobs()
+        except DaemonError:
+            # No daemon running
+            return
+        followed = {job.daemon_id for job in self.scheduler.jobs}
+        followed.update(thread.daemon_job for thread in self.running_threads() if isinstance(thread, DaemonBuildThread))
+        jobs = [daemon_job for daemon_job in jobs if daemon_job["id"] not in followed]
+        for daemon_job in jobs:
+            job = self.enqueue_command(daemon_job["name"], daemon_job["command"])
+            jobs_option = option_value(daemon_job["command"], "--jobs")
+            self.scheduler.adopt(job, int(jobs_option) if jobs_option and jobs_option.isdigit() else 1)
+            job.daemon_id = daemon_job["id"]
+            self.start_queue_thread(
+                job, DaemonBuildThread(self.daemon_argv(), job.name, job.command, daemon_job=daemon_job["id"])
+            )
+        if jobs:
+            self.log_message(f"🔌 Following {len(jobs)} builds of the build daemon")
+
+    def detach_daemon_threads(self, threads):
+        """Stop following daemon builds; they keep running"""
+        for thread in threads:
+            thread.detach()
+        for thread in threads:
+            thread.wait(1000)
+
+    def _sender_job(self):
+        """Return the queue job of the PackageThread that emitted the current signal"""
+        return self.scheduler.get(getattr(self.sender(), "job_id", None))
+
+    def append_queue_log(self, lines):
+        """Append build output to the log of the emitting queue job"""
+        job = self._sender_job()
+        if job:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.queue_logs[job.id].append_lines([f"[{timestamp}] {line}" for line in lines])
+
+    def append_queue_message(self, message):
+        """Append a message to the log of the emitting queue job"""
+        job = self._sender_job()
+        if job:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.queue_logs[job.id].append_lines([f"[{timestamp}] {message}"])
+
+    def append_queue_event(self, event, info):
+        """Log a build event of the emitting queue job"""
+        message = describe_build_event(event, info)
+        if message:
+            self.append_queue_message(message)
+
+    def update_queue_progress(self, percent):
+        """Record progress of the emitting queue job"""
+        job = self._sender_job()
+        if job:
+            job.percent = percent
+            self.update_queue_row(job)
+
+    def update_queue_phase(self, phase, eta):
+        """Record the build phase of the emitting queue job"""
+        job = self._sender_job()
+        if job:
+            job.phase = PHASE_LABELS.get(phase, phase)
+            if eta >= 0 and phase != "done":
+                job.phase += f" · {format_duration(eta)}"
+            self.update_queue_row(job)
+
+    def queue_job_finished(self, success):
+        """Handle completion of a queued build"""
+        job = self._sender_job()
+        if not job:
+            return
+        self.scheduler.finish(job, success)
+        thread = self.queue_threads.pop(job.id, None)
+        if isinstance(thread, DaemonBuildThread):
+            # Known once the daemon thread has submitted the build
+            job.daemon_id = thread.daemon_job
+        self.update_artifact_cache_stats()
+        self.update_ccache_status()
+        if job.status == SUCCEEDED:
+            job.percent = 100
+            self.log_message(f"✅ Queued build #{job.id} ({job.name}) succeeded")
+        else:
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.log_message(f"❌ Queued build #{job.id} ({job.name}) {status}")
+        self.update_queue_row(job)
+        self.variant_build_finished(job)
+        self.sweep_build_finished(job)
+        self.compiler_build_finished(job)
+
+        self.pump_queue()
+        if not self.scheduler.running and not self.scheduler.queued:
+            self.log_message("🏁 Build queue finished")
+
+    def update_queue_row(self, job):
+        """Refresh the table row of a queue job"""
+        row = self.scheduler.jobs.index(job)
+        values = [
+            f"#{job.id} {job.name}",
+            QUEUE_STATUS_LABELS[job.status],
+            str(job.jobs or "-"),
+            f"{job.percent}%",
+            job.phase,
+        ]
+        for column, value in enumerate(values):
+            item = self.queue_table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem()
+                self.queue_table.setItem(row, column, item)
+            item.setText(value)
+
+    def cancel_queue_job(self):
+        """Cancel the selected queue job"""
+        rows = self.queue_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        job = self.scheduler.jobs[rows[0].row()]
+        self.scheduler.cancel(job)
+        thread = self.queue_threads.get(job.id)
+        if thread and thread.isRunning():
+            thread.stop()
+        self.update_queue_row(job)
+
+    def remove_finished_jobs(self):
+        """Drop finished jobs and their logs from the queue"""
+        for job in self.scheduler.remove_finished():
+            if job.daemon_id is not None:
+                try:
+                    DaemonClient().remove(job.daemon_id)
+                except DaemonError:
+                    pass
+            log_view = self.queue_logs.pop(job.id)
+            self.queue_log_stack.removeWidget(log_view)
+            log_view.close_buffer()
+            log_view.deleteLater()
+
+        self.queue_table.setRowCount(len(self.scheduler.jobs))
+        for job in self.scheduler.jobs:
+            self.update_queue_row(job)
+
+    def show_queue_job_log(self):
+        """Show the log of the selected queue job"""
+        rows = self.queue_table.selectionModel().selectedRows()
+        if rows:
+            job = self.scheduler.jobs[rows[0].row()]
+            self.queue_log_stack.setCurrentWidget(self.queue_logs[job.id])
+
+    def build_artifact_cache(self):
+        """Return the artifact cache for new builds, or None when disabled"""
+        return self.artifact_cache if self.artifact_cache_check.isChecked() else None
+
+    def update_artifact_cache_settings(self):
+        """Persist artifact cache settings"""
+        self.settings.setValue("artifact_cache_enabled", self.artifact_cache_check.isChecked())
+        self.settings.setValue("artifact_cache_max_gb", self.artifact_cache_size_spin.value())
+        self.artifact_cache.max_bytes = self.artifact_cache_size_spin.value() * 1024 ** 3
+
+    def update_artifact_cache_stats(self):
+        """Show artifact cache size and hit counts"""
+        entries, size, hits, misses = self.artifact_cache.stats()
+        self.artifact_cache_stats_label.setText(f"{entries} entries · {size / 1024 ** 2:,.1f} MB · {hits} hits / {misses} misses")
+
+    def clear_artifact_cache(self):
+        """Remove all cached build artifacts"""
+        self.artifact_cache.clear()
+        self.update_artifact_cache_stats()
+        self.log_message("🗑 Artifact cache cleared")
+
+    def select_ccache_dir(self):
+        """Select the ccache directory"""
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "Select ccache Directory", "", QFileDialog.ShowDirsOnly
+        )
+        if dir_path:
+            self.ccache_dir_input.setText(dir_path)
+            self.update_ccache_settings()
+
+    def build_environment(self, variables=None):
+        """Return the environment for new builds, or None to inherit it
+
+        ``variables`` (such as the compiler and linker, see
+        toolchain_variables) are set on top.
+        """
+        env = None
+        nuitka_cache = self.build_nuitka_cache()
+        if nuitka_cache is not None:
+            env = nuitka_cache.environment()
+        if self.build_ccache() is not None:
+            env = self.ccache.environment(env)
+        if variables:
+            env = dict(os.environ if env is None else env, **variables)
+        return env
+
+    def refresh_toolchain(self, refresh=False):
+        """Detect compilers, linkers and ccache in the background"""
+        self.toolchain_refresh_btn.setEnabled(False)
+        task = BackgroundTask(detect_toolchain, refresh, parent=self)
+        task.result_signal.connect(self.populate_toolchain)
+        task.error_signal.connect(lambda message: self.log_message(f"⚠️ Toolchain detection failed: {message}"))
+        task.finished.connect(lambda: self.toolchain_refresh_btn.setEnabled(True))
+        task.finished.connect(task.deleteLater)
+        task.start()
+
+    def populate_toolchain(self, toolchain):
+        """Fill the compiler and linker lists, keeping the selection"""
+        if toolchain is None:
+            return
+        self.toolchain = toolchain
+        compiler, linker = self.compiler_combo.currentData(), self.linker_combo.currentData()
+        for combo in (self.compiler_combo, self.linker_combo):
+            combo.blockSignals(True)
+            while combo.count() > 1:
+                combo.removeItem(1)
+        for entry in toolchain["compilers"]:
+            family = COMPILER_FAMILY_LABELS[entry["family"]]
+            self.compiler_combo.addItem(
+                f"{entry['name']}  —  {family} {entry['version'] or '?'} · {entry['path']}", entry["path"]
+            )
+        for entry in toolchain["linkers"]:
+            default = " (default)" if entry["name"] == toolchain["default_linker"] else ""
+            self.linker_combo.addItem(
+                f"{entry['name']}{default}  —  {entry['version'] or '?'} · {entry['path']}", entry["name"]
+            )
+        self.select_toolchain(compiler, linker)
+        for combo in (self.compiler_combo, self.linker_combo):
+            combo.blockSignals(False)
+        self.show_toolchain_status(toolchain)
+
+    def select_toolchain(self, compiler, linker):
+        """Select a compiler path and linker name, listing them if not found"""
+        for combo, value in ((self.compiler_combo, compiler), (self.linker_combo, linker)):
+            index = combo.findData(value)
+            if index < 0:
+                combo.addItem(f"{value} (not found)", value)
+                index = combo.count() - 1
+            combo.setCurrentIndex(index)
+
+    def show_toolchain_status(self, toolchain):
+        """Describe the detected toolchain below the lists"""
+        lines = [f"{len(toolchain['compilers'])} compilers and {len(toolchain['linkers'])} linkers found on PATH"]
+        ccache = toolchain["ccache"]
+        if ccache is None:
+            lines.append("ccache not found")
+        else:
+            wrappers = f"; compiler wrappers in {', '.join(ccache['wrappers'])}" if ccache["wrappers"] else ""
+            lines.append(f"ccache {ccache['version'] or '?'}: {ccache['path']}{wrappers}")
+        self.toolchain_status_label.setText("\n".join(lines))
+
+    def create_package_thread(self, command, name=None, variables=None):
+        """Create a packaging thread using the configured caches and build environment"""
+        if self.daemon_builds_enabled():
+            options = job_options(
+                self.build_environment(variables),
+                os.getcwd(),
+                self.build_artifact_cache(),
+                self.build_ccache(),
+                self.build_nuitka_cache(),
+                history=True,
+                governor=self.build_memory_governor(),
+                warm_dirs=self.build_warm_dirs(),
+            )
+            thread = DaemonBuildThread(self.daemon_argv(), name or os.path.basename(command[-1]), command, options)
+        else:
+            thread = PackageThread(
+                command,
+                self.build_artifact_cache(),
+                self.build_environment(variables),
+                self.build_ccache(),
+                self.build_nuitka_cache(),
+                self.history,
+                governor=self.build_memory_governor(),
+                warm_dirs=self.build_warm_dirs(),
+            )
+        thread.event_signal.connect(self.update_nuitka_cache_from_event)
+        thread.event_signal.connect(self.update_warm_build_from_event)
+        thread.event_signal.connect(self.update_history_from_event)
+        thread.event_signal.connect(self.update_compile_cost_from_event)
+        return thread
+
+    def build_memory_governor(self):
+        """Return the memory governor for a new build, or None when disabled"""
+        if not self.memory_governor_check.isChecked() or read_meminfo() is None:
+            return None
+        return MemoryGovernor(
+            reserve=self.memory_reserve_spin.value() * 1024 ** 3,
+            pause_below=self.pause_below_spin.value() * 1024 ** 2,
+            low_memory=self.low_memory_fallback_check.isChecked(),
+            pause=self.pause_compilers_check.isChecked(),
+        )
+
+    def update_memory_governor_settings(self):
+        """Persist memory governor settings and show the available memory"""
+        self.settings.setValue("memory_governor_enabled", self.memory_governor_check.isChecked())
+        self.settings.setValue("memory_low_memory_fallback", self.low_memory_fallback_check.isChecked())
+        self.settings.setValue("memory_pause_compilers", self.pause_compilers_check.isChecked())
+        self.settings.setValue("memory_reserve_gb", self.memory_reserve_spin.value())
+        self.settings.setValue("memory_pause_below_mb", self.pause_below_spin.value())
+        info = read_meminfo()
+        if info is None:
+            self.memory_governor_check.setEnabled(False)
+            self.memory_status_label.setText("Needs /proc/meminfo (Linux)")
+            return
+        self.memory_status_label.setText(f"Available memory: {format_size(info['MemAvailable'])} of {format_size(info['MemTotal'])}")
+        enabled = self.memory_governor_check.isChecked()
+        for widget in (self.low_memory_fallback_check, self.pause_compilers_check, self.memory_reserve_spin,
+                       self.pause_below_spin):
+            widget.setEnabled(enabled)
+
+    def build_nuitka_cache(self):
+        """Return the managed Nuitka cache for new builds, or None when disabled"""
+        if not self.nuitka_cache_check.isChecked():
+            return None
+        return NuitkaCache.for_profile(profile_name(self.profile_path), self.nuitka_cache_quota_spin.value() * 1024 ** 3)
+
+    def update_nuitka_cache_settings(self):
+        """Persist Nuitka cache settings"""
+        self.settings.setValue("nuitka_cache_managed", self.nuitka_cache_check.isChecked())
+        self.settings.setValue("nuitka_cache_quota_gb", self.nuitka_cache_quota_spin.value())
+        self.refresh_nuitka_cache_sizes()
+
+    def refresh_nuitka_cache_sizes(self):
+        """Measure the managed Nuitka cache in the background"""
+        cache = self.build_nuitka_cache()
+        for widget in (self.nuitka_cache_quota_spin, self.nuitka_cache_refresh_btn):
+            widget.setEnabled(cache is not None)
+        if cache is None:
+            self.nuitka_cache_dir_label.clear()
+            self.nuitka_cache_sizes_label.clear()
+            return
+        if self.nuitka_cache_task and self.nuitka_cache_task.isRunning():
+            return
+
+        self.nuitka_cache_dir_label.setText(f"Directory: {cache.root}")
+        self.nuitka_cache_sizes_label.setText("Measuring...")
+        self.nuitka_cache_task = BackgroundTask(cache.sizes)
+        self.nuitka_cache_task.result_signal.connect(self.show_nuitka_cache_sizes)
+        self.nuitka_cache_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ Failed to measure Nuitka cache: {message}")
+        )
+        self.nuitka_cache_task.start()
+
+    def build_warm_dirs(self):
+        """Return the warm build directories for new builds, or None when disabled"""
+        if not self.warm_build_check.isChecked():
+            return None
+        return WarmBuildDirs.for_profile(profile_name(self.profile_path), self.clean_build_check.isChecked())
+
+    def update_warm_build_settings(self):
+        """Persist warm build directory settings"""
+        self.settings.setValue("warm_build_dirs", self.warm_build_check.isChecked())
+        self.refresh_warm_build_dirs()
+
+    def refresh_warm_build_dirs(self):
+        """Measure the warm build directories of the profile in the background"""
+        warm_dirs = self.build_warm_dirs()
+        for widget in (self.clean_build_check, self.warm_build_refresh_btn, self.warm_build_delete_btn):
+            widget.setEnabled(warm_dirs is not None)
+        if warm_dirs is None:
+            self.warm_build_dir_label.clear()
+            self.warm_build_sizes_label.clear()
+            return
+        if self.warm_build_task and self.warm_build_task.isRunning():
+            return
+
+        self.warm_build_dir_label.setText(f"Directory: {warm_dirs.root}")
+        self.warm_build_sizes_label.setText("Measuring...")
+        self.warm_build_task = BackgroundTask(warm_dirs.directories)
+        self.warm_build_task.result_signal.connect(self.show_warm_build_dirs)
+        self.warm_build_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ Failed to measure the warm build directories: {message}")
+        )
+        self.warm_build_task.start()
+
+    def refresh_history(self):
+        """Reload the build history and its project list"""
+        project = self.history_project_combo.currentData()
+        self.history_project_combo.blockSignals(True)
+        self.history_project_combo.clear()
+        self.history_project_combo.addItem("All projects", None)
+        for path in self.history.projects():
+            self.history_project_combo.addItem(path, path)
+        self.history_project_combo.setCurrentIndex(max(0, self.history_project_combo.findData(project)))
+        self.history_project_combo.blockSignals(False)
+        self.history_model.set_project(self.history_project_combo.currentData())
+        self.show_history_trends()
+
+    def select_history_project(self, index):
+        """Show the builds of the project chosen in the History tab"""
+        self.history_model.set_project(self.history_project_combo.itemData(index))
+        self.show_history_trends()
+
+    def show_history_trends(self, *args):
+        """Plot the trends of the selected project"""
+        project = self.history_project_combo.currentData()
+        current = self.history_view.currentIndex()
+        if project is None and current.isValid():
+            project = self.history_model.build(current.row())["project"]
+        if project is None and self.main_file:
+            project = os.path.abspath(self.main_file)
+        trend = self.history.trend(project) if project else []
+        self.duration_chart.set_values([duration for _, duration, _, _ in trend])
+        self.size_chart.set_values([size for _, _, size, _ in trend])
+        self.memory_chart.set_values([peak_rss for _, _, _, peak_rss in trend])
+
+    def analyze_dist_size(self):
+        """Measure the .dist folders of the output directory in the background"""
+        if not self.output_dir:
+            QMessageBox.warning(self, "Missing Configuration", "Select output directory")
+            return
+        if self.dist_size_task and self.dist_size_task.isRunning():
+            return
+        command = build_command(self.collect_config()) if self.python_path and self.main_file else None
+        self.dist_analyze_btn.setEnabled(False)
+        self.dist_summary_label.setText("Scanning...")
+        self.dist_size_task = BackgroundTask(analyze_output_dir, self.output_dir, command)
+        self.dist_size_task.result_signal.connect(self.show_dist_reports)
+        self.dist_size_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ Failed to analyze output folder: {message}")
+        )
+        self.dist_size_task.finished.connect(lambda: self.dist_analyze_btn.setEnabled(True))
+        self.dist_size_task.start()
+
+    def show_dist_reports(self, reports):
+        """List the analyzed dist folders, preferring the one of the main file"""
+        self.dist_reports = reports
+        self.dist_combo.blockSignals(True)
+        self.dist_combo.clear()
+        for report in reports:
+            self.dist_combo.addItem(os.path.basename(report["root"]))
+        if self.main_file:
+            index = self.dist_combo.findText(os.path.splitext(os.path.basename(self.main_file))[0] + ".dist")
+            self.dist_combo.setCurrentIndex(max(0, index))
+        self.dist_combo.blockSignals(False)
+        self.show_dist_report()
+
+    def show_dist_report(self, *args):
+        """Show the breakdown and suggestions of the selected dist folder"""
+        index = self.dist_combo.currentIndex()
+        if not 0 <= index < len(self.dist_reports):
+            self.dist_package_model.set_rows([], 0)
+            self.dist_library_model.set_rows([], 0)
+            self.dist_suggestions_table.setRowCount(0)
+            if self.output_dir:
+                self.dist_summary_label.setText(f"No .dist folder in {self.output_dir}")
+            return
+        report = self.dist_reports[index]
+        self.dist_package_model.set_rows(report["contributors"], report["size"])
+        self.dist_library_model.set_rows(report["libraries"], report["size"])
+        model = self.dist_library_model if self.dist_view_combo.currentIndex() == 1 else self.dist_package_model
+        self.dist_view.setModel(model)
+        self.dist_view.sortByColumn(model.columns.index("size"), Qt.DescendingOrder)
+        self.dist_summary_label.setText(f"{report['files']} files, {format_size(report['size'])} (scanned in {report['seconds']:.1f} s)")
+
+        table = self.dist_suggestions_table
+        table.setRowCount(len(report["suggestions"]))
+        for row, suggestion in enumerate(report["suggestions"]):
+            cells = [
+                SUGGESTION_OPTIONS[suggestion["field"]],
+                suggestion["value"],
+                format_size(suggestion["size"]),
+                DIST_SUGGESTION_REASONS[suggestion["reason"]].format(subject=suggestion["subject"]),
+            ]
+            for column, text in enumerate(cells):
+                table.setItem(row, column, QTableWidgetItem(text))
+        table.resizeColumnsToContents()
+
+    def apply_dist_suggestions(self):
+        """Add the selected suggestions to their option fields"""
+        index = self.dist_combo.currentIndex()
+        if not 0 <= index < len(self.dist_reports):
+            return
+        suggestions = self.dist_reports[index]["suggestions"]
+        widgets = self._config_widgets()
+        for row in sorted({item.row() for item in self.dist_suggestions_table.selectedItems()}):
+            suggestion = suggestions[row]
+            widget = widgets[suggestion["field"]]
+            entries = split_list(widget.text())
+            if suggestion["value"] in entries:
+                continue
+            widget.setText(", ".join(entries + [suggestion["value"]]))
+            option = SUGGESTION_OPTIONS[suggestion["field"]]
+            self.log_message(f"Added {option}={suggestion['value']}, rebuild and test the program")
+
+    def scan_import_graph(self):
+        """Scan the import graph of the main file in the background"""
+        if not self.python_path:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter")
+            return
+        if not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select main file")
+            return
+        if self.import_task and self.import_task.isRunning():
+            return
+        config = self.collect_config()
+        self.import_stop.clear()
+        self.import_scan_btn.setEnabled(False)
+        self.import_summary_label.setText("Scanning...")
+        self.import_task = BackgroundTask(
+            scan_imports, self.python_path, self.main_file, config["standalone"] or config["follow_stdlib"],
+            split_list(config["nofollow_import"]), split_list(config["include_module"]),
+            split_list(config["include_package"]), config["plugins"], None, self.import_stop,
+        )
+        self.import_task.result_signal.connect(self.show_import_report)
+        self.import_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ Failed to scan imports: {message}")
+        )
+        self.import_task.finished.connect(lambda: self.import_scan_btn.setEnabled(True))
+        self.import_task.start()
+
+    def stop_import_scan(self):
+        """Stop a running import scan"""
+        self.import_stop.set()
+        if self.import_task and self.import_task.isRunning():
+            self.import_task.wait()
+
+    def show_import_report(self, report):
+        """Show the scanned import graph and its suggestions"""
+        self.import_report = report
+        totals = report["totals"]
+        count = sum(total["modules"] for kind, total in totals.items() if kind != "missing")
+        size = sum(total["size"] for total in totals.values())
+        parts = []
+        for kind in ("project", "third_party", "stdlib"):
+            total = totals.get(kind)
+            if total:
+                parts.append(f"{IMPORT_KIND_LABELS[kind].lower()}: {total['modules']} modules, {format_size(total['size'])}")
+        text = f"{count} modules, {format_size(size)}"
+        if parts:
+            text += " (" + "; ".join(parts) + ")"
+        missing = totals.get("missing", {}).get("modules", 0)
+        if missing:
+            text += f", {missing} not found"
+        text += f"; parsed {report['parsed']} of {report['files']} files in {report['seconds']:.1f} s"
+        self.import_summary_label.setText(text)
+        for entry in report["dynamic"]:
+            if entry["kind"] == "unknown":
+                self.log_message(f"⚠️ {entry['importer']}:{entry['line']} imports a computed module name Nuitka cannot follow")
+        for path, message in report["errors"]:
+            self.log_message(f"⚠️ Cannot parse {path}: {message}")
+
+        self.import_package_model.set_rows(report["packages"], size)
+        self.import_module_model.set_rows(report["modules"], size)
+        self.show_import_view()
+
+        table = self.import_suggestions_table
+        table.setRowCount(len(report["suggestions"]))
+        for row, suggestion in enumerate(report["suggestions"]):
+            cells = [
+                IMPORT_OPTIONS[suggestion["field"]],
+                suggestion["value"],
+                IMPORT_SUGGESTION_REASONS[suggestion["reason"]].format(subject=suggestion["subject"]),
+            ]
+            for column, text in enumerate(cells):
+                table.setItem(row, column, QTableWidgetItem(text))
+        table.resizeColumnsToContents()
+
+    def show_import_view(self, *args):
+        """Show the packages or modules of the scanned graph"""
+        model = self.import_module_model if self.import_view_combo.currentIndex() == 1 else self.import_package_model
+        self.import_view.setModel(model)
+        self.import_view.sortByColumn(model.columns.index("size"), Qt.DescendingOrder)
+
+    def apply_import_suggestions(self):
+        """Add the selected suggestions to their options"""
+        if not self.import_report:
+            return
+        suggestions = self.import_report["suggestions"]
+        widgets = self._config_widgets()
+        for row in sorted({item.row() for item in self.import_suggestions_table.selectedItems()}):
+            suggestion = suggestions[row]
+            if suggestion["field"] == "plugins":
+                text = f"--enable-plugin={suggestion['value']}"
+                if not self.plugins_list.findItems(text, Qt.MatchExactly):
+                    self.plugins_list.addItem(text)
+                item = self.plugins_list.findItems(text, Qt.MatchExactly)[0]
+                if item.isSelected():
+                    continue
+                item.setSelected(True)
+            else:
+                widget = widgets[suggestion["field"]]
+                entries = split_list(widget.text())
+                if suggestion["value"] in entries:
+                    continue
+                widget.setText(", ".join(entries + [suggestion["value"]]))
+            option = IMPORT_OPTIONS[suggestion["field"]]
+            self.log_message(f"Added {option}={suggestion['value']}, rebuild and test the program")
+
+    def run_benchmark(self):
+        """Benchmark the startup of the built program in the background"""
+        if self.benchmark_running():
+            return
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        caches = [cache for cache, check in (("warm", self.benchmark_warm_check), ("cold", self.benchmark_cold_check))
+                  if check.isChecked() and check.isEnabled()]
+        if not caches:
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        options["compare_python"] = self.benchmark_python_check.isChecked()
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.benchmark_table.setRowCount(0)
+        self.benchmark_summary_label.setText("Running...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ Benchmarking startup ({runs} runs per variant)...")
+        self.benchmark_task = BackgroundTask(
+            lambda command: startup_benchmark(
+                command, runs, caches, stop=self.benchmark_stop, on_result=self.benchmark_result.emit, **options
+            ),
+            build_command(self.collect_config()),
+        )
+        self.benchmark_task.result_signal.connect(self.benchmark_finished)
+        self.benchmark_task.error_signal.connect(self.benchmark_failed)
+        self.benchmark_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.benchmark_task.start()
+
+    def benchmark_options(self):
+        """Launch settings of the Benchmark tab, or None if the arguments do not parse"""
+        try:
+            arguments = shlex.split(self.benchmark_args_input.text())
+        except ValueError as e:
+            self.log_message(f"⚠️ Invalid benchmark arguments: {e}")
+            return None
+        return {
+            "arguments": arguments,
+            "ready_marker": self.benchmark_marker_input.text() or None,
+            "timeout": self.benchmark_timeout_spin.value(),
+        }
+
+    def benchmark_running(self):
+        tasks = (self.benchmark_task, self.comparison_task, self.sweep_task, self.compiler_task)
+        return any(task and task.isRunning() for task in tasks)
+
+    def set_benchmark_buttons(self, enabled):
+        """Enable the benchmark buttons while no benchmark runs"""
+        self.benchmark_run_btn.setEnabled(enabled)
+        self.comparison_measure_btn.setEnabled(enabled)
+        self.sweep_measure_btn.setEnabled(enabled)
+        self.compiler_measure_btn.setEnabled(enabled)
+        self.benchmark_stop_btn.setEnabled(not enabled)
+
+    def stop_benchmark(self):
+        """Stop a running benchmark after the current launch"""
+        self.benchmark_stop.set()
+        for task in (self.benchmark_task, self.comparison_task, self.sweep_task, self.compiler_task):
+            if task and task.isRunning():
+                task.wait()
+
+    def add_benchmark_row(self, result):
+        """Add one benchmark result to the table"""
+        row = self.benchmark_table.rowCount()
+        self.benchmark_table.insertRow(row)
+        cells = [
+            BENCHMARK_LABELS[result["target"]],
+            BENCHMARK_LABELS[result["cache"]],
+            f"{result['runs']}" + (f" (+{result['failures']} ✗)" if result["failures"] else ""),
+        ]
+        cells += ["-" if result[key] is None else format_latency(result[key]) for key in ("min", "median", "p95")]
+        cells.append("-" if result["peak_rss"] is None else format_size(result["peak_rss"]))
+        for column, text in enumerate(cells):
+            item = QTableWidgetItem(text)
+            if column >= 2:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.benchmark_table.setItem(row, column, item)
+
+    def benchmark_failed(self, message):
+        """Report a benchmark that could not run"""
+        self.benchmark_summary_label.clear()
+        self.log_message(f"⚠️ Startup benchmark failed: {message}")
+
+    def benchmark_finished(self, result):
+        """Report and record a finished benchmark"""
+        lines = []
+        for cache, name in (("warm", "warm"), ("cold", "cold")):
+            factor = speedup(result["results"], cache)
+            if factor is None:
+                continue
+            if factor >= 1:
+                lines.append(f"Compiled program starts {factor:.2f}× faster than CPython (median, {name} cache)")
+            else:
+                factor = 1 / factor
+                lines.append(f"Compiled program starts {factor:.2f}× slower than CPython (median, {name} cache)")
+        failures = sum(entry["failures"] for entry in result["results"])
+        if failures:
+            code = next(entry["exit_code"] for entry in reversed(result["results"]) if entry["failures"])
+            lines.append(f"⚠️ {failures} launches failed (last exit code {code})")
+        self.benchmark_summary_label.setText("\n".join(lines) or f"Startup of {result['executable']}")
+        for line in lines:
+            self.log_message(line)
+
+        build_id = self.history.latest_build(os.path.abspath(self.main_file))
+        if build_id is None:
+            self.log_message("Benchmark not stored: no successful build of this project in the history")
+            return
+        self.history.record_benchmark(build_id, result["results"], result["arguments"])
+        self.log_message(f"Benchmark stored with build #{build_id}")
+        self.history_model.refresh()
+
+    def build_variants(self):
+        """Queue standalone and onefile builds of the current configuration for comparison"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        if self.comparison_jobs:
+            return
+        self.comparison_commands = {}
+        name = os.path.basename(self.main_file)
+        for variant, config in variant_configs(self.collect_config()).items():
+            command = build_command(config)
+            job = self.enqueue_command(
+                f"{name} ({COMPARISON_HEADERS[VARIANTS.index(variant)]})", command, toolchain_variables(config)
+            )
+            self.comparison_jobs[job.id] = variant
+            self.comparison_commands[variant] = command
+        self.comparison_build_btn.setEnabled(False)
+        self.comparison_summary_label.setText("Building both variants...")
+        self.log_message("🔀 Queued standalone and onefile builds for comparison")
+        if self.queue_run_btn.isChecked():
+            self.pump_queue()
+        else:
+            # Starting the queue launches both builds
+            self.queue_run_btn.setChecked(True)
+
+    def variant_build_finished(self, job):
+        """Measure the variants once both comparison builds succeeded"""
+        variant = self.comparison_jobs.pop(job.id, None)
+        if variant is None:
+            return
+        if job.status != SUCCEEDED:
+            # The other build may still run; its result is ignored
+            self.comparison_jobs.clear()
+            self.comparison_build_btn.setEnabled(True)
+            variant = COMPARISON_HEADERS[VARIANTS.index(variant)]
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.comparison_summary_label.setText(f"The {variant} build {status.lower()}, comparison abandoned")
+            return
+        if not self.comparison_jobs:
+            self.comparison_build_btn.setEnabled(True)
+            self.measure_variants(self.comparison_commands)
+
+    def compare_built_variants(self):
+        """Compare the variants already built from the current configuration"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        configs = variant_configs(self.collect_config())
+        self.measure_variants({variant: build_command(config) for variant, config in configs.items()})
+
+    def measure_variants(self, commands):
+        """Measure built variants in the background"""
+        if self.benchmark_running():
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.comparison_table.clearContents()
+        self.comparison_summary_label.setText("Measuring...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ Comparing onefile and standalone ({runs} runs per launch mode)...")
+        self.comparison_task = BackgroundTask(
+            lambda: compare_variants(commands, runs, stop=self.benchmark_stop, **options)
+        )
+        self.comparison_task.result_signal.connect(self.show_comparison)
+        self.comparison_task.error_signal.connect(self.comparison_failed)
+        self.comparison_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.comparison_task.start()
+
+    def comparison_failed(self, message):
+        """Report a comparison that could not run"""
+        self.comparison_summary_label.clear()
+        self.log_message(f"⚠️ Onefile / standalone comparison failed: {message}")
+
+    def show_comparison(self, comparison):
+        """Show a finished onefile / standalone comparison side by side"""
+
+        def latency(result):
+            return "-" if not result or result["median"] is None else format_latency(result["median"])
+
+        def size(value):
+            return "-" if value is None else format_size(value)
+
+        for column, variant in enumerate(VARIANTS):
+            entry = comparison[variant]
+            repeat = entry["repeat_launch"]
+            cells = [
+                size(entry["size"]),
+                latency(entry["first_launch"]),
+                latency(repeat),
+                size(repeat["peak_rss"] if repeat else None),
+                size(entry["extraction"]),
+                size(entry["extraction_left"]),
+            ]
+            for row, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.comparison_table.setItem(row, column, item)
+
+        standalone, onefile = comparison["standalone"], comparison["onefile"]
+        lines = []
+        if onefile["size"]:
+            ratio = standalone["size"] / onefile["size"]
+            lines.append(f"Onefile is {ratio:.1f}× smaller on disk ({format_size(onefile['size'])} vs {format_size(standalone['size'])})" if ratio >= 1 else f"Onefile is {1 / ratio:.1f}× larger on disk ({format_size(onefile['size'])} vs {format_size(standalone['size'])})")
+        for key, name in (("first_launch", "first launch"), ("repeat_launch", "repeated launch")):
+            base, other = standalone[key], onefile[key]
+            if base and other and base["median"] is not None and other["median"] is not None:
+                delta = (other["median"] - base["median"]) * 1000
+                lines.append(f"Onefile {name}: {delta:+.1f} ms ({format_latency(other['median'])} vs {format_latency(base['median'])})")
+        if onefile["extraction_left"]:
+            lines.append(f"Onefile leaves {format_size(onefile['extraction_left'])} in the temp directory (cached extraction)")
+        elif onefile["extraction"]:
+            lines.append(f"Onefile unpacks {format_size(onefile['extraction'])} into the temp directory on every launch")
+        self.comparison_summary_label.setText("\n".join(lines))
+        for line in lines:
+            self.log_message(line)
+
+    def build_sweep(self):
+        """Queue one onefile build per payload compression setting"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        if self.sweep_jobs:
+            return
+        config = self.collect_config()
+        self.sweep_commands = sweep_commands(config)
+        name = os.path.basename(self.main_file)
+        for setting, command in self.sweep_commands.items():
+            job = self.enqueue_command(f"{name} ({setting})", command, toolchain_variables(config))
+            self.sweep_jobs[job.id] = setting
+        self.sweep_build_btn.setEnabled(False)
+        self.sweep_summary_label.setText(f"Building {len(SETTINGS)} onefile programs...")
+        self.log_message("🗜️ Queued one onefile build per compression setting")
+        if self.queue_run_btn.isChecked():
+            self.pump_queue()
+        else:
+            # Starting the queue launches the builds
+            self.queue_run_btn.setChecked(True)
+
+    def sweep_build_finished(self, job):
+        """Measure the settings once all sweep builds succeeded"""
+        setting = self.sweep_jobs.pop(job.id, None)
+        if setting is None:
+            return
+        if job.status != SUCCEEDED:
+            # Builds still running are ignored
+            self.sweep_jobs.clear()
+            self.sweep_build_btn.setEnabled(True)
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.sweep_summary_label.setText(f"The {setting} build {status.lower()}, sweep abandoned")
+            return
+        if not self.sweep_jobs:
+            self.sweep_build_btn.setEnabled(True)
+            self.measure_sweep(self.sweep_commands)
+
+    def sweep_existing_builds(self):
+        """Sweep the settings already built from the current configuration"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        self.measure_sweep(sweep_commands(self.collect_config()))
+
+    def measure_sweep(self, commands):
+        """Measure built compression settings in the background"""
+        if self.benchmark_running():
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.sweep_table.setRowCount(0)
+        self.level_table.setRowCount(0)
+        self.sweep_recommended = None
+        self.sweep_apply_btn.setEnabled(False)
+        self.sweep_summary_label.setText("Measuring...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ Sweeping onefile compression settings ({runs} runs per launch mode)...")
+        self.sweep_task = BackgroundTask(lambda: sweep(commands, runs, stop=self.benchmark_stop, **options))
+        self.sweep_task.result_signal.connect(self.show_sweep)
+        self.sweep_task.error_signal.connect(self.sweep_failed)
+        self.sweep_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.sweep_task.start()
+
+    def sweep_failed(self, message):
+        """Report a sweep that could not run"""
+        self.sweep_summary_label.clear()
+        self.log_message(f"⚠️ Compression sweep failed: {message}")
+
+    def show_sweep(self, result):
+        """Show the measured settings and the level estimates"""
+
+        def latency(measured):
+            return "-" if not measured or measured["median"] is None else format_latency(measured["median"])
+
+        recommended = result["recommended"]
+        self.sweep_table.setRowCount(len(result["settings"]))
+        for row, (setting, measured) in enumerate(result["settings"].items()):
+            label = SWEEP_LABELS[setting] + (" (recommended)" if setting == recommended else "")
+            cells = [
+                label,
+                format_size(measured["size"]),
+                latency(measured["first_launch"]),
+                latency(measured["repeat_launch"]),
+                "-" if measured["extraction"] is None else format_size(measured["extraction"]),
+                "✓" if setting in result["pareto"] else "",
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column == len(cells) - 1:
+                    item.setTextAlignment(Qt.AlignCenter)
+                elif column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.sweep_table.setItem(row, column, item)
+
+        self.level_table.setRowCount(len(result["levels"]))
+        for row, estimate in enumerate(result["levels"]):
+            cells = [
+                str(estimate["level"]),
+                format_size(estimate["size"]),
+                format_latency(estimate["compress_seconds"]),
+                format_latency(estimate["decompress_seconds"]),
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.level_table.setItem(row, column, item)
+
+        self.sweep_recommended = recommended
+        self.sweep_apply_btn.setEnabled(recommended is not None)
+        summary = f"Recommended: {SWEEP_LABELS[recommended]}, Pareto-optimal: {', '.join(SWEEP_LABELS[setting] for setting in result['pareto'])}" if recommended else "No setting could be launched"
+        self.sweep_summary_label.setText(summary)
+        self.log_message(summary)
+
+    def apply_recommended_compression(self):
+        """Apply the recommended compression setting to the Onefile options"""
+        if self.sweep_recommended is None:
+            return
+        setting = SETTING_CONFIG[self.sweep_recommended]
+        self.onefile_check.setChecked(True)
+        self.onefile_no_compression_check.setChecked(setting["onefile_no_compression"])
+        self.onefile_as_archive_check.setChecked(setting["onefile_as_archive"])
+        self.low_memory_check.setChecked(setting["low_memory"])
+        self.log_message(f"🗜️ Applied compression setting: {SWEEP_LABELS[self.sweep_recommended]}")
+
+    def build_compilers(self):
+        """Queue one build of the current configuration per C compiler"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        if self.compiler_jobs:
+            return
+        if not self.toolchain or not self.toolchain["compilers"]:
+            QMessageBox.warning(self, "No C Compiler", "No C compiler was found on PATH")
+            return
+        self.compiler_commands = {}
+        name = os.path.basename(self.main_file)
+        for compiler, config in compiler_configs(self.collect_config(), self.toolchain["compilers"]).items():
+            command = build_command(config)
+            job = self.enqueue_command(f"{name} ({compiler})", command, toolchain_variables(config))
+            self.compiler_jobs[job.id] = compiler
+            self.compiler_commands[compiler] = command
+        self.compiler_build_btn.setEnabled(False)
+        self.compiler_summary_label.setText(f"Building with {len(self.compiler_commands)} compilers...")
+        self.log_message("🛠️ Queued one build per C compiler")
+        if self.queue_run_btn.isChecked():
+            self.pump_queue()
+        else:
+            # Starting the queue launches the builds
+            self.queue_run_btn.setChecked(True)
+
+    def compiler_build_finished(self, job):
+        """Measure the programs once all compiler builds succeeded"""
+        compiler = self.compiler_jobs.pop(job.id, None)
+        if compiler is None:
+            return
+        if job.status != SUCCEEDED:
+            # Builds still running are ignored
+            self.compiler_jobs.clear()
+            self.compiler_build_btn.setEnabled(True)
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.compiler_summary_label.setText(f"The {compiler} build {status.lower()}, comparison abandoned")
+            return
+        if not self.compiler_jobs:
+            self.compiler_build_btn.setEnabled(True)
+            self.measure_compilers(self.compiler_commands)
+
+    def compare_built_compilers(self):
+        """Compare the programs already built from the current configuration with each compiler"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        if not self.toolchain or not self.toolchain["compilers"]:
+            QMessageBox.warning(self, "No C Compiler", "No C compiler was found on PATH")
+            return
+        configs = compiler_configs(self.collect_config(), self.toolchain["compilers"])
+        self.measure_compilers({compiler: build_command(config) for compiler, config in configs.items()})
+
+    def measure_compilers(self, commands):
+        """Measure the programs built with each compiler in the background"""
+        if self.benchmark_running():
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.compiler_table.setRowCount(0)
+        self.compiler_summary_label.setText("Measuring...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ Comparing {len(commands)} C compilers ({runs} runs per launch mode)...")
+        self.compiler_task = BackgroundTask(
+            lambda: compare_compilers(commands, runs, stop=self.benchmark_stop, history=self.history, **options)
+        )
+        self.compiler_task.result_signal.connect(self.show_compilers)
+        self.compiler_task.error_signal.connect(self.compilers_failed)
+        self.compiler_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.compiler_task.start()
+
+    def compilers_failed(self, message):
+        """Report a compiler comparison that could not run"""
+        self.compiler_summary_label.clear()
+        self.log_message(f"⚠️ C compiler comparison failed: {message}")
+
+    def show_compilers(self, result):
+        """Show the compile time, size and launch times of each compiler"""
+
+        def latency(measured):
+            return "-" if not measured or measured["median"] is None else format_latency(measured["median"])
+
+        versions = {entry["name"]: entry["version"] for entry in (self.toolchain or {}).get("compilers", [])}
+        self.compiler_table.setRowCount(len(result))
+        for row, (compiler, measured) in enumerate(result.items()):
+            seconds = measured["compile_seconds"]
+            cells = [
+                compiler,
+                versions.get(compiler) or "?",
+                "-" if seconds is None else format_duration(seconds),
+                format_size(measured["size"]),
+                latency(measured["first_launch"]),
+                latency(measured["repeat_launch"]),
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column > 1:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.compiler_table.setItem(row, column, item)
+
+        lines = []
+        timed = {
+            compiler: measured["compile_seconds"] for compiler, measured in result.items() if measured["compile_seconds"]
+        }
+        if timed:
+            fastest = min(timed, key=timed.get)
+            lines.append(f"Fastest build: {fastest} ({format_duration(timed[fastest])})")
+        started = {
+            compiler: measured["repeat_launch"]["median"] for compiler, measured in result.items()
+            if measured["repeat_launch"] and measured["repeat_launch"]["median"] is not None
+        }
+        if started:
+            fastest = min(started, key=started.get)
+            lines.append(f"Fastest start: {fastest} ({format_latency(started[fastest])})")
+        self.compiler_summary_label.setText("\n".join(lines))
+        for line in lines:
+            self.log_message(line)
+
+    def update_benchmark_settings(self):
+        """Persist benchmark settings"""
+        self.settings.setValue("benchmark_runs", self.benchmark_runs_spin.value())
+        self.settings.setValue("benchmark_timeout", self.benchmark_timeout_spin.value())
+        self.settings.setValue("benchmark_after_build", self.benchmark_auto_check.isChecked())
+
+    def update_history_from_event(self, event, info):
+        """Show a finished build in the History tab"""
+        if event == "build_summary" and info["build_id"] is not None:
+            self.refresh_history()
+
+    def update_compile_cost_from_event(self, event, info):
+        """Show the compile cost reported by a build"""
+        if event != "compilation_report":
+            return
+        report = info["report"]
+        self.compile_report = report
+        totals = report["totals"]
+        text = (f"Nuitka {report['nuitka_version']}: {totals['modules']} modules ({totals['compiled']} compiled), "
+                f"{format_size(totals['size'])} of C, {totals['seconds']:.1f} s optimizing")
+        self.compile_summary_label.setText(text)
+        self.compile_package_model.set_rows(report["packages"], totals["size"])
+        self.compile_module_model.set_rows(report["modules"], totals["size"])
+        self.show_compile_view()
+
+    def show_compile_view(self, *args):
+        """Show the packages or modules of the compilation report"""
+        model = self.compile_module_model if self.compile_view_combo.currentIndex() == 1 else self.compile_package_model
+        self.compile_view.setModel(model)
+        self.compile_view.sortByColumn(model.columns.index("seconds"), Qt.DescendingOrder)
+
+    def update_nuitka_cache_from_event(self, event, info):
+        """Show Nuitka cache sizes reported by a build"""
+        if event == "nuitka_cache" and self.build_nuitka_cache() is not None:
+            self.show_nuitka_cache_sizes(info["sizes"])
+
+    def show_nuitka_cache_sizes(self, sizes):
+        """Show per-category sizes of the managed Nuitka cache"""
+        quota = self.nuitka_cache_quota_spin.value() * 1024 ** 3
+        parts = [f"{category} {format_size(size)}" for category, size in sorted(sizes.items()) if size]
+        parts.append(f"Total {format_size(sum(sizes.values()))} of {format_size(quota)}")
+        self.nuitka_cache_sizes_label.setText(" · ".join(parts) if len(parts) > 1 else "Empty")
+
+    def update_warm_build_from_event(self, event, info):
+        """Update the warm build directory list after a build"""
+        if event == "build_dir_summary" and self.build_warm_dirs() is not None:
+            self.refresh_warm_build_dirs()
+
+    def show_warm_build_dirs(self, directories):
+        """List the warm build directories of the profile with their sizes and last build times"""
+        states = {"building": "building", "failed": "last build did not finish"}
+        lines = []
+        for entry in directories:
+            parts = [f"{entry['output_dir'] or os.path.basename(entry['directory'])}: {format_size(entry['size'])}"]
+            if entry["cold_seconds"]:
+                parts.append(f"last cold build {format_duration(entry['cold_seconds'])}")
+            if entry["state"] in states:
+                parts.append(states[entry["state"]])
+            elif entry["seconds"]:
+                parts.append(f"last build {format_duration(entry['seconds'])}")
+            lines.append(" · ".join(parts))
+        if not lines:
+            lines.append("Empty")
+        if self.ccache is None:
+            # The directory only pays off through ccache
+            lines.append("⚠️ ccache not found: warm rebuilds compile every C file again")
+        self.warm_build_sizes_label.setText("\n".join(lines))
+
+    def delete_warm_build_dirs(self):
+        """Delete the warm build directories of the profile not in use"""
+        warm_dirs = self.build_warm_dirs()
+        if warm_dirs is None:
+            return
+        freed = warm_dirs.clear()
+        self.log_message(f"🗑 Warm build directories deleted ({format_size(freed)} freed)")
+        self.refresh_warm_build_dirs()
+
+    def build_ccache(self):
+        """Return the ccache to measure for new builds, or None"""
+        if self.ccache is None or self.disable_ccache_check.isChecked():
+            return None
+        return self.ccache
+
+    def update_ccache_settings(self):
+        """Persist ccache settings"""
+        self.settings.setValue("ccache_dir", self.ccache_dir_input.text().strip())
+        self.settings.setValue("ccache_maxsize", self.ccache_size_input.text().strip())
+        if self.ccache:
+            self.ccache.cache_dir = self.ccache_dir_input.text().strip()
+            self.ccache.max_size = self.ccache_size_input.text().strip()
+        self.update_ccache_status()
+
+    def update_ccache_status(self):
+        """Show the detected ccache and its statistics"""
+        if self.ccache is None:
+            self.ccache_status_label.setText("ccache not found - install it to speed up repeated builds")
+            self.ccache_stats_label.clear()
+            for widget in (self.ccache_refresh_btn, self.ccache_prewarm_btn):
+                widget.setEnabled(False)
+            return
+
+        version = self.ccache.version() or "ccache"
+        self.ccache_status_label.setText(f"{version} ({self.ccache.binary})")
+        stats = self.ccache.stats()
+        if stats is None:
+            self.ccache_stats_label.setText("No statistics available yet")
+            return
+        self.ccache_stats_label.setText(
+            f"{stats.files} files · {stats.size_bytes / 1024 ** 2:,.1f} MB · "
+                f"{stats.hits} hits / {stats.misses} misses overall"
+        )
+
+    def prewarm_ccache(self):
+        """Compile the current configuration once in the background to fill ccache"""
+        if self.prewarm_thread and self.prewarm_thread.isRunning():
+            self.log_message("⚠️ ccache prewarm already in progress")
+            return
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "Missing Configuration", "Select Python interpreter and main file")
+            return
+        if self.build_ccache() is None:
+            self.log_message("⚠️ ccache is disabled in Advanced Options")
+            return
+
+        # Build into a scratch directory so the user's output is untouched
+        command = [arg for arg in self.command_edit.toPlainText().split() if not arg.startswith("--output-dir=")]
+        command.insert(-1, f"--output-dir={state_dir('prewarm')}")
+        if "--remove-output" not in command:
+            command.insert(-1, "--remove-output")
+
+        self.prewarm_thread = PackageThread(
+            command, env=self.build_environment(toolchain_variables(self.collect_config())), ccache=self.build_ccache(),
+            nuitka_cache=self.build_nuitka_cache(),
+        )
+        self.prewarm_thread.event_signal.connect(self.log_build_event)
+        self.prewarm_thread.event_signal.connect(self.update_nuitka_cache_from_event)
+        self.prewarm_thread.finished_signal.connect(self.prewarm_finished)
+        self.ccache_prewarm_btn.setEnabled(False)
+        self.prewarm_thread.start()
+        self.log_message("🔥 Prewarming ccache with the current configuration...")
+
+    def prewarm_finished(self, success):
+        """Handle completion of a ccache prewarm build"""
+        self.ccache_prewarm_btn.setEnabled(True)
+        self.log_message("🔥 ccache prewarm finished" if success else "❌ ccache prewarm failed")
+        self.update_ccache_status()
+
+    def running_threads(self):
+        """Return all running packaging threads"""
+        threads = [thread for thread in self.queue_threads.values() if thread.isRunning()]
+        if self.prewarm_thread and self.prewarm_thread.isRunning():
+            threads.append(self.prewarm_thread)
+        if self.package_thread and self.package_thread.isRunning():
+            threads.append(self.package_thread)
+        return threads
 
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.package_thread and self.package_thread.isRunning():
+        running_threads = self.running_threads()
+        # Builds in the build daemon keep running, the window only stops following them
+        daemon_threads = [thread for thread in running_threads if isinstance(thread, DaemonBuildThread)]
+        running_threads = [thread for thread in running_threads if thread not in daemon_threads]
+        if running_threads:
             # 使用实例化的方式创建 QMessageBox 以便应用样式
             msg_box = QMessageBox(
                 QMessageBox.Question,  # 设置图标
@@ -1809,13 +4414,33 @@ class NuitkaPackager(QMainWindow):
             reply = msg_box.exec()  # 使用 exec() 显示对话框
 
             if reply == QMessageBox.Yes:
-                self.package_thread.stop()
+                for thread in running_threads:
+                    thread.stop()
+                # The threads log while stopping, so let them end before the logs close
+                for thread in running_threads:
+                    thread.wait(5000)
+                self.detach_daemon_threads(daemon_threads)
+                self.stop_benchmark()
+                self.stop_import_scan()
+                self.stop_watch()
+                self.close_log_buffers()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.detach_daemon_threads(daemon_threads)
+            self.stop_benchmark()
+            self.stop_import_scan()
+            self.stop_watch()
+            self.close_log_buffers()
             event.accept()
 
+    def close_log_buffers(self):
+        """Release the spill files of all log views"""
+        self.log_view.close_buffer()
+        for log_view in self.queue_logs.values():
+            log_view.close_buffer()
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
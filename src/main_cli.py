@@ -0,0 +1,856 @@
+"""Headless batch mode: build saved profiles without starting Qt.
+
+Profiles are saved from the GUI ("Save Profile...") and produce exactly the
+command the GUI would run. Several profiles are built concurrently under a
+shared core budget, like the GUI build queue.
+
+Examples:
+    python main_cli.py myapp.json
+    python main_cli.py app1.json app2.json --core-budget 16
+    python main_cli.py myapp.json --dry-run
+    python main_cli.py myapp.json --artifact-cache
+    python main_cli.py myapp.json --warm-build-dir
+    python main_cli.py myapp.json --analyze-size
+    python main_cli.py myapp.json --benchmark 20
+    python main_cli.py myapp.json --compare-onefile
+    python main_cli.py myapp.json --compression-sweep
+    python main_cli.py myapp.json --compare-compilers
+    python main_cli.py myapp.json --scan-imports
+    python main_cli.py --daemon
+    python main_cli.py --list-interpreters
+    python main_cli.py --list-toolchain
+
+Every build is checked before it starts (paths, compiler, disk space,
+Nuitka version, options); if a check fails nothing is built.
+
+Exit codes: 0 all builds succeeded, 1 a build failed, 2 usage or profile
+error or a failed pre-flight check, 130 interrupted.
+"""
+import argparse
+import functools
+import os
+import queue
+import shlex
+import shutil
+import sys
+import threading
+
+from packager.artifact_cache import ArtifactCache
+from packager.benchmark import CACHE_STATES, DEFAULT_RUNS, DEFAULT_TIMEOUT, speedup, startup_benchmark
+from packager.ccache import Ccache, find_ccache
+from packager.command import ProfileError, build_command, load_profile, profile_name, split_list
+from packager.compression import sweep, sweep_commands
+from packager.daemon import IDLE_MINUTES, BuildDaemon, DaemonError, daemon_supported
+from packager.distsize import SUGGESTION_OPTIONS, analyze_output_dir
+from packager.history import BuildHistory
+from packager.imports import IMPORT_OPTIONS, ScanError, scan_imports
+from packager.interpreter import discover_interpreters
+from packager.memory import MemoryGovernor
+from packager.nuitka_cache import NuitkaCache
+from packager.paths import option_value
+from packager.preflight import OK, describe_finding, estimate_output_size, preflight
+from packager.progress import format_duration, format_latency, format_phase_summary, format_size, format_table
+from packager.runner import BuildRunner
+from packager.scheduler import BuildScheduler, SUCCEEDED
+from packager.toolchain import LINKERS, compare_compilers, compiler_configs, detect_toolchain, toolchain_variables
+from packager.variants import VARIANTS, compare_variants, variant_configs
+from packager.warm_build import WarmBuildDirs
+
+EXIT_OK = 0
+EXIT_BUILD_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+# Display names for the build phases reported by ProgressTracker
+PHASE_LABELS = {
+    "starting": "Starting",
+    "python": "Python optimization",
+    "codegen": "C code generation",
+    "c_compile": "C compilation",
+    "link": "Linking",
+    "postprocess": "Post-processing",
+    "onefile": "Onefile compression",
+    "done": "Done",
+}
+SUMMARY_HEADINGS = ("phase", "time", "share", "total")
+# Display names of the process categories reported by ProcessTreeMonitor
+CPU_CATEGORY_LABELS = {
+    "nuitka": "Nuitka front-end",
+    "scons": "scons",
+    "compilers": "C compilers",
+    "other": "other",
+}
+# Display names of the contributors found by the dist size analysis
+DIST_KIND_LABELS = {
+    "package": "package",
+    "library": "shared library",
+    "program": "program",
+    "stdlib": "standard library extensions",
+    "other": "other files",
+}
+DIST_SUGGESTION_REASONS = {
+    "tests": "test suite {subject}",
+    "library": "large shared library {subject}",
+    "data": "package data in {subject}",
+    "package": "largest package {subject}",
+}
+# Display names of the module origins found by the import scan
+IMPORT_KIND_LABELS = {
+    "project": "project",
+    "stdlib": "standard library",
+    "third_party": "third-party",
+    "builtin": "built-in",
+    "missing": "not found",
+}
+IMPORT_SUGGESTION_REASONS = {
+    "dynamic": "imported by computed names in {subject}",
+    "plugin": "{subject} needs its plugin",
+}
+BENCHMARK_TARGET_LABELS = {"compiled": "compiled", "python": "CPython"}
+SWEEP_SETTING_LABELS = {
+    "uncompressed": "uncompressed (--onefile-no-compression)",
+    "zstd-3": "zstd level 3 (--low-memory)",
+    "zstd-22": "zstd level 22 (default)",
+    "archive": "archive (--onefile-as-archive)",
+}
+PREFLIGHT_MESSAGES = {
+    "paths_ok": "{count} paths found",
+    "missing_interpreter": "Python interpreter not found: {path}",
+    "missing_main": "main file not found: {path}",
+    "missing_path": "{option} source not found: {path}",
+    "output_not_writable": "output directory cannot be created or written: {path}",
+    "compiler_ok": "{compiler}, linker {linker}",
+    "compiler_download": "no C compiler found, Nuitka will offer to download MinGW64",
+    "no_compiler": "no C compiler found (install gcc or clang, or set CC)",
+    "no_clang": "--clang is set but clang is not installed",
+    "no_linker": "no linker (ld) found",
+    "missing_linker": "the {linker} linker (ld.{linker}) is not installed",
+    "no_patchelf": "patchelf not found, standalone builds on Linux need it",
+    "disk_ok": "{free} free on {path}, about {needed} needed",
+    "disk_low": "{free} free on {path}, the build needs about {needed}",
+    "disk_full": "only {free} free on {path}, the build needs about {needed}",
+    "disk_guess": "{free} free on {path}, a first build like this can take up to {needed}",
+    "probe_failed": "cannot run {path}: {error}",
+    "no_nuitka": "Nuitka is not installed for {path} (pip install nuitka)",
+    "nuitka_ok": "Nuitka {nuitka} on Python {python}",
+    "python_prerelease": "Nuitka {nuitka} does not build with Python {python} pre-releases ({release})",
+    "python_not_yet_supported": "Nuitka {nuitka} does not support Python {python} yet",
+    "python_unsupported": "Python {python} is only experimentally supported by Nuitka {nuitka}",
+    "no_zstandard": "zstandard is not installed, the onefile payload will not be compressed",
+    "options_ok": "no conflicting options",
+    "module_standalone": "--module cannot be combined with {option}",
+    "onefile_option": "{option} has no effect without --onefile",
+    "qt_plugins": "only one Qt plugin can be enabled: {plugins}",
+    "include_nofollow": "{name} is both included and excluded by --nofollow-import-to",
+    "main_suffix": "main file is not a .py or .pyw file: {path}",
+    "check_failed": "check failed: {error}",
+}
+# Why a build starts from an empty warm build directory
+BUILD_DIR_REASONS = {
+    "new": "first build",
+    "clean": "clean build requested",
+    "arguments": "the Nuitka arguments changed",
+    "interpreter": "the interpreter or its Nuitka changed",
+    "toolchain": "the C compiler or linker changed",
+    "incomplete": "the last build did not finish",
+}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Build Nuitka GUI Packager profiles from the command line.")
+    parser.add_argument("profiles", nargs="*", help="profile files saved from the GUI")
+    parser.add_argument("--python", help="override the Python interpreter of every profile")
+    parser.add_argument("--output-dir", help="override the output directory of every profile")
+    parser.add_argument("--compiler",
+                        help="override the C compiler of every profile (a path or name on PATH, \"\" for Nuitka's "
+                             "choice)")
+    parser.add_argument("--linker", choices=("",) + LINKERS,
+                        help="override the linker of every profile (passed as -fuse-ld, \"\" for the default)")
+    parser.add_argument("--core-budget", type=int, default=None,
+                        help="total C compile jobs shared by concurrent builds (default: CPU count)")
+    parser.add_argument("--max-parallel", type=int, default=None,
+                        help="maximum number of builds running at once")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the generated commands without running them")
+    parser.add_argument("--quiet", action="store_true", help="do not stream build output")
+    parser.add_argument("--artifact-cache", action="store_true",
+                        help="restore unchanged builds from the artifact cache and store new ones")
+    parser.add_argument("--cache-max-gb", type=float, default=5.0,
+                        help="size bound of the artifact cache in GB (default: 5)")
+    parser.add_argument("--ccache-dir", default="",
+                        help="ccache directory for the builds (default: Nuitka's cache directory)")
+    parser.add_argument("--ccache-max-size", default="",
+                        help="ccache size limit, e.g. 5G (default: ccache's own setting)")
+    parser.add_argument("--nuitka-cache-quota-gb", type=float, default=None,
+                        help="give every profile its own Nuitka cache directory, trimmed to this size before each build")
+    parser.add_argument("--warm-build-dir", action="store_true",
+                        help="build every profile in a build directory of its own that is kept between builds, so "
+                             "ccache finds the objects of unchanged code again, and move the artifacts to the "
+                             "output directory")
+    parser.add_argument("--clean-build", action="store_true",
+                        help="with --warm-build-dir, empty the warm build directories before building")
+    parser.add_argument("--memory-governor", action="store_true",
+                        help="size --jobs of every build to the available memory, adding --low-memory when tight, "
+                             "and pause compilers while memory runs low (Linux)")
+    parser.add_argument("--memory-reserve-gb", type=float, default=1.0,
+                        help="memory the governor leaves to the rest of the system in GB (default: 1)")
+    parser.add_argument("--no-pause-compilers", action="store_true",
+                        help="let the memory governor size --jobs but never pause compilers")
+    parser.add_argument("--no-history", action="store_true",
+                        help="do not record the builds in the build history")
+    parser.add_argument("--no-preflight", action="store_true",
+                        help="start the builds without checking paths, compiler, disk space, Nuitka and options first")
+    parser.add_argument("--analyze-size", action="store_true",
+                        help="after a successful build, break the .dist folders down by package and shared library "
+                             "and suggest exclusions")
+    parser.add_argument("--benchmark", type=int, metavar="RUNS", default=0,
+                        help="after a successful build, launch the program RUNS times with warm and cold caches "
+                             "and compare its startup latency with CPython")
+    parser.add_argument("--benchmark-args", default="",
+                        help="arguments passed to the program while benchmarking, as one shell-quoted string")
+    parser.add_argument("--benchmark-ready-marker", default=None,
+                        help="stop timing when the program prints this text instead of when it exits")
+    parser.add_argument("--compare-onefile", action="store_true",
+                        help="build every profile both as standalone folder and as onefile program, in parallel, "
+                             "and compare size, first and repeated launch time and extraction space")
+    parser.add_argument("--compression-sweep", action="store_true",
+                        help="build every profile as onefile program once per payload compression setting, in "
+                             "parallel, measure size and launch time and recommend a Pareto-optimal setting")
+    parser.add_argument("--compare-compilers", action="store_true",
+                        help="build every profile once with each C compiler found on PATH, in parallel, and compare "
+                             "compile time, size and launch time")
+    parser.add_argument("--scan-imports", action="store_true",
+                        help="instead of building, follow the imports of every main file and report the modules "
+                             "Nuitka will compile and the options they call for")
+    parser.add_argument("--benchmark-timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"kill benchmark launches after this many seconds (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--daemon", action="store_true",
+                        help="instead of building profiles, run the build daemon the GUI hands its builds to, "
+                             "so they keep running when the GUI is closed (Unix)")
+    parser.add_argument("--daemon-idle-minutes", type=float, default=IDLE_MINUTES,
+                        help=f"stop the daemon after this many minutes without builds or attached GUIs, "
+                             f"0 to keep it running (default: {IDLE_MINUTES})")
+    parser.add_argument("--list-interpreters", action="store_true",
+                        help="instead of building, list the Python interpreters found in virtual environments of "
+                             "the current directory, pyenv, conda, uv and PATH, with their Nuitka versions")
+    parser.add_argument("--list-toolchain", action="store_true",
+                        help="instead of building, list the C compilers, linkers and ccache found on PATH")
+    args = parser.parse_args(argv)
+    if not args.profiles and not args.daemon and not args.list_interpreters and not args.list_toolchain:
+        parser.error("the following arguments are required: profiles")
+    try:
+        args.benchmark_args = shlex.split(args.benchmark_args)
+    except ValueError as e:
+        parser.error(f"--benchmark-args: {e}")
+    return args
+
+
+def load_configs(args):
+    """Return (name, config) for every profile on the command line, overrides applied"""
+    configs = []
+    names = set()
+    for path in args.profiles:
+        config = load_profile(path)
+        if args.python:
+            config["python_path"] = args.python
+        if args.output_dir:
+            config["output_dir"] = args.output_dir
+        if args.compiler is not None:
+            # Names are looked up on PATH, like the GUI stores them
+            config["compiler"] = (shutil.which(args.compiler) or args.compiler) if args.compiler else ""
+        if args.linker is not None:
+            config["linker"] = args.linker
+        if not config["python_path"]:
+            config["python_path"] = sys.executable
+        if not config["main_file"]:
+            raise ProfileError(f"{path}: no main file configured")
+
+        name = profile_name(path)
+        while name in names:
+            name += "'"
+        names.add(name)
+        configs.append((name, config))
+    return configs
+
+
+def load_jobs(args):
+    """Return (name, command, variables, comparison) for every profile on the command line
+
+    variables are the environment variables selecting the profile's
+    compiler and linker. With ``--compare-onefile``, ``--compression-sweep``
+    or ``--compare-compilers`` every profile becomes one job per variant,
+    setting or compiler and comparison is (profile name, "onefile",
+    "compression" or "compiler", variant, setting or compiler name),
+    otherwise it is None.
+    """
+    compilers = []
+    if args.compare_compilers:
+        compilers = detect_toolchain()["compilers"]
+        if not compilers:
+            raise ProfileError("no C compiler found on PATH to compare")
+    jobs = []
+    for name, config in load_configs(args):
+        variables = toolchain_variables(config)
+        groups = []
+        if args.compare_onefile:
+            groups.append(("onefile", {
+                variant: (build_command(variant_config), variables)
+                for variant, variant_config in variant_configs(config).items()
+            }))
+        if args.compression_sweep:
+            groups.append(("compression", {
+                setting: (command, variables) for setting, command in sweep_commands(config).items()
+            }))
+        if args.compare_compilers:
+            groups.append(("compiler", {
+                compiler: (build_command(compiler_config), toolchain_variables(compiler_config))
+                for compiler, compiler_config in compiler_configs(config, compilers).items()
+            }))
+        for mode, builds in groups:
+            for key, (command, build_variables) in builds.items():
+                jobs.append((f"{name} ({key})", command, build_variables, (name, mode, key)))
+        if not groups:
+            jobs.append((name, build_command(config), variables, None))
+    return jobs
+
+
+def describe_event(event, info):
+    """Describe a BuildRunner event for the console"""
+    if event == "cache_hit":
+        return (f"artifact cache hit ({info['key'][:12]}): restored {', '.join(info['artifacts'])} "
+                f"({info['size'] / 1024 ** 2:.1f} MB) in {info['seconds']:.1f} s")
+    if event == "cache_miss":
+        return f"artifact cache miss ({info['key'][:12]}, keyed in {info['seconds']:.1f} s)"
+    if event == "cache_stored":
+        evicted = f", evicted {info['evicted']} old entries" if info["evicted"] else ""
+        return f"stored {info['size'] / 1024 ** 2:.1f} MB in the artifact cache{evicted}"
+    if event == "cache_skipped":
+        return f"artifact cache skipped: {info['reason']}"
+    if event == "nuitka_cache":
+        evicted = f", evicted {info['removed']} files ({format_size(info['freed'])})" if info["removed"] else ""
+        return f"Nuitka cache: {format_size(info['total'])} of {format_size(info['quota'])} quota{evicted}"
+    if event == "ccache_stats":
+        return (f"ccache: {info['hits']}/{info['hits'] + info['misses']} hits ({info['hit_rate']:.0%}), "
+                f"~{info['bytes_saved'] / 1024 ** 2:.1f} MB and ~{format_duration(info['seconds_saved'])} saved")
+    if event == "memory_plan":
+        basis = "measured" if info["measured"] else "assumed"
+        message = (f"memory governor: {format_size(info['available'])} available, "
+                   f"~{format_size(info['compiler_rss'])} per compiler ({basis}), --jobs={info['jobs']}")
+        if info["jobs"] != info["requested"]:
+            message += f" (was {info['requested']})"
+        return message + (" with --low-memory" if info["low_memory"] else "")
+    if event == "compilers_paused":
+        return f"memory low ({format_size(info['available'])} available): paused a compiler, {info['paused']} paused"
+    if event == "compilers_resumed":
+        return (f"memory recovered ({format_size(info['available'])} available): "
+                f"resumed a compiler, {info['paused']} still paused")
+    if event == "resource_summary":
+        total = sum(info["cpu_seconds"].values())
+        parts = [
+            f"{CPU_CATEGORY_LABELS.get(category, category)} {seconds:.1f} s ({seconds / total:.0%})"
+            for category, seconds in info["cpu_seconds"].items() if seconds >= 0.05
+        ]
+        peak = f", peak memory {format_size(info['peak_rss'])}" if info["peak_rss"] else ""
+        parts = f" ({', '.join(parts)})" if parts else ""
+        return (f"CPU time {total:.1f} s{parts}{peak}, "
+                f"I/O {format_size(info['read_bytes'])} read, {format_size(info['write_bytes'])} written")
+    if event == "build_summary":
+        table = format_phase_summary(info["phases"], info["total"], PHASE_LABELS, SUMMARY_HEADINGS)
+        if info["artifact_size"] is not None:
+            table.append(f"artifact size: {format_size(info['artifact_size'])}")
+        if info["peak_rss"] is not None:
+            table.append(f"peak memory: {format_size(info['peak_rss'])}")
+        return "\n".join(["build summary:"] + ["  " + line for line in table])
+    if event == "history_skipped":
+        return f"build history not recorded: {info['reason']}"
+    if event == "build_dir":
+        if info["warm"]:
+            last = f", last cold build {format_duration(info['cold_seconds'])}" if info["cold_seconds"] else ""
+            message = f"warm build directory {info['directory']}{last}"
+        else:
+            message = f"cold build directory {info['directory']}: {BUILD_DIR_REASONS[info['reason']]}"
+        if not info.get("ccache", True):
+            message += " (without ccache every C file is compiled again)"
+        return message
+    if event == "build_dir_summary":
+        if info["warm"] and info["cold_seconds"]:
+            message = (f"warm build took {format_duration(info['seconds'])}, "
+                       f"{info['seconds'] / info['cold_seconds']:.0%} of the last cold build "
+                       f"({format_duration(info['cold_seconds'])})")
+        else:
+            message = f"{'warm' if info['warm'] else 'cold'} build took {format_duration(info['seconds'])}"
+        if info["moved_seconds"] is not None:
+            message += f", artifacts moved to the output directory in {info['moved_seconds']:.1f} s"
+        return message
+    if event == "build_dir_skipped":
+        return f"warm build directory not used: {info['reason']}"
+    if event == "compilation_report":
+        return describe_compile_cost(info["report"])
+    if event == "report_skipped":
+        return f"compilation report not read: {info['reason']}"
+    return None
+
+
+def describe_compile_cost(report, limit=10):
+    """Describe the packages that took longest to optimize in a compilation report"""
+    totals = report["totals"]
+    lines = [
+        f"compile cost: {totals['modules']} modules ({totals['compiled']} compiled), "
+        f"{format_size(totals['size'])} of C, {totals['seconds']:.1f} s optimizing"
+    ]
+    rows = [("package", "modules", "compiled", "C size", "optimization")]
+    for package in report["packages"][:limit]:
+        rows.append((
+            package["name"], str(package["modules"]), str(package["compiled"]), format_size(package["size"]),
+            f"{package['seconds']:.2f} s",
+        ))
+    lines += ["  " + line for line in format_table(rows)]
+    return "\n".join(lines)
+
+
+def describe_dist_report(report, limit=10):
+    """Describe the largest contributors and suggestions of a dist size report"""
+    lines = [
+        f"dist size: {report['files']} files, {format_size(report['size'])} in {report['root']} "
+        f"(scanned in {report['seconds']:.1f} s)"
+    ]
+    rows = [("contributor", "type", "files", "size", "share")]
+    for entry in report["contributors"][:limit]:
+        name, kind = entry["name"], DIST_KIND_LABELS[entry["kind"]]
+        if name == entry["kind"]:
+            # Grouped files, named after their kind
+            name, kind = kind, ""
+        share = entry["size"] / report["size"] if report["size"] else 0
+        rows.append((name, kind, str(entry["files"]), format_size(entry["size"]), f"{share:.1%}"))
+    lines += ["  " + line for line in format_table(rows)]
+    if report["suggestions"]:
+        lines.append("suggestions (check the program still works after rebuilding):")
+        for suggestion in report["suggestions"]:
+            reason = DIST_SUGGESTION_REASONS[suggestion["reason"]].format(subject=suggestion["subject"])
+            lines.append(f"  {SUGGESTION_OPTIONS[suggestion['field']]}={suggestion['value']}"
+                         f"  saves up to {format_size(suggestion['size'])} ({reason})")
+    return "\n".join(lines)
+
+
+def describe_imports(report, limit=10):
+    """Describe the largest packages, unresolved imports and suggestions of an import scan"""
+    totals = report["totals"]
+    count = sum(total["modules"] for kind, total in totals.items() if kind != "missing")
+    size = sum(total["size"] for total in totals.values())
+    lines = [
+        f"imports: {count} modules ({format_size(size)}) reachable from {report['main_file']} "
+        f"(Python {report['version']}, parsed {report['parsed']} of {report['files']} files "
+        f"in {report['seconds']:.1f} s)"
+    ]
+    lines += [
+        f"  {IMPORT_KIND_LABELS[kind]}: {totals[kind]['modules']} modules, {format_size(totals[kind]['size'])}"
+        for kind in ("project", "third_party", "stdlib", "builtin") if kind in totals
+    ]
+    rows = [("package", "origin", "modules", "size", "share")]
+    for entry in report["packages"][:limit]:
+        share = entry["size"] / size if size else 0
+        rows.append((
+            entry["name"], IMPORT_KIND_LABELS[entry["kind"]], str(entry["modules"]),
+            format_size(entry["size"]), f"{share:.1%}",
+        ))
+    lines += ["  " + line for line in format_table(rows)]
+    missing = [entry for entry in report["modules"] if entry["kind"] == "missing"]
+    if missing:
+        lines.append("not found: " + ", ".join(f"{entry['name']} (imported by {entry['via']})" for entry in missing))
+    for entry in report["dynamic"]:
+        if entry["kind"] == "unknown":
+            lines.append(f"{entry['importer']}:{entry['line']} imports a computed module name Nuitka cannot follow")
+    for path, message in report["errors"]:
+        lines.append(f"cannot parse {path}: {message}")
+    if report["suggestions"]:
+        lines.append("suggestions:")
+        for suggestion in report["suggestions"]:
+            reason = IMPORT_SUGGESTION_REASONS[suggestion["reason"]].format(subject=suggestion["subject"])
+            lines.append(f"  {IMPORT_OPTIONS[suggestion['field']]}={suggestion['value']}  ({reason})")
+    return "\n".join(lines)
+
+
+def preflight_jobs(jobs, args):
+    """Check every job before anything is built; returns the exit code"""
+    history = None if args.no_history else BuildHistory()
+    status = EXIT_OK
+    for name, command, variables, _ in jobs:
+        env = dict(os.environ, **variables) if variables else None
+        report = preflight(command, None, estimate_output_size(command, history), env)
+        print(f"{name}: pre-flight checks: {report['errors']} errors, {report['warnings']} warnings "
+              f"({report['seconds']:.1f} s)")
+        for finding in report["findings"]:
+            if finding["severity"] != OK or not args.quiet:
+                print(f"  {finding['severity']:<8} {finding['check']}: {describe_finding(finding, PREFLIGHT_MESSAGES)}")
+        if report["errors"]:
+            status = EXIT_USAGE
+    return status
+
+
+def describe_interpreters(entries):
+    """Describe the interpreters found by discover_interpreters"""
+    if not entries:
+        return "no Python interpreters found"
+    rows = [("interpreter", "python", "nuitka", "installed by", "found in")]
+    for entry in entries:
+        info = entry["info"]
+        rows.append((
+            entry["path"], info["version"] or "?", info["nuitka"] or "-", info["installer"] or "-", entry["source"],
+        ))
+    return "\n".join(format_table(rows))
+
+
+def describe_toolchain(toolchain):
+    """Describe the compilers, linkers and ccache found by detect_toolchain"""
+    lines = []
+    if toolchain["compilers"]:
+        rows = [("compiler", "family", "version", "path")]
+        for compiler in toolchain["compilers"]:
+            rows.append((compiler["name"], compiler["family"], compiler["version"] or "?", compiler["path"]))
+        lines += format_table(rows)
+    else:
+        lines.append("no C compiler found on PATH")
+    if toolchain["linkers"]:
+        rows = [("linker", "version", "path")]
+        for linker in toolchain["linkers"]:
+            default = " (default)" if linker["name"] == toolchain["default_linker"] else ""
+            rows.append((linker["name"] + default, linker["version"] or "?", linker["path"]))
+        lines += [""] + format_table(rows)
+    ccache = toolchain["ccache"]
+    if ccache is None:
+        lines += ["", "ccache: not found"]
+    else:
+        lines += ["", f"ccache {ccache['version'] or '?'}: {ccache['path']}"]
+        for directory in ccache["wrappers"]:
+            on_path = " (on PATH)" if directory in ccache["on_path"] else ""
+            lines.append(f"  compiler wrappers: {directory}{on_path}")
+    return "\n".join(lines)
+
+
+def scan_profiles(args):
+    """Print the import scan of every profile; returns the exit code"""
+    status = EXIT_OK
+    for name, config in load_configs(args):
+        try:
+            report = scan_imports(
+                config["python_path"], config["main_file"], config["standalone"] or config["follow_stdlib"],
+                split_list(config["nofollow_import"]), split_list(config["include_module"]),
+                split_list(config["include_package"]), config["plugins"],
+            )
+        except ScanError as e:
+            sys.stderr.write(f"{name}: cannot scan imports: {e}\n")
+            status = EXIT_BUILD_FAILED
+            continue
+        print(f"{name}: {describe_imports(report)}")
+    return status
+
+
+def describe_benchmark(result):
+    """Describe the results of a startup benchmark"""
+    lines = [f"startup benchmark of {result['executable']}:"]
+    rows = [("program", "cache", "runs", "min", "median", "p95", "peak memory")]
+    for entry in result["results"]:
+        figures = [format_latency(entry[key]) if entry[key] is not None else "-" for key in ("min", "median", "p95")]
+        rows.append((
+            BENCHMARK_TARGET_LABELS[entry["target"]], entry["cache"], str(entry["runs"]), *figures,
+            format_size(entry["peak_rss"]) if entry["peak_rss"] is not None else "-",
+        ))
+    lines += ["  " + line for line in format_table(rows)]
+    for cache in CACHE_STATES:
+        factor = speedup(result["results"], cache)
+        if factor is not None:
+            comparison = f"{factor:.2f}× faster" if factor >= 1 else f"{1 / factor:.2f}× slower"
+            lines.append(f"compiled program starts {comparison} than CPython (median, {cache} cache)")
+    failures = sum(entry["failures"] for entry in result["results"])
+    if failures:
+        code = next(entry["exit_code"] for entry in reversed(result["results"]) if entry["failures"])
+        lines.append(f"{failures} launches failed (last exit code {code})")
+    return "\n".join(lines)
+
+
+def describe_comparison(comparison):
+    """Describe a onefile / standalone comparison side by side"""
+
+    def latency(result):
+        return format_latency(result["median"]) if result and result["median"] is not None else "-"
+
+    rows = [("",) + VARIANTS]
+    metrics = [
+        ("size on disk", lambda entry: format_size(entry["size"])),
+        ("first launch", lambda entry: latency(entry["first_launch"])),
+        ("repeated launch", lambda entry: latency(entry["repeat_launch"])),
+        ("peak memory", lambda entry: format_size(entry["repeat_launch"]["peak_rss"])
+            if entry["repeat_launch"] and entry["repeat_launch"]["peak_rss"] is not None else "-"),
+        ("extraction", lambda entry: format_size(entry["extraction"]) if entry["extraction"] is not None else "-"),
+        ("left in temp", lambda entry: format_size(entry["extraction_left"])
+            if entry["extraction_left"] is not None else "-"),
+    ]
+    for label, value in metrics:
+        rows.append((label,) + tuple(value(comparison[variant]) for variant in VARIANTS))
+    return "\n".join(["onefile / standalone comparison (medians):"] + ["  " + line for line in format_table(rows)])
+
+
+def describe_sweep(result):
+    """Describe a onefile compression sweep and its recommendation"""
+
+    def latency(measured):
+        return format_latency(measured["median"]) if measured and measured["median"] is not None else "-"
+
+    rows = [("setting", "size", "first launch", "repeated launch", "extraction", "pareto")]
+    for setting, measured in result["settings"].items():
+        rows.append((
+            SWEEP_SETTING_LABELS[setting], format_size(measured["size"]),
+            latency(measured["first_launch"]), latency(measured["repeat_launch"]),
+            format_size(measured["extraction"]) if measured["extraction"] is not None else "-",
+            "yes" if setting in result["pareto"] else "",
+        ))
+    lines = ["onefile compression sweep (medians):"] + ["  " + line for line in format_table(rows)]
+    if result["recommended"]:
+        lines.append(f"recommended: {SWEEP_SETTING_LABELS[result['recommended']]}")
+    if result["levels"]:
+        lines.append("payload estimate at other zstd levels (the uncompressed program compressed locally):")
+        rows = [("level", "size", "compression", "decompression")]
+        for estimate in result["levels"]:
+            rows.append((
+                str(estimate["level"]), format_size(estimate["size"]),
+                format_latency(estimate["compress_seconds"]), format_latency(estimate["decompress_seconds"]),
+            ))
+        lines += ["  " + line for line in format_table(rows)]
+    return "\n".join(lines)
+
+
+def describe_compilers(result, compilers):
+    """Describe a compiler comparison; ``compilers`` is {name: probe entry}"""
+
+    def latency(measured):
+        return format_latency(measured["median"]) if measured and measured["median"] is not None else "-"
+
+    rows = [("compiler", "version", "compile time", "size", "first launch", "repeated launch")]
+    for name, measured in result.items():
+        compiler = compilers.get(name, {})
+        rows.append((
+            name, compiler.get("version") or "?",
+            format_duration(measured["compile_seconds"]) if measured["compile_seconds"] is not None else "-",
+            format_size(measured["size"]), latency(measured["first_launch"]), latency(measured["repeat_launch"]),
+        ))
+    lines = ["C compiler comparison (medians):"] + ["  " + line for line in format_table(rows)]
+    timed = {name: measured["compile_seconds"] for name, measured in result.items() if measured["compile_seconds"]}
+    if timed:
+        fastest = min(timed, key=timed.get)
+        lines.append(f"fastest build: {fastest} ({format_duration(timed[fastest])})")
+    started = {
+        name: measured["repeat_launch"]["median"] for name, measured in result.items()
+        if measured["repeat_launch"] and measured["repeat_launch"]["median"] is not None
+    }
+    if started:
+        fastest = min(started, key=started.get)
+        lines.append(f"fastest start: {fastest} ({format_latency(started[fastest])})")
+    return "\n".join(lines)
+
+
+class Console:
+    """Serialize the output of concurrent builds onto stdout/stderr"""
+
+    def __init__(self, prefix, quiet):
+        self.prefix = prefix
+        self.quiet = quiet
+        self.lock = threading.Lock()
+
+    def lines(self, job, lines):
+        if self.quiet:
+            return
+        prefix = f"[{job.name}] " if self.prefix else ""
+        with self.lock:
+            sys.stdout.write("".join(f"{prefix}{line}\n" for line in lines))
+            sys.stdout.flush()
+
+    def status(self, job, message):
+        with self.lock:
+            sys.stderr.write("".join(f"[{job.name}] {line}\n" for line in message.splitlines()))
+            sys.stderr.flush()
+
+
+def run_jobs(jobs, args):
+    """Run all jobs under the scheduler and return the process exit code"""
+    scheduler = BuildScheduler(args.core_budget, max_parallel=args.max_parallel)
+    comparisons = {}
+    # {(profile name, mode): number of builds}
+    expected = {}
+    for name, command, variables, comparison in jobs:
+        job = scheduler.enqueue(name, command, variables)
+        if comparison:
+            comparisons[job.id] = comparison
+            expected[comparison[:2]] = expected.get(comparison[:2], 0) + 1
+    # {(profile name, mode): {variant or setting: command}} built so far
+    built = {}
+    console = Console(prefix=len(jobs) > 1, quiet=args.quiet)
+    cache = ArtifactCache(max_bytes=int(args.cache_max_gb * 1024 ** 3)) if args.artifact_cache else None
+    ccache_binary = find_ccache()
+    ccache = Ccache(ccache_binary, args.ccache_dir, args.ccache_max_size) if ccache_binary else None
+    history = None if args.no_history else BuildHistory()
+    finished = queue.Queue()
+    runners = {}
+
+    def on_progress(job, percent, phase, eta):
+        if phase != job.phase:
+            job.phase = phase
+            suffix = f", ETA {format_duration(eta)}" if eta is not None and phase != "done" else ""
+            console.status(job, f"{PHASE_LABELS.get(phase, phase)} ({percent}%{suffix})")
+
+    def on_event(job, event, info):
+        message = describe_event(event, info)
+        if message:
+            console.status(job, message)
+
+    def work(job, runner):
+        try:
+            return_code = runner.run()
+        except OSError as e:
+            console.status(job, f"cannot start build: {e}")
+            return_code = None
+        finished.put((job, return_code))
+
+    try:
+        while True:
+            for job in scheduler.next_launches():
+                console.status(job, f"starting with --jobs={job.jobs}: {shlex.join(job.launch_command)}")
+                nuitka_cache = None
+                env = None
+                profile = (comparisons[job.id][0] if job.id in comparisons else job.name).rstrip("'")
+                if args.nuitka_cache_quota_gb:
+                    nuitka_cache = NuitkaCache.for_profile(profile, int(args.nuitka_cache_quota_gb * 1024 ** 3))
+                    env = nuitka_cache.environment()
+                if ccache:
+                    env = ccache.environment(env)
+                if job.env:
+                    env = dict(os.environ if env is None else env, **job.env)
+                runner = BuildRunner(
+                    job.launch_command,
+                    env=env,
+                    on_lines=lambda lines, job=job: console.lines(job, lines),
+                    on_progress=lambda percent, phase, eta, job=job: on_progress(job, percent, phase, eta),
+                    on_event=lambda event, info, job=job: on_event(job, event, info),
+                    artifact_cache=cache,
+                    ccache=ccache,
+                    nuitka_cache=nuitka_cache,
+                    history=history,
+                    governor=MemoryGovernor(
+                        reserve=int(args.memory_reserve_gb * 1024 ** 3), pause=not args.no_pause_compilers
+                    ) if args.memory_governor else None,
+                    warm_dirs=WarmBuildDirs.for_profile(profile, args.clean_build) if args.warm_build_dir else None,
+                )
+                runners[job.id] = runner
+                threading.Thread(target=work, args=(job, runner), daemon=True).start()
+
+            if not scheduler.running:
+                break
+            job, return_code = finished.get()
+            scheduler.finish(job, return_code == 0)
+            runner = runners.pop(job.id)
+            if return_code == 0:
+                console.status(job, f"succeeded in {format_duration(runner.elapsed)}")
+                if args.analyze_size:
+                    for report in analyze_output_dir(option_value(job.command, "--output-dir") or ".", job.command):
+                        console.status(job, describe_dist_report(report))
+                if args.benchmark > 0:
+                    try:
+                        result = startup_benchmark(
+                            job.command, runs=args.benchmark, arguments=args.benchmark_args,
+                            ready_marker=args.benchmark_ready_marker, timeout=args.benchmark_timeout,
+                        )
+                    except OSError as e:
+                        console.status(job, f"cannot benchmark: {e}")
+                    else:
+                        console.status(job, describe_benchmark(result))
+                        if history and runner.build_id is not None:
+                            history.record_benchmark(runner.build_id, result["results"], result["arguments"])
+                if job.id in comparisons:
+                    profile, mode, key = comparisons[job.id]
+                    commands = built.setdefault((profile, mode), {})
+                    commands[key] = job.command
+                    measure, describe = {
+                        "onefile": (compare_variants, describe_comparison),
+                        "compression": (sweep, describe_sweep),
+                        "compiler": (
+                            functools.partial(compare_compilers, history=history),
+                            lambda result: describe_compilers(
+                                result, {compiler["name"]: compiler for compiler in detect_toolchain()["compilers"]}
+                            ),
+                        ),
+                    }[mode]
+                    if len(commands) == expected[(profile, mode)]:
+                        try:
+                            result = measure(
+                                commands, runs=args.benchmark or DEFAULT_RUNS, arguments=args.benchmark_args,
+                                ready_marker=args.benchmark_ready_marker, timeout=args.benchmark_timeout,
+                            )
+                        except (OSError, ImportError) as e:
+                            console.status(job, f"cannot measure: {e}")
+                        else:
+                            console.status(job, describe(result))
+            else:
+                console.status(job, f"failed with exit code {return_code}")
+    except KeyboardInterrupt:
+        for runner in runners.values():
+            try:
+                runner.stop()
+            except OSError:
+                pass
+        return EXIT_INTERRUPTED
+
+    failed = [job for job in scheduler.jobs if job.status != SUCCEEDED]
+    if len(jobs) > 1:
+        sys.stderr.write(f"{len(jobs) - len(failed)}/{len(jobs)} builds succeeded\n")
+    return EXIT_BUILD_FAILED if failed else EXIT_OK
+
+
+def serve_daemon(args):
+    """Run the build daemon until it is shut down or idle"""
+    if not daemon_supported():
+        sys.stderr.write("error: the build daemon needs Unix domain sockets\n")
+        return EXIT_USAGE
+    daemon = BuildDaemon(idle_minutes=args.daemon_idle_minutes)
+    sys.stderr.write(f"build daemon listening on {daemon.path}\n")
+    try:
+        daemon.serve()
+    except DaemonError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    return EXIT_OK
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.daemon:
+        return serve_daemon(args)
+    if args.list_interpreters:
+        print(describe_interpreters(discover_interpreters(os.getcwd())))
+        return EXIT_OK
+    if args.list_toolchain:
+        print(describe_toolchain(detect_toolchain()))
+        return EXIT_OK
+    try:
+        if args.scan_imports:
+            return scan_profiles(args)
+        jobs = load_jobs(args)
+    except ProfileError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return EXIT_USAGE
+
+    if args.dry_run:
+        for name, command, variables, _ in jobs:
+            print(f"{name}: {shlex.join([f'{key}={value}' for key, value in variables.items()] + command)}")
+        return EXIT_OK
+    if not args.no_preflight:
+        status = preflight_jobs(jobs, args)
+        if status != EXIT_OK:
+            sys.stderr.write("error: pre-flight checks failed, nothing was built\n")
+            return status
+    return run_jobs(jobs, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
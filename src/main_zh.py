@@ -1,56 +1,336 @@
 import sys
 import os
-import subprocess
 import logging
+import time
+import shlex
+import threading
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QTextEdit, QPushButton, QCheckBox, QFileDialog, QMessageBox,
     QGroupBox, QFrame, QProgressBar, QSizePolicy, QTabWidget, QComboBox,
-    QSpinBox, QListWidget, QListWidgetItem, QAbstractItemView, QSplitter, QToolButton
+    QSpinBox, QListWidget, QListWidgetItem, QAbstractItemView, QSplitter, QToolButton,
+    QTableWidget, QTableWidgetItem, QTableView, QStackedWidget
 )
 from PySide6.QtCore import Qt, QThread, Signal, QSettings
-from PySide6.QtGui import QFont, QIcon, QTextCursor, QPalette, QColor
+from PySide6.QtGui import QFont, QIcon, QPalette, QColor
+
+from packager.artifact_cache import ArtifactCache
+from packager.benchmark import cold_cache_supported, speedup, startup_benchmark
+from packager.ccache import Ccache, find_ccache
+from packager.command import ProfileError, build_command, load_profile, profile_name, save_profile, split_list
+from packager.compression import SETTINGS, SETTING_CONFIG, sweep, sweep_commands
+from packager.daemon import DaemonClient, DaemonError, daemon_supported, job_options, start_daemon
+from packager.distsize import SUGGESTION_OPTIONS, analyze_output_dir
+from packager.history import BuildHistory
+from packager.imports import IMPORT_OPTIONS, scan_imports
+from packager.interpreter import detect_interpreter, discover_interpreters, load_index
+from packager.memory import MemoryGovernor, read_meminfo
+from packager.nuitka_cache import NuitkaCache
+from packager.progress import format_duration, format_latency, format_phase_summary, format_size
+from packager.paths import option_value, option_values, state_dir
+from packager.preflight import ERROR, describe_finding, estimate_output_size, preflight
+from packager.qt import BackgroundTask, HistoryModel, LogView, SizeTableModel, TrendChart
+from packager.runner import BuildRunner
+from packager.scheduler import BuildScheduler, CANCELLED, SUCCEEDED
+from packager.toolchain import compare_compilers, compiler_configs, detect_toolchain, load_toolchain, toolchain_variables
+from packager.variants import VARIANTS, compare_variants, variant_configs
+from packager.warm_build import WarmBuildDirs
+from packager.watcher import SourceWatcher
 
 # 设置日志格式
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 
+# 构建输出更新状态栏的最小间隔(秒)
+STATUS_BAR_INTERVAL = 0.25
+
+# ProgressTracker 报告的构建阶段显示名称
+PHASE_LABELS = {
+    "starting": "启动",
+    "python": "Python 优化",
+    "codegen": "生成 C 代码",
+    "c_compile": "C 编译",
+    "link": "链接",
+    "postprocess": "后处理",
+    "onefile": "Onefile 压缩",
+    "done": "完成",
+}
+
+# 构建队列任务状态显示名称
+QUEUE_STATUS_LABELS = {
+    "queued": "排队中",
+    "running": "运行中",
+    "succeeded": "成功",
+    "failed": "失败",
+    "cancelled": "已取消",
+}
+
+# 构建摘要表格的列标题
+SUMMARY_HEADINGS = ("阶段", "耗时", "占比", "总计")
+
+# 构建历史表格的列标题
+HISTORY_HEADERS = ["开始时间", "项目", "耗时", "峰值内存", "启动耗时", "产物大小", "结果", "命令"]
+HISTORY_RESULTS = {"succeeded": "成功", "failed": "失败", "cached": "从缓存恢复"}
+
+# ProcessTreeMonitor 报告的进程类别的显示名称
+CPU_CATEGORY_LABELS = {
+    "nuitka": "Nuitka 前端",
+    "scons": "Scons",
+    "compilers": "C 编译器",
+    "other": "其他",
+}
+
+# 独立目录体积分析的列标题和标签
+DIST_SIZE_HEADERS = ["来源", "类型", "文件数", "大小", "占比"]
+DIST_LIBRARY_HEADERS = ["动态库", "所属包", "大小", "占比"]
+DIST_KIND_LABELS = {
+    "package": "Python 包",
+    "library": "动态库",
+    "program": "程序",
+    "stdlib": "标准库扩展模块",
+    "other": "其他文件",
+}
+DIST_SUGGESTION_REASONS = {
+    "tests": "测试套件 {subject}",
+    "library": "较大的动态库 {subject}",
+    "data": "{subject} 中的包数据",
+    "package": "最大的包 {subject}",
+}
+
+# 导入分析的列标题和标签
+IMPORT_PACKAGE_HEADERS = ["包", "来源", "模块数", "大小", "占比"]
+IMPORT_MODULE_HEADERS = ["模块", "来源", "被导入次数", "大小", "占比", "首次导入者"]
+IMPORT_KIND_LABELS = {
+    "project": "项目",
+    "stdlib": "标准库",
+    "third_party": "第三方",
+    "builtin": "内置",
+    "missing": "未找到",
+}
+IMPORT_SUGGESTION_REASONS = {
+    "dynamic": "{subject} 中通过计算得到的名称导入",
+    "plugin": "{subject} 需要对应的插件",
+}
+
+# 构建编译开销的列标题和标签
+COMPILE_PACKAGE_HEADERS = ["包", "模块数", "已编译", "C 代码大小", "占比", "优化耗时"]
+COMPILE_MODULE_HEADERS = ["模块", "类型", "C 代码大小", "占比", "优化耗时", "原因"]
+COMPILE_KIND_LABELS = {
+    "PythonMainModule": "主模块",
+    "CompiledPythonModule": "已编译",
+    "CompiledPythonPackage": "已编译包",
+    "UncompiledPythonModule": "字节码",
+    "UncompiledPythonPackage": "字节码包",
+    "PythonExtensionModule": "扩展模块",
+}
+
+# 构建前检查的标签和消息
+PREFLIGHT_CHECK_LABELS = {
+    "paths": "路径",
+    "compiler": "编译器",
+    "disk": "磁盘空间",
+    "nuitka": "Nuitka",
+    "options": "选项",
+}
+PREFLIGHT_ICONS = {"ok": "✓", "warning": "⚠️", "error": "❌"}
+PREFLIGHT_MESSAGES = {
+    "paths_ok": "找到 {count} 个路径",
+    "missing_interpreter": "找不到 Python 解释器: {path}",
+    "missing_main": "找不到主文件: {path}",
+    "missing_path": "找不到 {option} 的源路径: {path}",
+    "output_not_writable": "无法创建或写入输出目录: {path}",
+    "compiler_ok": "{compiler}，链接器 {linker}",
+    "compiler_download": "未找到 C 编译器，Nuitka 将提示下载 MinGW64",
+    "no_compiler": "未找到 C 编译器(请安装 gcc 或 clang，或设置 CC)",
+    "no_clang": "已设置 --clang，但未安装 clang",
+    "missing_linker": "未安装 {linker} 链接器(ld.{linker})",
+    "no_linker": "未找到链接器(ld)",
+    "no_patchelf": "未找到 patchelf，Linux 上的独立模式构建需要它",
+    "disk_ok": "{path} 上可用 {free}，约需 {needed}",
+    "disk_low": "{path} 上可用 {free}，构建约需 {needed}",
+    "disk_full": "{path} 上仅剩 {free}，构建约需 {needed}",
+    "disk_guess": "{path} 上可用 {free}，此类首次构建最多可能需要 {needed}",
+    "probe_failed": "无法运行 {path}: {error}",
+    "no_nuitka": "{path} 中未安装 Nuitka(pip install nuitka)",
+    "nuitka_ok": "Nuitka {nuitka}，Python {python}",
+    "python_prerelease": "Nuitka {nuitka} 不支持使用 Python {python} 预发布版本({release})构建",
+    "python_not_yet_supported": "Nuitka {nuitka} 尚不支持 Python {python}",
+    "python_unsupported": "Nuitka {nuitka} 对 Python {python} 仅为实验性支持",
+    "no_zstandard": "未安装 zstandard，单文件载荷将不会被压缩",
+    "options_ok": "没有冲突的选项",
+    "module_standalone": "--module 不能与 {option} 同时使用",
+    "onefile_option": "未使用 --onefile 时 {option} 无效",
+    "qt_plugins": "只能启用一个 Qt 插件: {plugins}",
+    "include_nofollow": "{name} 既被包含又被 --nofollow-import-to 排除",
+    "main_suffix": "主文件不是 .py 或 .pyw 文件: {path}",
+    "check_failed": "检查出错: {error}",
+}
+
+
+# 发现解释器的位置的显示名称
+INTERPRETER_SOURCE_LABELS = {
+    "project": "项目虚拟环境",
+    "pyenv": "pyenv",
+    "conda": "conda",
+    "uv": "uv",
+    "path": "PATH",
+}
+
+# 构建从空的持久构建目录开始的原因
+BUILD_DIR_REASONS = {
+    "new": "首次构建",
+    "clean": "要求全新构建",
+    "arguments": "Nuitka 参数已改变",
+    "interpreter": "解释器或其 Nuitka 已改变",
+    "toolchain": "C 编译器或链接器已改变",
+    "incomplete": "上次构建未完成",
+}
+
+
+def describe_preflight(report):
+    """将构建前检查结果描述为日志，每项结果一行"""
+    return [
+        f"    {PREFLIGHT_ICONS[finding['severity']]} {PREFLIGHT_CHECK_LABELS[finding['check']]}: "
+        f"{describe_finding(finding, PREFLIGHT_MESSAGES)}"
+        for finding in report["findings"]
+    ]
+
+
+def describe_build_event(event, info):
+    """描述 BuildRunner 事件以写入日志"""
+    if event == "cache_hit":
+        return (f"♻️ 产物缓存命中 ({info['key'][:12]}): 已恢复 {', '.join(info['artifacts'])} "
+                f"({info['size'] / 1024 ** 2:.1f} MB), 耗时 {info['seconds']:.1f} 秒")
+    if event == "cache_miss":
+        return f"产物缓存未命中 ({info['key'][:12]}, 计算键耗时 {info['seconds']:.1f} 秒)"
+    if event == "cache_stored":
+        evicted = f", 淘汰了 {info['evicted']} 个旧条目" if info["evicted"] else ""
+        return f"📦 已将 {info['size'] / 1024 ** 2:.1f} MB 存入产物缓存{evicted}"
+    if event == "cache_skipped":
+        return f"⚠️ 已跳过产物缓存: {info['reason']}"
+    if event == "ccache_stats":
+        return (f"🧮 ccache: 命中 {info['hits']}/{info['hits'] + info['misses']} ({info['hit_rate']:.0%}), "
+                f"节省约 {info['bytes_saved'] / 1024 ** 2:.1f} MB 和约 {format_duration(info['seconds_saved'])}")
+    if event == "nuitka_cache":
+        if info["removed"]:
+            return (f"🗄 Nuitka 缓存: {format_size(info['total'])} / 配额 {format_size(info['quota'])}, "
+                    f"淘汰了 {info['removed']} 个文件 ({format_size(info['freed'])}), 耗时 {info['seconds']:.1f} 秒")
+        return f"🗄 Nuitka 缓存: {format_size(info['total'])} / 配额 {format_size(info['quota'])}"
+    if event == "memory_plan":
+        basis = "实测" if info["measured"] else "估计"
+        message = f"🧠 内存调控: 可用 {format_size(info['available'])}，每个编译器约 {format_size(info['compiler_rss'])} ({basis}) → --jobs={info['jobs']}"
+        if info["jobs"] != info["requested"]:
+            message += f" (原为 {info['requested']})"
+        if info["low_memory"]:
+            message += "，并启用 --low-memory"
+        return message
+    if event == "compilers_paused":
+        return f"⏸ 内存不足 (可用 {format_size(info['available'])}): 已暂停一个编译器，共暂停 {info['paused']} 个"
+    if event == "compilers_resumed":
+        return f"▶ 内存已恢复 (可用 {format_size(info['available'])}): 已恢复一个编译器，仍暂停 {info['paused']} 个"
+    if event == "resource_summary":
+        total = sum(info["cpu_seconds"].values())
+        parts = [
+            f"{CPU_CATEGORY_LABELS.get(category, category)} {seconds:.1f} 秒 ({seconds / total:.0%})"
+            for category, seconds in info["cpu_seconds"].items() if seconds >= 0.05
+        ]
+        message = f"🧮 CPU 时间 {total:.1f} 秒"
+        if parts:
+            message += f" ({'，'.join(parts)})"
+        if info["peak_rss"]:
+            message += f" · 峰值内存 {format_size(info['peak_rss'])}"
+        return message + f" · I/O 读取 {format_size(info['read_bytes'])}，写入 {format_size(info['write_bytes'])}"
+    if event == "build_summary":
+        table = format_phase_summary(info["phases"], info["total"], PHASE_LABELS, SUMMARY_HEADINGS)
+        lines = ["📊 构建摘要:"] + ["    " + line for line in table]
+        if info["artifact_size"] is not None:
+            lines.append(f"    产物大小: {format_size(info['artifact_size'])}")
+        if info["peak_rss"] is not None:
+            lines.append(f"    峰值内存: {format_size(info['peak_rss'])}")
+        return "\n".join(lines)
+    if event == "compilation_report":
+        totals = info["report"]["totals"]
+        return (f"🧾 编译报告: {totals['modules']} 个模块(已编译 {totals['compiled']} 个)，"
+                f"C 代码 {format_size(totals['size'])}，优化耗时 {totals['seconds']:.1f} 秒")
+    if event == "report_skipped":
+        return f"⚠️ 未读取编译报告: {info['reason']}"
+    if event == "build_dir":
+        if info["warm"]:
+            last = f"(上次冷构建 {format_duration(info['cold_seconds'])})" if info["cold_seconds"] else ""
+            message = f"🔥 热构建目录: {info['directory']}{last}"
+        else:
+            message = f"🧊 冷构建目录: {info['directory']}({BUILD_DIR_REASONS[info['reason']]})"
+        if not info.get("ccache", True):
+            message += "，未使用 ccache，所有 C 文件都会重新编译"
+        return message
+    if event == "build_dir_summary":
+        if info["warm"] and info["cold_seconds"]:
+            message = (f"🔥 热构建耗时 {format_duration(info['seconds'])}，"
+                       f"为上次冷构建({format_duration(info['cold_seconds'])})的 "
+                       f"{info['seconds'] / info['cold_seconds']:.0%}")
+        else:
+            message = f"{'🔥 热' if info['warm'] else '🧊 冷'}构建耗时 {format_duration(info['seconds'])}"
+        if info["moved_seconds"] is not None:
+            message += f"，产物已在 {info['moved_seconds']:.1f} 秒内移至输出目录"
+        return message
+    if event == "build_dir_skipped":
+        return f"⚠️ 未使用持久构建目录: {info['reason']}"
+    if event == "history_skipped":
+        return f"⚠️ 未记录构建历史: {info['reason']}"
+    return None
+
 
 class PackageThread(QThread):
     """执行打包命令的线程"""
     log_signal = Signal(str)
+    log_batch_signal = Signal(list)
+    throughput_signal = Signal(float)
+    resources_signal = Signal(dict)
     progress_signal = Signal(int)
+    phase_signal = Signal(str, float)
+    event_signal = Signal(str, dict)
     finished_signal = Signal(bool)
 
-    def __init__(self, command, parent=None):
+    def __init__(self, command, artifact_cache=None, env=None, ccache=None, nuitka_cache=None,
+                 history=None, governor=None, warm_dirs=None, parent=None):
         super().__init__(parent)
         self.command = command
         self.running = True
-        self.process = None  # 添加对子进程的引用
+        self.job_id = None  # 构建队列任务时设置
+        # 运行子进程并解析其输出
+        self.runner = BuildRunner(
+            command,
+            env=env,
+            on_lines=self.log_batch_signal.emit,
+            on_rate=self.throughput_signal.emit,
+            on_progress=self._emit_progress,
+            on_event=self.event_signal.emit,
+            artifact_cache=artifact_cache,
+            ccache=ccache,
+            nuitka_cache=nuitka_cache,
+            history=history,
+            on_resources=self.resources_signal.emit,
+            governor=governor,
+            warm_dirs=warm_dirs,
+        )
+
+    def _emit_progress(self, percent, phase, eta):
+        self.progress_signal.emit(percent)
+        self.phase_signal.emit(phase, -1.0 if eta is None else eta)
 
     def run(self):
         """执行打包命令并捕获输出"""
         self.log_signal.emit(f"开始执行打包命令: {' '.join(self.command)}\n")
         try:
-            # 创建子进程执行命令
-            self.process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1
-            )
-
-            # 实时读取输出
-            for line in iter(self.process.stdout.readline, ''):
-                if not self.running:
-                    break
-                self.log_signal.emit(line.strip())
+            return_code = self.runner.run()
+            batcher = self.runner.batcher
+            elapsed = self.runner.elapsed
+            if batcher:
+                self.log_signal.emit(
+                    f"日志管道: {batcher.total_lines} 行, 耗时 {elapsed:.1f} 秒 "
+                    f"(平均 {batcher.average_rate:,.0f} 行/秒)"
+                )
 
-            # 等待进程结束
-            return_code = self.process.wait()
             if return_code == 0:
                 self.log_signal.emit("\n✅ 打包成功完成！")
                 self.finished_signal.emit(True)
@@ -67,14 +347,126 @@ class PackageThread(QThread):
         self.log_signal.emit("\n🛑 用户请求停止打包...")
 
         # 尝试终止子进程
-        if self.process:
-            try:
-                self.process.terminate()
-            except Exception as e:
-                self.log_signal.emit(f"⚠️ 终止进程失败: {str(e)}")
+        try:
+            self.runner.stop()
+        except Exception as e:
+            self.log_signal.emit(f"⚠️ 终止进程失败: {str(e)}")
+
+
+class DaemonBuildThread(QThread):
+    """跟踪构建守护进程中构建的线程
+
+    信号与 PackageThread 相同。未指定 ``daemon_job`` 时将命令提交给守护进程，
+    守护进程未运行时先用 ``daemon_argv`` 启动；否则关联到该守护进程任务并回放其日志。
+    ``detach`` 停止跟踪但不会停止构建。
+    """
+    log_signal = Signal(str)
+    log_batch_signal = Signal(list)
+    throughput_signal = Signal(float)
+    resources_signal = Signal(dict)
+    progress_signal = Signal(int)
+    phase_signal = Signal(str, float)
+    event_signal = Signal(str, dict)
+    finished_signal = Signal(bool)
+
+    def __init__(self, daemon_argv, name, command, options=None, daemon_job=None, parent=None):
+        super().__init__(parent)
+        self.daemon_argv = daemon_argv
+        self.name = name
+        self.command = command
+        self.options = options
+        self.daemon_job = daemon_job
+        self.job_id = None  # 构建队列任务时设置
+        self.client = DaemonClient()
+        self.attachment = None
+        self.stop_requested = False
+        self.detached = False
+
+    def run(self):
+        """提交或关联构建并转发其消息"""
+        try:
+            if self.daemon_job is None:
+                self.client = start_daemon(self.daemon_argv)
+                self.daemon_job = self.client.submit(self.name, self.command, self.options)["id"]
+                self.log_signal.emit(f"在构建守护进程中开始执行打包命令(任务 {self.daemon_job}): {' '.join(self.command)}\n")
+                if self.stop_requested:
+                    # 在提交构建之前已被停止
+                    self.client.cancel(self.daemon_job)
+            else:
+                self.log_signal.emit(f"已关联构建守护进程任务 {self.daemon_job}，正在回放其日志")
+            self.attachment = self.client.attach(self.daemon_job)
+            if self.detached:
+                self.attachment.close()
+            for message in self.attachment:
+                kind = message["type"]
+                if kind == "lines":
+                    self.log_batch_signal.emit(message["lines"])
+                elif kind == "event":
+                    self.event_signal.emit(message["event"], message["info"])
+                elif kind == "progress":
+                    self.progress_signal.emit(message["percent"])
+                    if message["phase"]:
+                        self.phase_signal.emit(message["phase"], -1.0 if message["eta"] is None else message["eta"])
+                elif kind == "rate":
+                    self.throughput_signal.emit(message["rate"])
+                elif kind == "resources":
+                    self.resources_signal.emit(message["sample"])
+                elif kind == "finished":
+                    if message["status"] == SUCCEEDED:
+                        self.log_signal.emit("\n✅ 打包成功完成！")
+                    elif message["status"] == CANCELLED:
+                        self.log_signal.emit("\n🛑 打包已停止")
+                    else:
+                        self.log_signal.emit(f"\n❌ 打包失败，错误代码: {message['return_code']}")
+                    self.finished_signal.emit(message["status"] == SUCCEEDED)
+                    return
+            if not self.detached:
+                self.log_signal.emit("\n❌ 与构建守护进程的连接已断开")
+                self.finished_signal.emit(False)
+        except DaemonError as e:
+            self.log_signal.emit(f"\n❌ 构建守护进程: {e}")
+            self.finished_signal.emit(False)
+
+    def stop(self):
+        """停止守护进程中的构建"""
+        self.stop_requested = True
+        self.log_signal.emit("\n🛑 用户请求停止打包...")
+        if self.daemon_job is None:
+            return
+        try:
+            self.client.cancel(self.daemon_job)
+        except DaemonError as e:
+            self.log_signal.emit(f"⚠️ 终止进程失败: {e}")
+
+    def detach(self):
+        """停止跟踪构建，构建在守护进程中继续运行"""
+        self.detached = True
+        if self.attachment:
+            self.attachment.close()
+
+
+# 启动基准测试的列标题和标签
+BENCHMARK_HEADERS = ["程序", "缓存", "次数", "最小", "中位数", "P95", "峰值内存"]
+SWEEP_HEADERS = ["设置", "大小", "首次启动", "重复启动", "解压", "帕累托"]
+SWEEP_LABELS = {
+    "uncompressed": "不压缩 (--onefile-no-compression)",
+    "zstd-3": "zstd 3 级 (--low-memory)",
+    "zstd-22": "zstd 22 级 (默认)",
+    "archive": "归档 (--onefile-as-archive)",
+}
+LEVEL_HEADERS = ["zstd 级别", "载荷大小(估算)", "压缩耗时", "解压耗时"]
+# C 编译器对比的列
+COMPILER_HEADERS = ["编译器", "版本", "编译耗时", "大小", "首次启动", "重复启动"]
+COMPILER_FAMILY_LABELS = {"gcc": "GCC", "clang": "Clang", "msvc": "MSVC"}
+COMPARISON_HEADERS = ["独立模式", "单文件"]
+COMPARISON_METRICS = ["磁盘占用", "首次启动", "重复启动", "峰值内存", "临时解压", "临时目录残留"]
+BENCHMARK_LABELS = {"compiled": "编译程序", "python": "CPython", "warm": "热", "cold": "冷"}
 
 
 class NuitkaPackager(QMainWindow):
+    sources_changed = Signal(list)
+    benchmark_result = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Nuitka 高级打包工具")
@@ -103,8 +495,95 @@ class NuitkaPackager(QMainWindow):
         self.main_file = ""
         self.icon_file = ""
         self.output_dir = ""
+        self.profile_path = ""
         self.package_thread = None
+        self.preflight_task = None
+        # 构建前检查运行期间源码发生变化时设置
+        self.rebuild_pending = False
         self.plugins = []
+        self._last_status_update = 0.0
+        self.scheduler = BuildScheduler(self.core_budget_spin.value())
+        self.queue_threads = {}
+        self.queue_logs = {}
+        self.source_watcher = None
+        self.sources_changed.connect(self.rebuild_on_change)
+        self.artifact_cache = ArtifactCache(max_bytes=self.artifact_cache_size_spin.value() * 1024 ** 3)
+        self.update_artifact_cache_stats()
+        ccache_binary = find_ccache()
+        self.ccache = Ccache(ccache_binary) if ccache_binary else None
+        self.prewarm_thread = None
+        self.nuitka_cache_task = None
+        self.warm_build_task = None
+        # 已完成构建的阶段耗时和结果
+        self.history = BuildHistory()
+        # 在历史标签页中浏览已记录的构建
+        self.history_model = HistoryModel(self.history, HISTORY_HEADERS, HISTORY_RESULTS, self)
+        self.history_view.setModel(self.history_model)
+        self.history_view.setColumnWidth(0, 150)
+        self.history_view.selectionModel().currentRowChanged.connect(self.show_history_trends)
+        self.refresh_history()
+        # 在体积分析标签页中显示独立构建的体积构成
+        self.dist_reports = []
+        self.dist_size_task = None
+        self.dist_package_model = SizeTableModel(
+            ["name", "kind", "files", "size", "share"], DIST_SIZE_HEADERS, DIST_KIND_LABELS, self
+        )
+        self.dist_library_model = SizeTableModel(["name", "owner", "size", "share"], DIST_LIBRARY_HEADERS, parent=self)
+        self.dist_view.setModel(self.dist_package_model)
+        self.dist_view.setColumnWidth(0, 260)
+        # 导入分析标签页中主文件的导入图
+        self.import_report = None
+        self.import_task = None
+        self.import_stop = threading.Event()
+        self.import_package_model = SizeTableModel(
+            ["name", "kind", "modules", "size", "share"], IMPORT_PACKAGE_HEADERS, IMPORT_KIND_LABELS, self
+        )
+        self.import_module_model = SizeTableModel(
+            ["name", "kind", "importers", "size", "share", "via"], IMPORT_MODULE_HEADERS, IMPORT_KIND_LABELS, self
+        )
+        self.import_view.setModel(self.import_package_model)
+        self.import_view.setColumnWidth(0, 260)
+        # 编译开销标签页中上次构建的编译开销
+        self.compile_report = None
+        self.compile_package_model = SizeTableModel(
+            ["name", "modules", "compiled", "size", "share", "seconds"], COMPILE_PACKAGE_HEADERS, parent=self
+        )
+        self.compile_module_model = SizeTableModel(
+            ["name", "kind", "size", "share", "seconds", "reason"], COMPILE_MODULE_HEADERS, COMPILE_KIND_LABELS, self
+        )
+        self.compile_view.setModel(self.compile_package_model)
+        self.compile_view.setColumnWidth(0, 260)
+        # 已构建程序的启动基准测试
+        self.benchmark_task = None
+        self.benchmark_stop = threading.Event()
+        self.benchmark_result.connect(self.add_benchmark_row)
+        # 单文件 / 独立模式对比: 仍在运行的构建 {队列任务 id: 模式} 以及 {模式: 命令}
+        self.comparison_jobs = {}
+        self.comparison_commands = {}
+        self.comparison_task = None
+        # 压缩设置扫描: 仍在运行的构建 {队列任务 id: 设置} 以及 {设置: 命令}
+        self.sweep_jobs = {}
+        self.sweep_commands = {}
+        self.sweep_task = None
+        self.sweep_recommended = None
+        # 编译器对比: 仍在运行的构建 {队列任务 id: 编译器名称} 以及 {编译器名称: 命令}
+        self.compiler_jobs = {}
+        self.compiler_commands = {}
+        self.compiler_task = None
+        # 在 PATH 中找到的编译器、链接器和 ccache
+        self.toolchain = None
+        self.update_ccache_settings()
+        self.update_nuitka_cache_settings()
+        self.refresh_warm_build_dirs()
+        self.update_memory_governor_settings()
+        # 构建守护进程中的构建，例如重启之前启动的构建
+        self.attach_daemon_jobs()
+        # 先显示之前找到的解释器，再重新查找
+        self.populate_interpreters(load_index())
+        self.refresh_interpreters()
+        # 先显示之前找到的工具链，PATH 有变化时再重新探测
+        self.populate_toolchain(load_toolchain())
+        self.refresh_toolchain()
 
         # 设置样式
         self.set_style()
@@ -159,8 +638,12 @@ class NuitkaPackager(QMainWindow):
 
         # Python解释器选择
         self.python_label = QLabel("Python解释器:")
-        self.python_input = QLineEdit()
-        self.python_input.setPlaceholderText("请选择Python解释器 (位于venv/Scripts/python.exe)")
+        self.python_input = QComboBox()
+        self.python_input.setEditable(True)
+        self.python_input.setInsertPolicy(QComboBox.NoInsert)
+        self.python_input.lineEdit().setPlaceholderText("请选择Python解释器 (位于venv/Scripts/python.exe)")
+        self.python_input.activated.connect(self.choose_python)
+        self.python_input.lineEdit().editingFinished.connect(self.python_edited)
         self.python_btn = QPushButton("浏览...")
         self.python_btn.clicked.connect(self.select_python)
 
@@ -203,6 +686,22 @@ class NuitkaPackager(QMainWindow):
         config_layout.addWidget(self.output_btn, 3, 2)
 
         file_config_layout.addWidget(config_group)
+
+        # 配置方案控制 (保存的配置, 也可供 main_cli.py 使用)
+        profile_group = QGroupBox("配置方案")
+        profile_layout = QHBoxLayout(profile_group)
+        profile_layout.setContentsMargins(15, 15, 15, 15)
+        self.profile_label = QLabel("未加载配置 (默认)")
+        self.load_profile_btn = QPushButton("加载配置...")
+        self.load_profile_btn.clicked.connect(self.load_profile)
+        self.save_profile_btn = QPushButton("保存配置...")
+        self.save_profile_btn.clicked.connect(self.save_profile)
+        profile_layout.addWidget(self.profile_label)
+        profile_layout.addStretch()
+        profile_layout.addWidget(self.load_profile_btn)
+        profile_layout.addWidget(self.save_profile_btn)
+
+        file_config_layout.addWidget(profile_group)
         file_config_layout.addStretch()
 
         # 将文件配置标签页添加到主选项卡
@@ -402,6 +901,10 @@ class NuitkaPackager(QMainWindow):
         self.lto_check.setChecked(False)
         self.lto_check.stateChanged.connect(self.update_command)
 
+        self.low_memory_check = QCheckBox("--low-memory (降低内存占用；单文件载荷使用 zstd 3 级压缩)")
+        self.low_memory_check.setChecked(False)
+        self.low_memory_check.stateChanged.connect(self.update_command)
+
         self.disable_ccache_check = QCheckBox("--disable-ccache (禁用ccache缓存)")
         self.disable_ccache_check.setChecked(False)
         self.disable_ccache_check.stateChanged.connect(self.update_command)
@@ -429,9 +932,75 @@ class NuitkaPackager(QMainWindow):
 
         advanced_group_layout.addWidget(self.windows_uac_admin_check, 2, 0)
         advanced_group_layout.addWidget(self.windows_uac_uiaccess_check, 2, 1)
+        advanced_group_layout.addWidget(self.low_memory_check, 2, 2)
 
         advanced_layout.addWidget(advanced_group)
 
+        # 构建使用的 C 编译器和链接器
+        toolchain_group = QGroupBox("C 工具链")
+        toolchain_layout = QGridLayout(toolchain_group)
+        toolchain_layout.setSpacing(10)
+        self.compiler_label = QLabel("C 编译器:")
+        self.compiler_combo = QComboBox()
+        self.compiler_combo.addItem("由 Nuitka 选择", "")
+        self.compiler_combo.setToolTip("通过 CC 传给 Nuitka，clang 还会加上 --clang；ccache 仍会包装它")
+        self.compiler_combo.currentIndexChanged.connect(self.update_command)
+        self.linker_label = QLabel("链接器:")
+        self.linker_combo = QComboBox()
+        self.linker_combo.addItem("默认", "")
+        self.linker_combo.setToolTip("通过 LDFLAGS 中的 -fuse-ld 传给编译器")
+        self.linker_combo.currentIndexChanged.connect(self.update_command)
+        self.toolchain_refresh_btn = QPushButton("重新检测")
+        self.toolchain_refresh_btn.clicked.connect(lambda: self.refresh_toolchain(refresh=True))
+        self.toolchain_status_label = QLabel()
+        self.toolchain_status_label.setWordWrap(True)
+        toolchain_layout.addWidget(self.compiler_label, 0, 0)
+        toolchain_layout.addWidget(self.compiler_combo, 0, 1)
+        toolchain_layout.addWidget(self.toolchain_refresh_btn, 0, 2)
+        toolchain_layout.addWidget(self.linker_label, 1, 0)
+        toolchain_layout.addWidget(self.linker_combo, 1, 1)
+        toolchain_layout.addWidget(self.toolchain_status_label, 2, 0, 1, 3)
+        toolchain_layout.setColumnStretch(1, 1)
+        advanced_layout.addWidget(toolchain_group)
+
+        # 按可用内存调整并监管 C 编译并行度
+        memory_group = QGroupBox("内存调控")
+        memory_layout = QGridLayout(memory_group)
+        memory_layout.setSpacing(10)
+        self.memory_governor_check = QCheckBox("按可用内存设置 --jobs")
+        self.memory_governor_check.setToolTip("每次构建前根据之前构建中测得的编译器内存降低 --jobs，使编译器能容纳于空闲内存")
+        self.memory_governor_check.setChecked(self.settings.value("memory_governor_enabled", False, type=bool))
+        self.memory_governor_check.toggled.connect(self.update_memory_governor_settings)
+        self.low_memory_fallback_check = QCheckBox("连两个编译器都容纳不下时自动使用 --low-memory")
+        self.low_memory_fallback_check.setChecked(self.settings.value("memory_low_memory_fallback", True, type=bool))
+        self.low_memory_fallback_check.toggled.connect(self.update_memory_governor_settings)
+        self.pause_compilers_check = QCheckBox("可用内存不足时暂停编译器 (SIGSTOP)")
+        self.pause_compilers_check.setToolTip("内存低于阈值时暂停最新的编译器，空闲内存恢复到阈值两倍后继续")
+        self.pause_compilers_check.setChecked(self.settings.value("memory_pause_compilers", True, type=bool))
+        self.pause_compilers_check.toggled.connect(self.update_memory_governor_settings)
+        self.memory_reserve_label = QLabel("为系统保留 (GB):")
+        self.memory_reserve_spin = QSpinBox()
+        self.memory_reserve_spin.setRange(0, 256)
+        self.memory_reserve_spin.setValue(self.settings.value("memory_reserve_gb", 1, type=int))
+        self.memory_reserve_spin.valueChanged.connect(self.update_memory_governor_settings)
+        self.pause_below_label = QLabel("低于此值时暂停 (MB):")
+        self.pause_below_spin = QSpinBox()
+        self.pause_below_spin.setRange(64, 65536)
+        self.pause_below_spin.setSingleStep(128)
+        self.pause_below_spin.setValue(self.settings.value("memory_pause_below_mb", 512, type=int))
+        self.pause_below_spin.valueChanged.connect(self.update_memory_governor_settings)
+        self.memory_status_label = QLabel()
+
+        memory_layout.addWidget(self.memory_governor_check, 0, 0, 1, 2)
+        memory_layout.addWidget(self.low_memory_fallback_check, 0, 2)
+        memory_layout.addWidget(self.pause_compilers_check, 1, 0, 1, 2)
+        memory_layout.addWidget(self.memory_status_label, 1, 2)
+        memory_layout.addWidget(self.memory_reserve_label, 2, 0)
+        memory_layout.addWidget(self.memory_reserve_spin, 2, 1)
+        memory_layout.addWidget(self.pause_below_label, 3, 0)
+        memory_layout.addWidget(self.pause_below_spin, 3, 1)
+        advanced_layout.addWidget(memory_group)
+
         # 包含选项组
         include_group = QGroupBox("包含选项")
         include_layout = QGridLayout(include_group)
@@ -501,6 +1070,14 @@ class NuitkaPackager(QMainWindow):
         self.include_raw_dir_input.setMinimumHeight(20)  # 设置最小高度
         self.include_raw_dir_input.textChanged.connect(self.update_command)
 
+        # 不跟随的导入
+        self.nofollow_import_label = QLabel("不跟随导入:")
+        self.nofollow_import_input = QLineEdit()
+        self.nofollow_import_input.setPlaceholderText("模块或包名 (e.g., numpy.tests)")
+        self.nofollow_import_input.setMinimumWidth(300)  # 防止压缩
+        self.nofollow_import_input.setMinimumHeight(20)  # 设置最小高度
+        self.nofollow_import_input.textChanged.connect(self.update_command)
+
         # 添加包含选项到布局
         include_layout.addWidget(self.include_package_label, 0, 0)
         include_layout.addWidget(self.include_package_input, 0, 1)
@@ -526,6 +1103,9 @@ class NuitkaPackager(QMainWindow):
         include_layout.addWidget(self.include_raw_dir_label, 7, 0)
         include_layout.addWidget(self.include_raw_dir_input, 7, 1)
 
+        include_layout.addWidget(self.nofollow_import_label, 8, 0)
+        include_layout.addWidget(self.nofollow_import_input, 8, 1)
+
         advanced_layout.addWidget(include_group)
         advanced_layout.addStretch()
 
@@ -578,6 +1158,50 @@ class NuitkaPackager(QMainWindow):
 
         onefile_layout.addWidget(onefile_group)
 
+        sweep_group = QGroupBox("压缩设置扫描")
+        sweep_group_layout = QVBoxLayout(sweep_group)
+        sweep_group_layout.setContentsMargins(15, 15, 15, 15)
+        sweep_hint = QLabel("通过构建队列并行地按每种载荷设置将当前配置构建为单文件程序(位于输出目录下的 compression/)，并使用基准测试标签页中的设置测试大小和启动耗时。其他 zstd 级别通过在本地压缩未压缩的程序进行估算。")
+        sweep_hint.setWordWrap(True)
+        sweep_group_layout.addWidget(sweep_hint)
+
+        self.sweep_build_btn = QPushButton("构建并扫描")
+        self.sweep_build_btn.clicked.connect(self.build_sweep)
+        self.sweep_measure_btn = QPushButton("扫描已有构建")
+        self.sweep_measure_btn.clicked.connect(self.sweep_existing_builds)
+        self.sweep_apply_btn = QPushButton("应用推荐设置")
+        self.sweep_apply_btn.setEnabled(False)
+        self.sweep_apply_btn.clicked.connect(self.apply_recommended_compression)
+        sweep_buttons_layout = QHBoxLayout()
+        sweep_buttons_layout.addWidget(self.sweep_build_btn)
+        sweep_buttons_layout.addWidget(self.sweep_measure_btn)
+        sweep_buttons_layout.addStretch()
+        sweep_buttons_layout.addWidget(self.sweep_apply_btn)
+        sweep_group_layout.addLayout(sweep_buttons_layout)
+
+        self.sweep_table = QTableWidget(0, len(SWEEP_HEADERS))
+        self.sweep_table.setHorizontalHeaderLabels(SWEEP_HEADERS)
+        self.sweep_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.sweep_table.verticalHeader().setVisible(False)
+        self.sweep_table.horizontalHeader().setStretchLastSection(True)
+        self.sweep_table.setColumnWidth(0, 280)
+        for column in range(1, len(SWEEP_HEADERS) - 1):
+            self.sweep_table.setColumnWidth(column, 130)
+        self.level_table = QTableWidget(0, len(LEVEL_HEADERS))
+        self.level_table.setHorizontalHeaderLabels(LEVEL_HEADERS)
+        self.level_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.level_table.verticalHeader().setVisible(False)
+        self.level_table.horizontalHeader().setStretchLastSection(True)
+        for column in range(len(LEVEL_HEADERS) - 1):
+            self.level_table.setColumnWidth(column, 180)
+        self.sweep_summary_label = QLabel()
+        self.sweep_summary_label.setWordWrap(True)
+        sweep_group_layout.addWidget(self.sweep_table)
+        sweep_group_layout.addWidget(self.level_table)
+        sweep_group_layout.addWidget(self.sweep_summary_label)
+
+        onefile_layout.addWidget(sweep_group)
+
         # DLL选项组
         dll_group = QGroupBox("DLL控制")
         dll_layout = QGridLayout(dll_group)
@@ -754,10 +1378,14 @@ class NuitkaPackager(QMainWindow):
         log_group_layout.setContentsMargins(15, 15, 15, 15)
         log_group.setMinimumHeight(450)  # 关键设置：固定最小高度
 
-        self.log_edit = QTextEdit()
-        self.log_edit.setReadOnly(True)
-        self.log_edit.setFont(QFont("Consolas", 9))
-        log_group_layout.addWidget(self.log_edit)
+        self.log_view = LogView()
+        self.log_view.setObjectName("log_view")
+        self.log_view.setFont(QFont("Consolas", 9))
+        log_group_layout.addWidget(self.log_view)
+
+        # 实测日志管道吞吐量
+        self.log_rate_label = QLabel("日志吞吐量: -")
+        log_group_layout.addWidget(self.log_rate_label)
 
         # 添加日志框到布局
         log_layout.addWidget(log_group)
@@ -766,6 +1394,558 @@ class NuitkaPackager(QMainWindow):
         # 将操作日志标签页添加到主选项卡
         main_tab.addTab(log_tab, "操作日志")
 
+        # ===== 历史标签页 =====
+        history_tab = QWidget()
+        history_layout = QVBoxLayout(history_tab)
+        history_layout.setContentsMargins(10, 10, 10, 10)
+        history_layout.setSpacing(15)
+
+        history_group = QGroupBox("构建历史")
+        history_group_layout = QVBoxLayout(history_group)
+        history_group_layout.setContentsMargins(15, 15, 15, 15)
+        history_group.setMinimumHeight(450)
+
+        history_controls_layout = QHBoxLayout()
+        self.history_project_combo = QComboBox()
+        self.history_project_combo.currentIndexChanged.connect(self.select_history_project)
+        self.history_refresh_btn = QPushButton("刷新")
+        self.history_refresh_btn.clicked.connect(self.refresh_history)
+        history_controls_layout.addWidget(QLabel("项目:"))
+        history_controls_layout.addWidget(self.history_project_combo, 1)
+        history_controls_layout.addWidget(self.history_refresh_btn)
+        history_group_layout.addLayout(history_controls_layout)
+
+        # 上方为历史构建，下方为所选项目的趋势
+        self.history_view = QTableView()
+        self.history_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.history_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.history_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.history_view.verticalHeader().setVisible(False)
+        self.history_view.horizontalHeader().setStretchLastSection(True)
+
+        self.duration_chart = TrendChart("构建耗时", format_duration, "{count} 次构建，最近一次 {latest}")
+        self.size_chart = TrendChart("产物大小", format_size, "{count} 次构建，最近一次 {latest}")
+        self.memory_chart = TrendChart("峰值内存", format_size, "{count} 次构建，最近一次 {latest}")
+        charts_widget = QWidget()
+        charts_layout = QHBoxLayout(charts_widget)
+        charts_layout.setContentsMargins(0, 0, 0, 0)
+        charts_layout.addWidget(self.duration_chart)
+        charts_layout.addWidget(self.size_chart)
+        charts_layout.addWidget(self.memory_chart)
+
+        history_splitter = QSplitter(Qt.Vertical)
+        history_splitter.addWidget(self.history_view)
+        history_splitter.addWidget(charts_widget)
+        history_group_layout.addWidget(history_splitter)
+
+        history_layout.addWidget(history_group)
+        history_layout.addStretch()
+
+        # 将历史标签页添加到主选项卡
+        main_tab.addTab(history_tab, "历史")
+
+        # ===== 体积分析标签页 =====
+        dist_size_tab = QWidget()
+        dist_size_layout = QVBoxLayout(dist_size_tab)
+        dist_size_layout.setContentsMargins(10, 10, 10, 10)
+        dist_size_layout.setSpacing(15)
+
+        dist_size_group = QGroupBox("独立目录体积")
+        dist_size_group_layout = QVBoxLayout(dist_size_group)
+        dist_size_group_layout.setContentsMargins(15, 15, 15, 15)
+        dist_size_group.setMinimumHeight(450)
+
+        dist_controls_layout = QHBoxLayout()
+        self.dist_combo = QComboBox()
+        self.dist_combo.currentIndexChanged.connect(self.show_dist_report)
+        self.dist_view_combo = QComboBox()
+        self.dist_view_combo.addItems(["按包", "按动态库"])
+        self.dist_view_combo.currentIndexChanged.connect(self.show_dist_report)
+        self.dist_analyze_btn = QPushButton("分析")
+        self.dist_analyze_btn.clicked.connect(self.analyze_dist_size)
+        dist_controls_layout.addWidget(QLabel("目录:"))
+        dist_controls_layout.addWidget(self.dist_combo, 1)
+        dist_controls_layout.addWidget(self.dist_view_combo)
+        dist_controls_layout.addWidget(self.dist_analyze_btn)
+        dist_size_group_layout.addLayout(dist_controls_layout)
+
+        self.dist_summary_label = QLabel("分析输出目录中的 .dist 目录(每次独立模式构建后自动运行)")
+        dist_size_group_layout.addWidget(self.dist_summary_label)
+
+        # 上方为体积最大的来源，下方为建议的排除项
+        self.dist_view = QTableView()
+        self.dist_view.setSortingEnabled(True)
+        self.dist_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.dist_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.dist_view.verticalHeader().setVisible(False)
+        self.dist_view.horizontalHeader().setStretchLastSection(True)
+
+        suggestions_widget = QWidget()
+        suggestions_layout = QVBoxLayout(suggestions_widget)
+        suggestions_layout.setContentsMargins(0, 0, 0, 0)
+        self.dist_suggestions_table = QTableWidget(0, 4)
+        self.dist_suggestions_table.setHorizontalHeaderLabels(["选项", "值", "最多节省", "原因"])
+        self.dist_suggestions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.dist_suggestions_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.dist_suggestions_table.verticalHeader().setVisible(False)
+        self.dist_suggestions_table.horizontalHeader().setStretchLastSection(True)
+        self.dist_apply_btn = QPushButton("应用所选建议")
+        self.dist_apply_btn.setToolTip("被排除的文件可能在运行时需要，重新构建后请测试程序")
+        self.dist_apply_btn.clicked.connect(self.apply_dist_suggestions)
+        suggestions_layout.addWidget(QLabel("建议:"))
+        suggestions_layout.addWidget(self.dist_suggestions_table)
+        suggestions_layout.addWidget(self.dist_apply_btn, 0, Qt.AlignRight)
+
+        dist_splitter = QSplitter(Qt.Vertical)
+        dist_splitter.addWidget(self.dist_view)
+        dist_splitter.addWidget(suggestions_widget)
+        dist_size_group_layout.addWidget(dist_splitter)
+
+        dist_size_layout.addWidget(dist_size_group)
+        dist_size_layout.addStretch()
+
+        # 将体积分析标签页添加到主选项卡
+        main_tab.addTab(dist_size_tab, "体积分析")
+
+        # ===== 导入分析标签页 =====
+        imports_tab = QWidget()
+        imports_layout = QVBoxLayout(imports_tab)
+        imports_layout.setContentsMargins(10, 10, 10, 10)
+        imports_layout.setSpacing(15)
+
+        imports_group = QGroupBox("导入图")
+        imports_group_layout = QVBoxLayout(imports_group)
+        imports_group_layout.setContentsMargins(15, 15, 15, 15)
+        imports_group.setMinimumHeight(450)
+
+        import_controls_layout = QHBoxLayout()
+        self.import_view_combo = QComboBox()
+        self.import_view_combo.addItems(["按包", "按模块"])
+        self.import_view_combo.currentIndexChanged.connect(self.show_import_view)
+        self.import_scan_btn = QPushButton("扫描")
+        self.import_scan_btn.clicked.connect(self.scan_import_graph)
+        import_controls_layout.addWidget(self.import_view_combo)
+        import_controls_layout.addStretch()
+        import_controls_layout.addWidget(self.import_scan_btn)
+        imports_group_layout.addLayout(import_controls_layout)
+
+        self.import_summary_label = QLabel("按所选解释器的 sys.path 跟踪主文件的导入")
+        self.import_summary_label.setWordWrap(True)
+        imports_group_layout.addWidget(self.import_summary_label)
+
+        # 上方为模块或包，下方为建议
+        self.import_view = QTableView()
+        self.import_view.setSortingEnabled(True)
+        self.import_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.import_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.import_view.verticalHeader().setVisible(False)
+        self.import_view.horizontalHeader().setStretchLastSection(True)
+
+        import_suggestions_widget = QWidget()
+        import_suggestions_layout = QVBoxLayout(import_suggestions_widget)
+        import_suggestions_layout.setContentsMargins(0, 0, 0, 0)
+        self.import_suggestions_table = QTableWidget(0, 3)
+        self.import_suggestions_table.setHorizontalHeaderLabels(["选项", "值", "原因"])
+        self.import_suggestions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.import_suggestions_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.import_suggestions_table.verticalHeader().setVisible(False)
+        self.import_suggestions_table.horizontalHeader().setStretchLastSection(True)
+        self.import_apply_btn = QPushButton("应用所选建议")
+        self.import_apply_btn.clicked.connect(self.apply_import_suggestions)
+        import_suggestions_layout.addWidget(QLabel("建议:"))
+        import_suggestions_layout.addWidget(self.import_suggestions_table)
+        import_suggestions_layout.addWidget(self.import_apply_btn, 0, Qt.AlignRight)
+
+        imports_splitter = QSplitter(Qt.Vertical)
+        imports_splitter.addWidget(self.import_view)
+        imports_splitter.addWidget(import_suggestions_widget)
+        imports_group_layout.addWidget(imports_splitter)
+
+        imports_layout.addWidget(imports_group)
+        imports_layout.addStretch()
+
+        # 将导入分析标签页添加到主选项卡
+        main_tab.addTab(imports_tab, "导入分析")
+
+        # ===== 编译开销标签页 =====
+        compile_tab = QWidget()
+        compile_layout = QVBoxLayout(compile_tab)
+        compile_layout.setContentsMargins(10, 10, 10, 10)
+        compile_layout.setSpacing(15)
+
+        compile_group = QGroupBox("各模块的编译开销")
+        compile_group_layout = QVBoxLayout(compile_group)
+        compile_group_layout.setContentsMargins(15, 15, 15, 15)
+        compile_group.setMinimumHeight(450)
+
+        compile_controls_layout = QHBoxLayout()
+        self.compile_view_combo = QComboBox()
+        self.compile_view_combo.addItems(["按包", "按模块"])
+        self.compile_view_combo.currentIndexChanged.connect(self.show_compile_view)
+        compile_controls_layout.addWidget(self.compile_view_combo)
+        compile_controls_layout.addStretch()
+        compile_group_layout.addLayout(compile_controls_layout)
+
+        self.compile_summary_label = QLabel("下次构建的 Nuitka 编译报告：每个模块被包含的原因、其 C 代码和优化耗时")
+        self.compile_summary_label.setWordWrap(True)
+        compile_group_layout.addWidget(self.compile_summary_label)
+
+        self.compile_view = QTableView()
+        self.compile_view.setSortingEnabled(True)
+        self.compile_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.compile_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.compile_view.verticalHeader().setVisible(False)
+        self.compile_view.horizontalHeader().setStretchLastSection(True)
+        compile_group_layout.addWidget(self.compile_view)
+
+        compile_layout.addWidget(compile_group)
+
+        # 将编译开销标签页添加到主选项卡
+        main_tab.addTab(compile_tab, "编译开销")
+
+        # ===== 基准测试标签页 =====
+        benchmark_tab = QWidget()
+        benchmark_layout = QVBoxLayout(benchmark_tab)
+        benchmark_layout.setContentsMargins(10, 10, 10, 10)
+        benchmark_layout.setSpacing(15)
+
+        benchmark_group = QGroupBox("启动基准测试")
+        benchmark_group_layout = QVBoxLayout(benchmark_group)
+        benchmark_group_layout.setContentsMargins(15, 15, 15, 15)
+        benchmark_group.setMinimumHeight(450)
+
+        # 基准测试设置，下方为结果
+        benchmark_settings_layout = QGridLayout()
+        benchmark_settings_layout.setSpacing(10)
+        self.benchmark_runs_spin = QSpinBox()
+        self.benchmark_runs_spin.setRange(1, 1000)
+        self.benchmark_runs_spin.setValue(self.settings.value("benchmark_runs", 10, type=int))
+        self.benchmark_runs_spin.valueChanged.connect(self.update_benchmark_settings)
+        self.benchmark_timeout_spin = QSpinBox()
+        self.benchmark_timeout_spin.setRange(1, 3600)
+        self.benchmark_timeout_spin.setValue(self.settings.value("benchmark_timeout", 60, type=int))
+        self.benchmark_timeout_spin.valueChanged.connect(self.update_benchmark_settings)
+        self.benchmark_args_input = QLineEdit()
+        self.benchmark_args_input.setPlaceholderText("传给程序和脚本的参数 (e.g., --version)")
+        self.benchmark_marker_input = QLineEdit()
+        self.benchmark_marker_input.setPlaceholderText("输出中首次出现包含此文本的行时停止计时(默认等待程序退出)")
+        self.benchmark_warm_check = QCheckBox("热缓存")
+        self.benchmark_warm_check.setChecked(True)
+        self.benchmark_cold_check = QCheckBox("冷缓存(每次运行前清除页缓存)")
+        self.benchmark_cold_check.setToolTip("使用 posix_fadvise；仍被运行中程序映射的文件会保留在缓存中")
+        self.benchmark_cold_check.setChecked(cold_cache_supported())
+        self.benchmark_cold_check.setEnabled(cold_cache_supported())
+        self.benchmark_python_check = QCheckBox("与 CPython 直接运行主文件对比")
+        self.benchmark_python_check.setChecked(True)
+        self.benchmark_auto_check = QCheckBox("每次构建成功后运行")
+        self.benchmark_auto_check.setChecked(self.settings.value("benchmark_after_build", False, type=bool))
+        self.benchmark_auto_check.toggled.connect(self.update_benchmark_settings)
+        self.benchmark_run_btn = QPushButton("运行基准测试")
+        self.benchmark_run_btn.clicked.connect(self.run_benchmark)
+        self.benchmark_stop_btn = QPushButton("停止")
+        self.benchmark_stop_btn.setEnabled(False)
+        self.benchmark_stop_btn.clicked.connect(self.stop_benchmark)
+
+        benchmark_settings_layout.addWidget(QLabel("运行次数:"), 0, 0)
+        benchmark_settings_layout.addWidget(self.benchmark_runs_spin, 0, 1)
+        benchmark_settings_layout.addWidget(QLabel("超时(秒):"), 0, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_timeout_spin, 0, 3)
+        benchmark_settings_layout.addWidget(QLabel("参数:"), 1, 0)
+        benchmark_settings_layout.addWidget(self.benchmark_args_input, 1, 1, 1, 3)
+        benchmark_settings_layout.addWidget(QLabel("就绪标记:"), 2, 0)
+        benchmark_settings_layout.addWidget(self.benchmark_marker_input, 2, 1, 1, 3)
+        benchmark_settings_layout.addWidget(self.benchmark_warm_check, 3, 0, 1, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_cold_check, 3, 2, 1, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_python_check, 4, 0, 1, 2)
+        benchmark_settings_layout.addWidget(self.benchmark_auto_check, 4, 2, 1, 2)
+        benchmark_settings_layout.setColumnStretch(1, 1)
+        benchmark_settings_layout.setColumnStretch(3, 1)
+        benchmark_group_layout.addLayout(benchmark_settings_layout)
+
+        benchmark_buttons_layout = QHBoxLayout()
+        benchmark_buttons_layout.addWidget(self.benchmark_run_btn)
+        benchmark_buttons_layout.addWidget(self.benchmark_stop_btn)
+        benchmark_buttons_layout.addStretch()
+        benchmark_group_layout.addLayout(benchmark_buttons_layout)
+
+        self.benchmark_table = QTableWidget(0, len(BENCHMARK_HEADERS))
+        self.benchmark_table.setHorizontalHeaderLabels(BENCHMARK_HEADERS)
+        self.benchmark_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.benchmark_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.benchmark_table.verticalHeader().setVisible(False)
+        self.benchmark_table.horizontalHeader().setStretchLastSection(True)
+        self.benchmark_summary_label = QLabel()
+        self.benchmark_summary_label.setWordWrap(True)
+        benchmark_group_layout.addWidget(self.benchmark_table)
+        benchmark_group_layout.addWidget(self.benchmark_summary_label)
+
+        benchmark_layout.addWidget(benchmark_group)
+
+        comparison_group = QGroupBox("单文件与独立模式对比")
+        comparison_group_layout = QVBoxLayout(comparison_group)
+        comparison_group_layout.setContentsMargins(15, 15, 15, 15)
+        comparison_hint = QLabel("通过构建队列并行地将当前配置分别构建为独立模式目录和单文件程序(位于输出目录下的 comparison/)，然后使用上方的设置分别测试。启动耗时为中位数；首次启动在冷页缓存下进行。")
+        comparison_hint.setWordWrap(True)
+        comparison_group_layout.addWidget(comparison_hint)
+
+        self.comparison_build_btn = QPushButton("构建两者并对比")
+        self.comparison_build_btn.clicked.connect(self.build_variants)
+        self.comparison_measure_btn = QPushButton("对比已有构建")
+        self.comparison_measure_btn.clicked.connect(self.compare_built_variants)
+        comparison_buttons_layout = QHBoxLayout()
+        comparison_buttons_layout.addWidget(self.comparison_build_btn)
+        comparison_buttons_layout.addWidget(self.comparison_measure_btn)
+        comparison_buttons_layout.addStretch()
+        comparison_group_layout.addLayout(comparison_buttons_layout)
+
+        # 每个指标一行，每种模式一列
+        self.comparison_table = QTableWidget(len(COMPARISON_METRICS), len(COMPARISON_HEADERS))
+        self.comparison_table.setHorizontalHeaderLabels(COMPARISON_HEADERS)
+        self.comparison_table.setVerticalHeaderLabels(COMPARISON_METRICS)
+        self.comparison_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.comparison_table.horizontalHeader().setStretchLastSection(True)
+        self.comparison_table.setMinimumHeight(220)
+        self.comparison_summary_label = QLabel()
+        self.comparison_summary_label.setWordWrap(True)
+        comparison_group_layout.addWidget(self.comparison_table)
+        comparison_group_layout.addWidget(self.comparison_summary_label)
+
+        benchmark_layout.addWidget(comparison_group)
+
+        compiler_group = QGroupBox("C 编译器对比")
+        compiler_group_layout = QVBoxLayout(compiler_group)
+        compiler_group_layout.setContentsMargins(15, 15, 15, 15)
+        compiler_hint = QLabel("通过构建队列并行地用 PATH 中找到的每个 C 编译器各构建一次当前配置(位于输出目录下的 compilers/)，然后使用上方的设置测试各程序。编译耗时取自构建历史中各自最近一次构建；启动耗时为中位数。")
+        compiler_hint.setWordWrap(True)
+        compiler_group_layout.addWidget(compiler_hint)
+
+        self.compiler_build_btn = QPushButton("分别构建并对比")
+        self.compiler_build_btn.clicked.connect(self.build_compilers)
+        self.compiler_measure_btn = QPushButton("对比已有构建")
+        self.compiler_measure_btn.clicked.connect(self.compare_built_compilers)
+        compiler_buttons_layout = QHBoxLayout()
+        compiler_buttons_layout.addWidget(self.compiler_build_btn)
+        compiler_buttons_layout.addWidget(self.compiler_measure_btn)
+        compiler_buttons_layout.addStretch()
+        compiler_group_layout.addLayout(compiler_buttons_layout)
+
+        self.compiler_table = QTableWidget(0, len(COMPILER_HEADERS))
+        self.compiler_table.setHorizontalHeaderLabels(COMPILER_HEADERS)
+        self.compiler_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.compiler_table.verticalHeader().setVisible(False)
+        self.compiler_table.horizontalHeader().setStretchLastSection(True)
+        self.compiler_table.setColumnWidth(0, 180)
+        for column in range(1, len(COMPILER_HEADERS) - 1):
+            self.compiler_table.setColumnWidth(column, 120)
+        self.compiler_summary_label = QLabel()
+        self.compiler_summary_label.setWordWrap(True)
+        compiler_group_layout.addWidget(self.compiler_table)
+        compiler_group_layout.addWidget(self.compiler_summary_label)
+
+        benchmark_layout.addWidget(compiler_group)
+        benchmark_layout.addStretch()
+
+        # 将基准测试标签页添加到主选项卡
+        main_tab.addTab(benchmark_tab, "基准测试")
+
+        # ===== 构建队列标签页 =====
+        queue_tab = QWidget()
+        queue_layout = QVBoxLayout(queue_tab)
+        queue_layout.setContentsMargins(10, 10, 10, 10)
+        queue_layout.setSpacing(15)
+
+        queue_group = QGroupBox("构建队列")
+        queue_group_layout = QVBoxLayout(queue_group)
+        queue_group_layout.setContentsMargins(15, 15, 15, 15)
+        queue_group.setMinimumHeight(450)
+
+        # 队列控制
+        queue_controls_layout = QHBoxLayout()
+        self.enqueue_btn = QPushButton("添加当前命令")
+        self.enqueue_btn.clicked.connect(self.enqueue_current_command)
+        self.queue_run_btn = QPushButton("启动队列")
+        self.queue_run_btn.setCheckable(True)
+        self.queue_run_btn.toggled.connect(self.toggle_queue)
+        self.queue_cancel_btn = QPushButton("取消所选")
+        self.queue_cancel_btn.clicked.connect(self.cancel_queue_job)
+        self.queue_clear_btn = QPushButton("移除已完成")
+        self.queue_clear_btn.clicked.connect(self.remove_finished_jobs)
+
+        self.daemon_check = QCheckBox("在构建守护进程中运行")
+        self.daemon_check.setToolTip("关闭本窗口后构建继续运行，重新打开时会重新关联并回放其日志")
+        self.daemon_check.setChecked(daemon_supported() and self.settings.value("daemon_builds", False, type=bool))
+        self.daemon_check.setEnabled(daemon_supported())
+        if not daemon_supported():
+            self.daemon_check.setToolTip("构建守护进程需要 Unix 域套接字")
+        self.daemon_check.toggled.connect(self.update_daemon_settings)
+
+        self.core_budget_label = QLabel("核心预算:")
+        self.core_budget_spin = QSpinBox()
+        self.core_budget_spin.setRange(1, 256)
+        self.core_budget_spin.setValue(os.cpu_count() or 1)
+        self.core_budget_spin.setToolTip("所有运行中构建共享的 C 编译任务总数")
+        self.core_budget_spin.valueChanged.connect(self.update_core_budget)
+
+        queue_controls_layout.addWidget(self.enqueue_btn)
+        queue_controls_layout.addWidget(self.queue_run_btn)
+        queue_controls_layout.addWidget(self.queue_cancel_btn)
+        queue_controls_layout.addWidget(self.queue_clear_btn)
+        queue_controls_layout.addStretch()
+        queue_controls_layout.addWidget(self.daemon_check)
+        queue_controls_layout.addWidget(self.core_budget_label)
+        queue_controls_layout.addWidget(self.core_budget_spin)
+        queue_group_layout.addLayout(queue_controls_layout)
+
+        # 队列任务及其各自日志
+        self.queue_table = QTableWidget(0, 5)
+        self.queue_table.setHorizontalHeaderLabels(["任务", "状态", "C 任务数", "进度", "阶段"])
+        self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.queue_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_table.verticalHeader().setVisible(False)
+        self.queue_table.horizontalHeader().setStretchLastSection(True)
+        self.queue_table.setColumnWidth(0, 260)
+        self.queue_table.itemSelectionChanged.connect(self.show_queue_job_log)
+
+        self.queue_log_stack = QStackedWidget()
+
+        queue_splitter = QSplitter(Qt.Vertical)
+        queue_splitter.addWidget(self.queue_table)
+        queue_splitter.addWidget(self.queue_log_stack)
+        queue_group_layout.addWidget(queue_splitter)
+
+        queue_layout.addWidget(queue_group)
+        queue_layout.addStretch()
+
+        # 将构建队列标签页添加到主选项卡
+        main_tab.addTab(queue_tab, "构建队列")
+
+        # ===== 缓存标签页 =====
+        caches_tab = QWidget()
+        caches_layout = QVBoxLayout(caches_tab)
+        caches_layout.setContentsMargins(10, 10, 10, 10)
+        caches_layout.setSpacing(15)
+
+        # 已完成构建的内容寻址缓存
+        artifact_group = QGroupBox("构建产物缓存")
+        artifact_layout = QGridLayout(artifact_group)
+        artifact_layout.setSpacing(10)
+        artifact_layout.setContentsMargins(15, 15, 15, 15)
+        self.artifact_cache_check = QCheckBox("从产物缓存恢复未变化的构建")
+        self.artifact_cache_check.setToolTip("构建按源码内容、命令、已安装包和 Nuitka 版本计算键")
+        self.artifact_cache_check.setChecked(self.settings.value("artifact_cache_enabled", False, type=bool))
+        self.artifact_cache_check.toggled.connect(self.update_artifact_cache_settings)
+        self.artifact_cache_size_label = QLabel("最大容量 (GB):")
+        self.artifact_cache_size_spin = QSpinBox()
+        self.artifact_cache_size_spin.setRange(1, 1024)
+        self.artifact_cache_size_spin.setValue(self.settings.value("artifact_cache_max_gb", 5, type=int))
+        self.artifact_cache_size_spin.valueChanged.connect(self.update_artifact_cache_settings)
+        self.artifact_cache_stats_label = QLabel()
+        self.artifact_cache_clear_btn = QPushButton("清空缓存")
+        self.artifact_cache_clear_btn.clicked.connect(self.clear_artifact_cache)
+
+        artifact_layout.addWidget(self.artifact_cache_check, 0, 0, 1, 3)
+        artifact_layout.addWidget(self.artifact_cache_size_label, 1, 0)
+        artifact_layout.addWidget(self.artifact_cache_size_spin, 1, 1)
+        artifact_layout.addWidget(self.artifact_cache_stats_label, 2, 0, 1, 2)
+        artifact_layout.addWidget(self.artifact_cache_clear_btn, 2, 2)
+        caches_layout.addWidget(artifact_group)
+
+        # C 编译的 ccache 统计和容量设置
+        ccache_group = QGroupBox("ccache")
+        ccache_layout = QGridLayout(ccache_group)
+        ccache_layout.setSpacing(10)
+        ccache_layout.setContentsMargins(15, 15, 15, 15)
+        self.ccache_status_label = QLabel()
+        self.ccache_dir_label = QLabel("缓存目录:")
+        self.ccache_dir_input = QLineEdit(self.settings.value("ccache_dir", "", type=str))
+        self.ccache_dir_input.setPlaceholderText("默认: Nuitka 缓存目录")
+        self.ccache_dir_input.editingFinished.connect(self.update_ccache_settings)
+        self.ccache_dir_btn = QPushButton("浏览...")
+        self.ccache_dir_btn.clicked.connect(self.select_ccache_dir)
+        self.ccache_size_label = QLabel("最大容量:")
+        self.ccache_size_input = QLineEdit(self.settings.value("ccache_maxsize", "", type=str))
+        self.ccache_size_input.setPlaceholderText("例如 5G (默认: ccache 设置)")
+        self.ccache_size_input.editingFinished.connect(self.update_ccache_settings)
+        self.ccache_stats_label = QLabel()
+        self.ccache_refresh_btn = QPushButton("刷新")
+        self.ccache_refresh_btn.clicked.connect(self.update_ccache_status)
+        self.ccache_prewarm_btn = QPushButton("预热")
+        self.ccache_prewarm_btn.setToolTip("在后台编译一次当前配置以填充缓存")
+        self.ccache_prewarm_btn.clicked.connect(self.prewarm_ccache)
+
+        ccache_layout.addWidget(self.ccache_status_label, 0, 0, 1, 3)
+        ccache_layout.addWidget(self.ccache_dir_label, 1, 0)
+        ccache_layout.addWidget(self.ccache_dir_input, 1, 1)
+        ccache_layout.addWidget(self.ccache_dir_btn, 1, 2)
+        ccache_layout.addWidget(self.ccache_size_label, 2, 0)
+        ccache_layout.addWidget(self.ccache_size_input, 2, 1)
+        ccache_layout.addWidget(self.ccache_stats_label, 3, 0, 1, 2)
+        ccache_layout.addWidget(self.ccache_refresh_btn, 3, 2)
+        ccache_layout.addWidget(self.ccache_prewarm_btn, 4, 2)
+        caches_layout.addWidget(ccache_group)
+
+        # 按配置独立的 Nuitka 自身缓存目录(字节码、DLL 依赖、ccache 等)
+        nuitka_cache_group = QGroupBox("Nuitka 缓存")
+        nuitka_cache_layout = QGridLayout(nuitka_cache_group)
+        nuitka_cache_layout.setSpacing(10)
+        nuitka_cache_layout.setContentsMargins(15, 15, 15, 15)
+        self.nuitka_cache_check = QCheckBox("为每个配置使用托管的缓存目录")
+        self.nuitka_cache_check.setToolTip("设置 NUITKA_CACHE_DIR，并在每次构建前按最久未使用淘汰文件直到不超过配额")
+        self.nuitka_cache_check.setChecked(self.settings.value("nuitka_cache_managed", False, type=bool))
+        self.nuitka_cache_check.toggled.connect(self.update_nuitka_cache_settings)
+        self.nuitka_cache_quota_label = QLabel("配额 (GB):")
+        self.nuitka_cache_quota_spin = QSpinBox()
+        self.nuitka_cache_quota_spin.setRange(1, 1024)
+        self.nuitka_cache_quota_spin.setValue(self.settings.value("nuitka_cache_quota_gb", 10, type=int))
+        self.nuitka_cache_quota_spin.valueChanged.connect(self.update_nuitka_cache_settings)
+        self.nuitka_cache_dir_label = QLabel()
+        self.nuitka_cache_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.nuitka_cache_sizes_label = QLabel()
+        self.nuitka_cache_sizes_label.setWordWrap(True)
+        self.nuitka_cache_refresh_btn = QPushButton("刷新")
+        self.nuitka_cache_refresh_btn.clicked.connect(self.refresh_nuitka_cache_sizes)
+
+        nuitka_cache_layout.addWidget(self.nuitka_cache_check, 0, 0, 1, 3)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_quota_label, 1, 0)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_quota_spin, 1, 1)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_dir_label, 2, 0, 1, 3)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_sizes_label, 3, 0, 1, 2)
+        nuitka_cache_layout.addWidget(self.nuitka_cache_refresh_btn, 3, 2)
+        caches_layout.addWidget(nuitka_cache_group)
+
+        # 按配置保留 Nuitka 的构建目录，使 ccache 能再次找到未改变的目标文件
+        warm_build_group = QGroupBox("持久构建目录")
+        warm_build_layout = QGridLayout(warm_build_group)
+        warm_build_layout.setSpacing(10)
+        warm_build_layout.setContentsMargins(15, 15, 15, 15)
+        self.warm_build_check = QCheckBox("为每个配置保留持久构建目录")
+        self.warm_build_check.setToolTip("在打包工具缓存目录下的固定目录中构建而不是在输出目录中，完成后将产物移至输出目录；参数、解释器或工具链改变时会先清空该目录")
+        self.warm_build_check.setChecked(self.settings.value("warm_build_dirs", False, type=bool))
+        self.warm_build_check.toggled.connect(self.update_warm_build_settings)
+        self.clean_build_check = QCheckBox("全新构建(每次构建前清空)")
+        self.clean_build_check.setToolTip("每次构建都从空目录开始，与参数改变后相同")
+        self.warm_build_dir_label = QLabel()
+        self.warm_build_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.warm_build_sizes_label = QLabel()
+        self.warm_build_sizes_label.setWordWrap(True)
+        self.warm_build_refresh_btn = QPushButton("刷新")
+        self.warm_build_refresh_btn.clicked.connect(self.refresh_warm_build_dirs)
+        self.warm_build_delete_btn = QPushButton("删除")
+        self.warm_build_delete_btn.clicked.connect(self.delete_warm_build_dirs)
+
+        warm_build_layout.addWidget(self.warm_build_check, 0, 0, 1, 3)
+        warm_build_layout.addWidget(self.clean_build_check, 1, 0, 1, 3)
+        warm_build_layout.addWidget(self.warm_build_dir_label, 2, 0, 1, 3)
+        warm_build_layout.addWidget(self.warm_build_sizes_label, 3, 0, 1, 3)
+        warm_build_layout.addWidget(self.warm_build_refresh_btn, 4, 1)
+        warm_build_layout.addWidget(self.warm_build_delete_btn, 4, 2)
+        caches_layout.addWidget(warm_build_group)
+        caches_layout.addStretch()
+
+        # 将缓存标签页添加到主选项卡
+        main_tab.addTab(caches_tab, "缓存")
+
         # 命令区域
         command_group = QGroupBox("打包命令")
         command_layout = QVBoxLayout(command_group)
@@ -780,12 +1960,21 @@ class NuitkaPackager(QMainWindow):
 
         main_layout.addWidget(command_group)
 
-        # 进度条
+        # 进度条及阶段和剩余时间
+        progress_layout = QHBoxLayout()
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(10)
-        main_layout.addWidget(self.progress_bar)
+        self.progress_label = QLabel()
+        self.progress_label.setMinimumWidth(260)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.progress_label)
+        # 构建进程树的实时 CPU、内存和 I/O
+        self.resource_label = QLabel()
+        self.resource_label.setToolTip("Nuitka、scons 及所有编译器进程的合计")
+        progress_layout.addWidget(self.resource_label)
+        main_layout.addLayout(progress_layout)
 
         # 按钮区域
         button_layout = QHBoxLayout()
@@ -831,8 +2020,15 @@ class NuitkaPackager(QMainWindow):
         self.clear_btn.setFixedHeight(40)
         self.clear_btn.clicked.connect(self.clear_log)
 
+        self.watch_btn = QPushButton("监视模式")
+        self.watch_btn.setFixedHeight(40)
+        self.watch_btn.setCheckable(True)
+        self.watch_btn.setToolTip("项目源码变化时自动重新构建")
+        self.watch_btn.toggled.connect(self.toggle_watch)
+
         button_layout.addWidget(self.execute_btn)
         button_layout.addWidget(self.stop_btn)
+        button_layout.addWidget(self.watch_btn)
         button_layout.addWidget(self.clear_btn)
 
         main_layout.addLayout(button_layout)
@@ -953,14 +2149,14 @@ class NuitkaPackager(QMainWindow):
                 background-color: transparent;
                 color: #ffffff;
             }
-            QTextEdit {
+            QTextEdit, QAbstractScrollArea#log_view {
                 background-color: #1e1e1e;
                 border: 1px solid #555;
                 border-radius: 4px;
                 padding: 5px;
                 color: #ffffff;
             }
-            QLineEdit, QComboBox, QListWidget {
+            QLineEdit, QComboBox, QListWidget, QTableWidget {
                 background-color: #1e1e1e;
                 border: 1px solid #555;
                 border-radius: 4px;
@@ -1024,6 +2220,12 @@ class NuitkaPackager(QMainWindow):
                 color: white;
                 border-radius: 3px;
             }
+            QHeaderView::section {
+                background-color: #444;
+                color: #ffffff;
+                border: none;
+                padding: 4px;
+            }
             QCheckBox {
                 color: #ffffff;
             }
@@ -1126,14 +2328,14 @@ class NuitkaPackager(QMainWindow):
                 background-color: transparent;
                 color: #2c3e50;
             }
-            QTextEdit {
+            QTextEdit, QAbstractScrollArea#log_view {
                 background-color: white;
                 border: 1px solid #dcdde1;
                 border-radius: 4px;
                 padding: 5px;
                 color: #2c3e50;
             }
-            QLineEdit, QComboBox, QListWidget {
+            QLineEdit, QComboBox, QListWidget, QTableWidget {
                 background-color: white;
                 border: 1px solid #dcdde1;
                 border-radius: 4px;
@@ -1197,6 +2399,12 @@ class NuitkaPackager(QMainWindow):
                 color: white;
                 border-radius: 3px;
             }
+            QHeaderView::section {
+                background-color: #ecf0f1;
+                color: #2c3e50;
+                border: none;
+                padding: 4px;
+            }
             QCheckBox {
                 color: #2c3e50;
             }
@@ -1329,12 +2537,26 @@ class NuitkaPackager(QMainWindow):
     def log_message(self, message):
         """在日志框中添加消息"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_edit.append(f"[{timestamp}] {message}")
-        self.log_edit.moveCursor(QTextCursor.End)
+        self.log_view.append_lines([f"[{timestamp}] {message}"])
 
         # 在状态栏显示最后一条消息
         self.status_bar.showMessage(message)
 
+    def append_log_batch(self, lines):
+        """以单次模型插入将一批构建输出追加到日志视图"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_view.append_lines([f"[{timestamp}] {line}" for line in lines])
+
+        # 限制状态栏更新频率
+        now = time.monotonic()
+        if now - self._last_status_update >= STATUS_BAR_INTERVAL:
+            self._last_status_update = now
+            self.status_bar.showMessage(lines[-1])
+
+    def update_log_rate(self, rate):
+        """显示实测日志管道吞吐量"""
+        self.log_rate_label.setText(f"日志吞吐量: {rate:,.0f} 行/秒")
+
     def select_python(self):
         """选择Python解释器"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1342,10 +2564,70 @@ class NuitkaPackager(QMainWindow):
         )
         if file_path:
             self.python_path = file_path
-            self.python_input.setText(file_path)
-
-            # 检查是否安装了Nuitka
-            if not self.check_nuitka_installed():
+            self.python_input.setEditText(file_path)
+
+            # 在 GUI 线程之外检测 Nuitka
+            self.check_interpreter()
+
+    def choose_python(self, index):
+        """使用查找到的解释器"""
+        python_path = self.python_input.itemData(index)
+        self.python_input.setEditText(python_path)
+        if python_path != self.python_path:
+            self.python_path = python_path
+            self.check_interpreter(warn=False)
+
+    def python_edited(self):
+        """使用输入框中输入的解释器路径"""
+        python_path = self.python_input.currentText().strip()
+        if python_path and python_path != self.python_path:
+            self.python_path = python_path
+            self.check_interpreter(warn=False)
+
+    def refresh_interpreters(self):
+        """在后台查找解释器"""
+        project_dir = os.path.dirname(os.path.abspath(self.main_file)) if self.main_file else None
+        task = BackgroundTask(discover_interpreters, project_dir, parent=self)
+        task.result_signal.connect(self.populate_interpreters)
+        task.error_signal.connect(lambda message: self.log_message(f"⚠️ 查找解释器失败: {message}"))
+        task.finished.connect(task.deleteLater)
+        task.start()
+
+    def populate_interpreters(self, entries):
+        """填充解释器列表，保留当前路径"""
+        text = self.python_input.currentText()
+        self.python_input.blockSignals(True)
+        self.python_input.clear()
+        for entry in entries:
+            info = entry["info"]
+            nuitka = f"Nuitka {info['nuitka']}" if info["nuitka"] else "未安装 Nuitka"
+            self.python_input.addItem(
+                f"{entry['path']}  —  Python {info['version']} · {nuitka} · "
+                f"{INTERPRETER_SOURCE_LABELS[entry['source']]}",
+                entry["path"],
+            )
+        self.python_input.setCurrentIndex(-1)
+        self.python_input.setEditText(text)
+        self.python_input.blockSignals(False)
+
+    def check_interpreter(self, warn=True):
+        """在后台检测所选解释器的 Python 和 Nuitka"""
+        python_path = self.python_path
+        self.python_input.setToolTip("")
+        task = BackgroundTask(detect_interpreter, python_path, parent=self)
+        task.result_signal.connect(lambda info: self.show_interpreter(python_path, info, warn))
+        task.error_signal.connect(lambda message: self.log_message(f"⚠️ 无法运行 {python_path}: {message}"))
+        task.finished.connect(task.deleteLater)
+        task.start()
+
+    def show_interpreter(self, python_path, info, warn):
+        """报告解释器中的 Nuitka 安装情况"""
+        if python_path != self.python_path:
+            # 期间已选择了其他解释器
+            return
+        if not info["nuitka"]:
+            self.python_input.setToolTip(f"Python {info['version']}，未安装 Nuitka")
+            if warn:
                 QMessageBox.warning(
                     self,
                     "Nuitka未安装",
@@ -1353,65 +2635,10 @@ class NuitkaPackager(QMainWindow):
                     QMessageBox.Ok
                 )
             else:
-                self.log_message("✓ Nuitka已安装在选定的Python环境中")
-
-    def check_nuitka_installed(self):
-        """检查选定的Python环境中是否安装了Nuitka"""
-        try:
-            # 方法1：检查解释器路径是否直接指向nuitka（特殊情况处理）
-            if "nuitka" in self.python_path.lower():
-                return True
-
-            # 方法2：最可靠的方法 - 尝试执行 nuitka --version
-            try:
-                result = subprocess.run(
-                    [self.python_path, "-m", "nuitka", "--version"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=2,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                if result.returncode == 0:
-                    return True
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-
-            # 方法3：检查虚拟环境的可执行文件目录
-            # 获取虚拟环境的基础目录
-            env_base = os.path.dirname(os.path.dirname(self.python_path))
-
-            # 确定脚本目录名称 (Windows: Scripts, Unix: bin)
-            scripts_dir = "Scripts" if sys.platform.startswith("win") else "bin"
-            scripts_path = os.path.join(env_base, scripts_dir)
-
-            # 检查可能的可执行文件
-            for exe_name in ["nuitka", "nuitka.exe", "nuitka.cmd", "nuitka-script.py"]:
-                exe_path = os.path.join(scripts_path, exe_name)
-                if os.path.exists(exe_path):
-                    return True
-
-            # 方法4：检查包元数据（兼容uv/pip）
-            # 优先尝试uv，再尝试pip
-            for module in ["uv", "pip"]:
-                try:
-                    result = subprocess.run(
-                        [self.python_path, "-m", module, "show", "nuitka"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        timeout=2,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    # 检查是否成功且包含包信息
-                    if result.returncode == 0 and "Name: nuitka" in result.stdout:
-                        return True
-                except:
-                    continue
-
-            return False
-        except Exception:
-            return False
+                self.log_message("⚠️ 在选定的Python环境中未检测到Nuitka")
+            return
+        self.python_input.setToolTip(f"Python {info['version']}，Nuitka {info['nuitka']}({info['installer']})")
+        self.log_message(f"✓ 选定的Python环境中已安装 Nuitka {info['nuitka']}(Python {info['version']}，{info['installer']})")
 
     def select_main_file(self):
         """选择主Python文件"""
@@ -1421,6 +2648,8 @@ class NuitkaPackager(QMainWindow):
         if file_path:
             self.main_file = file_path
             self.file_input.setText(file_path)
+            # 项目中的虚拟环境
+            self.refresh_interpreters()
 
     def select_icon(self):
         """选择图标文件"""
@@ -1440,231 +2669,146 @@ class NuitkaPackager(QMainWindow):
             self.output_dir = dir_path
             self.output_input.setText(dir_path)
 
+    def _config_widgets(self):
+        """将配置键映射到保存它们的控件"""
+        return {
+            "onefile": self.onefile_check,
+            "standalone": self.standalone_check,
+            "disable_console": self.disable_console_check,
+            "remove_output": self.remove_output_check,
+            "include_qt": self.include_qt_check,
+            "show_progress": self.show_progress_check,
+            "show_memory": self.show_memory_check,
+            "follow_imports": self.follow_imports_check,
+            "follow_stdlib": self.follow_stdlib_check,
+            "module_mode": self.module_mode_check,
+            "lto": self.lto_check,
+            "low_memory": self.low_memory_check,
+            "disable_ccache": self.disable_ccache_check,
+            "assume_yes": self.assume_yes_check,
+            "windows_uac_admin": self.windows_uac_admin_check,
+            "windows_uac_uiaccess": self.windows_uac_uiaccess_check,
+            "include_package": self.include_package_input,
+            "include_package_data": self.include_package_data_input,
+            "include_module": self.include_module_input,
+            "nofollow_import": self.nofollow_import_input,
+            "include_data_files": self.include_data_input,
+            "include_data_dir": self.include_data_dir_input,
+            "noinclude_data": self.noinclude_data_input,
+            "include_onefile_ext": self.include_onefile_ext_input,
+            "include_raw_dir": self.include_raw_dir_input,
+            "onefile_tempdir": self.onefile_tempdir_input,
+            "onefile_grace_time": self.onefile_grace_time_spin,
+            "onefile_no_compression": self.onefile_no_compression_check,
+            "onefile_as_archive": self.onefile_as_archive_check,
+            "noinclude_dlls": self.noinclude_dlls_input,
+            "company": self.company_input,
+            "product": self.product_input,
+            "file_version": self.file_version_input,
+            "product_version": self.product_version_input,
+            "file_description": self.file_description_input,
+            "copyright": self.copyright_input,
+            "force_env": self.force_env_input,
+            "debug": self.debug_check,
+            "unstripped": self.unstripped_check,
+            "trace_execution": self.trace_execution_check,
+            "warn_implicit": self.warn_implicit_check,
+            "warn_unusual": self.warn_unusual_check,
+            "deployment": self.deployment_check,
+        }
+
+    def collect_config(self):
+        """将当前控件状态收集为配置字典"""
+        config = {
+            "python_path": self.python_path,
+            "main_file": self.main_file,
+            "icon_file": self.icon_file,
+            "output_dir": self.output_dir,
+            "plugins": [item.text().split('=')[1] for item in self.plugins_list.selectedItems()],
+            "python_flags": [self.flags_list.item(i).text() for i in range(self.flags_list.count())],
+            "compiler": self.compiler_combo.currentData(),
+            "linker": self.linker_combo.currentData(),
+        }
+        for key, widget in self._config_widgets().items():
+            if isinstance(widget, QCheckBox):
+                config[key] = widget.isChecked()
+            elif isinstance(widget, QSpinBox):
+                config[key] = widget.value()
+            else:
+                config[key] = widget.text()
+        return config
+
+    def apply_config(self, config):
+        """将配置字典加载到控件中"""
+        self.python_path = config["python_path"]
+        self.python_input.setEditText(self.python_path)
+        if self.python_path:
+            self.check_interpreter(warn=False)
+        self.main_file = config["main_file"]
+        self.file_input.setText(self.main_file)
+        self.icon_file = config["icon_file"]
+        self.icon_input.setText(self.icon_file)
+        self.output_dir = config["output_dir"]
+        self.output_input.setText(self.output_dir)
+
+        for i in range(self.plugins_list.count()):
+            item = self.plugins_list.item(i)
+            item.setSelected(item.text().split('=')[1] in config["plugins"])
+        self.flags_list.clear()
+        self.flags_list.addItems(config["python_flags"])
+        self.select_toolchain(config["compiler"], config["linker"])
+
+        for key, widget in self._config_widgets().items():
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(bool(config[key]))
+            elif isinstance(widget, QSpinBox):
+                widget.setValue(int(config[key]))
+            else:
+                widget.setText(config[key])
+        self.update_command()
+
+    def load_profile(self):
+        """从配置文件加载配置"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "加载配置", "", "打包配置 (*.json);;所有文件 (*)")
+        if not file_path:
+            return
+        try:
+            config = load_profile(file_path)
+        except ProfileError as e:
+            QMessageBox.warning(self, "配置错误", str(e))
+            return
+        self.profile_path = file_path
+        self.apply_config(config)
+        name = profile_name(file_path)
+        self.profile_label.setText(f"配置: {name}")
+        self.log_message(f"📂 已加载配置: {file_path}")
+        self.refresh_nuitka_cache_sizes()
+        self.refresh_warm_build_dirs()
+
+    def save_profile(self):
+        """将当前配置保存到配置文件"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "保存配置", self.profile_path, "打包配置 (*.json);;所有文件 (*)")
+        if not file_path:
+            return
+        try:
+            save_profile(file_path, self.collect_config())
+        except OSError as e:
+            QMessageBox.warning(self, "配置错误", str(e))
+            return
+        self.profile_path = file_path
+        name = profile_name(file_path)
+        self.profile_label.setText(f"配置: {name}")
+        self.log_message(f"💾 已保存配置: {file_path}")
+        self.refresh_nuitka_cache_sizes()
+        self.refresh_warm_build_dirs()
+
     def update_command(self):
         """根据用户选择更新打包命令"""
         if not self.python_path or not self.main_file:
             self.command_edit.setPlainText("1.请先选择Python解释器和主文件 \n2.选择常用选项以更新打包命令")
             return
 
-        # 构建基本命令
-        command = [
-            self.python_path,
-            "-m", "nuitka"
-        ]
-
-        # 如果是uv环境，直接使用nuitka.cmd
-        if self.python_path.endswith("nuitka.cmd"):
-            command = [self.python_path]
-
-        # ===== 常用选项 =====
-        if self.onefile_check.isChecked():
-            command.append("--onefile")
-
-        if self.standalone_check.isChecked():
-            command.append("--standalone")
-
-        if self.disable_console_check.isChecked():
-            command.append("--windows-disable-console")
-
-        if self.remove_output_check.isChecked():
-            command.append("--remove-output")
-
-        if self.include_qt_check.isChecked():
-            command.append("--include-qt-plugins=sensible,styles")
-
-        if self.show_progress_check.isChecked():
-            command.append("--show-progress")
-
-        if self.show_memory_check.isChecked():
-            command.append("--show-memory")
-
-        # 添加图标
-        if self.icon_file:
-            command.append(f"--windows-icon-from-ico={self.icon_file}")
-
-        # 添加输出目录
-        if self.output_dir:
-            command.append(f"--output-dir={self.output_dir}")
-
-        # ===== 插件选项 =====
-        selected_plugins = [item.text().split('=')[1] for item in self.plugins_list.selectedItems()]
-        for plugin in selected_plugins:
-            command.append(f"--enable-plugin={plugin}")
-
-        # ===== 高级选项 =====
-        if self.follow_imports_check.isChecked():
-            command.append("--follow-imports")
-
-        if self.follow_stdlib_check.isChecked():
-            command.append("--follow-stdlib")
-
-        if self.module_mode_check.isChecked():
-            command.append("--module")
-
-        if self.lto_check.isChecked():
-            command.append("--lto")
-
-        if self.disable_ccache_check.isChecked():
-            command.append("--disable-ccache")
-
-        if self.assume_yes_check.isChecked():
-            command.append("--assume-yes")
-
-        if self.windows_uac_admin_check.isChecked():
-            command.append("--windows-uac-admin")
-
-        if self.windows_uac_uiaccess_check.isChecked():
-            command.append("--windows-uac-uiaccess")
-
-        # ===== 包含选项 =====
-        # 包含包
-        if self.include_package_input.text():
-            packages = [pkg.strip() for pkg in self.include_package_input.text().split(',') if pkg.strip()]
-            for pkg in packages:
-                command.append(f"--include-package={pkg}")
-
-        # 包含包数据
-        if self.include_package_data_input.text():
-            package_data = [pd.strip() for pd in self.include_package_data_input.text().split(',') if pd.strip()]
-            for pd in package_data:
-                command.append(f"--include-package-data={pd}")
-
-        # 包含模块
-        if self.include_module_input.text():
-            modules = [mod.strip() for mod in self.include_module_input.text().split(',') if mod.strip()]
-            for mod in modules:
-                command.append(f"--include-module={mod}")
-
-        # 包含数据目录
-        if self.include_data_dir_input.text():
-            data_dirs = [dd.strip() for dd in self.include_data_dir_input.text().split(',') if dd.strip()]
-
-            # 获取主文件所在目录作为项目基础路径
-            if not self.main_file:
-                QMessageBox.warning(self, "警告", "请先选择主文件")
-                return
-
-            project_base_dir = os.path.dirname(self.main_file)
-
-            for dd in data_dirs:
-                # 分割源路径和目标路径
-                if '=' in dd:
-                    src_path, dest_path = dd.split('=', 1)
-                else:
-                    src_path = dd
-                    # 默认目标路径为源路径的最后一部分
-                    dest_path = os.path.basename(src_path)
-
-                # 确保源路径是绝对路径
-                if not os.path.isabs(src_path):
-                    # 基于主文件所在目录解析相对路径
-                    resolved_path = os.path.join(project_base_dir, src_path)
-
-                    # 验证路径是否存在
-                    if os.path.exists(resolved_path):
-                        src_path = resolved_path
-                    else:
-                        logging.warning(f"资源路径不存在: {resolved_path}")
-                        continue
-
-                # 验证路径是否存在
-                if not os.path.exists(src_path):
-                    logging.warning(f"包含数据目录不存在: {src_path}")
-                    continue
-
-                # 添加到命令
-                command.append(f"--include-data-dir={src_path}={dest_path}")
-                logging.info(f"添加包含目录: {src_path} -> {dest_path}")
-
-                # 详细日志
-                logging.debug(f"原始输入: {dd}")
-                logging.debug(f"解析后源路径: {src_path}")
-                logging.debug(f"解析后目标路径: {dest_path}")
-
-        # 排除数据文件
-        if self.noinclude_data_input.text():
-            exclude_data = [ed.strip() for ed in self.noinclude_data_input.text().split(',') if ed.strip()]
-            for ed in exclude_data:
-                command.append(f"--noinclude-data-files={ed}")
-
-        # 单文件外部数据 (仅当单文件模式启用时添加)
-        if self.onefile_check.isChecked() and self.include_onefile_ext_input.text():
-            onefile_ext = [oe.strip() for oe in self.include_onefile_ext_input.text().split(',') if oe.strip()]
-            for oe in onefile_ext:
-                command.append(f"--include-onefile-external-data={oe}")
-
-        # 包含原始目录
-        if self.include_raw_dir_input.text():
-            raw_dirs = [rd.strip() for rd in self.include_raw_dir_input.text().split(',') if rd.strip()]
-            for rd in raw_dirs:
-                command.append(f"--include-raw-dir={rd}")
-
-        # ===== Python标志 =====
-        for i in range(self.flags_list.count()):
-            command.append(self.flags_list.item(i).text())
-
-        # ===== 单文件选项 =====
-        if self.onefile_check.isChecked():
-            if self.onefile_tempdir_input.text():
-                command.append(f"--onefile-tempdir-spec={self.onefile_tempdir_input.text()}")
-
-            if self.onefile_grace_time_spin.value() != 5000:
-                command.append(f"--onefile-child-grace-time={self.onefile_grace_time_spin.value()}")
-
-            if self.onefile_no_compression_check.isChecked():
-                command.append("--onefile-no-compression")
-
-            if self.onefile_as_archive_check.isChecked():
-                command.append("--onefile-as-archive")
-
-        # ===== DLL控制 =====
-        if self.noinclude_dlls_input.text():
-            command.append(f"--noinclude-dlls={self.noinclude_dlls_input.text()}")
-
-        # ===== 元数据 =====
-        if self.company_input.text():
-            command.append(f"--company-name={self.company_input.text()}")
-
-        if self.product_input.text():
-            command.append(f"--product-name={self.product_input.text()}")
-
-        if self.file_version_input.text():
-            command.append(f"--file-version={self.file_version_input.text()}")
-
-        if self.product_version_input.text():
-            command.append(f"--product-version={self.product_version_input.text()}")
-
-        if self.file_description_input.text():
-            command.append(f"--file-description={self.file_description_input.text()}")
-
-        if self.copyright_input.text():
-            command.append(f"--copyright={self.copyright_input.text()}")
-
-        # ===== 环境控制 =====
-        if self.force_env_input.text():
-            command.append(f"--force-runtime-environment-variable={self.force_env_input.text()}")
-
-        # ===== 调试选项 =====
-        if self.debug_check.isChecked():
-            command.append("--debug")
-
-        if self.unstripped_check.isChecked():
-            command.append("--unstripped")
-
-        if self.trace_execution_check.isChecked():
-            command.append("--trace-execution")
-
-        if self.warn_implicit_check.isChecked():
-            command.append("--warn-implicit-exceptions")
-
-        if self.warn_unusual_check.isChecked():
-            command.append("--warn-unusual-code")
-
-        if self.deployment_check.isChecked():
-            command.append("--deployment")
-
-        # 添加主文件
-        command.append(self.main_file)
+        command = build_command(self.collect_config())
 
         # 显示命令
         self.command_edit.setPlainText(" ".join(command))
@@ -1675,6 +2819,9 @@ class NuitkaPackager(QMainWindow):
         if self.package_thread and self.package_thread.isRunning():
             self.log_message("⚠️ 已有打包任务在进行中")
             return
+        if self.preflight_task and self.preflight_task.isRunning():
+            self.log_message("⚠️ 构建前检查正在进行中")
+            return
 
         # 验证必要输入
         if not self.python_path:
@@ -1689,35 +2836,98 @@ class NuitkaPackager(QMainWindow):
             QMessageBox.warning(self, "缺少配置", "请选择输出目录")
             return
 
-        # 检查Nuitka是否安装
-        if not self.check_nuitka_installed():
-            QMessageBox.warning(
-                self,
-                "Nuitka未安装",
-                "在选定的Python环境中未检测到Nuitka。\n请使用以下命令安装: pip install nuitka",
-                QMessageBox.Ok
+        # 获取命令
+        command = self.command_edit.toPlainText().split()
+        if self.watch_btn.isChecked() and "--remove-output" in command:
+            # 保留构建目录，使 Nuitka 和 ccache 只重新编译变化的部分
+            command.remove("--remove-output")
+
+        # 编译前检查路径、编译器、磁盘空间、Nuitka 和选项
+        self.execute_btn.setEnabled(False)
+        self.log_message("🔎 正在进行构建前检查...")
+        env = self.build_environment(toolchain_variables(self.collect_config()))
+        self.preflight_task = BackgroundTask(
+            lambda: preflight(command, None, estimate_output_size(command, self.history), env)
+        )
+        self.preflight_task.result_signal.connect(lambda report: self.preflight_finished(command, report))
+        self.preflight_task.error_signal.connect(self.preflight_failed)
+        self.preflight_task.finished.connect(self.start_pending_rebuild)
+        self.preflight_task.start()
+        # 直到变化后的源码开始检查才清除
+        self.rebuild_pending = False
+
+    def preflight_finished(self, command, report):
+        """除非有构建前检查失败，否则开始构建"""
+        self.execute_btn.setEnabled(True)
+        self.log_message(f"🔎 构建前检查: {report['errors']} 个错误，{report['warnings']} 个警告({report['seconds']:.1f} 秒)")
+        for line in describe_preflight(report):
+            self.log_message(line)
+        if self.rebuild_pending:
+            # 任务结束后再重新检查，见 start_pending_rebuild
+            return
+        if report["errors"] and self.watch_btn.isChecked():
+            # 监视模式下不在每次保存时弹出对话框
+            self.log_message("⏹ 已跳过构建: 构建前检查未通过，等待下一次变化")
+            return
+        if report["errors"]:
+            problems = "\n".join(
+                describe_finding(finding, PREFLIGHT_MESSAGES)
+                for finding in report["findings"] if finding["severity"] == ERROR
             )
+            msg_box = QMessageBox(
+                QMessageBox.Warning,
+                "构建前检查未通过",
+                f"构建将会失败:\n\n{problems}\n\n仍然开始构建吗？",
+                QMessageBox.Yes | QMessageBox.No,
+                self
+            )
+            msg_box.setDefaultButton(QMessageBox.No)
+            msg_box.setStyleSheet(self.get_messagebox_style())
+            if msg_box.exec() != QMessageBox.Yes:
+                self.log_message("⏹ 未开始构建")
+                return
+        self.start_package(command)
+
+    def start_pending_rebuild(self):
+        """开始构建前检查期间请求的重新构建
+
+        连接到构建前检查任务的 finished 信号：其结果可能在线程仍在运行时
+        到达，此时 execute_package 会拒绝开始新的检查。
+        """
+        if not self.rebuild_pending:
             return
+        # 已检查的命令可能已过时，改为检查当前命令
+        self.log_message("🔁 构建前检查期间源码已变化，重新检查")
+        self.execute_package()
 
-        # 获取命令
-        command = self.command_edit.toPlainText().split()
+    def preflight_failed(self, message):
+        """报告无法运行的构建前检查"""
+        self.execute_btn.setEnabled(True)
+        self.log_message(f"⚠️ 构建前检查出错: {message}")
 
+    def start_package(self, command):
+        """为已检查的命令启动打包线程"""
         # 创建并启动打包线程
-        self.package_thread = PackageThread(command)
+        self.package_thread = self.create_package_thread(command, variables=toolchain_variables(self.collect_config()))
         self.package_thread.log_signal.connect(self.log_message)
+        self.package_thread.log_batch_signal.connect(self.append_log_batch)
+        self.package_thread.throughput_signal.connect(self.update_log_rate)
+        self.package_thread.progress_signal.connect(self.progress_bar.setValue)
+        self.package_thread.phase_signal.connect(self.update_progress_phase)
+        self.package_thread.resources_signal.connect(self.update_resource_usage)
+        self.package_thread.event_signal.connect(self.log_build_event)
         self.package_thread.finished_signal.connect(self.package_finished)
 
         # 更新UI状态
         self.execute_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setValue(0)
+        self.resource_label.clear()
 
         # 启动线程
         self.package_thread.start()
         self.log_message("▶ 开始打包进程...")
 
-        # 模拟进度更新（实际进度需要从输出中解析）
-        self.progress_timer = self.startTimer(1000)
 
         # 自动切换到日志标签页 - 修复版
         # 获取主选项卡控件
@@ -1729,10 +2939,25 @@ class NuitkaPackager(QMainWindow):
                     main_tab.setCurrentIndex(i)
                     break
 
-    def timerEvent(self, event):
-        """定时器事件，用于更新进度条"""
-        if self.progress_bar.value() < 90:
-            self.progress_bar.setValue(self.progress_bar.value() + 5)
+    def log_build_event(self, event, info):
+        """记录主构建的构建事件"""
+        message = describe_build_event(event, info)
+        if message:
+            self.log_message(message)
+
+    def update_progress_phase(self, phase, eta):
+        """在进度条旁显示构建阶段、百分比和剩余时间"""
+        text = f"{PHASE_LABELS.get(phase, phase)} · {self.progress_bar.value()}%"
+        if eta >= 0 and phase != "done":
+            text += f" · 剩余 {format_duration(eta)}"
+        self.progress_label.setText(text)
+
+    def update_resource_usage(self, sample):
+        """在进度条旁显示构建进程树的 CPU、内存和 I/O"""
+        self.resource_label.setText(
+            f"CPU {sample['cpu_percent']:.0f}% · 内存 {format_size(sample['rss'])} (峰值 {format_size(sample['peak_rss'])}) · "
+            f"I/O 读取 {format_size(sample['read_bytes'])}，写入 {format_size(sample['write_bytes'])}"
+        )
 
     def stop_package(self):
         """停止打包过程"""
@@ -1750,28 +2975,39 @@ class NuitkaPackager(QMainWindow):
             # 立即重置按钮状态
             self.execute_btn.setEnabled(True)
             self.progress_bar.setValue(0)
-
-            # 停止进度更新
-            if hasattr(self, 'progress_timer'):
-                self.killTimer(self.progress_timer)
+            self.progress_label.clear()
 
     def package_finished(self, success):
         """打包完成后的处理"""
+        # 忽略已被新构建取消的旧构建的完成信号
+        if self.sender() is not self.package_thread:
+            return
+
         # 总是更新UI状态
         self.execute_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
+        self.update_artifact_cache_stats()
+        self.update_ccache_status()
 
         # 完成进度条
         self.progress_bar.setValue(100 if success else 0)
 
-        # 停止进度更新
-        if hasattr(self, 'progress_timer'):
-            self.killTimer(self.progress_timer)
 
         if success:
             self.log_message("✅ 打包成功完成！")
             self.log_message(f"输出目录: {self.output_dir}")
 
+            # 显示独立目录的构成
+            if self.standalone_check.isChecked():
+                self.analyze_dist_size()
+            # 测量新程序的启动耗时
+            if self.benchmark_auto_check.isChecked():
+                self.run_benchmark()
+
+            # 自动重建时不弹出对话框打断编辑
+            if self.watch_btn.isChecked():
+                return
+
             # 询问是否打开输出目录
             msg_box = QMessageBox(QMessageBox.Question,  # 显式设置图标
                                   "打包成功",
@@ -1786,15 +3022,1378 @@ class NuitkaPackager(QMainWindow):
         else:
             self.log_message("❌ 打包过程中出现错误，请检查日志")
 
+    def toggle_watch(self, enabled):
+        """开始或停止在源码变化时自动重新构建"""
+        if not enabled:
+            self.stop_watch()
+            return
+        if not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择主文件")
+            self.watch_btn.setChecked(False)
+            return
+
+        command = self.command_edit.toPlainText().split()
+        data_dirs = [
+            spec.split("=", 1)[0]
+            for spec in option_values(command, "--include-data-dir") + option_values(command, "--include-raw-dir")
+        ]
+        self.source_watcher = SourceWatcher(
+            self.main_file,
+            self.sources_changed.emit,
+            data_dirs=data_dirs,
+            output_dir=self.output_dir or None,
+        )
+        self.source_watcher.start()
+        self.log_message(f"👁 监视模式: 正在监视 {', '.join(self.source_watcher.roots)} ({self.source_watcher.backend})")
+
+        if not (self.package_thread and self.package_thread.isRunning()):
+            self.execute_package()
+
+    def stop_watch(self):
+        """停止监视项目源码"""
+        if self.source_watcher:
+            self.source_watcher.stop()
+            self.source_watcher = None
+            self.log_message("👁 监视模式已停止")
+        self.rebuild_pending = False
+
+    def rebuild_on_change(self, paths):
+        """源码变化稳定后取消正在运行的构建并重新构建"""
+        if not self.source_watcher:
+            return
+        names = ", ".join(os.path.basename(path) for path in paths[:5])
+        more = f" (另有 {len(paths) - 5} 个)" if len(paths) > 5 else ""
+        self.log_message(f"🔁 源码已变化: {names}{more}")
+
+        if self.package_thread and self.package_thread.isRunning():
+            self.log_message("⏹ 正在取消运行中的构建")
+            self.stop_package()
+        if self.preflight_task and self.preflight_task.isRunning():
+            self.rebuild_pending = True
+            self.log_message("🔁 将在构建前检查完成后重新构建")
+            return
+        self.execute_package()
+
     def clear_log(self):
         """清除日志"""
-        self.log_edit.clear()
+        self.log_view.clear()
         self.log_message("日志已清除")
         self.progress_bar.setValue(0)
+        self.progress_label.clear()
+
+    def enqueue_current_command(self):
+        """将当前命令快照加入构建队列"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+
+        name = os.path.basename(self.main_file)
+        if self.onefile_check.isChecked():
+            name += " (单文件)"
+        elif self.standalone_check.isChecked():
+            name += " (独立)"
+        self.enqueue_command(name, self.command_edit.toPlainText().split(), toolchain_variables(self.collect_config()))
+        self.pump_queue()
+
+    def enqueue_command(self, name, command, env=None):
+        """将命令加入构建队列并返回其任务
+
+        ``env`` 为仅用于此构建的环境变量。
+        """
+        job = self.scheduler.enqueue(name, command, env)
+
+        log_view = LogView()
+        log_view.setObjectName("log_view")
+        log_view.setFont(QFont("Consolas", 9))
+        self.queue_logs[job.id] = log_view
+        self.queue_log_stack.addWidget(log_view)
+
+        self.queue_table.insertRow(self.queue_table.rowCount())
+        self.update_queue_row(job)
+        self.log_message(f"➕ 已加入构建 #{job.id}: {job.name}")
+        return job
+
+    def toggle_queue(self, running):
+        """启动或暂停队列中构建的启动"""
+        self.queue_run_btn.setText("暂停队列" if running else "启动队列")
+        if running:
+            self.pump_queue()
+
+    def update_core_budget(self, value):
+        """将新的核心预算应用到调度器"""
+        self.scheduler.core_budget = value
+        self.pump_queue()
+
+    def pump_queue(self):
+        """在核心预算允许时启动队列中的构建"""
+        if not self.queue_run_btn.isChecked():
+            return
+
+        for job in self.scheduler.next_launches():
+            self.start_queue_thread(job, self.create_package_thread(job.launch_command, job.name, job.env))
+            self.log_message(f"▶ 已启动队列构建 #{job.id} ({job.name}), --jobs={job.jobs}")
+
+    def start_queue_thread(self, job, thread):
+        """连接队列任务线程的信号并启动它"""
+        thread.job_id = job.id
+        thread.log_signal.connect(self.append_queue_message)
+        thread.log_batch_signal.connect(self.append_queue_log)
+        thread.progress_signal.connect(self.update_queue_progress)
+        thread.phase_signal.connect(self.update_queue_phase)
+        thread.event_signal.connect(self.append_queue_event)
+        thread.finished_signal.connect(self.queue_job_finished)
+        self.queue_threads[job.id] = thread
+        thread.start()
+        self.update_queue_row(job)
+
+    def daemon_builds_enabled(self):
+        """新构建是否在构建守护进程中运行"""
+        return daemon_supported() and self.daemon_check.isChecked()
+
+    def update_daemon_settings(self):
+        """保存构建守护进程设置"""
+        self.settings.setValue("daemon_builds", self.daemon_check.isChecked())
+        if self.daemon_check.isChecked():
+            self.attach_daemon_jobs()
+
+    def daemon_argv(self):
+        """启动构建守护进程的命令行"""
+        return [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "main_cli.py"), "--daemon"]
+
+    def attach_daemon_jobs(self):
+        """在构建队列中跟踪构建守护进程的构建"""
+        if not self.daemon_builds_enabled():
+            return
+        try:
+            jobs = DaemonClient().jobs()
+        except DaemonError:
+            # 没有运行中的守护进程
+            return
+        followed = {job.daemon_id for job in self.scheduler.jobs}
+        followed.update(thread.daemon_job for thread in self.running_threads() if isinstance(thread, DaemonBuildThread))
+        jobs = [daemon_job for daemon_job in jobs if daemon_job["id"] not in followed]
+        for daemon_job in jobs:
+            job = self.enqueue_command(daemon_job["name"], daemon_job["command"])
+            jobs_option = option_value(daemon_job["command"], "--jobs")
+            self.scheduler.adopt(job, int(jobs_option) if jobs_option and jobs_option.isdigit() else 1)
+            job.daemon_id = daemon_job["id"]
+            self.start_queue_thread(
+                job, DaemonBuildThread(self.daemon_argv(), job.name, job.command, daemon_job=daemon_job["id"])
+            )
+        if jobs:
+            self.log_message(f"🔌 正在跟踪构建守护进程的 {len(jobs)} 个构建")
+
+    def detach_daemon_threads(self, threads):
+        """停止跟踪守护进程中的构建，构建继续运行"""
+        for thread in threads:
+            thread.detach()
+        for thread in threads:
+            thread.wait(1000)
+
+    def _sender_job(self):
+        """返回发出当前信号的 PackageThread 对应的队列任务"""
+        return self.scheduler.get(getattr(self.sender(), "job_id", None))
+
+    def append_queue_log(self, lines):
+        """将构建输出追加到发出信号的队列任务日志"""
+        job = self._sender_job()
+        if job:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.queue_logs[job.id].append_lines([f"[{timestamp}] {line}" for line in lines])
+
+    def append_queue_message(self, message):
+        """将消息追加到发出信号的队列任务日志"""
+        job = self._sender_job()
+        if job:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.queue_logs[job.id].append_lines([f"[{timestamp}] {message}"])
+
+    def append_queue_event(self, event, info):
+        """记录发出信号的队列任务的构建事件"""
+        message = describe_build_event(event, info)
+        if message:
+            self.append_queue_message(message)
+
+    def update_queue_progress(self, percent):
+        """记录发出信号的队列任务进度"""
+        job = self._sender_job()
+        if job:
+            job.percent = percent
+            self.update_queue_row(job)
+
+    def update_queue_phase(self, phase, eta):
+        """记录发出信号的队列任务构建阶段"""
+        job = self._sender_job()
+        if job:
+            job.phase = PHASE_LABELS.get(phase, phase)
+            if eta >= 0 and phase != "done":
+                job.phase += f" · {format_duration(eta)}"
+            self.update_queue_row(job)
+
+    def queue_job_finished(self, success):
+        """处理队列构建完成"""
+        job = self._sender_job()
+        if not job:
+            return
+        self.scheduler.finish(job, success)
+        thread = self.queue_threads.pop(job.id, None)
+        if isinstance(thread, DaemonBuildThread):
+            # 守护进程线程提交构建后才知道
+            job.daemon_id = thread.daemon_job
+        self.update_artifact_cache_stats()
+        self.update_ccache_status()
+        if job.status == SUCCEEDED:
+            job.percent = 100
+            self.log_message(f"✅ 队列构建 #{job.id} ({job.name}) 成功")
+        else:
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.log_message(f"❌ 队列构建 #{job.id} ({job.name}) {status}")
+        self.update_queue_row(job)
+        self.variant_build_finished(job)
+        self.sweep_build_finished(job)
+        self.compiler_build_finished(job)
+
+        self.pump_queue()
+        if not self.scheduler.running and not self.scheduler.queued:
+            self.log_message("🏁 构建队列已全部完成")
+
+    def update_queue_row(self, job):
+        """刷新队列任务的表格行"""
+        row = self.scheduler.jobs.index(job)
+        values = [
+            f"#{job.id} {job.name}",
+            QUEUE_STATUS_LABELS[job.status],
+            str(job.jobs or "-"),
+            f"{job.percent}%",
+            job.phase,
+        ]
+        for column, value in enumerate(values):
+            item = self.queue_table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem()
+                self.queue_table.setItem(row, column, item)
+            item.setText(value)
+
+    def cancel_queue_job(self):
+        """取消所选队列任务"""
+        rows = self.queue_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        job = self.scheduler.jobs[rows[0].row()]
+        self.scheduler.cancel(job)
+        thread = self.queue_threads.get(job.id)
+        if thread and thread.isRunning():
+            thread.stop()
+        self.update_queue_row(job)
+
+    def remove_finished_jobs(self):
+        """从队列中移除已完成任务及其日志"""
+        for job in self.scheduler.remove_finished():
+            if job.daemon_id is not None:
+                try:
+                    DaemonClient().remove(job.daemon_id)
+                except DaemonError:
+                    pass
+            log_view = self.queue_logs.pop(job.id)
+            self.queue_log_stack.removeWidget(log_view)
+            log_view.close_buffer()
+            log_view.deleteLater()
+
+        self.queue_table.setRowCount(len(self.scheduler.jobs))
+        for job in self.scheduler.jobs:
+            self.update_queue_row(job)
+
+    def show_queue_job_log(self):
+        """显示所选队列任务的日志"""
+        rows = self.queue_table.selectionModel().selectedRows()
+        if rows:
+            job = self.scheduler.jobs[rows[0].row()]
+            self.queue_log_stack.setCurrentWidget(self.queue_logs[job.id])
+
+    def build_artifact_cache(self):
+        """返回新构建使用的产物缓存，禁用时返回 None"""
+        return self.artifact_cache if self.artifact_cache_check.isChecked() else None
+
+    def update_artifact_cache_settings(self):
+        """保存产物缓存设置"""
+        self.settings.setValue("artifact_cache_enabled", self.artifact_cache_check.isChecked())
+        self.settings.setValue("artifact_cache_max_gb", self.artifact_cache_size_spin.value())
+        self.artifact_cache.max_bytes = self.artifact_cache_size_spin.value() * 1024 ** 3
+
+    def update_artifact_cache_stats(self):
+        """显示产物缓存大小和命中次数"""
+        entries, size, hits, misses = self.artifact_cache.stats()
+        self.artifact_cache_stats_label.setText(f"{entries} 个条目 · {size / 1024 ** 2:,.1f} MB · 命中 {hits} 次 / 未命中 {misses} 次")
+
+    def clear_artifact_cache(self):
+        """删除所有缓存的构建产物"""
+        self.artifact_cache.clear()
+        self.update_artifact_cache_stats()
+        self.log_message("🗑 产物缓存已清空")
+
+    def select_ccache_dir(self):
+        """选择 ccache 目录"""
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "选择 ccache 目录", "", QFileDialog.ShowDirsOnly
+        )
+        if dir_path:
+            self.ccache_dir_input.setText(dir_path)
+            self.update_ccache_settings()
+
+    def build_environment(self, variables=None):
+        """返回新构建使用的环境变量，返回 None 表示继承当前环境
+
+        ``variables``(例如编译器和链接器，见 toolchain_variables)会在此基础上设置。
+        """
+        env = None
+        nuitka_cache = self.build_nuitka_cache()
+        if nuitka_cache is not None:
+            env = nuitka_cache.environment()
+        if self.build_ccache() is not None:
+            env = self.ccache.environment(env)
+        if variables:
+            env = dict(os.environ if env is None else env, **variables)
+        return env
+
+    def refresh_toolchain(self, refresh=False):
+        """在后台检测编译器、链接器和 ccache"""
+        self.toolchain_refresh_btn.setEnabled(False)
+        task = BackgroundTask(detect_toolchain, refresh, parent=self)
+        task.result_signal.connect(self.populate_toolchain)
+        task.error_signal.connect(lambda message: self.log_message(f"⚠️ 检测工具链失败: {message}"))
+        task.finished.connect(lambda: self.toolchain_refresh_btn.setEnabled(True))
+        task.finished.connect(task.deleteLater)
+        task.start()
+
+    def populate_toolchain(self, toolchain):
+        """填充编译器和链接器列表，保留当前选择"""
+        if toolchain is None:
+            return
+        self.toolchain = toolchain
+        compiler, linker = self.compiler_combo.currentData(), self.linker_combo.currentData()
+        for combo in (self.compiler_combo, self.linker_combo):
+            combo.blockSignals(True)
+            while combo.count() > 1:
+                combo.removeItem(1)
+        for entry in toolchain["compilers"]:
+            family = COMPILER_FAMILY_LABELS[entry["family"]]
+            self.compiler_combo.addItem(
+                f"{entry['name']}  —  {family} {entry['version'] or '?'} · {entry['path']}", entry["path"]
+            )
+        for entry in toolchain["linkers"]:
+            default = " (默认)" if entry["name"] == toolchain["default_linker"] else ""
+            self.linker_combo.addItem(
+                f"{entry['name']}{default}  —  {entry['version'] or '?'} · {entry['path']}", entry["name"]
+            )
+        self.select_toolchain(compiler, linker)
+        for combo in (self.compiler_combo, self.linker_combo):
+            combo.blockSignals(False)
+        self.show_toolchain_status(toolchain)
+
+    def select_toolchain(self, compiler, linker):
+        """选择编译器路径和链接器名称，未找到时也将其列出"""
+        for combo, value in ((self.compiler_combo, compiler), (self.linker_combo, linker)):
+            index = combo.findData(value)
+            if index < 0:
+                combo.addItem(f"{value} (未找到)", value)
+                index = combo.count() - 1
+            combo.setCurrentIndex(index)
+
+    def show_toolchain_status(self, toolchain):
+        """在列表下方描述检测到的工具链"""
+        lines = [f"在 PATH 中找到 {len(toolchain['compilers'])} 个编译器和 {len(toolchain['linkers'])} 个链接器"]
+        ccache = toolchain["ccache"]
+        if ccache is None:
+            lines.append("未找到 ccache")
+        else:
+            wrappers = f"；编译器包装目录: {', '.join(ccache['wrappers'])}" if ccache["wrappers"] else ""
+            lines.append(f"ccache {ccache['version'] or '?'}: {ccache['path']}{wrappers}")
+        self.toolchain_status_label.setText("\n".join(lines))
+
+    def create_package_thread(self, command, name=None, variables=None):
+        """使用已配置的缓存和构建环境创建打包线程"""
+        if self.daemon_builds_enabled():
+            options = job_options(
+                self.build_environment(variables),
+                os.getcwd(),
+                self.build_artifact_cache(),
+                self.build_ccache(),
+                self.build_nuitka_cache(),
+                history=True,
+                governor=self.build_memory_governor(),
+                warm_dirs=self.build_warm_dirs(),
+            )
+            thread = DaemonBuildThread(self.daemon_argv(), name or os.path.basename(command[-1]), command, options)
+        else:
+            thread = PackageThread(
+                command,
+                self.build_artifact_cache(),
+                self.build_environment(variables),
+                self.build_ccache(),
+                self.build_nuitka_cache(),
+                self.history,
+                governor=self.build_memory_governor(),
+                warm_dirs=self.build_warm_dirs(),
+            )
+        thread.event_signal.connect(self.update_nuitka_cache_from_event)
+        thread.event_signal.connect(self.update_warm_build_from_event)
+        thread.event_signal.connect(self.update_history_from_event)
+        thread.event_signal.connect(self.update_compile_cost_from_event)
+        return thread
+
+    def build_memory_governor(self):
+        """返回新构建使用的内存调控器，禁用时返回 None"""
+        if not self.memory_governor_check.isChecked() or read_meminfo() is None:
+            return None
+        return MemoryGovernor(
+            reserve=self.memory_reserve_spin.value() * 1024 ** 3,
+            pause_below=self.pause_below_spin.value() * 1024 ** 2,
+            low_memory=self.low_memory_fallback_check.isChecked(),
+            pause=self.pause_compilers_check.isChecked(),
+        )
+
+    def update_memory_governor_settings(self):
+        """保存内存调控设置并显示可用内存"""
+        self.settings.setValue("memory_governor_enabled", self.memory_governor_check.isChecked())
+        self.settings.setValue("memory_low_memory_fallback", self.low_memory_fallback_check.isChecked())
+        self.settings.setValue("memory_pause_compilers", self.pause_compilers_check.isChecked())
+        self.settings.setValue("memory_reserve_gb", self.memory_reserve_spin.value())
+        self.settings.setValue("memory_pause_below_mb", self.pause_below_spin.value())
+        info = read_meminfo()
+        if info is None:
+            self.memory_governor_check.setEnabled(False)
+            self.memory_status_label.setText("需要 /proc/meminfo (Linux)")
+            return
+        self.memory_status_label.setText(f"可用内存: {format_size(info['MemAvailable'])} / {format_size(info['MemTotal'])}")
+        enabled = self.memory_governor_check.isChecked()
+        for widget in (self.low_memory_fallback_check, self.pause_compilers_check, self.memory_reserve_spin,
+                       self.pause_below_spin):
+            widget.setEnabled(enabled)
+
+    def build_nuitka_cache(self):
+        """返回新构建使用的托管 Nuitka 缓存，禁用时返回 None"""
+        if not self.nuitka_cache_check.isChecked():
+            return None
+        return NuitkaCache.for_profile(profile_name(self.profile_path), self.nuitka_cache_quota_spin.value() * 1024 ** 3)
+
+    def update_nuitka_cache_settings(self):
+        """保存 Nuitka 缓存设置"""
+        self.settings.setValue("nuitka_cache_managed", self.nuitka_cache_check.isChecked())
+        self.settings.setValue("nuitka_cache_quota_gb", self.nuitka_cache_quota_spin.value())
+        self.refresh_nuitka_cache_sizes()
+
+    def refresh_nuitka_cache_sizes(self):
+        """在后台统计托管 Nuitka 缓存的大小"""
+        cache = self.build_nuitka_cache()
+        for widget in (self.nuitka_cache_quota_spin, self.nuitka_cache_refresh_btn):
+            widget.setEnabled(cache is not None)
+        if cache is None:
+            self.nuitka_cache_dir_label.clear()
+            self.nuitka_cache_sizes_label.clear()
+            return
+        if self.nuitka_cache_task and self.nuitka_cache_task.isRunning():
+            return
+
+        self.nuitka_cache_dir_label.setText(f"目录: {cache.root}")
+        self.nuitka_cache_sizes_label.setText("正在统计...")
+        self.nuitka_cache_task = BackgroundTask(cache.sizes)
+        self.nuitka_cache_task.result_signal.connect(self.show_nuitka_cache_sizes)
+        self.nuitka_cache_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ 统计 Nuitka 缓存失败: {message}")
+        )
+        self.nuitka_cache_task.start()
+
+    def build_warm_dirs(self):
+        """返回新构建使用的持久构建目录，未启用时返回 None"""
+        if not self.warm_build_check.isChecked():
+            return None
+        return WarmBuildDirs.for_profile(profile_name(self.profile_path), self.clean_build_check.isChecked())
+
+    def update_warm_build_settings(self):
+        """保存持久构建目录设置"""
+        self.settings.setValue("warm_build_dirs", self.warm_build_check.isChecked())
+        self.refresh_warm_build_dirs()
+
+    def refresh_warm_build_dirs(self):
+        """在后台统计当前配置的持久构建目录"""
+        warm_dirs = self.build_warm_dirs()
+        for widget in (self.clean_build_check, self.warm_build_refresh_btn, self.warm_build_delete_btn):
+            widget.setEnabled(warm_dirs is not None)
+        if warm_dirs is None:
+            self.warm_build_dir_label.clear()
+            self.warm_build_sizes_label.clear()
+            return
+        if self.warm_build_task and self.warm_build_task.isRunning():
+            return
+
+        self.warm_build_dir_label.setText(f"目录: {warm_dirs.root}")
+        self.warm_build_sizes_label.setText("正在统计...")
+        self.warm_build_task = BackgroundTask(warm_dirs.directories)
+        self.warm_build_task.result_signal.connect(self.show_warm_build_dirs)
+        self.warm_build_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ 统计持久构建目录失败: {message}")
+        )
+        self.warm_build_task.start()
+
+    def refresh_history(self):
+        """重新加载构建历史及其项目列表"""
+        project = self.history_project_combo.currentData()
+        self.history_project_combo.blockSignals(True)
+        self.history_project_combo.clear()
+        self.history_project_combo.addItem("所有项目", None)
+        for path in self.history.projects():
+            self.history_project_combo.addItem(path, path)
+        self.history_project_combo.setCurrentIndex(max(0, self.history_project_combo.findData(project)))
+        self.history_project_combo.blockSignals(False)
+        self.history_model.set_project(self.history_project_combo.currentData())
+        self.show_history_trends()
+
+    def select_history_project(self, index):
+        """显示历史标签页中所选项目的构建"""
+        self.history_model.set_project(self.history_project_combo.itemData(index))
+        self.show_history_trends()
+
+    def show_history_trends(self, *args):
+        """绘制所选项目的趋势"""
+        project = self.history_project_combo.currentData()
+        current = self.history_view.currentIndex()
+        if project is None and current.isValid():
+            project = self.history_model.build(current.row())["project"]
+        if project is None and self.main_file:
+            project = os.path.abspath(self.main_file)
+        trend = self.history.trend(project) if project else []
+        self.duration_chart.set_values([duration for _, duration, _, _ in trend])
+        self.size_chart.set_values([size for _, _, size, _ in trend])
+        self.memory_chart.set_values([peak_rss for _, _, _, peak_rss in trend])
+
+    def analyze_dist_size(self):
+        """在后台统计输出目录中 .dist 目录的体积"""
+        if not self.output_dir:
+            QMessageBox.warning(self, "缺少配置", "请选择输出目录")
+            return
+        if self.dist_size_task and self.dist_size_task.isRunning():
+            return
+        command = build_command(self.collect_config()) if self.python_path and self.main_file else None
+        self.dist_analyze_btn.setEnabled(False)
+        self.dist_summary_label.setText("正在扫描...")
+        self.dist_size_task = BackgroundTask(analyze_output_dir, self.output_dir, command)
+        self.dist_size_task.result_signal.connect(self.show_dist_reports)
+        self.dist_size_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ 分析输出目录失败: {message}")
+        )
+        self.dist_size_task.finished.connect(lambda: self.dist_analyze_btn.setEnabled(True))
+        self.dist_size_task.start()
+
+    def show_dist_reports(self, reports):
+        """列出已分析的 .dist 目录，优先选择主文件对应的目录"""
+        self.dist_reports = reports
+        self.dist_combo.blockSignals(True)
+        self.dist_combo.clear()
+        for report in reports:
+            self.dist_combo.addItem(os.path.basename(report["root"]))
+        if self.main_file:
+            index = self.dist_combo.findText(os.path.splitext(os.path.basename(self.main_file))[0] + ".dist")
+            self.dist_combo.setCurrentIndex(max(0, index))
+        self.dist_combo.blockSignals(False)
+        self.show_dist_report()
+
+    def show_dist_report(self, *args):
+        """显示所选 .dist 目录的体积构成和建议"""
+        index = self.dist_combo.currentIndex()
+        if not 0 <= index < len(self.dist_reports):
+            self.dist_package_model.set_rows([], 0)
+            self.dist_library_model.set_rows([], 0)
+            self.dist_suggestions_table.setRowCount(0)
+            if self.output_dir:
+                self.dist_summary_label.setText(f"{self.output_dir} 中没有 .dist 目录")
+            return
+        report = self.dist_reports[index]
+        self.dist_package_model.set_rows(report["contributors"], report["size"])
+        self.dist_library_model.set_rows(report["libraries"], report["size"])
+        model = self.dist_library_model if self.dist_view_combo.currentIndex() == 1 else self.dist_package_model
+        self.dist_view.setModel(model)
+        self.dist_view.sortByColumn(model.columns.index("size"), Qt.DescendingOrder)
+        self.dist_summary_label.setText(f"{report['files']} 个文件，{format_size(report['size'])}(扫描耗时 {report['seconds']:.1f} 秒)")
+
+        table = self.dist_suggestions_table
+        table.setRowCount(len(report["suggestions"]))
+        for row, suggestion in enumerate(report["suggestions"]):
+            cells = [
+                SUGGESTION_OPTIONS[suggestion["field"]],
+                suggestion["value"],
+                format_size(suggestion["size"]),
+                DIST_SUGGESTION_REASONS[suggestion["reason"]].format(subject=suggestion["subject"]),
+            ]
+            for column, text in enumerate(cells):
+                table.setItem(row, column, QTableWidgetItem(text))
+        table.resizeColumnsToContents()
+
+    def apply_dist_suggestions(self):
+        """将所选建议添加到对应的选项中"""
+        index = self.dist_combo.currentIndex()
+        if not 0 <= index < len(self.dist_reports):
+            return
+        suggestions = self.dist_reports[index]["suggestions"]
+        widgets = self._config_widgets()
+        for row in sorted({item.row() for item in self.dist_suggestions_table.selectedItems()}):
+            suggestion = suggestions[row]
+            widget = widgets[suggestion["field"]]
+            entries = split_list(widget.text())
+            if suggestion["value"] in entries:
+                continue
+            widget.setText(", ".join(entries + [suggestion["value"]]))
+            option = SUGGESTION_OPTIONS[suggestion["field"]]
+            self.log_message(f"已添加 {option}={suggestion['value']}，请重新构建并测试程序")
+
+    def scan_import_graph(self):
+        """在后台扫描主文件的导入图"""
+        if not self.python_path:
+            QMessageBox.warning(self, "缺少配置", "请选择Python解释器")
+            return
+        if not self.main_file:
+            QMessageBox.warning(self, "缺少配置", "请选择主文件")
+            return
+        if self.import_task and self.import_task.isRunning():
+            return
+        config = self.collect_config()
+        self.import_stop.clear()
+        self.import_scan_btn.setEnabled(False)
+        self.import_summary_label.setText("正在扫描...")
+        self.import_task = BackgroundTask(
+            scan_imports, self.python_path, self.main_file, config["standalone"] or config["follow_stdlib"],
+            split_list(config["nofollow_import"]), split_list(config["include_module"]),
+            split_list(config["include_package"]), config["plugins"], None, self.import_stop,
+        )
+        self.import_task.result_signal.connect(self.show_import_report)
+        self.import_task.error_signal.connect(
+            lambda message: self.log_message(f"⚠️ 扫描导入失败: {message}")
+        )
+        self.import_task.finished.connect(lambda: self.import_scan_btn.setEnabled(True))
+        self.import_task.start()
+
+    def stop_import_scan(self):
+        """停止正在运行的导入扫描"""
+        self.import_stop.set()
+        if self.import_task and self.import_task.isRunning():
+            self.import_task.wait()
+
+    def show_import_report(self, report):
+        """显示扫描得到的导入图及建议"""
+        self.import_report = report
+        totals = report["totals"]
+        count = sum(total["modules"] for kind, total in totals.items() if kind != "missing")
+        size = sum(total["size"] for total in totals.values())
+        parts = []
+        for kind in ("project", "third_party", "stdlib"):
+            total = totals.get(kind)
+            if total:
+                parts.append(f"{IMPORT_KIND_LABELS[kind]} {total['modules']} 个模块 {format_size(total['size'])}")
+        text = f"{count} 个模块，共 {format_size(size)}"
+        if parts:
+            text += " (" + "，".join(parts) + ")"
+        missing = totals.get("missing", {}).get("modules", 0)
+        if missing:
+            text += f"，{missing} 个未找到"
+        text += f"；{report['seconds']:.1f} 秒内解析了 {report['files']} 个文件中的 {report['parsed']} 个"
+        self.import_summary_label.setText(text)
+        for entry in report["dynamic"]:
+            if entry["kind"] == "unknown":
+                self.log_message(f"⚠️ {entry['importer']}:{entry['line']} 通过计算得到的名称导入模块，Nuitka 无法跟踪")
+        for path, message in report["errors"]:
+            self.log_message(f"⚠️ 无法解析 {path}: {message}")
+
+        self.import_package_model.set_rows(report["packages"], size)
+        self.import_module_model.set_rows(report["modules"], size)
+        self.show_import_view()
+
+        table = self.import_suggestions_table
+        table.setRowCount(len(report["suggestions"]))
+        for row, suggestion in enumerate(report["suggestions"]):
+            cells = [
+                IMPORT_OPTIONS[suggestion["field"]],
+                suggestion["value"],
+                IMPORT_SUGGESTION_REASONS[suggestion["reason"]].format(subject=suggestion["subject"]),
+            ]
+            for column, text in enumerate(cells):
+                table.setItem(row, column, QTableWidgetItem(text))
+        table.resizeColumnsToContents()
+
+    def show_import_view(self, *args):
+        """显示扫描结果中的包或模块"""
+        model = self.import_module_model if self.import_view_combo.currentIndex() == 1 else self.import_package_model
+        self.import_view.setModel(model)
+        self.import_view.sortByColumn(model.columns.index("size"), Qt.DescendingOrder)
+
+    def apply_import_suggestions(self):
+        """将所选建议添加到对应的选项中"""
+        if not self.import_report:
+            return
+        suggestions = self.import_report["suggestions"]
+        widgets = self._config_widgets()
+        for row in sorted({item.row() for item in self.import_suggestions_table.selectedItems()}):
+            suggestion = suggestions[row]
+            if suggestion["field"] == "plugins":
+                text = f"--enable-plugin={suggestion['value']}"
+                if not self.plugins_list.findItems(text, Qt.MatchExactly):
+                    self.plugins_list.addItem(text)
+                item = self.plugins_list.findItems(text, Qt.MatchExactly)[0]
+                if item.isSelected():
+                    continue
+                item.setSelected(True)
+            else:
+                widget = widgets[suggestion["field"]]
+                entries = split_list(widget.text())
+                if suggestion["value"] in entries:
+                    continue
+                widget.setText(", ".join(entries + [suggestion["value"]]))
+            option = IMPORT_OPTIONS[suggestion["field"]]
+            self.log_message(f"已添加 {option}={suggestion['value']}，请重新构建并测试程序")
+
+    def run_benchmark(self):
+        """在后台测试已构建程序的启动耗时"""
+        if self.benchmark_running():
+            return
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "缺少配置", "请选择Python解释器和主文件")
+            return
+        caches = [cache for cache, check in (("warm", self.benchmark_warm_check), ("cold", self.benchmark_cold_check))
+                  if check.isChecked() and check.isEnabled()]
+        if not caches:
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        options["compare_python"] = self.benchmark_python_check.isChecked()
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.benchmark_table.setRowCount(0)
+        self.benchmark_summary_label.setText("运行中...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ 正在测试启动耗时(每种情况 {runs} 次)...")
+        self.benchmark_task = BackgroundTask(
+            lambda command: startup_benchmark(
+                command, runs, caches, stop=self.benchmark_stop, on_result=self.benchmark_result.emit, **options
+            ),
+            build_command(self.collect_config()),
+        )
+        self.benchmark_task.result_signal.connect(self.benchmark_finished)
+        self.benchmark_task.error_signal.connect(self.benchmark_failed)
+        self.benchmark_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.benchmark_task.start()
+
+    def benchmark_options(self):
+        """基准测试标签页中的启动设置，参数无法解析时返回 None"""
+        try:
+            arguments = shlex.split(self.benchmark_args_input.text())
+        except ValueError as e:
+            self.log_message(f"⚠️ 基准测试参数无效: {e}")
+            return None
+        return {
+            "arguments": arguments,
+            "ready_marker": self.benchmark_marker_input.text() or None,
+            "timeout": self.benchmark_timeout_spin.value(),
+        }
+
+    def benchmark_running(self):
+        tasks = (self.benchmark_task, self.comparison_task, self.sweep_task, self.compiler_task)
+        return any(task and task.isRunning() for task in tasks)
+
+    def set_benchmark_buttons(self, enabled):
+        """没有基准测试运行时才启用基准测试按钮"""
+        self.benchmark_run_btn.setEnabled(enabled)
+        self.comparison_measure_btn.setEnabled(enabled)
+        self.sweep_measure_btn.setEnabled(enabled)
+        self.compiler_measure_btn.setEnabled(enabled)
+        self.benchmark_stop_btn.setEnabled(not enabled)
+
+    def stop_benchmark(self):
+        """在当前这次运行结束后停止基准测试"""
+        self.benchmark_stop.set()
+        for task in (self.benchmark_task, self.comparison_task, self.sweep_task, self.compiler_task):
+            if task and task.isRunning():
+                task.wait()
+
+    def add_benchmark_row(self, result):
+        """将一条基准测试结果添加到表格"""
+        row = self.benchmark_table.rowCount()
+        self.benchmark_table.insertRow(row)
+        cells = [
+            BENCHMARK_LABELS[result["target"]],
+            BENCHMARK_LABELS[result["cache"]],
+            f"{result['runs']}" + (f" (+{result['failures']} ✗)" if result["failures"] else ""),
+        ]
+        cells += ["-" if result[key] is None else format_latency(result[key]) for key in ("min", "median", "p95")]
+        cells.append("-" if result["peak_rss"] is None else format_size(result["peak_rss"]))
+        for column, text in enumerate(cells):
+            item = QTableWidgetItem(text)
+            if column >= 2:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.benchmark_table.setItem(row, column, item)
+
+    def benchmark_failed(self, message):
+        """报告无法运行的基准测试"""
+        self.benchmark_summary_label.clear()
+        self.log_message(f"⚠️ 启动基准测试失败: {message}")
+
+    def benchmark_finished(self, result):
+        """报告并记录完成的基准测试"""
+        lines = []
+        for cache, name in (("warm", "热"), ("cold", "冷")):
+            factor = speedup(result["results"], cache)
+            if factor is None:
+                continue
+            if factor >= 1:
+                lines.append(f"编译程序的启动速度是 CPython 的 {factor:.2f} 倍(中位数，{name}缓存)")
+            else:
+                factor = 1 / factor
+                lines.append(f"编译程序的启动比 CPython 慢 {factor:.2f} 倍(中位数，{name}缓存)")
+        failures = sum(entry["failures"] for entry in result["results"])
+        if failures:
+            code = next(entry["exit_code"] for entry in reversed(result["results"]) if entry["failures"])
+            lines.append(f"⚠️ {failures} 次运行失败(最后的退出码 {code})")
+        self.benchmark_summary_label.setText("\n".join(lines) or f"{result['executable']} 的启动耗时")
+        for line in lines:
+            self.log_message(line)
+
+        build_id = self.history.latest_build(os.path.abspath(self.main_file))
+        if build_id is None:
+            self.log_message("未保存基准测试结果: 历史中没有该项目的成功构建")
+            return
+        self.history.record_benchmark(build_id, result["results"], result["arguments"])
+        self.log_message(f"基准测试结果已与构建 #{build_id} 一起保存")
+        self.history_model.refresh()
+
+    def build_variants(self):
+        """将当前配置的独立模式和单文件构建加入队列以进行对比"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        if self.comparison_jobs:
+            return
+        self.comparison_commands = {}
+        name = os.path.basename(self.main_file)
+        for variant, config in variant_configs(self.collect_config()).items():
+            command = build_command(config)
+            job = self.enqueue_command(
+                f"{name} ({COMPARISON_HEADERS[VARIANTS.index(variant)]})", command, toolchain_variables(config)
+            )
+            self.comparison_jobs[job.id] = variant
+            self.comparison_commands[variant] = command
+        self.comparison_build_btn.setEnabled(False)
+        self.comparison_summary_label.setText("正在构建两种模式...")
+        self.log_message("🔀 已将独立模式和单文件构建加入队列以进行对比")
+        if self.queue_run_btn.isChecked():
+            self.pump_queue()
+        else:
+            # 启动队列即会开始两个构建
+            self.queue_run_btn.setChecked(True)
+
+    def variant_build_finished(self, job):
+        """两个对比构建都成功后开始测试"""
+        variant = self.comparison_jobs.pop(job.id, None)
+        if variant is None:
+            return
+        if job.status != SUCCEEDED:
+            # 另一个构建可能仍在运行，其结果将被忽略
+            self.comparison_jobs.clear()
+            self.comparison_build_btn.setEnabled(True)
+            variant = COMPARISON_HEADERS[VARIANTS.index(variant)]
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.comparison_summary_label.setText(f"{variant}构建{status}，已放弃对比")
+            return
+        if not self.comparison_jobs:
+            self.comparison_build_btn.setEnabled(True)
+            self.measure_variants(self.comparison_commands)
+
+    def compare_built_variants(self):
+        """对比当前配置已构建好的两种模式"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        configs = variant_configs(self.collect_config())
+        self.measure_variants({variant: build_command(config) for variant, config in configs.items()})
+
+    def measure_variants(self, commands):
+        """在后台测试已构建的两种模式"""
+        if self.benchmark_running():
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.comparison_table.clearContents()
+        self.comparison_summary_label.setText("测试中...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ 正在对比单文件和独立模式(每种启动方式 {runs} 次)...")
+        self.comparison_task = BackgroundTask(
+            lambda: compare_variants(commands, runs, stop=self.benchmark_stop, **options)
+        )
+        self.comparison_task.result_signal.connect(self.show_comparison)
+        self.comparison_task.error_signal.connect(self.comparison_failed)
+        self.comparison_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.comparison_task.start()
+
+    def comparison_failed(self, message):
+        """报告无法运行的对比"""
+        self.comparison_summary_label.clear()
+        self.log_message(f"⚠️ 单文件 / 独立模式对比失败: {message}")
+
+    def show_comparison(self, comparison):
+        """并排显示完成的单文件 / 独立模式对比"""
+
+        def latency(result):
+            return "-" if not result or result["median"] is None else format_latency(result["median"])
+
+        def size(value):
+            return "-" if value is None else format_size(value)
+
+        for column, variant in enumerate(VARIANTS):
+            entry = comparison[variant]
+            repeat = entry["repeat_launch"]
+            cells = [
+                size(entry["size"]),
+                latency(entry["first_launch"]),
+                latency(repeat),
+                size(repeat["peak_rss"] if repeat else None),
+                size(entry["extraction"]),
+                size(entry["extraction_left"]),
+            ]
+            for row, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.comparison_table.setItem(row, column, item)
+
+        standalone, onefile = comparison["standalone"], comparison["onefile"]
+        lines = []
+        if onefile["size"]:
+            ratio = standalone["size"] / onefile["size"]
+            lines.append(f"单文件的磁盘占用小 {ratio:.1f} 倍({format_size(onefile['size'])} 对比 {format_size(standalone['size'])})" if ratio >= 1 else f"单文件的磁盘占用大 {1 / ratio:.1f} 倍({format_size(onefile['size'])} 对比 {format_size(standalone['size'])})")
+        for key, name in (("first_launch", "首次启动"), ("repeat_launch", "重复启动")):
+            base, other = standalone[key], onefile[key]
+            if base and other and base["median"] is not None and other["median"] is not None:
+                delta = (other["median"] - base["median"]) * 1000
+                lines.append(f"单文件{name}: {delta:+.1f} ms({format_latency(other['median'])} 对比 {format_latency(base['median'])})")
+        if onefile["extraction_left"]:
+            lines.append(f"单文件在临时目录中保留了 {format_size(onefile['extraction_left'])}(缓存解压)")
+        elif onefile["extraction"]:
+            lines.append(f"单文件每次启动都会向临时目录解压 {format_size(onefile['extraction'])}")
+        self.comparison_summary_label.setText("\n".join(lines))
+        for line in lines:
+            self.log_message(line)
+
+    def build_sweep(self):
+        """为每种载荷压缩设置各加入一个单文件构建"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        if self.sweep_jobs:
+            return
+        config = self.collect_config()
+        self.sweep_commands = sweep_commands(config)
+        name = os.path.basename(self.main_file)
+        for setting, command in self.sweep_commands.items():
+            job = self.enqueue_command(f"{name} ({setting})", command, toolchain_variables(config))
+            self.sweep_jobs[job.id] = setting
+        self.sweep_build_btn.setEnabled(False)
+        self.sweep_summary_label.setText(f"正在构建 {len(SETTINGS)} 个单文件程序...")
+        self.log_message("🗜️ 已为每种压缩设置各加入一个单文件构建")
+        if self.queue_run_btn.isChecked():
+            self.pump_queue()
+        else:
+            # 启动队列即会开始构建
+            self.queue_run_btn.setChecked(True)
+
+    def sweep_build_finished(self, job):
+        """所有扫描构建都成功后开始测试"""
+        setting = self.sweep_jobs.pop(job.id, None)
+        if setting is None:
+            return
+        if job.status != SUCCEEDED:
+            # 仍在运行的构建将被忽略
+            self.sweep_jobs.clear()
+            self.sweep_build_btn.setEnabled(True)
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.sweep_summary_label.setText(f"{setting}构建{status}，已放弃扫描")
+            return
+        if not self.sweep_jobs:
+            self.sweep_build_btn.setEnabled(True)
+            self.measure_sweep(self.sweep_commands)
+
+    def sweep_existing_builds(self):
+        """扫描当前配置已构建好的各种设置"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        self.measure_sweep(sweep_commands(self.collect_config()))
+
+    def measure_sweep(self, commands):
+        """在后台测试已构建的压缩设置"""
+        if self.benchmark_running():
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.sweep_table.setRowCount(0)
+        self.level_table.setRowCount(0)
+        self.sweep_recommended = None
+        self.sweep_apply_btn.setEnabled(False)
+        self.sweep_summary_label.setText("测试中...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ 正在扫描单文件压缩设置(每种启动方式 {runs} 次)...")
+        self.sweep_task = BackgroundTask(lambda: sweep(commands, runs, stop=self.benchmark_stop, **options))
+        self.sweep_task.result_signal.connect(self.show_sweep)
+        self.sweep_task.error_signal.connect(self.sweep_failed)
+        self.sweep_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.sweep_task.start()
+
+    def sweep_failed(self, message):
+        """报告无法运行的扫描"""
+        self.sweep_summary_label.clear()
+        self.log_message(f"⚠️ 压缩设置扫描失败: {message}")
+
+    def show_sweep(self, result):
+        """显示各设置的测试结果和各级别的估算"""
+
+        def latency(measured):
+            return "-" if not measured or measured["median"] is None else format_latency(measured["median"])
+
+        recommended = result["recommended"]
+        self.sweep_table.setRowCount(len(result["settings"]))
+        for row, (setting, measured) in enumerate(result["settings"].items()):
+            label = SWEEP_LABELS[setting] + (" (推荐)" if setting == recommended else "")
+            cells = [
+                label,
+                format_size(measured["size"]),
+                latency(measured["first_launch"]),
+                latency(measured["repeat_launch"]),
+                "-" if measured["extraction"] is None else format_size(measured["extraction"]),
+                "✓" if setting in result["pareto"] else "",
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column == len(cells) - 1:
+                    item.setTextAlignment(Qt.AlignCenter)
+                elif column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.sweep_table.setItem(row, column, item)
+
+        self.level_table.setRowCount(len(result["levels"]))
+        for row, estimate in enumerate(result["levels"]):
+            cells = [
+                str(estimate["level"]),
+                format_size(estimate["size"]),
+                format_latency(estimate["compress_seconds"]),
+                format_latency(estimate["decompress_seconds"]),
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.level_table.setItem(row, column, item)
+
+        self.sweep_recommended = recommended
+        self.sweep_apply_btn.setEnabled(recommended is not None)
+        summary = f"推荐: {SWEEP_LABELS[recommended]}，帕累托最优: {'、'.join(SWEEP_LABELS[setting] for setting in result['pareto'])}" if recommended else "没有可以启动的设置"
+        self.sweep_summary_label.setText(summary)
+        self.log_message(summary)
+
+    def apply_recommended_compression(self):
+        """将推荐的压缩设置应用到单文件选项"""
+        if self.sweep_recommended is None:
+            return
+        setting = SETTING_CONFIG[self.sweep_recommended]
+        self.onefile_check.setChecked(True)
+        self.onefile_no_compression_check.setChecked(setting["onefile_no_compression"])
+        self.onefile_as_archive_check.setChecked(setting["onefile_as_archive"])
+        self.low_memory_check.setChecked(setting["low_memory"])
+        self.log_message(f"🗜️ 已应用压缩设置: {SWEEP_LABELS[self.sweep_recommended]}")
+
+    def build_compilers(self):
+        """为每个 C 编译器各加入一个当前配置的构建"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        if self.compiler_jobs:
+            return
+        if not self.toolchain or not self.toolchain["compilers"]:
+            QMessageBox.warning(self, "没有 C 编译器", "在 PATH 中未找到 C 编译器")
+            return
+        self.compiler_commands = {}
+        name = os.path.basename(self.main_file)
+        for compiler, config in compiler_configs(self.collect_config(), self.toolchain["compilers"]).items():
+            command = build_command(config)
+            job = self.enqueue_command(f"{name} ({compiler})", command, toolchain_variables(config))
+            self.compiler_jobs[job.id] = compiler
+            self.compiler_commands[compiler] = command
+        self.compiler_build_btn.setEnabled(False)
+        self.compiler_summary_label.setText(f"正在用 {len(self.compiler_commands)} 个编译器构建...")
+        self.log_message("🛠️ 已为每个 C 编译器各加入一个构建")
+        if self.queue_run_btn.isChecked():
+            self.pump_queue()
+        else:
+            # 启动队列即会开始构建
+            self.queue_run_btn.setChecked(True)
+
+    def compiler_build_finished(self, job):
+        """所有编译器构建都成功后开始测试"""
+        compiler = self.compiler_jobs.pop(job.id, None)
+        if compiler is None:
+            return
+        if job.status != SUCCEEDED:
+            # 仍在运行的构建将被忽略
+            self.compiler_jobs.clear()
+            self.compiler_build_btn.setEnabled(True)
+            status = QUEUE_STATUS_LABELS[job.status]
+            self.compiler_summary_label.setText(f"{compiler}构建{status}，已放弃对比")
+            return
+        if not self.compiler_jobs:
+            self.compiler_build_btn.setEnabled(True)
+            self.measure_compilers(self.compiler_commands)
+
+    def compare_built_compilers(self):
+        """对比当前配置已用各编译器构建好的程序"""
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        if not self.toolchain or not self.toolchain["compilers"]:
+            QMessageBox.warning(self, "没有 C 编译器", "在 PATH 中未找到 C 编译器")
+            return
+        configs = compiler_configs(self.collect_config(), self.toolchain["compilers"])
+        self.measure_compilers({compiler: build_command(config) for compiler, config in configs.items()})
+
+    def measure_compilers(self, commands):
+        """在后台测试用各编译器构建的程序"""
+        if self.benchmark_running():
+            return
+        options = self.benchmark_options()
+        if options is None:
+            return
+        runs = self.benchmark_runs_spin.value()
+        self.benchmark_stop.clear()
+        self.compiler_table.setRowCount(0)
+        self.compiler_summary_label.setText("测试中...")
+        self.set_benchmark_buttons(False)
+        self.log_message(f"⏱️ 正在对比 {len(commands)} 个 C 编译器(每种启动方式 {runs} 次)...")
+        self.compiler_task = BackgroundTask(
+            lambda: compare_compilers(commands, runs, stop=self.benchmark_stop, history=self.history, **options)
+        )
+        self.compiler_task.result_signal.connect(self.show_compilers)
+        self.compiler_task.error_signal.connect(self.compilers_failed)
+        self.compiler_task.finished.connect(lambda: self.set_benchmark_buttons(True))
+        self.compiler_task.start()
+
+    def compilers_failed(self, message):
+        """报告无法运行的编译器对比"""
+        self.compiler_summary_label.clear()
+        self.log_message(f"⚠️ C 编译器对比失败: {message}")
+
+    def show_compilers(self, result):
+        """显示各编译器的编译耗时、大小和启动耗时"""
+
+        def latency(measured):
+            return "-" if not measured or measured["median"] is None else format_latency(measured["median"])
+
+        versions = {entry["name"]: entry["version"] for entry in (self.toolchain or {}).get("compilers", [])}
+        self.compiler_table.setRowCount(len(result))
+        for row, (compiler, measured) in enumerate(result.items()):
+            seconds = measured["compile_seconds"]
+            cells = [
+                compiler,
+                versions.get(compiler) or "?",
+                "-" if seconds is None else format_duration(seconds),
+                format_size(measured["size"]),
+                latency(measured["first_launch"]),
+                latency(measured["repeat_launch"]),
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column > 1:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.compiler_table.setItem(row, column, item)
+
+        lines = []
+        timed = {
+            compiler: measured["compile_seconds"] for compiler, measured in result.items() if measured["compile_seconds"]
+        }
+        if timed:
+            fastest = min(timed, key=timed.get)
+            lines.append(f"构建最快: {fastest} ({format_duration(timed[fastest])})")
+        started = {
+            compiler: measured["repeat_launch"]["median"] for compiler, measured in result.items()
+            if measured["repeat_launch"] and measured["repeat_launch"]["median"] is not None
+        }
+        if started:
+            fastest = min(started, key=started.get)
+            lines.append(f"启动最快: {fastest} ({format_latency(started[fastest])})")
+        self.compiler_summary_label.setText("\n".join(lines))
+        for line in lines:
+            self.log_message(line)
+
+    def update_benchmark_settings(self):
+        """保存基准测试设置"""
+        self.settings.setValue("benchmark_runs", self.benchmark_runs_spin.value())
+        self.settings.setValue("benchmark_timeout", self.benchmark_timeout_spin.value())
+        self.settings.setValue("benchmark_after_build", self.benchmark_auto_check.isChecked())
+
+    def update_history_from_event(self, event, info):
+        """在历史标签页中显示刚完成的构建"""
+        if event == "build_summary" and info["build_id"] is not None:
+            self.refresh_history()
+
+    def update_compile_cost_from_event(self, event, info):
+        """显示构建报告的编译开销"""
+        if event != "compilation_report":
+            return
+        report = info["report"]
+        self.compile_report = report
+        totals = report["totals"]
+        text = (f"Nuitka {report['nuitka_version']}: {totals['modules']} 个模块(已编译 {totals['compiled']} 个)，"
+                f"C 代码 {format_size(totals['size'])}，优化耗时 {totals['seconds']:.1f} 秒")
+        self.compile_summary_label.setText(text)
+        self.compile_package_model.set_rows(report["packages"], totals["size"])
+        self.compile_module_model.set_rows(report["modules"], totals["size"])
+        self.show_compile_view()
+
+    def show_compile_view(self, *args):
+        """显示编译报告中的包或模块"""
+        model = self.compile_module_model if self.compile_view_combo.currentIndex() == 1 else self.compile_package_model
+        self.compile_view.setModel(model)
+        self.compile_view.sortByColumn(model.columns.index("seconds"), Qt.DescendingOrder)
+
+    def update_nuitka_cache_from_event(self, event, info):
+        """显示构建报告的 Nuitka 缓存大小"""
+        if event == "nuitka_cache" and self.build_nuitka_cache() is not None:
+            self.show_nuitka_cache_sizes(info["sizes"])
+
+    def show_nuitka_cache_sizes(self, sizes):
+        """显示托管 Nuitka 缓存各类别的大小"""
+        quota = self.nuitka_cache_quota_spin.value() * 1024 ** 3
+        parts = [f"{category} {format_size(size)}" for category, size in sorted(sizes.items()) if size]
+        parts.append(f"共 {format_size(sum(sizes.values()))} / {format_size(quota)}")
+        self.nuitka_cache_sizes_label.setText(" · ".join(parts) if len(parts) > 1 else "空")
+
+    def update_warm_build_from_event(self, event, info):
+        """构建结束后更新持久构建目录列表"""
+        if event == "build_dir_summary" and self.build_warm_dirs() is not None:
+            self.refresh_warm_build_dirs()
+
+    def show_warm_build_dirs(self, directories):
+        """列出当前配置的持久构建目录及其大小和上次构建耗时"""
+        states = {"building": "正在构建", "failed": "上次构建未完成"}
+        lines = []
+        for entry in directories:
+            parts = [f"{entry['output_dir'] or os.path.basename(entry['directory'])}: {format_size(entry['size'])}"]
+            if entry["cold_seconds"]:
+                parts.append(f"上次冷构建 {format_duration(entry['cold_seconds'])}")
+            if entry["state"] in states:
+                parts.append(states[entry["state"]])
+            elif entry["seconds"]:
+                parts.append(f"上次构建 {format_duration(entry['seconds'])}")
+            lines.append(" · ".join(parts))
+        if not lines:
+            lines.append("空")
+        if self.ccache is None:
+            # 持久构建目录只有配合 ccache 才能节省时间
+            lines.append("⚠️ 未找到 ccache: 热构建仍会重新编译所有 C 文件")
+        self.warm_build_sizes_label.setText("\n".join(lines))
+
+    def delete_warm_build_dirs(self):
+        """删除当前配置中未在使用的持久构建目录"""
+        warm_dirs = self.build_warm_dirs()
+        if warm_dirs is None:
+            return
+        freed = warm_dirs.clear()
+        self.log_message(f"🗑 已删除持久构建目录(释放 {format_size(freed)})")
+        self.refresh_warm_build_dirs()
+
+    def build_ccache(self):
+        """返回新构建要统计的 ccache，没有时返回 None"""
+        if self.ccache is None or self.disable_ccache_check.isChecked():
+            return None
+        return self.ccache
+
+    def update_ccache_settings(self):
+        """保存 ccache 设置"""
+        self.settings.setValue("ccache_dir", self.ccache_dir_input.text().strip())
+        self.settings.setValue("ccache_maxsize", self.ccache_size_input.text().strip())
+        if self.ccache:
+            self.ccache.cache_dir = self.ccache_dir_input.text().strip()
+            self.ccache.max_size = self.ccache_size_input.text().strip()
+        self.update_ccache_status()
+
+    def update_ccache_status(self):
+        """显示检测到的 ccache 及其统计信息"""
+        if self.ccache is None:
+            self.ccache_status_label.setText("未找到 ccache - 安装后可加速重复构建")
+            self.ccache_stats_label.clear()
+            for widget in (self.ccache_refresh_btn, self.ccache_prewarm_btn):
+                widget.setEnabled(False)
+            return
+
+        version = self.ccache.version() or "ccache"
+        self.ccache_status_label.setText(f"{version} ({self.ccache.binary})")
+        stats = self.ccache.stats()
+        if stats is None:
+            self.ccache_stats_label.setText("暂无统计信息")
+            return
+        self.ccache_stats_label.setText(
+            f"{stats.files} 个文件 · {stats.size_bytes / 1024 ** 2:,.1f} MB · "
+                f"累计命中 {stats.hits} 次 / 未命中 {stats.misses} 次"
+        )
+
+    def prewarm_ccache(self):
+        """在后台编译一次当前配置以填充 ccache"""
+        if self.prewarm_thread and self.prewarm_thread.isRunning():
+            self.log_message("⚠️ ccache 预热已在进行中")
+            return
+        if not self.python_path or not self.main_file:
+            QMessageBox.warning(self, "配置缺失", "请选择Python解释器和主文件")
+            return
+        if self.build_ccache() is None:
+            self.log_message("⚠️ 已在高级选项中禁用 ccache")
+            return
+
+        # 构建到临时目录，不影响用户的输出目录
+        command = [arg for arg in self.command_edit.toPlainText().split() if not arg.startswith("--output-dir=")]
+        command.insert(-1, f"--output-dir={state_dir('prewarm')}")
+        if "--remove-output" not in command:
+            command.insert(-1, "--remove-output")
+
+        self.prewarm_thread = PackageThread(
+            command, env=self.build_environment(toolchain_variables(self.collect_config())), ccache=self.build_ccache(),
+            nuitka_cache=self.build_nuitka_cache(),
+        )
+        self.prewarm_thread.event_signal.connect(self.log_build_event)
+        self.prewarm_thread.event_signal.connect(self.update_nuitka_cache_from_event)
+        self.prewarm_thread.finished_signal.connect(self.prewarm_finished)
+        self.ccache_prewarm_btn.setEnabled(False)
+        self.prewarm_thread.start()
+        self.log_message("🔥 正在使用当前配置预热 ccache...")
+
+    def prewarm_finished(self, success):
+        """处理 ccache 预热构建完成"""
+        self.ccache_prewarm_btn.setEnabled(True)
+        self.log_message("🔥 ccache 预热完成" if success else "❌ ccache 预热失败")
+        self.update_ccache_status()
+
+    def running_threads(self):
+        """返回所有正在运行的打包线程"""
+        threads = [thread for thread in self.queue_threads.values() if thread.isRunning()]
+        if self.prewarm_thread and self.prewarm_thread.isRunning():
+            threads.append(self.prewarm_thread)
+        if self.package_thread and self.package_thread.isRunning():
+            threads.append(self.package_thread)
+        return threads
 
     def closeEvent(self, event):
         """处理窗口关闭事件"""
-        if self.package_thread and self.package_thread.isRunning():
+        running_threads = self.running_threads()
+        # 构建守护进程中的构建继续运行，窗口只是停止跟踪
+        daemon_threads = [thread for thread in running_threads if isinstance(thread, DaemonBuildThread)]
+        running_threads = [thread for thread in running_threads if thread not in daemon_threads]
+        if running_threads:
             # 使用实例化的方式创建 QMessageBox 以便应用样式
             msg_box = QMessageBox(
                 QMessageBox.Question,  # 设置图标
@@ -1808,13 +4407,33 @@ class NuitkaPackager(QMainWindow):
             reply = msg_box.exec()  # 使用 exec() 显示对话框
 
             if reply == QMessageBox.Yes:
-                self.package_thread.stop()
+                for thread in running_threads:
+                    thread.stop()
+                # 线程停止时仍会输出日志，需等其结束后再关闭日志
+                for thread in running_threads:
+                    thread.wait(5000)
+                self.detach_daemon_threads(daemon_threads)
+                self.stop_benchmark()
+                self.stop_import_scan()
+                self.stop_watch()
+                self.close_log_buffers()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.detach_daemon_threads(daemon_threads)
+            self.stop_benchmark()
+            self.stop_import_scan()
+            self.stop_watch()
+            self.close_log_buffers()
             event.accept()
 
+    def close_log_buffers(self):
+        """释放所有日志视图的溢出文件"""
+        self.log_view.close_buffer()
+        for log_view in self.queue_logs.values():
+            log_view.close_buffer()
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,4 @@
+"""Build helpers shared by the GUI front-ends (main.py / main_zh.py).
+
+Everything except ``packager.qt`` is Qt-free.
+"""
@@ -0,0 +1,320 @@
+"""Content-addressed cache of build artifacts.
+
+A build is keyed by a hash over everything that determines its output: the
+content of the project sources and included data directories, the Nuitka
+argv (minus options that only affect logging or placement), the interpreter
+version with its installed distributions (which includes Nuitka's own
+version). A hit restores the stored artifacts into the output directory
+instead of compiling. Entries are evicted least-recently-used once the cache
+exceeds its size bound.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+from packager.paths import option_value, option_values, source_files, state_dir, tree_size
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+# Options that do not change what Nuitka produces
+_NEUTRAL_OPTIONS = (
+    "--output-dir=", "--jobs=", "--show-progress", "--show-memory", "--show-scons",
+    "--remove-output", "--report=", "--assume-yes", "--low-memory",
+)
+# Environment variables choosing the C compiler, linker and their flags
+_TOOLCHAIN_VARIABLES = ("CC", "CFLAGS", "CCFLAGS", "CPPFLAGS", "LDFLAGS")
+# Nuitka work directories next to the artifacts
+_BUILD_SUFFIXES = (".build", ".onefile-build")
+
+_PROBE = (
+    "import importlib.metadata as m, json, sys; "
+    "print(json.dumps({'python': sys.version, 'platform': sys.platform, "
+    "'packages': sorted({(d.metadata['Name'] or '').lower(): d.version "
+    "for d in m.distributions()}.items())}))"
+)
+
+# Guards the index within this process; other processes (the GUI, main_cli.py,
+# the build daemon) are kept out with a lock file where fcntl is available
+_index_lock = threading.Lock()
+
+
+class CacheError(Exception):
+    """Raised when a build cannot be keyed (e.g. the interpreter cannot be probed)"""
+
+
+def interpreter_fingerprint(python_path):
+    """Describe the interpreter and its installed distributions as a JSON string"""
+    try:
+        result = subprocess.run(
+            [python_path, "-c", _PROBE],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=60,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise CacheError(f"cannot probe interpreter {python_path}: {e}") from e
+    if result.returncode != 0:
+        raise CacheError(f"cannot probe interpreter {python_path}: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def build_arguments(command):
+    """The Nuitka arguments of an argv that change what it produces"""
+    return [arg for arg in command[1:] if not arg.startswith(_NEUTRAL_OPTIONS)]
+
+
+def toolchain_environment(env=None):
+    """{name: value} of the set variables choosing the C compiler, linker and their flags"""
+    env = os.environ if env is None else env
+    return {name: env[name] for name in _TOOLCHAIN_VARIABLES if env.get(name)}
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SourceHasher:
+    """Hash directory trees by content, reusing digests of files whose stat is unchanged
+
+    ``save`` keeps only the digests of the files hashed since loading, so the
+    memo covers the trees of the last build instead of every project ever
+    built.
+    """
+
+    def __init__(self, memo_path):
+        self.memo_path = memo_path
+        try:
+            with open(memo_path, encoding="utf-8") as f:
+                self.memo = json.load(f)
+        except (OSError, ValueError):
+            self.memo = {}
+        self.used = {}
+        self.files = 0
+        self.rehashed = 0
+
+    def hash_tree(self, root, exclude=()):
+        """Return a digest of all file names and contents below ``root``"""
+        tree = hashlib.sha256()
+        for path in source_files(root, exclude):
+            try:
+                digest = self._digest(path)
+            except OSError:
+                continue
+            tree.update(os.path.relpath(path, root).replace(os.sep, "/").encode())
+            tree.update(digest.encode())
+        return tree.hexdigest()
+
+    def _digest(self, path):
+        stat = os.stat(path)
+        self.files += 1
+        cached = self.memo.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            self.used[path] = cached
+            return cached[2]
+        digest = _file_digest(path)
+        self.used[path] = [stat.st_size, stat.st_mtime_ns, digest]
+        self.rehashed += 1
+        return digest
+
+    def save(self):
+        tmp_path = f"{self.memo_path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.used, f)
+        os.replace(tmp_path, self.memo_path)
+
+
+def build_outputs(output_dir, main_file):
+    """Snapshot artifact candidates for ``main_file`` in ``output_dir`` as {name: mtime_ns}"""
+    stem = os.path.splitext(os.path.basename(main_file))[0]
+    outputs = {}
+    try:
+        entries = list(os.scandir(output_dir))
+    except OSError:
+        return outputs
+    for entry in entries:
+        if entry.name != stem and not entry.name.startswith(stem + "."):
+            continue
+        if entry.name.endswith(_BUILD_SUFFIXES):
+            continue
+        outputs[entry.name] = entry.stat(follow_symlinks=False).st_mtime_ns
+    return outputs
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _copy(src, dst):
+    if os.path.isdir(src):
+        shutil.copytree(src, dst, symlinks=True)
+    else:
+        shutil.copy2(src, dst)
+
+
+class ArtifactCache:
+    """Size-bounded LRU store of build artifacts keyed by build inputs"""
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root or state_dir("artifacts")
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(self.root, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index_path = os.path.join(self.root, "index.json")
+
+    # ----- index -----
+
+    @contextlib.contextmanager
+    def _locked_index(self):
+        """Hold the index against other threads and, where possible, other processes"""
+        with _index_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.index_path + ".lock", "a") as lock_file:
+                # Released when the file closes
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                yield
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault("entries", {})
+        index.setdefault("hits", 0)
+        index.setdefault("misses", 0)
+        return index
+
+    def _save_index(self, index):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def stats(self):
+        """Return (entries, total bytes, hits, misses)"""
+        with self._locked_index():
+            index = self._load_index()
+        total = sum(entry["size"] for entry in index["entries"].values())
+        return len(index["entries"]), total, index["hits"], index["misses"]
+
+    # ----- keys -----
+
+    def key_for(self, command, fingerprint=None, env=None):
+        """Compute the cache key of a build command run with ``env``
+
+        Raises CacheError when the interpreter cannot be probed.
+        """
+        main_file = os.path.abspath(command[-1])
+        project_dir = os.path.dirname(main_file)
+        output_dir = option_value(command, "--output-dir")
+
+        key = hashlib.sha256()
+        key.update(json.dumps(build_arguments(command)).encode())
+        key.update((fingerprint or interpreter_fingerprint(command[0])).encode())
+        toolchain = toolchain_environment(env)
+        if toolchain:
+            key.update(json.dumps(toolchain, sort_keys=True).encode())
+
+        hasher = SourceHasher(os.path.join(self.root, "source-digests.json"))
+        exclude = [self.root] + ([output_dir] if output_dir else [])
+        key.update(hasher.hash_tree(project_dir, exclude).encode())
+
+        # Data directories may live outside the project
+        for spec in option_values(command, "--include-data-dir") + option_values(command, "--include-raw-dir"):
+            source = spec.split("=", 1)[0]
+            if os.path.exists(source) and not os.path.abspath(source).startswith(project_dir + os.sep):
+                key.update(hasher.hash_tree(source, exclude).encode())
+        hasher.save()
+        return key.hexdigest()
+
+    # ----- store / restore -----
+
+    def restore(self, key, output_dir):
+        """Copy the artifacts stored under ``key`` into ``output_dir``
+
+        Returns (artifact names, bytes) on a hit or None on a miss.
+        """
+        with self._locked_index():
+            index = self._load_index()
+            entry = index["entries"].get(key)
+            object_dir = os.path.join(self.objects_dir, key)
+            if entry is None or not os.path.isdir(object_dir):
+                index["entries"].pop(key, None)
+                index["misses"] += 1
+                self._save_index(index)
+                return None
+            entry["last_used"] = time.time()
+            index["hits"] += 1
+            self._save_index(index)
+
+        os.makedirs(output_dir, exist_ok=True)
+        for name in entry["artifacts"]:
+            target = os.path.join(output_dir, name)
+            _remove(target)
+            _copy(os.path.join(object_dir, name), target)
+        return entry["artifacts"], entry["size"]
+
+    def store(self, key, output_dir, names):
+        """Store the named artifacts of ``output_dir`` under ``key``
+
+        Returns (bytes stored, number of evicted entries).
+        """
+        object_dir = os.path.join(self.objects_dir, key)
+        tmp_dir = f"{object_dir}.tmp-{os.getpid()}-{threading.get_ident()}"
+        _remove(tmp_dir)
+        os.makedirs(tmp_dir)
+        for name in names:
+            _copy(os.path.join(output_dir, name), os.path.join(tmp_dir, name))
+        size = tree_size(tmp_dir)
+
+        with self._locked_index():
+            _remove(object_dir)
+            os.replace(tmp_dir, object_dir)
+            index = self._load_index()
+            now = time.time()
+            index["entries"][key] = {"artifacts": sorted(names), "size": size, "created": now, "last_used": now}
+            evicted = self._evict(index, keep=key)
+            self._save_index(index)
+        return size, evicted
+
+    def _evict(self, index, keep=None):
+        """Drop least-recently-used entries until the cache fits its bound"""
+        entries = index["entries"]
+        total = sum(entry["size"] for entry in entries.values())
+        evicted = 0
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries.pop(key)["size"]
+            _remove(os.path.join(self.objects_dir, key))
+            evicted += 1
+        return evicted
+
+    def clear(self):
+        with self._locked_index():
+            _remove(self.objects_dir)
+            os.makedirs(self.objects_dir)
+            self._save_index({"entries": {}, "hits": 0, "misses": 0})
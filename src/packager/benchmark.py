@@ -0,0 +1,321 @@
+"""Measure the startup latency of a built program.
+
+The program is launched a number of times and the wall time until it exits
+(or until it prints a ready marker) and its peak resident set size are
+summarized as min / median / p95. Warm runs follow one discarded warm-up
+run; cold runs first ask the kernel to drop the cached pages of the program
+(and, for the CPython comparison, of the interpreter, its standard library
+and the project sources) with ``posix_fadvise(POSIX_FADV_DONTNEED)``.
+Pages still mapped by running processes stay cached, so cold runs are an
+approximation of a first launch after boot.
+"""
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from packager.paths import option_value
+
+DEFAULT_RUNS = 10
+DEFAULT_TIMEOUT = 60.0
+
+# Launch targets and cache states, in reporting order
+TARGETS = ("compiled", "python")
+CACHE_STATES = ("warm", "cold")
+
+_INTERPRETER_PATHS = "import sys, sysconfig; print(sys.executable); print(sysconfig.get_path('stdlib'))"
+
+
+def cold_cache_supported():
+    return hasattr(os, "posix_fadvise")
+
+
+def find_executable(command):
+    """The program a Nuitka argv produces, or None if it has not been built
+
+    Standalone programs are looked up inside their ``.dist`` folder.
+    """
+    output_dir = option_value(command, "--output-dir") or "."
+    main_file = command[-1]
+    stem = os.path.splitext(os.path.basename(main_file))[0]
+    filename = option_value(command, "--output-filename")
+    names = [filename] if filename else [stem + ".exe", stem + ".bin", stem]
+    folders = [output_dir]
+    if "--standalone" in command and "--onefile" not in command:
+        folders.insert(0, os.path.join(output_dir, stem + ".dist"))
+    for folder in folders:
+        for name in names:
+            path = os.path.join(folder, name)
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+    return None
+
+
+def interpreter_paths(python_path):
+    """The interpreter binary and standard library directory of an interpreter"""
+    try:
+        result = subprocess.run(
+            [python_path, "-c", _INTERPRETER_PATHS],
+            capture_output=True, text=True, timeout=30,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return [python_path]
+    return [line for line in result.stdout.splitlines() if line] or [python_path]
+
+
+def drop_page_cache(paths):
+    """Ask the kernel to evict the cached pages of files and directory trees
+
+    Returns the number of files advised.
+    """
+    count = 0
+    for root in paths:
+        if os.path.isdir(root):
+            files = (os.path.join(dirpath, name) for dirpath, _, names in os.walk(root) for name in names)
+        else:
+            files = [root]
+        for path in files:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                count += 1
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    return count
+
+
+# Launches a program and reports "seconds peak_rss exit_code ready". It runs
+# in a fresh interpreter because wait4() counts the resident set a child had
+# before exec(), so a program forked from the GUI would report at least the
+# GUI's memory; a bare interpreter only adds its own few megabytes.
+_LAUNCHER = r"""
+import os, signal, sys, time
+timeout, marker, argv = float(sys.argv[1]), sys.argv[2].encode(), sys.argv[3:]
+devnull = os.open(os.devnull, os.O_RDWR)
+actions = [(os.POSIX_SPAWN_DUP2, devnull, 0), (os.POSIX_SPAWN_DUP2, devnull, 2)]
+if marker:
+    output, write_end = os.pipe()
+    actions.append((os.POSIX_SPAWN_DUP2, write_end, 1))
+else:
+    actions.append((os.POSIX_SPAWN_DUP2, devnull, 1))
+started = time.perf_counter()
+pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=actions)
+signal.signal(signal.SIGALRM, lambda *args: os.kill(pid, signal.SIGKILL))
+signal.setitimer(signal.ITIMER_REAL, timeout)
+seconds = None
+ready = False
+if marker:
+    os.close(write_end)
+    seen = b""
+    while True:
+        chunk = os.read(output, 65536)
+        if not chunk:
+            break
+        seen = seen[-len(marker):] + chunk
+        if marker in seen:
+            seconds = time.perf_counter() - started
+            ready = True
+            os.kill(pid, signal.SIGKILL)
+            break
+_, status, usage = os.wait4(pid, 0)
+signal.setitimer(signal.ITIMER_REAL, 0)
+if seconds is None:
+    seconds = time.perf_counter() - started
+code = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+print(seconds, usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024), code, int(ready))
+"""
+
+
+def _wait(process):
+    """Wait for a launched program; return (exit code, peak_rss or None)
+
+    Where wait4() is available ``peak_rss`` is the largest resident set of
+    the program and the children it waited for, in bytes.
+    """
+    if not hasattr(os, "wait4"):
+        return process.wait(), None
+    try:
+        _, status, usage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        # Already reaped by Popen
+        return process.wait(), None
+    process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    # ru_maxrss is in kilobytes except on macOS
+    return process.returncode, usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+def time_launch(argv, cwd=None, ready_marker=None, timeout=DEFAULT_TIMEOUT, launcher=None):
+    """Launch a program once and return (seconds, peak_rss, exit code, ready)
+
+    Without a ``ready_marker`` the time runs until the program exits. With
+    one it runs until a line of its output contains the marker, after which
+    the program is killed. Programs still running after ``timeout`` seconds
+    are killed.
+
+    ``peak_rss`` (bytes) comes from wait4() and covers the program and the
+    children it waited for, like the unpacked payload of a onefile program;
+    it is None where wait4() is not available. With a ``launcher`` (a Python
+    interpreter) the program is started and measured by a small helper
+    process, which keeps the memory of the calling process out of the
+    figure; peaks below the helper's own few megabytes then read as that.
+    """
+    if launcher and hasattr(os, "posix_spawn") and hasattr(os, "wait4"):
+        output = subprocess.run(
+            [launcher, "-S", "-c", _LAUNCHER, str(timeout), ready_marker or ""] + list(argv),
+            cwd=cwd, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+        ).stdout.split()
+        if len(output) != 4:
+            raise OSError(f"cannot launch {argv[0]}")
+        seconds, peak_rss, exit_code, ready = output
+        return float(seconds), int(peak_rss), int(exit_code), ready == "1"
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        argv,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if ready_marker else subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+    timer = threading.Timer(timeout, process.kill)
+    timer.start()
+    seconds = None
+    ready = False
+    try:
+        if ready_marker:
+            marker = ready_marker.encode()
+            for line in process.stdout:
+                if marker in line:
+                    seconds = time.perf_counter() - started
+                    ready = True
+                    process.kill()
+                    break
+            process.stdout.close()
+        exit_code, peak_rss = _wait(process)
+    finally:
+        timer.cancel()
+    if seconds is None:
+        seconds = time.perf_counter() - started
+    return seconds, peak_rss, exit_code, ready
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(samples):
+    """Reduce [(seconds, peak_rss)] to min, median, p95 and peak_rss"""
+    if not samples:
+        return {"min": None, "median": None, "p95": None, "peak_rss": None}
+    seconds = [sample[0] for sample in samples]
+    peaks = [sample[1] for sample in samples if sample[1] is not None]
+    return {
+        "min": min(seconds),
+        "median": percentile(seconds, 0.5),
+        "p95": percentile(seconds, 0.95),
+        "peak_rss": max(peaks) if peaks else None,
+    }
+
+
+def benchmark(argv, runs=DEFAULT_RUNS, cache="warm", cold_paths=(), cwd=None, ready_marker=None,
+              timeout=DEFAULT_TIMEOUT, stop=None, launcher=None):
+    """Launch ``argv`` ``runs`` times and summarize the successful launches
+
+    Warm benchmarks start with a discarded warm-up launch; cold ones drop
+    the page cache of ``cold_paths`` before every launch. A launch succeeds
+    when it exits with 0 or, with a ``ready_marker``, prints it. ``stop`` is
+    an optional threading.Event that ends the benchmark early. ``launcher``
+    is passed on to ``time_launch``.
+
+    Returns the summary (see ``summarize``) with runs (successful
+    launches), failures and exit_code (of the last failure, or None).
+    """
+    if cache == "warm":
+        time_launch(argv, cwd, ready_marker, timeout, launcher)
+    samples = []
+    failures = 0
+    exit_code = None
+    for _ in range(runs):
+        if stop is not None and stop.is_set():
+            break
+        if cache == "cold":
+            drop_page_cache(cold_paths)
+        seconds, peak_rss, code, ready = time_launch(argv, cwd, ready_marker, timeout, launcher)
+        if ready or (code == 0 and not ready_marker):
+            samples.append((seconds, peak_rss))
+        else:
+            failures += 1
+            exit_code = code
+    return dict(summarize(samples), runs=len(samples), failures=failures, exit_code=exit_code)
+
+
+def startup_benchmark(command, runs=DEFAULT_RUNS, caches=CACHE_STATES, compare_python=True, arguments=(),
+                      ready_marker=None, timeout=DEFAULT_TIMEOUT, stop=None, on_result=None):
+    """Benchmark the program built by a Nuitka argv against CPython
+
+    The CPython comparison runs the main file with the interpreter of the
+    argv, which also hosts the launch helper; both run in the main file's
+    directory with ``arguments``. Cold
+    variants are left out where the page cache cannot be dropped.
+    ``on_result`` is called with every result as it completes.
+
+    Returns a dict with executable, arguments, ready_marker and results: a
+    list of dicts with target (see TARGETS), cache (see CACHE_STATES) and
+    the figures of ``benchmark``. Raises FileNotFoundError if the program
+    has not been built.
+    """
+    executable = find_executable(command)
+    if executable is None:
+        raise FileNotFoundError(f"no built program for {command[-1]}")
+    main_file = os.path.abspath(command[-1])
+    cwd = os.path.dirname(main_file)
+    executable = os.path.abspath(executable)
+    dist_dir = os.path.dirname(executable)
+    cold_program = [dist_dir] if dist_dir.endswith(".dist") else [executable]
+
+    targets = [("compiled", [executable] + list(arguments), cold_program)]
+    python_path = command[0]
+    launcher = None if python_path.endswith("nuitka.cmd") else python_path
+    if compare_python and launcher:
+        cold_python = interpreter_paths(python_path) + [cwd]
+        targets.append(("python", [python_path, main_file] + list(arguments), cold_python))
+
+    results = []
+    for cache in caches:
+        if cache == "cold" and not cold_cache_supported():
+            continue
+        for target, argv, cold_paths in targets:
+            if stop is not None and stop.is_set():
+                break
+            result = dict(
+                benchmark(argv, runs, cache, cold_paths, cwd, ready_marker, timeout, stop, launcher),
+                target=target, cache=cache,
+            )
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return {
+        "executable": executable,
+        "arguments": list(arguments),
+        "ready_marker": ready_marker,
+        "results": results,
+    }
+
+
+def speedup(results, cache="warm"):
+    """How many times faster the compiled program starts (median), or None"""
+    medians = {result["target"]: result["median"] for result in results if result["cache"] == cache}
+    if medians.get("compiled") and medians.get("python"):
+        return medians["python"] / medians["compiled"]
+    return None
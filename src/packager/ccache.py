@@ -0,0 +1,172 @@
+"""Detect ccache and measure how much it saves per build.
+
+Nuitka wraps the C compiler with ccache when it finds one; unless
+``CCACHE_DIR`` is set, results go to Nuitka's own cache directory.
+"""
+import glob
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import namedtuple
+
+from packager.paths import nuitka_cache_dir
+from packager.progress import SECONDS_PER_C_FILE
+
+CcacheStats = namedtuple("CcacheStats", "hits misses size_bytes files")
+
+# ccache -s output of versions without --print-stats (before 3.7)
+_LEGACY_PATTERNS = {
+    "direct": re.compile(r"^cache hit \(direct\)\s+(\d+)", re.M),
+    "preprocessed": re.compile(r"^cache hit \(preprocessed\)\s+(\d+)", re.M),
+    "misses": re.compile(r"^cache miss\s+(\d+)", re.M),
+    "files": re.compile(r"^files in cache\s+(\d+)", re.M),
+    "size": re.compile(r"^cache size\s+([\d.]+)\s*([kMGT]?i?B)", re.M),
+}
+_UNITS = {"B": 1, "kB": 1000, "MB": 1000 ** 2, "GB": 1000 ** 3, "TB": 1000 ** 4,
+          "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3, "TiB": 1024 ** 4}
+
+
+def _guessed_paths():
+    """Locations Nuitka itself checks, plus the ccache it downloads on Windows"""
+    yield "/usr/local/opt/ccache"
+    yield "/opt/homebrew/bin/ccache"
+    if sys.platform.startswith("win"):
+        yield from sorted(glob.glob(os.path.join(nuitka_cache_dir("downloads"), "ccache", "**", "ccache.exe"),
+                                    recursive=True))
+
+
+def find_ccache():
+    """Return the ccache binary Nuitka would use, or None"""
+    binary = os.environ.get("NUITKA_CCACHE_BINARY") or shutil.which("ccache")
+    if binary:
+        return binary
+    for candidate in _guessed_paths():
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def parse_stats(output):
+    """Parse ``ccache --print-stats`` (or legacy ``ccache -s``) output"""
+    values = {}
+    for line in output.splitlines():
+        key, _, value = line.partition("\t")
+        if value.strip().isdigit():
+            values[key.strip()] = int(value)
+    if values:
+        return CcacheStats(
+            hits=values.get("direct_cache_hit", 0) + values.get("preprocessed_cache_hit", 0),
+            misses=values.get("cache_miss", 0),
+            size_bytes=values.get("cache_size_kibibyte", 0) * 1024,
+            files=values.get("files_in_cache", 0),
+        )
+
+    found = {name: pattern.search(output) for name, pattern in _LEGACY_PATTERNS.items()}
+    if not found["misses"]:
+        return None
+    count = lambda name: int(found[name].group(1)) if found[name] else 0
+    size = found["size"]
+    return CcacheStats(
+        hits=count("direct") + count("preprocessed"),
+        misses=count("misses"),
+        size_bytes=int(float(size.group(1)) * _UNITS.get(size.group(2), 1)) if size else 0,
+        files=count("files"),
+    )
+
+
+def build_savings(before, after, compile_seconds=0.0, jobs=1):
+    """Estimate what ccache saved between two stats snapshots
+
+    Returns a dict with hits, misses, hit_rate (0-1), bytes_saved and
+    seconds_saved. Saved bytes count cached results at the cache's average
+    entry size; saved time prices each hit at the measured cost of a miss
+    (or a default when everything was a hit).
+    """
+    hits = max(after.hits - before.hits, 0)
+    misses = max(after.misses - before.misses, 0)
+    total = hits + misses
+    average_entry = after.size_bytes / after.files if after.files else 0
+    if misses and compile_seconds:
+        seconds_per_file = compile_seconds * jobs / misses
+    else:
+        seconds_per_file = SECONDS_PER_C_FILE
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+        "bytes_saved": int(hits * average_entry),
+        "seconds_saved": hits * seconds_per_file / max(jobs, 1),
+    }
+
+
+class Ccache:
+    """A ccache binary with the cache directory and size limit used for builds
+
+    ``cache_dir`` and ``max_size`` (ccache syntax, e.g. "5G") are optional;
+    without a directory the one Nuitka picks is used.
+    """
+
+    def __init__(self, binary, cache_dir="", max_size=""):
+        self.binary = binary
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def environment(self, base=None):
+        """Return a build environment with CCACHE_DIR/CCACHE_MAXSIZE set"""
+        env = dict(os.environ if base is None else base)
+        env["CCACHE_DIR"] = self.cache_dir or env.get("CCACHE_DIR") or nuitka_cache_dir("ccache", env)
+        if self.max_size:
+            env["CCACHE_MAXSIZE"] = self.max_size
+        return env
+
+    def _run(self, args, env):
+        return subprocess.run(
+            [self.binary] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=30,
+            env=env,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+
+    def version(self):
+        """First line of ``ccache --version``, or None"""
+        try:
+            result = self._run(["--version"], None)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        lines = result.stdout.splitlines()
+        return lines[0].strip() if result.returncode == 0 and lines else None
+
+    def stats(self, env=None):
+        """Current statistics of the cache used with ``env``, or None"""
+        env = self.environment(env)
+        for args in (["--print-stats"], ["-s"]):
+            try:
+                result = self._run(args, env)
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            if result.returncode == 0:
+                stats = parse_stats(result.stdout)
+                if stats:
+                    return stats
+        return None
+
+    def trim(self, max_bytes):
+        """Set the size limit of the cache to ``max_bytes`` and clean it up to
+        that; return whether ccache succeeded"""
+        env = self.environment()
+        # A limit from the environment would override the one set here
+        env.pop("CCACHE_MAXSIZE", None)
+        # The limit is stored in the cache's ccache.conf; 0 would mean unlimited
+        for args in (["-M", f"{max(max_bytes // 1000, 1)}k"], ["-c"]):
+            try:
+                result = self._run(args, env)
+            except (OSError, subprocess.TimeoutExpired):
+                return False
+            if result.returncode != 0:
+                return False
+        return True
@@ -0,0 +1,262 @@
+"""Build the Nuitka command line from a plain configuration dict.
+
+The GUI collects its widget state into such a dict (see
+``NuitkaPackager.collect_config``); profiles are the same dict saved as JSON,
+which lets the headless CLI produce exactly the argv the GUI would.
+"""
+import json
+import logging
+import os
+
+from packager.toolchain import compiler_options
+
+PROFILE_VERSION = 1
+
+# Widget defaults of the GUI; profiles only need to store what differs
+DEFAULT_CONFIG = {
+    # File configuration
+    "python_path": "",
+    "main_file": "",
+    "icon_file": "",
+    "output_dir": "",
+    # Common options
+    "onefile": False,
+    "standalone": True,
+    "disable_console": True,
+    "remove_output": True,
+    "include_qt": False,
+    "show_progress": True,
+    "show_memory": False,
+    # Plugins and Python flags
+    "plugins": [],
+    "python_flags": [],
+    # Advanced options
+    "follow_imports": True,
+    "follow_stdlib": False,
+    "module_mode": False,
+    "lto": False,
+    "low_memory": False,
+    "disable_ccache": False,
+    "assume_yes": False,
+    "windows_uac_admin": False,
+    "windows_uac_uiaccess": False,
+    # C compiler path and -fuse-ld linker name, "" for Nuitka's choice
+    "compiler": "",
+    "linker": "",
+    # Include options (comma separated, as typed in the GUI)
+    "include_package": "",
+    "include_package_data": "",
+    "include_module": "",
+    "nofollow_import": "",
+    "include_data_files": "",
+    "include_data_dir": "",
+    "noinclude_data": "",
+    "include_onefile_ext": "",
+    "include_raw_dir": "",
+    # Onefile options
+    "onefile_tempdir": "",
+    "onefile_grace_time": 5000,
+    "onefile_no_compression": False,
+    "onefile_as_archive": False,
+    "noinclude_dlls": "",
+    # Metadata
+    "company": "",
+    "product": "",
+    "file_version": "",
+    "product_version": "",
+    "file_description": "",
+    "copyright": "",
+    "force_env": "",
+    # Debug options
+    "debug": False,
+    "unstripped": False,
+    "trace_execution": False,
+    "warn_implicit": False,
+    "warn_unusual": False,
+    "deployment": False,
+}
+
+# Checkbox options that map one-to-one onto a Nuitka flag, in command order
+_COMMON_FLAGS = (
+    ("onefile", "--onefile"),
+    ("standalone", "--standalone"),
+    ("disable_console", "--windows-disable-console"),
+    ("remove_output", "--remove-output"),
+    ("include_qt", "--include-qt-plugins=sensible,styles"),
+    ("show_progress", "--show-progress"),
+    ("show_memory", "--show-memory"),
+)
+_ADVANCED_FLAGS = (
+    ("follow_imports", "--follow-imports"),
+    ("follow_stdlib", "--follow-stdlib"),
+    ("module_mode", "--module"),
+    ("lto", "--lto"),
+    ("low_memory", "--low-memory"),
+    ("disable_ccache", "--disable-ccache"),
+    ("assume_yes", "--assume-yes"),
+    ("windows_uac_admin", "--windows-uac-admin"),
+    ("windows_uac_uiaccess", "--windows-uac-uiaccess"),
+)
+_METADATA_OPTIONS = (
+    ("company", "--company-name"),
+    ("product", "--product-name"),
+    ("file_version", "--file-version"),
+    ("product_version", "--product-version"),
+    ("file_description", "--file-description"),
+    ("copyright", "--copyright"),
+)
+_DEBUG_FLAGS = (
+    ("debug", "--debug"),
+    ("unstripped", "--unstripped"),
+    ("trace_execution", "--trace-execution"),
+    ("warn_implicit", "--warn-implicit-exceptions"),
+    ("warn_unusual", "--warn-unusual-code"),
+    ("deployment", "--deployment"),
+)
+
+
+class ProfileError(Exception):
+    """Raised when a profile file cannot be read"""
+
+
+def split_list(value):
+    """Split a comma separated GUI field into stripped, non-empty entries"""
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def resolve_data_dirs(value, main_file):
+    """Resolve ``--include-data-dir`` entries relative to the main file directory
+
+    Returns (source, destination) pairs for the directories that exist.
+    """
+    project_base_dir = os.path.dirname(main_file)
+    resolved = []
+    for dd in split_list(value):
+        # Split source and destination paths
+        if '=' in dd:
+            src_path, dest_path = dd.split('=', 1)
+        else:
+            src_path = dd
+            # Default destination is last part of source path
+            dest_path = os.path.basename(src_path)
+
+        # Resolve relative path based on main file directory
+        if not os.path.isabs(src_path):
+            src_path = os.path.join(project_base_dir, src_path)
+
+        if not os.path.exists(src_path):
+            logging.warning(f"Include data directory not found: {src_path}")
+            continue
+        resolved.append((src_path, dest_path))
+    return resolved
+
+
+def build_command(config):
+    """Return the Nuitka argv for ``config`` (missing keys take their defaults)"""
+    config = dict(DEFAULT_CONFIG, **config)
+    python_path = config["python_path"]
+
+    # Build base command; for uv environments, use nuitka.cmd directly
+    if python_path.endswith("nuitka.cmd"):
+        command = [python_path]
+    else:
+        command = [python_path, "-m", "nuitka"]
+
+    # ===== Common Options =====
+    command += [flag for key, flag in _COMMON_FLAGS if config[key]]
+
+    if config["icon_file"]:
+        command.append(f"--windows-icon-from-ico={config['icon_file']}")
+
+    if config["output_dir"]:
+        command.append(f"--output-dir={config['output_dir']}")
+
+    # ===== Plugin Options =====
+    command += [f"--enable-plugin={plugin}" for plugin in config["plugins"]]
+
+    # ===== Advanced Options =====
+    command += [flag for key, flag in _ADVANCED_FLAGS if config[key]]
+    # The compiler itself is passed in CC, see toolchain_variables
+    command += compiler_options(config["compiler"])
+
+    # ===== Include Options =====
+    command += [f"--include-package={pkg}" for pkg in split_list(config["include_package"])]
+    command += [f"--include-package-data={pd}" for pd in split_list(config["include_package_data"])]
+    command += [f"--include-module={mod}" for mod in split_list(config["include_module"])]
+    command += [f"--nofollow-import-to={mod}" for mod in split_list(config["nofollow_import"])]
+
+    for src_path, dest_path in resolve_data_dirs(config["include_data_dir"], config["main_file"]):
+        command.append(f"--include-data-dir={src_path}={dest_path}")
+        logging.info(f"Added include directory: {src_path} -> {dest_path}")
+
+    command += [f"--noinclude-data-files={ed}" for ed in split_list(config["noinclude_data"])]
+
+    # Onefile external data (only when onefile mode is enabled)
+    if config["onefile"]:
+        command += [f"--include-onefile-external-data={oe}" for oe in split_list(config["include_onefile_ext"])]
+
+    command += [f"--include-raw-dir={rd}" for rd in split_list(config["include_raw_dir"])]
+
+    # ===== Python Flags =====
+    command += list(config["python_flags"])
+
+    # ===== Onefile Options =====
+    if config["onefile"]:
+        if config["onefile_tempdir"]:
+            command.append(f"--onefile-tempdir-spec={config['onefile_tempdir']}")
+
+        if config["onefile_grace_time"] != 5000:
+            command.append(f"--onefile-child-grace-time={config['onefile_grace_time']}")
+
+        if config["onefile_no_compression"]:
+            command.append("--onefile-no-compression")
+
+        if config["onefile_as_archive"]:
+            command.append("--onefile-as-archive")
+
+    # ===== DLL Control =====
+    command += [f"--noinclude-dlls={nd}" for nd in split_list(config["noinclude_dlls"])]
+
+    # ===== Metadata =====
+    command += [f"{option}={config[key]}" for key, option in _METADATA_OPTIONS if config[key]]
+
+    # ===== Environment Control =====
+    if config["force_env"]:
+        command.append(f"--force-runtime-environment-variable={config['force_env']}")
+
+    # ===== Debug Options =====
+    command += [flag for key, flag in _DEBUG_FLAGS if config[key]]
+
+    # Add main file
+    command.append(config["main_file"])
+    return command
+
+
+def load_profile(path):
+    """Load a profile file and return its configuration with defaults applied"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ProfileError(f"{path}: {e}") from e
+    if not isinstance(data, dict) or not isinstance(data.get("config"), dict):
+        raise ProfileError(f"{path}: not a packager profile")
+
+    unknown = set(data["config"]) - set(DEFAULT_CONFIG)
+    if unknown:
+        logging.warning(f"{path}: ignoring unknown profile keys: {', '.join(sorted(unknown))}")
+    config = dict(DEFAULT_CONFIG)
+    config.update((key, value) for key, value in data["config"].items() if key in DEFAULT_CONFIG)
+    return config
+
+
+def save_profile(path, config):
+    """Save ``config`` as a profile file"""
+    data = {"version": PROFILE_VERSION, "config": {key: config[key] for key in DEFAULT_CONFIG}}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def profile_name(path):
+    """Profile name used for per-profile state (file name without extension)"""
+    return os.path.splitext(os.path.basename(path))[0] if path else "default"
@@ -0,0 +1,144 @@
+"""Attribute compile cost to modules from Nuitka's compilation report.
+
+Every build asks Nuitka for an XML report (``--report=``) in a temporary
+file. It lists each included module with its kind, why it was included and
+the time every optimization pass took; the report is read with
+``iterparse`` one module at a time, so large builds never hold the whole
+document in memory. The report does not give the size of the generated C
+code, which is read from the ``module.<name>.c`` files of the build
+directory once C compilation starts (``--remove-output`` deletes them when
+the build ends).
+"""
+import os
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+from packager.paths import option_value
+
+# Phases by which Nuitka has written all C files
+C_PHASES = ("c_compile", "link", "postprocess", "onefile", "done")
+
+# Module kinds Nuitka generates C code for
+COMPILED_KINDS = ("PythonMainModule", "CompiledPythonModule", "CompiledPythonPackage")
+
+
+class ReportError(Exception):
+    """Raised when a compilation report cannot be parsed"""
+
+
+def with_report(command):
+    """Return (argv, report path, owned) asking Nuitka for a compilation report
+
+    A report the command already asks for is used as is; otherwise a
+    temporary file is requested, which the caller owns and removes.
+    """
+    path = option_value(command, "--report")
+    if path:
+        return list(command), path, False
+    fd, path = tempfile.mkstemp(prefix="nuitka-report-", suffix=".xml")
+    os.close(fd)
+    return command[:-1] + [f"--report={path}"] + command[-1:], path, True
+
+
+def build_dir(command, cwd=None):
+    """The directory Nuitka generates C code into for an argv"""
+    output_dir = option_value(command, "--output-dir") or "."
+    stem = os.path.splitext(os.path.basename(command[-1]))[0]
+    return os.path.join(cwd or os.getcwd(), output_dir, stem + ".build")
+
+
+def c_source_sizes(directory):
+    """Return {module name: bytes of generated C} of a build directory"""
+    sizes = {}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return sizes
+    for entry in entries:
+        if entry.name.startswith("module.") and entry.name.endswith(".c"):
+            try:
+                sizes[entry.name[len("module."):-len(".c")]] = entry.stat().st_size
+            except OSError:
+                pass
+    return sizes
+
+
+def _package(name, distribution):
+    """Group modules by the distribution they came from, else their top-level name"""
+    if distribution:
+        return distribution.split(",")[0]
+    return name.partition(".")[0]
+
+
+def parse_report(path, c_sizes=None):
+    """Read a compilation report
+
+    ``c_sizes`` is {module name: bytes} (see ``c_source_sizes``). Returns a
+    dict with nuitka_version, mode, completion, modules (dicts with name,
+    kind, usage, reason, package, size of the generated C code and seconds
+    spent optimizing), packages (dicts with name, modules, compiled, size
+    and seconds, slowest first), totals (modules, compiled, size, seconds)
+    and parse_seconds. Raises OSError and ReportError.
+    """
+    try:
+        return _parse_report(path, c_sizes)
+    except ET.ParseError as e:
+        raise ReportError(f"cannot parse compilation report {path}: {e}") from e
+
+
+def _parse_report(path, c_sizes):
+    started = time.monotonic()
+    c_sizes = c_sizes or {}
+    report = {"nuitka_version": None, "mode": None, "completion": None}
+    modules = []
+    root = None
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+                report["nuitka_version"] = element.get("nuitka_version")
+                report["mode"] = element.get("mode")
+                report["completion"] = element.get("completion")
+            continue
+        if element.tag != "module":
+            continue
+        seconds = 0.0
+        for timing in element.iter("optimization-time"):
+            try:
+                seconds += float(timing.get("time", 0))
+            except ValueError:
+                # "volatile" in diffable reports
+                pass
+        name = element.get("name")
+        modules.append({
+            "name": name,
+            "kind": element.get("kind"),
+            "usage": element.get("usage"),
+            "reason": element.get("reason", ""),
+            "package": _package(name, element.get("distribution")),
+            "size": c_sizes.get(name, 0),
+            "seconds": seconds,
+        })
+        # Processed modules are dropped from the tree
+        root.clear()
+
+    packages = {}
+    for module in modules:
+        package = packages.setdefault(
+            module["package"], {"name": module["package"], "modules": 0, "compiled": 0, "size": 0, "seconds": 0.0}
+        )
+        package["modules"] += 1
+        package["compiled"] += module["kind"] in COMPILED_KINDS
+        package["size"] += module["size"]
+        package["seconds"] += module["seconds"]
+    report["modules"] = sorted(modules, key=lambda module: module["seconds"], reverse=True)
+    report["packages"] = sorted(packages.values(), key=lambda package: package["seconds"], reverse=True)
+    report["totals"] = {
+        "modules": len(modules),
+        "compiled": sum(package["compiled"] for package in packages.values()),
+        "size": sum(module["size"] for module in modules),
+        "seconds": sum(module["seconds"] for module in modules),
+    }
+    report["parse_seconds"] = time.monotonic() - started
+    return report
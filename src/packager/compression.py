@@ -0,0 +1,149 @@
+"""Sweep the onefile payload compression settings and pick a trade-off.
+
+Nuitka compresses the onefile payload with zstandard at level 22, or at
+level 3 under ``--low-memory``; ``--onefile-no-compression`` stores it as
+is and ``--onefile-as-archive`` writes an archive ``nuitka-onefile-unpack``
+can open. Smaller payloads cost decompression time on every launch. The
+sweep builds the program once per setting (see SETTINGS), measures size and
+launch latency of each, and recommends one of the Pareto-optimal settings.
+
+Nuitka offers no other compression levels, so the remaining zstd levels
+are estimated locally: the uncompressed program is compressed at each of
+ZSTD_LEVELS and decompressed in memory, which approximates the payload
+size and the decompression share of the launch time at that level.
+"""
+import os
+import tempfile
+import time
+
+from packager.benchmark import DEFAULT_RUNS, DEFAULT_TIMEOUT, percentile
+from packager.command import build_command
+from packager.variants import measure_build
+
+# Payload settings Nuitka can build, in reporting order, and the
+# configuration each applies on top of the current one
+SETTINGS = ("uncompressed", "zstd-3", "zstd-22", "archive")
+SETTING_CONFIG = {
+    "uncompressed": {"onefile_no_compression": True, "onefile_as_archive": False, "low_memory": False},
+    "zstd-3": {"onefile_no_compression": False, "onefile_as_archive": False, "low_memory": True},
+    "zstd-22": {"onefile_no_compression": False, "onefile_as_archive": False, "low_memory": False},
+    "archive": {"onefile_no_compression": False, "onefile_as_archive": True, "low_memory": False},
+}
+
+# Levels of the local payload estimate
+ZSTD_LEVELS = (1, 3, 9, 15, 19, 22)
+
+
+def sweep_configs(config):
+    """Return {setting: config} building every setting side by side
+
+    Each setting builds a onefile program into its own sub-directory of the
+    configured output directory (or of the main file's directory).
+    """
+    base = config["output_dir"] or os.path.dirname(os.path.abspath(config["main_file"]))
+    return {
+        setting: dict(
+            config, **SETTING_CONFIG[setting], standalone=True, onefile=True,
+            output_dir=os.path.join(base, "compression", setting),
+        )
+        for setting in SETTINGS
+    }
+
+
+def sweep_commands(config):
+    """Return {setting: Nuitka argv} of ``sweep_configs``"""
+    return {setting: build_command(setting_config) for setting, setting_config in sweep_configs(config).items()}
+
+
+class _NullWriter:
+    """Discards what zstandard decompresses"""
+
+    def write(self, data):
+        return len(data)
+
+
+def estimate_levels(program, levels=ZSTD_LEVELS, runs=3, stop=None):
+    """Compress a program at several zstd levels and time its decompression
+
+    Returns a list of dicts with level, size (compressed bytes),
+    compress_seconds and decompress_seconds (median of ``runs``). The
+    compressed data is kept in a temporary file, not in memory.
+    """
+    # Only the sweep needs zstandard, the rest of the packager runs without it
+    import zstandard
+
+    estimates = []
+    for level in levels:
+        if stop is not None and stop.is_set():
+            break
+        with open(program, "rb") as source, tempfile.TemporaryFile() as compressed:
+            started = time.perf_counter()
+            zstandard.ZstdCompressor(level=level).copy_stream(source, compressed)
+            compress_seconds = time.perf_counter() - started
+            size = compressed.tell()
+            timings = []
+            for _ in range(runs):
+                compressed.seek(0)
+                started = time.perf_counter()
+                zstandard.ZstdDecompressor().copy_stream(compressed, _NullWriter())
+                timings.append(time.perf_counter() - started)
+        estimates.append({
+            "level": level,
+            "size": size,
+            "compress_seconds": compress_seconds,
+            "decompress_seconds": percentile(timings, 0.5),
+        })
+    return estimates
+
+
+def pareto_front(points):
+    """The (name, size, seconds) points no other point beats in both"""
+    return [
+        point for point in points
+        if not any(
+            other[1] <= point[1] and other[2] <= point[2] and (other[1], other[2]) != (point[1], point[2])
+            for other in points
+        )
+    ]
+
+
+def recommend(measured):
+    """Return (Pareto-optimal settings, recommended setting) of a sweep
+
+    ``measured`` is {setting: result of ``measure_build``}; latency is the
+    median repeated launch, which every launch of a onefile program pays.
+    Of the Pareto-optimal settings the one with the smallest sum of size and
+    latency, each relative to the best seen, is recommended.
+    """
+    points = [
+        (setting, result["size"], result["repeat_launch"]["median"])
+        for setting, result in measured.items()
+        if result["repeat_launch"] and result["repeat_launch"]["median"] is not None
+    ]
+    if not points:
+        return [], None
+    front = pareto_front(points)
+    smallest = min(point[1] for point in points) or 1
+    fastest = min(point[2] for point in points) or 1
+    best = min(front, key=lambda point: point[1] / smallest + point[2] / fastest)
+    return [point[0] for point in front], best[0]
+
+
+def sweep(commands, runs=DEFAULT_RUNS, arguments=(), ready_marker=None, timeout=DEFAULT_TIMEOUT, stop=None,
+          levels=ZSTD_LEVELS):
+    """Measure the built settings of ``commands`` ({setting: Nuitka argv})
+
+    Returns a dict with settings ({setting: result of ``measure_build``}),
+    pareto (Pareto-optimal settings), recommended (a setting, or None) and
+    levels (see ``estimate_levels``, empty without an uncompressed build).
+    Raises FileNotFoundError if a setting has not been built.
+    """
+    measured = {}
+    for setting in SETTINGS:
+        if setting in commands:
+            measured[setting] = measure_build(commands[setting], runs, arguments, ready_marker, timeout, stop)
+    front, recommended = recommend(measured)
+    estimates = []
+    if "uncompressed" in measured and levels:
+        estimates = estimate_levels(measured["uncompressed"]["executable"], levels, stop=stop)
+    return {"settings": measured, "pareto": front, "recommended": recommended, "levels": estimates}
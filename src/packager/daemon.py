@@ -0,0 +1,593 @@
+"""Run builds in a local daemon that outlives the GUI.
+
+The daemon listens on a Unix domain socket below the packager state
+directory. It owns the Nuitka processes and keeps the output of every job in
+a SpillingLogBuffer, so closing or crashing the GUI no longer ends a build:
+a client attaches to a job, has its log replayed and follows it live, and
+detaches by closing the connection. Several clients can follow one job.
+
+The protocol is JSON lines. Every request is an object with an "op" and
+gets a reply with "ok" (and "error" when false):
+
+  - ``submit``: name, command, options (see ``job_options``) -> job
+  - ``list`` -> jobs
+  - ``attach``: job, start (first log line to replay) -> job, followed by
+    messages until the job has finished: {"type": "lines", "lines"},
+    {"type": "event", "event", "info"}, {"type": "progress", "percent",
+    "phase", "eta"}, {"type": "rate", "rate"}, {"type": "resources",
+    "sample"} and finally {"type": "finished", "status", "return_code"}
+  - ``cancel``: job -> job
+  - ``remove``: job (a finished one) -> nothing
+  - ``shutdown`` -> nothing; refused while builds are running
+
+Jobs are described as dicts with id, name, command, status (see
+``packager.scheduler``), percent, phase, return_code, lines, started_at and
+finished_at. Unix domain sockets (and ``fcntl`` locks) are not available
+everywhere, see ``daemon_supported``.
+"""
+import bisect
+import json
+import os
+import select
+import socket
+import socketserver
+import subprocess
+import threading
+import time
+
+from packager.artifact_cache import ArtifactCache
+from packager.ccache import Ccache
+from packager.history import BuildHistory
+from packager.logstore import SpillingLogBuffer
+from packager.memory import MemoryGovernor
+from packager.nuitka_cache import NuitkaCache
+from packager.paths import state_dir
+from packager.runner import BuildRunner
+from packager.scheduler import CANCELLED, FAILED, FINISHED_STATES, RUNNING, SUCCEEDED
+from packager.warm_build import WarmBuildDirs
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Finished jobs kept for clients to replay, newest first
+MAX_FINISHED_JOBS = 20
+# Log lines per replayed message
+REPLAY_CHUNK = 2000
+# Seconds between checks whether an attached client has gone
+ATTACH_POLL = 1.0
+# Seconds to wait for a connection or a reply
+CONNECT_TIMEOUT = 5.0
+# Seconds to wait for a started daemon to listen
+START_TIMEOUT = 15.0
+# Minutes without builds or clients after which the daemon exits
+IDLE_MINUTES = 30
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or refuses a request"""
+
+
+def daemon_supported():
+    """Whether this platform can run the build daemon"""
+    return hasattr(socket, "AF_UNIX") and hasattr(socketserver, "ThreadingUnixStreamServer") and fcntl is not None
+
+
+def socket_path():
+    """The socket the daemon listens on, in a directory only its user can enter"""
+    directory = state_dir("daemon")
+    os.chmod(directory, 0o700)
+    return os.path.join(directory, "daemon.sock")
+
+
+def job_options(env=None, cwd=None, artifact_cache=None, ccache=None, nuitka_cache=None, history=False,
+                governor=None, warm_dirs=None):
+    """Options of a submitted job, from what would be passed to BuildRunner
+
+    ``governor`` is a MemoryGovernor, ``warm_dirs`` WarmBuildDirs, the
+    caches the objects used by the GUI; the daemon creates its own (see
+    ``runner_options``).
+    """
+    return {
+        "env": env,
+        "cwd": cwd,
+        "artifact_cache": None if artifact_cache is None else {
+            "root": artifact_cache.root, "max_bytes": artifact_cache.max_bytes,
+        },
+        "ccache": None if ccache is None else {
+            "binary": ccache.binary, "cache_dir": ccache.cache_dir, "max_size": ccache.max_size,
+        },
+        "nuitka_cache": None if nuitka_cache is None else {
+            "root": nuitka_cache.root, "quota_bytes": nuitka_cache.quota_bytes,
+        },
+        "history": bool(history),
+        "governor": None if governor is None else {
+            "reserve": governor.reserve, "pause_below": governor.pause_below,
+            "low_memory": governor.low_memory, "pause": governor.pause,
+        },
+        "warm_dirs": None if warm_dirs is None else {"root": warm_dirs.root, "clean": warm_dirs.clean},
+    }
+
+
+def runner_options(options, history=None):
+    """BuildRunner keyword arguments of ``job_options``; ``history`` is the daemon's BuildHistory"""
+    artifact_cache = options.get("artifact_cache")
+    ccache = options.get("ccache")
+    nuitka_cache = options.get("nuitka_cache")
+    governor = options.get("governor")
+    warm_dirs = options.get("warm_dirs")
+    return {
+        "env": options.get("env"),
+        "cwd": options.get("cwd"),
+        "artifact_cache": ArtifactCache(**artifact_cache) if artifact_cache else None,
+        "ccache": Ccache(**ccache) if ccache else None,
+        "nuitka_cache": NuitkaCache(**nuitka_cache) if nuitka_cache else None,
+        "history": history if options.get("history") else None,
+        "governor": MemoryGovernor(**governor) if governor else None,
+        "warm_dirs": WarmBuildDirs(**warm_dirs) if warm_dirs else None,
+    }
+
+
+class DaemonJob:
+    """A build run by the daemon, with its log and live state
+
+    ``changed`` guards all attributes and is notified whenever they change.
+    Events are kept with the number of log lines before them, so a replay
+    interleaves them with the output as it happened.
+    """
+
+    def __init__(self, job_id, name, command, options):
+        self.id = job_id
+        self.name = name
+        self.command = list(command)
+        self.options = options
+        self.status = RUNNING
+        self.return_code = None
+        self.percent = 0
+        self.phase = ""
+        self.eta = None
+        self.rate = None
+        self.resources = None
+        self.log = SpillingLogBuffer()
+        self.events = []
+        self.changed = threading.Condition()
+        self.runner = None
+        self.cancel_requested = False
+        self.attached = 0
+        self.started_at = time.time()
+        self.finished_at = None
+
+    def describe(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "command": self.command,
+            "status": self.status,
+            "percent": self.percent,
+            "phase": self.phase,
+            "return_code": self.return_code,
+            "lines": len(self.log),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    # Only defined where Unix domain sockets are
+    class _Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        daemon = self.server.build_daemon
+        for raw in self.rfile:
+            try:
+                request = json.loads(raw)
+                op = request["op"]
+            except (ValueError, KeyError, TypeError):
+                self.send({"ok": False, "error": "malformed request"})
+                continue
+            if op == "attach":
+                daemon.stream(request, self)
+                return
+            try:
+                reply = daemon.handle(op, request)
+            except DaemonError as e:
+                reply = {"ok": False, "error": str(e)}
+            self.send(reply)
+
+    def send(self, *messages):
+        self.wfile.write(b"".join(json.dumps(message, default=str).encode() + b"\n" for message in messages))
+        self.wfile.flush()
+
+
+class BuildDaemon:
+    """Run submitted builds and serve their logs over a Unix domain socket
+
+    Builds start as soon as they are submitted; clients schedule them (see
+    ``packager.scheduler``). With an ``idle_minutes`` the daemon exits once
+    no build has run and no client has been attached for that long.
+    """
+
+    def __init__(self, path=None, idle_minutes=IDLE_MINUTES, history=None):
+        self.path = path or socket_path()
+        self.idle_minutes = idle_minutes
+        self.history = history
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.server = None
+        self.last_active = time.monotonic()
+        self._next_id = 1
+
+    def serve(self):
+        """Serve requests until shut down
+
+        Raises DaemonError if another daemon is running or the socket
+        cannot be created.
+        """
+        lock_file = open(self.path + ".lock", "w")
+        try:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                raise DaemonError(f"a build daemon is already running on {self.path}")
+            # Left over by a daemon that did not exit cleanly
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            # The daemon runs whatever a client sends, so no other user may
+            # connect, not even before the socket's mode could be changed
+            umask = os.umask(0o077)
+            try:
+                self.server = _Server(self.path, _Handler)
+            except OSError as e:
+                raise DaemonError(f"cannot listen on {self.path}: {e}")
+            finally:
+                os.umask(umask)
+            self.server.build_daemon = self
+            if self.idle_minutes:
+                threading.Thread(target=self._exit_when_idle, daemon=True).start()
+            try:
+                self.server.serve_forever(poll_interval=0.5)
+            finally:
+                self.server.server_close()
+                self.stop_all()
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+        finally:
+            lock_file.close()
+
+    def _exit_when_idle(self):
+        while True:
+            time.sleep(min(60.0, self.idle_minutes * 60 / 4))
+            with self.lock:
+                busy = any(job.status == RUNNING or job.attached for job in self.jobs.values())
+                if busy:
+                    self.last_active = time.monotonic()
+                elif time.monotonic() - self.last_active > self.idle_minutes * 60:
+                    break
+        self.server.shutdown()
+
+    def stop_all(self):
+        """Terminate all running builds"""
+        with self.lock:
+            jobs = [job for job in self.jobs.values() if job.status == RUNNING]
+        for job in jobs:
+            self.cancel(job.id)
+
+    # ----- requests -----
+
+    def handle(self, op, request):
+        """Return the reply to a request other than attach"""
+        with self.lock:
+            self.last_active = time.monotonic()
+        if op == "submit":
+            command = request.get("command")
+            if not command or not isinstance(command, list):
+                raise DaemonError("submit needs a command")
+            job = self.submit(request.get("name") or os.path.basename(command[-1]), command, request.get("options") or {})
+            return {"ok": True, "job": job.describe()}
+        if op == "list":
+            with self.lock:
+                jobs = sorted(self.jobs.values(), key=lambda job: job.id)
+            return {"ok": True, "jobs": [job.describe() for job in jobs]}
+        if op == "cancel":
+            return {"ok": True, "job": self.cancel(self._job(request).id).describe()}
+        if op == "remove":
+            job = self._job(request)
+            if job.status not in FINISHED_STATES:
+                raise DaemonError(f"job {job.id} is still running")
+            with self.lock:
+                self.jobs.pop(job.id, None)
+            job.log.close()
+            return {"ok": True}
+        if op == "shutdown":
+            with self.lock:
+                running = [job for job in self.jobs.values() if job.status == RUNNING]
+            if running:
+                raise DaemonError(f"{len(running)} builds are running")
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {"ok": True}
+        raise DaemonError(f"unknown request {op!r}")
+
+    def _job(self, request):
+        with self.lock:
+            job = self.jobs.get(request.get("job"))
+        if job is None:
+            raise DaemonError(f"no job {request.get('job')}")
+        return job
+
+    def submit(self, name, command, options):
+        """Start a build and return its DaemonJob"""
+        with self.lock:
+            job = DaemonJob(self._next_id, name, command, options)
+            self._next_id += 1
+            self.jobs[job.id] = job
+        if options.get("history") and self.history is None:
+            self.history = BuildHistory()
+        job.runner = BuildRunner(
+            job.command,
+            on_lines=lambda lines: self._update(job, lines=lines),
+            on_rate=lambda rate: self._update(job, rate=rate),
+            on_progress=lambda percent, phase, eta: self._update(job, percent=percent, phase=phase, eta=eta),
+            on_event=lambda event, info: self._update(job, event=(event, info)),
+            on_resources=lambda sample: self._update(job, resources=sample),
+            **runner_options(options, self.history),
+        )
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+        return job
+
+    def _update(self, job, lines=None, event=None, **state):
+        if lines and any("\n" in line for line in lines):
+            # One log line per output line, as LogView stores them
+            lines = "\n".join(lines).split("\n")
+        with job.changed:
+            if lines:
+                job.log.append_lines(lines)
+            if event:
+                job.events.append((len(job.log),) + event)
+            for key, value in state.items():
+                setattr(job, key, value)
+            job.changed.notify_all()
+
+    def _run(self, job):
+        try:
+            return_code = job.runner.run()
+        except Exception as e:
+            self._update(job, lines=[f"Cannot run the build: {e}"])
+            return_code = None
+        with job.changed:
+            job.return_code = return_code
+            if job.cancel_requested:
+                job.status = CANCELLED
+            else:
+                job.status = SUCCEEDED if return_code == 0 else FAILED
+            job.finished_at = time.time()
+            job.log.flush()
+            job.changed.notify_all()
+        with self.lock:
+            self.last_active = time.monotonic()
+            finished = sorted(
+                (other for other in self.jobs.values() if other.status in FINISHED_STATES),
+                key=lambda other: other.finished_at, reverse=True,
+            )
+            evicted = [other for other in finished[MAX_FINISHED_JOBS:] if not other.attached]
+            for other in evicted:
+                del self.jobs[other.id]
+        for other in evicted:
+            other.log.close()
+
+    def cancel(self, job_id):
+        """Stop a running build; returns its DaemonJob"""
+        job = self._job({"job": job_id})
+        with job.changed:
+            if job.status != RUNNING:
+                return job
+            job.cancel_requested = True
+        try:
+            job.runner.stop()
+        except OSError as e:
+            self._update(job, lines=[f"Cannot stop the build: {e}"])
+        return job
+
+    # ----- attached clients -----
+
+    def stream(self, request, handler):
+        """Replay and follow a job for an attached client until it finishes or the client goes"""
+        try:
+            job = self._job(request)
+        except DaemonError as e:
+            handler.send({"ok": False, "error": str(e)})
+            return
+        with job.changed:
+            job.attached += 1
+            start = max(0, min(int(request.get("start") or 0), len(job.log)))
+            cursor = {"lines": start, "events": bisect.bisect_left([event[0] for event in job.events], start),
+                      "progress": None, "rate": None, "resources": None}
+            describe = job.describe()
+        try:
+            handler.send({"ok": True, "job": describe})
+            while True:
+                with job.changed:
+                    messages, done = self._pending(job, cursor)
+                    while not messages:
+                        job.changed.wait(ATTACH_POLL)
+                        if self._client_gone(handler.connection):
+                            return
+                        messages, done = self._pending(job, cursor)
+                handler.send(*messages)
+                if done:
+                    return
+        except OSError:
+            # The client went away while being written to
+            pass
+        finally:
+            with job.changed:
+                job.attached -= 1
+            with self.lock:
+                self.last_active = time.monotonic()
+
+    def _pending(self, job, cursor):
+        """Return (messages a client has not seen yet, whether the job is over); call with job.changed held"""
+        messages = []
+        end = len(job.log)
+        if cursor["events"] < len(job.events):
+            end = min(end, job.events[cursor["events"]][0])
+        end = min(end, cursor["lines"] + REPLAY_CHUNK)
+        if cursor["lines"] < end:
+            messages.append({"type": "lines", "lines": [job.log.line(n) for n in range(cursor["lines"], end)]})
+            cursor["lines"] = end
+        while cursor["events"] < len(job.events) and job.events[cursor["events"]][0] <= cursor["lines"]:
+            _, event, info = job.events[cursor["events"]]
+            messages.append({"type": "event", "event": event, "info": info})
+            cursor["events"] += 1
+        progress = (job.percent, job.phase, job.eta)
+        if progress != cursor["progress"]:
+            cursor["progress"] = progress
+            messages.append({"type": "progress", "percent": job.percent, "phase": job.phase, "eta": job.eta})
+        for key, field in (("rate", "rate"), ("resources", "sample")):
+            value = getattr(job, key)
+            if value is not None and value != cursor[key]:
+                cursor[key] = value
+                messages.append({"type": key, field: value})
+        done = (
+            job.status in FINISHED_STATES and cursor["lines"] == len(job.log) and cursor["events"] == len(job.events)
+        )
+        if done:
+            messages.append({"type": "finished", "status": job.status, "return_code": job.return_code})
+        return messages, done
+
+    @staticmethod
+    def _client_gone(connection):
+        # Attached clients send nothing, so anything readable is their end of the stream
+        readable, _, _ = select.select([connection], [], [], 0)
+        return bool(readable)
+
+
+class Attachment:
+    """The messages of an attached job; ``close`` detaches, the build keeps running"""
+
+    def __init__(self, sock, reader, job):
+        self.job = job
+        self._sock = sock
+        self._reader = reader
+
+    def __iter__(self):
+        try:
+            for raw in self._reader:
+                yield json.loads(raw)
+        except (OSError, ValueError):
+            return
+        finally:
+            self._reader.close()
+            self._sock.close()
+
+    def close(self):
+        """Detach; safe to call from another thread while iterating"""
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class DaemonClient:
+    """Talk to the build daemon; every request uses its own connection"""
+
+    def __init__(self, path=None, timeout=CONNECT_TIMEOUT):
+        self.path = path or socket_path()
+        self.timeout = timeout
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            raise DaemonError(f"cannot reach the build daemon at {self.path}: {e}")
+        return sock
+
+    def _exchange(self, sock, request):
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            reader = sock.makefile("rb")
+            raw = reader.readline()
+        except OSError as e:
+            raise DaemonError(f"lost the connection to the build daemon: {e}")
+        if not raw:
+            raise DaemonError("the build daemon closed the connection")
+        reply = json.loads(raw)
+        if not reply.get("ok"):
+            raise DaemonError(reply.get("error") or "request failed")
+        return reply, reader
+
+    def request(self, op, **fields):
+        """Send one request and return its reply; raises DaemonError"""
+        sock = self._connect()
+        try:
+            reply, reader = self._exchange(sock, dict(fields, op=op))
+            reader.close()
+            return reply
+        finally:
+            sock.close()
+
+    def running(self):
+        """Whether a daemon is listening"""
+        try:
+            self._connect().close()
+        except DaemonError:
+            return False
+        return True
+
+    def submit(self, name, command, options=None):
+        return self.request("submit", name=name, command=list(command), options=options or {})["job"]
+
+    def jobs(self):
+        return self.request("list")["jobs"]
+
+    def cancel(self, job_id):
+        return self.request("cancel", job=job_id)["job"]
+
+    def remove(self, job_id):
+        self.request("remove", job=job_id)
+
+    def shutdown(self):
+        self.request("shutdown")
+
+    def attach(self, job_id, start=0):
+        """Return an Attachment replaying the log of a job from line ``start``"""
+        sock = self._connect()
+        try:
+            reply, reader = self._exchange(sock, {"op": "attach", "job": job_id, "start": start})
+        except DaemonError:
+            sock.close()
+            raise
+        # Builds can be quiet for long stretches
+        sock.settimeout(None)
+        return Attachment(sock, reader, reply["job"])
+
+
+def start_daemon(argv, path=None, timeout=START_TIMEOUT):
+    """Return a DaemonClient, starting the daemon with ``argv`` unless one is listening
+
+    The daemon runs in its own session so it survives its starter, with its
+    output appended to ``daemon.log`` next to the socket. Raises DaemonError
+    if it does not listen within ``timeout`` seconds.
+    """
+    client = DaemonClient(path)
+    if client.running():
+        return client
+    log_path = os.path.join(os.path.dirname(client.path), "daemon.log")
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            argv, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, start_new_session=True,
+        )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.running():
+            return client
+        time.sleep(0.1)
+    raise DaemonError(f"the build daemon did not start, see {log_path}")
@@ -0,0 +1,269 @@
+"""Attribute the size of standalone ``.dist`` folders to packages and libraries.
+
+A standalone build copies extension modules, shared libraries and package
+data next to the program, and the folder easily grows to hundreds of
+megabytes without saying why. The analyzer scans ``<output_dir>/*.dist``
+with a thread pool (one task per top-level directory, which is where the
+packages are), attributes every file to the Python package or shared
+library it came from, and suggests ``--noinclude-dlls``,
+``--noinclude-data-files`` and ``--nofollow-import-to`` values for the
+largest contributors.
+"""
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from packager.paths import option_values
+
+# Kinds of contributors
+PACKAGE = "package"
+LIBRARY = "library"
+PROGRAM = "program"
+STDLIB = "stdlib"
+OTHER = "other"
+
+# Configuration fields the suggestions fill and the option each becomes
+SUGGESTION_OPTIONS = {
+    "noinclude_dlls": "--noinclude-dlls",
+    "noinclude_data": "--noinclude-data-files",
+    "nofollow_import": "--nofollow-import-to",
+}
+
+# Extension modules: "x.pyd", "x.cpython-311-x86_64-linux-gnu.so", "x.abi3.so"
+_TAGGED_EXTENSION_RE = re.compile(r"\.(?:cpython-\d+\w*|cp\d+\w*|abi3|pypy\d*\w*)(?:-[\w-]+)?\.(?:so|pyd)$")
+_EXTENSION_RE = re.compile(_TAGGED_EXTENSION_RE.pattern + r"|\.pyd$", re.IGNORECASE)
+_SHARED_LIBRARY_RE = re.compile(r"\.(?:so(?:\.\d+)*|dll|dylib)$", re.IGNORECASE)
+# The interpreter itself, which no suggestion may remove
+_RUNTIME_RE = re.compile(r"^(?:lib)?python\d", re.IGNORECASE)
+_TEST_DIRS = {"tests", "test", "testing"}
+
+MIN_SUGGESTION_BYTES = 1024 ** 2
+# Per suggestion kind
+MAX_SUGGESTIONS = 5
+
+
+def find_dists(output_dir):
+    """The ``*.dist`` folders in an output directory, sorted by name"""
+    try:
+        entries = list(os.scandir(output_dir))
+    except OSError:
+        return []
+    return sorted(entry.path for entry in entries if entry.name.endswith(".dist") and entry.is_dir())
+
+
+def _scan_tree(root, prefix):
+    """Return [(relative path, size)] of the files below ``root``
+
+    Symbolic links (versioned library aliases) are skipped so no file is
+    counted twice.
+    """
+    files = []
+    pending = [(root, prefix)]
+    while pending:
+        path, relative = pending.pop()
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in entries:
+            name = relative + "/" + entry.name
+            try:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    pending.append((entry.path, name))
+                else:
+                    files.append((name, entry.stat(follow_symlinks=False).st_size))
+            except OSError:
+                # Removed while scanning
+                pass
+    return files
+
+
+def scan_dists(dist_dirs, workers=None):
+    """Return {dist folder: [(relative path, size)]} for several folders
+
+    Relative paths use "/" on every platform. The folders share one pool.
+    """
+    results = {}
+    tasks = []
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for dist_dir in dist_dirs:
+            files = results.setdefault(dist_dir, [])
+            try:
+                entries = list(os.scandir(dist_dir))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    tasks.append((dist_dir, pool.submit(_scan_tree, entry.path, entry.name)))
+                else:
+                    files.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+        for dist_dir, task in tasks:
+            results[dist_dir].extend(task.result())
+    return results
+
+
+def classify(path):
+    """Return (contributor, kind, file kind) of a file of a dist folder
+
+    File kinds are "extension", "library" and "data".
+    """
+    parts = path.split("/")
+    name = parts[-1]
+    if _EXTENSION_RE.search(name):
+        file_kind = "extension"
+    elif _SHARED_LIBRARY_RE.search(name):
+        file_kind = "library"
+    else:
+        file_kind = "data"
+    if len(parts) > 1:
+        # Vendored libraries of wheels live next to the package ("numpy.libs")
+        owner = parts[0][:-len(".libs")] if parts[0].endswith(".libs") else parts[0]
+        return owner, PACKAGE, file_kind
+    lower = name.lower()
+    if _TAGGED_EXTENSION_RE.search(name):
+        return name.split(".")[0], PACKAGE, "extension"
+    if lower.endswith(".pyd") or (lower.endswith(".so") and not lower.startswith("lib")):
+        # Standard library extension modules ("_ssl.so", "_ctypes.pyd")
+        return STDLIB, STDLIB, "extension"
+    if file_kind == "library":
+        return name, LIBRARY, file_kind
+    if "." not in name or lower.endswith((".exe", ".bin")):
+        return name, PROGRAM, file_kind
+    return OTHER, OTHER, file_kind
+
+
+def analyze(dist_dir, files, command=None):
+    """Break a scanned dist folder down by contributor
+
+    Returns a dict with root, files, size, contributors (dicts with name,
+    kind, files, size, extensions, libraries and data, largest first),
+    libraries (dicts with name, path, owner and size, largest first) and
+    suggestions (see ``suggest``).
+    """
+    contributors = {}
+    libraries = []
+    for path, size in files:
+        owner, kind, file_kind = classify(path)
+        entry = contributors.get(owner)
+        if entry is None:
+            entry = contributors[owner] = {
+                "name": owner, "kind": kind, "files": 0, "size": 0, "extensions": 0, "libraries": 0, "data": 0,
+            }
+        entry["files"] += 1
+        entry["size"] += size
+        entry[{"extension": "extensions", "library": "libraries", "data": "data"}[file_kind]] += size
+        if file_kind == "library":
+            libraries.append({"name": path.rsplit("/", 1)[-1], "path": path, "owner": owner, "size": size})
+
+    report = {
+        "root": dist_dir,
+        "files": len(files),
+        "size": sum(size for _, size in files),
+        "contributors": sorted(contributors.values(), key=lambda entry: entry["size"], reverse=True),
+        "libraries": sorted(libraries, key=lambda entry: entry["size"], reverse=True),
+    }
+    report["suggestions"] = suggest(report, files, command)
+    return report
+
+
+def analyze_output_dir(output_dir, command=None):
+    """Scan and analyze every dist folder of an output directory
+
+    Returns a list of reports (see ``analyze``) with the scan time in
+    ``seconds``.
+    """
+    started = time.monotonic()
+    scanned = scan_dists(find_dists(output_dir))
+    reports = [analyze(dist_dir, files, command) for dist_dir, files in scanned.items()]
+    seconds = time.monotonic() - started
+    for report in reports:
+        report["seconds"] = seconds
+    return reports
+
+
+def _library_pattern(path):
+    """``--noinclude-dlls`` pattern matching a library under any version suffix"""
+    return re.sub(r"\.so(?:\.\d+)*$", ".so*", path)
+
+
+def suggest(report, files, command=None):
+    """Suggest options that would shrink the dist folder
+
+    Returns dicts with field (a key of SUGGESTION_OPTIONS and of the GUI
+    configuration), value, size (bytes it would save at most), reason
+    ("tests", "library", "data" or "package") and subject, largest first.
+    Values already present in ``command`` are left out. Every suggestion
+    removes code or data the program may need; they are candidates to try,
+    not safe defaults.
+    """
+    threshold = max(MIN_SUGGESTION_BYTES, report["size"] // 100)
+    existing = {
+        field: set(option_values(command or [], option)) for field, option in SUGGESTION_OPTIONS.items()
+    }
+    suggestions = []
+
+    def add(field, value, size, reason, subject):
+        if value not in existing[field]:
+            suggestions.append({"field": field, "value": value, "size": size, "reason": reason, "subject": subject})
+
+    # Test suites shipped inside packages: extension modules need the
+    # import not to be followed, plain data can be left out
+    tests = {}
+    data_dirs = {}
+    for path, size in files:
+        parts = path.split("/")
+        for index, part in enumerate(parts[:-1]):
+            if part in _TEST_DIRS:
+                prefix = tuple(parts[:index + 1])
+                entry = tests.setdefault(prefix, [0, False])
+                entry[0] += size
+                entry[1] = entry[1] or bool(_EXTENSION_RE.search(parts[-1]))
+                break
+        else:
+            if len(parts) > 2 and classify(path)[2] == "data":
+                for depth in range(2, len(parts)):
+                    data_dirs[tuple(parts[:depth])] = data_dirs.get(tuple(parts[:depth]), 0) + size
+    for prefix, (size, has_extensions) in sorted(tests.items(), key=lambda item: item[1][0], reverse=True):
+        if size < MIN_SUGGESTION_BYTES:
+            break
+        if has_extensions and all(part.isidentifier() for part in prefix):
+            add("nofollow_import", ".".join(prefix), size, "tests", "/".join(prefix))
+        else:
+            add("noinclude_data", "/".join(prefix) + "/*", size, "tests", "/".join(prefix))
+
+    for library in report["libraries"][:MAX_SUGGESTIONS]:
+        if library["size"] < threshold:
+            break
+        if not _RUNTIME_RE.match(library["name"]):
+            add("noinclude_dlls", _library_pattern(library["path"]), library["size"], "library", library["name"])
+
+    # Package data by directory below the package, narrowed down to the
+    # sub-directory holding nearly all of it
+    largest = sorted(
+        ((prefix, size) for prefix, size in data_dirs.items() if len(prefix) == 2),
+        key=lambda item: item[1], reverse=True,
+    )
+    for prefix, size in largest[:MAX_SUGGESTIONS]:
+        if size < threshold:
+            break
+        while True:
+            children = [(child, child_size) for child, child_size in data_dirs.items()
+                        if len(child) == len(prefix) + 1 and child[:-1] == prefix]
+            child, child_size = max(children, key=lambda item: item[1], default=(None, 0))
+            if child_size < size * 0.9:
+                break
+            prefix, size = child, child_size
+        add("noinclude_data", "/".join(prefix) + "/*", size, "data", "/".join(prefix))
+
+    packages = [entry for entry in report["contributors"] if entry["kind"] == PACKAGE and entry["name"].isidentifier()]
+    for entry in packages[:MAX_SUGGESTIONS]:
+        if entry["size"] < max(threshold, report["size"] // 20):
+            break
+        add("nofollow_import", entry["name"], entry["size"], "package", entry["name"])
+
+    return sorted(suggestions, key=lambda suggestion: suggestion["size"], reverse=True)
@@ -0,0 +1,287 @@
+"""Persistent build history in a local SQLite database.
+
+Every build records its argv, interpreter, exit code, duration, peak
+memory, artifact size and the time spent in each phase, so slow builds can
+be compared with earlier ones. The memory of its largest compiler process
+is kept to size the parallelism of the next build, and startup benchmarks
+of the built program are stored with the build they measured. Listing
+queries are paged so a browser can fetch rows as they are scrolled into
+view.
+"""
+import json
+import os
+import sqlite3
+import time
+
+from packager.paths import option_value, state_dir, uses_lto
+
+SCHEMA_VERSION = 4
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    project TEXT NOT NULL,
+    interpreter TEXT NOT NULL,
+    argv TEXT NOT NULL,
+    exit_code INTEGER,
+    duration REAL NOT NULL,
+    artifact_size INTEGER,
+    cache_hit INTEGER NOT NULL DEFAULT 0,
+    peak_rss INTEGER,
+    compiler_rss INTEGER
+);
+CREATE INDEX IF NOT EXISTS builds_by_project ON builds (project, started_at);
+CREATE INDEX IF NOT EXISTS builds_by_time ON builds (started_at);
+CREATE TABLE IF NOT EXISTS phases (
+    build_id INTEGER NOT NULL REFERENCES builds (id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (build_id, phase)
+);
+CREATE TABLE IF NOT EXISTS benchmarks (
+    id INTEGER PRIMARY KEY,
+    build_id INTEGER NOT NULL REFERENCES builds (id) ON DELETE CASCADE,
+    measured_at REAL NOT NULL,
+    target TEXT NOT NULL,
+    cache TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    min REAL,
+    median REAL,
+    p95 REAL,
+    peak_rss INTEGER
+);
+CREATE INDEX IF NOT EXISTS benchmarks_by_build ON benchmarks (build_id);
+"""
+# Scripts upgrading a database from the previous schema version
+_MIGRATIONS = {
+    2: """
+ALTER TABLE builds ADD COLUMN peak_rss INTEGER;
+CREATE INDEX IF NOT EXISTS builds_by_time ON builds (started_at);
+""",
+    3: "ALTER TABLE builds ADD COLUMN compiler_rss INTEGER;",
+    4: _SCHEMA,
+}
+# Columns returned by BuildHistory.rows
+ROW_COLUMNS = (
+    "id", "started_at", "project", "duration", "peak_rss", "startup", "artifact_size", "exit_code", "cache_hit",
+    "argv",
+)
+# Computed columns: median warm startup of the last benchmark of the build
+_ROW_EXPRESSIONS = {
+    "startup": "(SELECT median FROM benchmarks WHERE build_id = builds.id AND target = 'compiled'"
+               " AND cache = 'warm' ORDER BY measured_at DESC LIMIT 1)",
+}
+# Figures stored per benchmark result
+BENCHMARK_COLUMNS = ("target", "cache", "runs", "failures", "min", "median", "p95", "peak_rss")
+
+
+class BuildHistory:
+    """Build records stored in ``history.sqlite3`` below the packager state directory
+
+    A connection is opened per call, so one instance can be shared by
+    builds running on different threads.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(state_dir(), "history.sqlite3")
+        db = self._connect()
+        try:
+            version = db.execute("PRAGMA user_version").fetchone()[0]
+            if version == 0:
+                db.executescript(_SCHEMA)
+            else:
+                for target in range(version + 1, SCHEMA_VERSION + 1):
+                    db.executescript(_MIGRATIONS[target])
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            db.commit()
+        finally:
+            db.close()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA foreign_keys = ON")
+        return db
+
+    def record(self, command, exit_code, duration, phase_times, artifact_size=None, cache_hit=False,
+               started_at=None, peak_rss=None, compiler_rss=None):
+        """Store one build and return its id"""
+        db = self._connect()
+        try:
+            with db:
+                cursor = db.execute(
+                    "INSERT INTO builds (started_at, project, interpreter, argv, exit_code, duration,"
+                    " artifact_size, cache_hit, peak_rss, compiler_rss) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        time.time() - duration if started_at is None else started_at,
+                        os.path.abspath(command[-1]),
+                        command[0],
+                        json.dumps(command),
+                        exit_code,
+                        duration,
+                        artifact_size,
+                        int(cache_hit),
+                        peak_rss,
+                        compiler_rss,
+                    ),
+                )
+                build_id = cursor.lastrowid
+                db.executemany(
+                    "INSERT INTO phases (build_id, phase, seconds) VALUES (?, ?, ?)",
+                    [(build_id, phase, seconds) for phase, seconds in phase_times.items()],
+                )
+        finally:
+            db.close()
+        return build_id
+
+    def phases(self, build_id):
+        """Return {phase: seconds} of a recorded build"""
+        db = self._connect()
+        try:
+            rows = db.execute("SELECT phase, seconds FROM phases WHERE build_id = ?", (build_id,)).fetchall()
+        finally:
+            db.close()
+        return dict(rows)
+
+    def count(self, project=None):
+        """Number of recorded builds, optionally of one project"""
+        where, params = self._filter(project)
+        db = self._connect()
+        try:
+            return db.execute(f"SELECT COUNT(*) FROM builds{where}", params).fetchone()[0]
+        finally:
+            db.close()
+
+    def rows(self, offset, limit, project=None):
+        """Return up to ``limit`` builds, newest first, as tuples of ROW_COLUMNS
+
+        ``argv`` is decoded back into a list.
+        """
+        where, params = self._filter(project)
+        db = self._connect()
+        try:
+            rows = db.execute(
+                f"SELECT {', '.join(_ROW_EXPRESSIONS.get(column, column) for column in ROW_COLUMNS)}"
+                f" FROM builds{where}"
+                " ORDER BY started_at DESC, id DESC LIMIT ? OFFSET ?",
+                params + (limit, offset),
+            ).fetchall()
+        finally:
+            db.close()
+        return [row[:-1] + (json.loads(row[-1]),) for row in rows]
+
+    def projects(self):
+        """Main files that have recorded builds, most recently built first"""
+        db = self._connect()
+        try:
+            rows = db.execute(
+                "SELECT project FROM builds GROUP BY project ORDER BY MAX(started_at) DESC"
+            ).fetchall()
+        finally:
+            db.close()
+        return [project for project, in rows]
+
+    def trend(self, project, limit=200):
+        """Return (started_at, duration, artifact_size, peak_rss) of the last
+        successful builds of a project, oldest first
+
+        Builds restored from the artifact cache are left out, their duration
+        says nothing about the compile time.
+        """
+        db = self._connect()
+        try:
+            rows = db.execute(
+                "SELECT started_at, duration, artifact_size, peak_rss FROM builds"
+                " WHERE project = ? AND exit_code = 0 AND cache_hit = 0"
+                " ORDER BY started_at DESC LIMIT ?",
+                (project, limit),
+            ).fetchall()
+        finally:
+            db.close()
+        return rows[::-1]
+
+    def compiler_rss(self, project, lto, builds=5):
+        """Largest compiler resident set seen in the last successful builds
+        of a project with the same LTO setting, or None"""
+        db = self._connect()
+        try:
+            rows = db.execute(
+                "SELECT argv, compiler_rss FROM builds"
+                " WHERE project = ? AND exit_code = 0 AND compiler_rss IS NOT NULL"
+                " ORDER BY started_at DESC LIMIT 50",
+                (project,),
+            ).fetchall()
+        finally:
+            db.close()
+        sizes = [size for argv, size in rows if uses_lto(json.loads(argv)) == lto][:builds]
+        return max(sizes) if sizes else None
+
+    def latest_build(self, project):
+        """Id of the last successful build of a project, or None"""
+        db = self._connect()
+        try:
+            row = db.execute(
+                "SELECT id FROM builds WHERE project = ? AND exit_code = 0 ORDER BY started_at DESC LIMIT 1",
+                (project,),
+            ).fetchone()
+        finally:
+            db.close()
+        return row[0] if row else None
+
+    def last_duration(self, command):
+        """Duration of the last successful, compiled build of the project of
+        an argv into the same output directory, or None"""
+        output_dir = option_value(command, "--output-dir")
+        db = self._connect()
+        try:
+            rows = db.execute(
+                "SELECT argv, duration FROM builds"
+                " WHERE project = ? AND exit_code = 0 AND cache_hit = 0"
+                " ORDER BY started_at DESC LIMIT 50",
+                (os.path.abspath(command[-1]),),
+            ).fetchall()
+        finally:
+            db.close()
+        for argv, duration in rows:
+            if option_value(json.loads(argv), "--output-dir") == output_dir:
+                return duration
+        return None
+
+    def record_benchmark(self, build_id, results, arguments=()):
+        """Store the results of a startup benchmark (see benchmark.startup_benchmark)"""
+        measured_at = time.time()
+        db = self._connect()
+        try:
+            with db:
+                db.executemany(
+                    f"INSERT INTO benchmarks (build_id, measured_at, arguments, {', '.join(BENCHMARK_COLUMNS)})"
+                    f" VALUES (?, ?, ?{', ?' * len(BENCHMARK_COLUMNS)})",
+                    [
+                        (build_id, measured_at, json.dumps(list(arguments)))
+                        + tuple(result[column] for column in BENCHMARK_COLUMNS)
+                        for result in results
+                    ],
+                )
+        finally:
+            db.close()
+
+    def benchmarks(self, build_id):
+        """Return the last benchmark results of a build as dicts keyed by BENCHMARK_COLUMNS"""
+        db = self._connect()
+        try:
+            rows = db.execute(
+                f"SELECT {', '.join(BENCHMARK_COLUMNS)} FROM benchmarks b WHERE build_id = ?"
+                " AND measured_at = (SELECT MAX(measured_at) FROM benchmarks WHERE build_id = b.build_id)"
+                " ORDER BY id",
+                (build_id,),
+            ).fetchall()
+        finally:
+            db.close()
+        return [dict(zip(BENCHMARK_COLUMNS, row)) for row in rows]
+
+    @staticmethod
+    def _filter(project):
+        if project is None:
+            return "", ()
+        return " WHERE project = ?", (project,)
@@ -0,0 +1,550 @@
+"""Scan the import graph of a project without running it.
+
+Nuitka compiles every module the program imports, so the size of that graph
+is what its compile time grows with. The scanner parses the main file with
+``ast``, resolves its imports against the ``sys.path`` of the selected
+interpreter (probed once in a subprocess) the way the path finder would, and
+follows them into the project, third-party packages and, for standalone
+builds, the standard library. Extension modules are counted but not
+followed; their imports are invisible without loading them.
+
+Parse results are cached per file, keyed by size and modification time, so a
+rescan after editing a few files only parses those again. Imports Nuitka
+cannot follow statically (``importlib.import_module`` with a computed name)
+and packages that need a plugin enabled are reported as suggestions.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+
+from packager.paths import normalize_path, state_dir
+
+# Where a module comes from
+PROJECT = "project"
+STDLIB = "stdlib"
+THIRD_PARTY = "third_party"
+BUILTIN = "builtin"
+MISSING = "missing"
+
+# Configuration fields the suggestions fill and the option each becomes
+IMPORT_OPTIONS = {
+    "include_package": "--include-package",
+    "plugins": "--enable-plugin",
+}
+
+# Top-level modules whose support Nuitka leaves to a plugin that has to be
+# enabled explicitly
+PLUGIN_MODULES = {
+    "PySide6": "pyside6",
+    "PySide2": "pyside2",
+    "PyQt6": "pyqt6",
+    "PyQt5": "pyqt5",
+    "tkinter": "tk-inter",
+    "gevent": "gevent",
+    "dill": "dill-compat",
+    "playwright": "playwright",
+    "spacy": "spacy",
+}
+
+# Calls importing a module given by name
+_IMPORT_CALLS = {"import_module", "__import__"}
+
+# Bumped whenever the cached parse results change shape
+_CACHE_FORMAT = 1
+
+_PROBE = r"""
+import _imp, json, os, sys, sysconfig
+from importlib.machinery import EXTENSION_SUFFIXES, SOURCE_SUFFIXES
+names = getattr(sys, "stdlib_module_names", None)
+if names is None:
+    names = set()
+    for key in ("stdlib", "platstdlib"):
+        root = sysconfig.get_path(key)
+        for folder in (root, os.path.join(root, "lib-dynload")):
+            try:
+                entries = os.listdir(folder)
+            except OSError:
+                continue
+            names.update(entry.split(".")[0] for entry in entries if entry != "site-packages")
+print(json.dumps({
+    "executable": sys.executable,
+    "version": sys.version.split()[0],
+    "path": [entry for entry in sys.path[1:] if entry],
+    "builtin": sorted(sys.builtin_module_names),
+    "frozen": sorted(getattr(_imp, "_frozen_module_names", list)()),
+    "aliases": {
+        name: module.__name__ for name, module in list(sys.modules.items())
+        if "." in name and module is not None and module.__name__ != name
+    },
+    "stdlib": sorted(names),
+    "stdlib_dirs": sorted({sysconfig.get_path("stdlib"), sysconfig.get_path("platstdlib")}),
+    "source_suffixes": SOURCE_SUFFIXES,
+    "extension_suffixes": EXTENSION_SUFFIXES,
+}))
+"""
+
+# {(interpreter, mtime_ns): probe result}
+_interpreters = {}
+
+
+class ScanError(Exception):
+    """Raised when the interpreter cannot be probed or the main file read"""
+
+
+def probe_interpreter(python_path):
+    """Return the module search setup of an interpreter
+
+    A dict with executable, version, path (``sys.path`` without the script
+    directory), builtin and frozen (module names), aliases
+    ({name: module} of modules importable under another name, like
+    ``os.path``), stdlib (module names), stdlib_dirs, source_suffixes and
+    extension_suffixes. Results are kept for as long as the interpreter
+    binary is unchanged.
+    """
+    if python_path.endswith("nuitka.cmd"):
+        # uv environments: the interpreter sits next to the wrapper
+        python_path = os.path.join(os.path.dirname(python_path), "python.exe")
+    try:
+        key = (python_path, os.stat(python_path).st_mtime_ns)
+    except OSError as e:
+        raise ScanError(f"cannot probe interpreter {python_path}: {e}") from e
+    if key not in _interpreters:
+        try:
+            result = subprocess.run(
+                [python_path, "-c", _PROBE],
+                capture_output=True, text=True, timeout=60,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise ScanError(f"cannot probe interpreter {python_path}: {e}") from e
+        if result.returncode != 0:
+            raise ScanError(f"cannot probe interpreter {python_path}: {result.stderr.strip()}")
+        _interpreters[key] = json.loads(result.stdout)
+    return _interpreters[key]
+
+
+def _import_target(node):
+    """The module an ``import_module``/``__import__`` call names
+
+    Returns ("dynamic", name) for constant names, ("prefix", text) for
+    names built from a constant prefix and ("unknown", "") otherwise, or
+    None if ``node`` is no such call.
+    """
+    func = node.func
+    name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+    if name not in _IMPORT_CALLS or not node.args:
+        return None
+    arg = node.args[0]
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        return "dynamic", arg.value
+    prefix = None
+    if isinstance(arg, ast.JoinedStr) and arg.values:
+        prefix = arg.values[0]
+    elif isinstance(arg, ast.BinOp) and isinstance(arg.op, (ast.Add, ast.Mod)):
+        prefix = arg.left
+    elif isinstance(arg, ast.Call) and isinstance(arg.func, ast.Attribute) and arg.func.attr == "format":
+        prefix = arg.func.value
+    if isinstance(prefix, ast.Constant) and isinstance(prefix.value, str):
+        text = prefix.value.split("%")[0].split("{")[0]
+        if text:
+            return "prefix", text
+    return "unknown", ""
+
+
+def parse_imports(source, filename="<unknown>"):
+    """Return the imports of a module's source
+
+    A list of [kind, module, level, names, optional, line] where kind is
+    "import", "from", "dynamic" (constant ``import_module`` name),
+    "prefix" (name built from a constant prefix) or "unknown". ``optional``
+    is true for imports inside ``try``, ``if`` or a function, whose absence
+    the program may well tolerate. Raises SyntaxError and ValueError.
+    """
+    tree = ast.parse(source, filename)
+    imports = []
+    pending = [(tree, False)]
+    while pending:
+        node, optional = pending.pop()
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(["import", alias.name, 0, [], optional, node.lineno])
+        elif isinstance(node, ast.ImportFrom):
+            names = [alias.name for alias in node.names]
+            imports.append(["from", node.module or "", node.level, names, optional, node.lineno])
+        elif isinstance(node, ast.Call):
+            target = _import_target(node)
+            if target is not None:
+                kind, name = target
+                level = len(name) - len(name.lstrip("."))
+                imports.append([kind, name[level:], level, [], optional, node.lineno])
+        nested = optional or isinstance(node, (ast.Try, ast.If, ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda))
+        pending.extend((child, nested) for child in ast.iter_child_nodes(node))
+    imports.sort(key=lambda entry: entry[5])
+    return imports
+
+
+class ImportCache:
+    """Parse results of source files, reused while a file's stat is unchanged"""
+
+    def __init__(self, memo_path=None):
+        self.memo_path = memo_path or os.path.join(state_dir("imports"), "parsed.json")
+        try:
+            with open(self.memo_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        # Another parser version may accept different syntax
+        if data.get("format") != _CACHE_FORMAT or data.get("parser") != list(sys.version_info[:2]):
+            data = {"format": _CACHE_FORMAT, "parser": list(sys.version_info[:2]), "files": {}}
+        self.memo = data["files"]
+        self.files = 0
+        self.parsed = 0
+
+    def imports(self, path, stat):
+        """Return (imports, error) of a file (see ``parse_imports``)
+
+        ``error`` is a message if the file cannot be parsed, else None.
+        """
+        self.files += 1
+        cached = self.memo.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2], cached[3]
+        try:
+            with open(path, "rb") as f:
+                source = f.read()
+            imports, error = parse_imports(source, path), None
+        except (SyntaxError, ValueError) as e:
+            imports, error = [], str(e)
+        except OSError as e:
+            return [], str(e)
+        self.memo[path] = [stat.st_size, stat.st_mtime_ns, imports, error]
+        self.parsed += 1
+        return imports, error
+
+    def save(self):
+        tmp_path = self.memo_path + ".tmp"
+        data = {"format": _CACHE_FORMAT, "parser": list(sys.version_info[:2]), "files": self.memo}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.memo_path)
+
+
+class ModuleFinder:
+    """Resolve module names to files like the path finder of an interpreter
+
+    ``search_path`` is the interpreter's ``sys.path`` with the script
+    directory in front. Directory listings are read once per scan.
+    """
+
+    def __init__(self, interpreter, search_path, project_dir):
+        self.search_path = search_path
+        self.builtin = set(interpreter["builtin"])
+        self.frozen = set(interpreter["frozen"])
+        self.aliases = interpreter["aliases"]
+        self.stdlib = set(interpreter["stdlib"])
+        self.suffixes = interpreter["extension_suffixes"] + interpreter["source_suffixes"]
+        self.source_suffixes = tuple(interpreter["source_suffixes"])
+        self.project_dir = normalize_path(project_dir) + os.sep
+        self.stdlib_dirs = tuple(normalize_path(path) + os.sep for path in interpreter["stdlib_dirs"])
+        self._listings = {}
+        self._modules = {}
+
+    def _listing(self, directory):
+        names = self._listings.get(directory)
+        if names is None:
+            try:
+                names = self._listings[directory] = set(os.listdir(directory))
+            except OSError:
+                names = self._listings[directory] = set()
+        return names
+
+    def _find_in(self, name, locations):
+        """Return (path, package locations) of ``name`` in directories, or None"""
+        namespace = []
+        for directory in locations:
+            names = self._listing(directory)
+            if name in names:
+                folder = os.path.join(directory, name)
+                if os.path.isdir(folder):
+                    children = self._listing(folder)
+                    for suffix in self.suffixes:
+                        if "__init__" + suffix in children:
+                            return os.path.join(folder, "__init__" + suffix), [folder]
+                    namespace.append(folder)
+            for suffix in self.suffixes:
+                if name + suffix in names:
+                    return os.path.join(directory, name + suffix), None
+        if namespace:
+            return None, namespace
+        return None
+
+    def resolve(self, fullname):
+        """Return the module dict of a dotted name (see ``scan_imports``)"""
+        module = self._modules.get(fullname)
+        if module is not None:
+            return module
+        parent_name, _, name = fullname.rpartition(".")
+        found = None
+        if not parent_name:
+            if fullname in self.builtin:
+                found = (None, None)
+            else:
+                found = self._find_in(fullname, self.search_path)
+                if found is None and fullname in self.frozen:
+                    # Frozen modules usually have their source next to the others
+                    found = (None, None)
+        else:
+            parent = self.resolve(parent_name)
+            if parent["locations"]:
+                found = self._find_in(name, parent["locations"])
+        module = {"name": fullname, "path": None, "locations": None, "size": 0}
+        if found is None:
+            module["kind"] = MISSING
+        elif found == (None, None):
+            module["kind"] = BUILTIN
+        else:
+            module["path"], module["locations"] = found
+            top = fullname.partition(".")[0]
+            anchor = normalize_path(module["path"] or module["locations"][0])
+            if anchor.startswith(self.project_dir):
+                module["kind"] = PROJECT
+            elif top in self.stdlib or (
+                # Packages left out of the stdlib names, like "test"
+                anchor.startswith(self.stdlib_dirs) and "site-packages" not in anchor and "dist-packages" not in anchor
+            ):
+                module["kind"] = STDLIB
+            else:
+                module["kind"] = THIRD_PARTY
+        self._modules[fullname] = module
+        return module
+
+    def is_source(self, module):
+        return bool(module["path"]) and module["path"].endswith(self.source_suffixes)
+
+
+def _package_of(name, module):
+    """The package relative imports of a module start from"""
+    return name if module["locations"] else name.rpartition(".")[0]
+
+
+def _absolute(importer, module, name, level):
+    """Resolve a relative module name, or None if it leaves the top package"""
+    if not level:
+        return name
+    package = _package_of(importer, module) if importer != "__main__" else ""
+    base = package.split(".") if package else []
+    if level - 1 >= len(base):
+        return None
+    base = base[:len(base) - (level - 1)]
+    return ".".join(base + ([name] if name else []))
+
+
+def _parents(name):
+    """A dotted name and all its parent packages, outermost first"""
+    parts = name.split(".")
+    return [".".join(parts[:index]) for index in range(1, len(parts) + 1)]
+
+
+def _package_modules(finder, package):
+    """The dotted names of the source modules below a package"""
+    names = []
+    for location in package["locations"] or []:
+        for dirpath, dirnames, filenames in os.walk(location):
+            dirnames[:] = sorted(name for name in dirnames if name.isidentifier())
+            relative = os.path.relpath(dirpath, location)
+            prefix = package["name"] if relative == "." else package["name"] + "." + relative.replace(os.sep, ".")
+            for filename in sorted(filenames):
+                stem, suffix = os.path.splitext(filename)
+                if suffix in finder.source_suffixes and stem.isidentifier() and stem != "__init__":
+                    names.append(prefix + "." + stem)
+    return names
+
+
+def scan_imports(python_path, main_file, follow_stdlib=True, nofollow=(), include_modules=(),
+                 include_packages=(), plugins=(), cache=None, stop=None):
+    """Follow the imports of a main file and summarize the graph
+
+    ``follow_stdlib`` follows imports into the standard library (Nuitka
+    compiles it for standalone builds), ``nofollow`` lists modules and
+    packages not followed (``--nofollow-import-to``); ``include_modules``
+    and ``include_packages`` (whole packages) are scanned as additional
+    roots. ``plugins`` are the enabled plugins, which are not suggested.
+
+    Returns a dict with main_file, interpreter, version, modules (dicts
+    with name, kind, path, size, importers and via, the module that first
+    imported it; modules not found are only listed where the project
+    requires them), packages (dicts with name, kind, modules and size per
+    top-level package, largest first), totals ({kind: {modules, size}}),
+    dynamic (dicts with importer, line, kind and target of the project's
+    computed imports), suggestions (dicts with field, value, reason and subject),
+    errors ([(path, message)] of unparsable files), files, parsed (files
+    parsed anew rather than taken from the cache) and seconds.
+    """
+    started = time.monotonic()
+    interpreter = probe_interpreter(python_path)
+    main_file = os.path.abspath(main_file)
+    if not os.path.isfile(main_file):
+        raise ScanError(f"main file not found: {main_file}")
+    project_dir = os.path.dirname(main_file)
+    finder = ModuleFinder(interpreter, [project_dir] + interpreter["path"], project_dir)
+    own_cache = cache is None
+    if own_cache:
+        cache = ImportCache()
+
+    main = {"name": "__main__", "kind": PROJECT, "path": main_file, "locations": None, "size": 0}
+    graph = {"__main__": main}
+    importers = {"__main__": set()}
+    via = {"__main__": None}
+    # Modules the project cannot do without
+    required = set()
+    queue = deque(["__main__"])
+    dynamic = []
+    errors = []
+    skipped = tuple(nofollow)
+
+    def add(name, importer, optional):
+        name = finder.aliases.get(name, name)
+        module = graph.get(name) or finder.resolve(name)
+        if name not in graph:
+            graph[name] = module
+            importers[name] = set()
+            via[name] = importer
+            queue.append(name)
+        if importer is not None and importer != name:
+            importers[name].add(importer)
+        if not optional and (importer is None or graph[importer]["kind"] == PROJECT):
+            required.add(name)
+        return module
+
+    for name in list(include_modules):
+        for parent in _parents(name):
+            add(parent, None, False)
+    for name in list(include_packages):
+        for parent in _parents(name):
+            package = add(parent, None, False)
+        for child in _package_modules(finder, package):
+            add(child, name, False)
+
+    while queue:
+        if stop is not None and stop.is_set():
+            break
+        name = queue.popleft()
+        module = graph[name]
+        if module["path"]:
+            try:
+                stat = os.stat(module["path"])
+            except OSError:
+                continue
+            module["size"] = stat.st_size
+        if not finder.is_source(module):
+            continue
+        if module["kind"] == STDLIB and not follow_stdlib:
+            continue
+        if any(name == entry or name.startswith(entry + ".") for entry in skipped):
+            continue
+        imports, error = cache.imports(module["path"], stat)
+        if error:
+            errors.append((module["path"], error))
+        # Computed imports of the project; libraries know what they load
+        own = module["kind"] == PROJECT
+        for kind, target, level, names, optional, line in imports:
+            if kind == "unknown":
+                if own:
+                        dynamic.append({"importer": name, "line": line, "kind": kind, "target": ""})
+                continue
+            absolute = _absolute(name, module, target, level)
+            if not absolute:
+                continue
+            if kind == "prefix":
+                if not own:
+                    continue
+                # "plugins." or "plugins.x_": everything below the last dot
+                package_name = absolute.rpartition(".")[0]
+                dynamic.append({"importer": name, "line": line, "kind": kind, "target": package_name or absolute})
+                if package_name:
+                    for parent in _parents(package_name):
+                        add(parent, name, optional)
+                continue
+            if kind == "dynamic" and own:
+                dynamic.append({"importer": name, "line": line, "kind": kind, "target": absolute})
+            for parent in _parents(absolute):
+                imported = add(parent, name, optional)
+            # "from package import submodule"
+            if kind == "from" and imported["locations"]:
+                for child in names:
+                    if child != "*" and finder.resolve(absolute + "." + child)["kind"] != MISSING:
+                        add(absolute + "." + child, name, optional)
+
+    if own_cache:
+        try:
+            cache.save()
+        except OSError:
+            pass
+
+    modules = []
+    packages = {}
+    totals = {}
+    for name, module in graph.items():
+        if module["kind"] == MISSING and name not in required:
+            # Optional dependencies and platform-specific imports of libraries
+            continue
+        modules.append({
+            "name": name, "kind": module["kind"], "path": module["path"] or "", "size": module["size"],
+            "importers": len(importers[name]), "via": via[name] or "",
+        })
+        total = totals.setdefault(module["kind"], {"modules": 0, "size": 0})
+        total["modules"] += 1
+        total["size"] += module["size"]
+        top = name.partition(".")[0]
+        package = packages.setdefault(top, {"name": top, "kind": module["kind"], "modules": 0, "size": 0})
+        package["modules"] += 1
+        package["size"] += module["size"]
+    modules.sort(key=lambda entry: entry["size"], reverse=True)
+
+    report = {
+        "main_file": main_file,
+        "interpreter": interpreter["executable"],
+        "version": interpreter["version"],
+        "modules": modules,
+        "packages": sorted(packages.values(), key=lambda entry: entry["size"], reverse=True),
+        "totals": totals,
+        "dynamic": dynamic,
+        "errors": errors,
+        "files": cache.files,
+        "parsed": cache.parsed,
+    }
+    report["suggestions"] = suggest(report, graph, include_packages, plugins)
+    report["seconds"] = time.monotonic() - started
+    return report
+
+
+def suggest(report, graph, include_packages=(), plugins=()):
+    """Suggest options the import graph calls for
+
+    Packages whose modules are imported by computed names become
+    ``--include-package`` suggestions (reason "dynamic"; constant names
+    Nuitka follows itself) and packages with a plugin of their own become
+    ``--enable-plugin`` ones (reason "plugin"). Values already configured
+    are left out.
+    """
+    existing = {"include_package": set(include_packages), "plugins": set(plugins)}
+    suggestions = []
+
+    def add(field, value, reason, subject):
+        if value not in existing[field]:
+            existing[field].add(value)
+            suggestions.append({"field": field, "value": value, "reason": reason, "subject": subject})
+
+    for entry in report["dynamic"]:
+        target = graph.get(entry["target"])
+        if entry["kind"] == "prefix" and target and target["locations"]:
+            add("include_package", entry["target"], "dynamic", entry["importer"])
+    for package in report["packages"]:
+        plugin = PLUGIN_MODULES.get(package["name"])
+        if plugin and package["kind"] != MISSING:
+            add("plugins", plugin, "plugin", package["name"])
+    return suggestions
@@ -0,0 +1,401 @@
+"""Detect the Python and Nuitka versions of an interpreter, cached.
+
+Asking an interpreter what it has installed means starting it, and
+importing Nuitka's version tables takes a noticeable part of a second. The
+answer only changes when the environment does, so it is kept (in memory and
+in the packager's state directory) together with the modification times of
+the interpreter binary and of its site-packages directories. Installing,
+upgrading or removing a package adds or removes a ``.dist-info`` directory
+there, which changes the directory's modification time and invalidates the
+entry; anything else reuses it without starting a process.
+
+``discover_interpreters`` looks for interpreters in the virtual
+environments of the project, pyenv, conda and uv installations and on PATH,
+lists those locations and probes what it finds side by side, and keeps the
+list in an index the GUI fills its interpreter list from at startup.
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from packager.paths import normalize_path, state_dir
+
+PROBE_TIMEOUT = 30
+
+# Where interpreters are looked for, in the order a duplicate is credited
+SOURCES = ("project", "pyenv", "conda", "uv", "path")
+
+# Interpreter names looked for in PATH directories
+_PATH_NAMES = re.compile(r"^python(3(\.\d+)?)?(\.exe)?$", re.IGNORECASE)
+
+# Installation directories of conda distributions below the home directory
+_CONDA_ROOTS = ("miniconda3", "miniconda", "anaconda3", "anaconda", "miniforge3", "mambaforge", "micromamba")
+
+# Bumped whenever the probe reports something new
+_CACHE_FORMAT = 1
+_INDEX_FORMAT = 1
+
+_PROBE = r"""
+import json, os, site, sys
+info = {
+    "executable": sys.executable,
+    "version": "%d.%d.%d" % sys.version_info[:3],
+    "python": "%d.%d" % sys.version_info[:2],
+    "release": sys.version_info[3],
+    "prefix": sys.prefix,
+    "venv": sys.prefix != getattr(sys, "base_prefix", sys.prefix),
+    "conda": os.path.isdir(os.path.join(sys.prefix, "conda-meta")),
+    "nuitka": None,
+    "installer": None,
+}
+try:
+    dirs = site.getsitepackages()
+except AttributeError:
+    dirs = []
+user_site = getattr(site, "USER_SITE", None)
+if user_site:
+    dirs.append(user_site)
+info["site_dirs"] = dirs
+try:
+    from nuitka.Version import getNuitkaVersion
+    from nuitka import PythonVersions
+except ImportError:
+    pass
+else:
+    info["nuitka"] = getNuitkaVersion()
+    info["supported"] = list(PythonVersions.getSupportedPythonVersions())
+    info["not_yet_supported"] = list(getattr(PythonVersions, "getNotYetSupportedPythonVersions", tuple)())
+    try:
+        from importlib.metadata import distribution
+        info["installer"] = (distribution("nuitka").read_text("INSTALLER") or "").strip() or "unknown"
+    except Exception:
+        info["installer"] = "source"
+try:
+    import zstandard
+    info["zstandard"] = True
+except ImportError:
+    info["zstandard"] = False
+print(json.dumps(info))
+"""
+
+
+class InterpreterError(Exception):
+    """Raised when an interpreter cannot be run or its answer read
+
+    The message is the reason alone, callers name the interpreter.
+    """
+
+
+def _run(argv):
+    try:
+        return subprocess.run(
+            argv, capture_output=True, text=True, timeout=PROBE_TIMEOUT,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise InterpreterError(str(e)) from e
+
+
+def _probe_nuitka_cmd(path):
+    """Detect a uv ``nuitka.cmd`` wrapper from its ``--version`` output"""
+    result = _run([path, "--version"])
+    lines = result.stdout.splitlines()
+    info = {
+        "executable": path, "version": None, "python": None, "release": "final", "prefix": None,
+        "venv": False, "conda": False, "installer": "uv", "zstandard": None,
+        "nuitka": lines[0].strip() if result.returncode == 0 and lines else None,
+        # Reinstalling rewrites the wrapper's directory
+        "site_dirs": [os.path.dirname(path)],
+    }
+    for line in lines:
+        if line.startswith("Python:"):
+            info["version"] = line.split()[1]
+            info["python"] = ".".join(info["version"].split(".")[:2])
+    return info
+
+
+def probe(python_path):
+    """Ask an interpreter about itself, uncached
+
+    Returns a dict with executable, version ("3.11.7"), python ("3.11"),
+    release (the release level), prefix, venv and conda (the kind of
+    environment), site_dirs, nuitka (its version, None if not importable),
+    installer (how Nuitka was installed: "pip", "uv", "conda", "source"...),
+    supported and not_yet_supported (Python versions, when Nuitka is
+    importable) and zstandard. Raises InterpreterError.
+    """
+    if python_path.endswith("nuitka.cmd"):
+        return _probe_nuitka_cmd(python_path)
+    result = _run([python_path, "-c", _PROBE])
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise InterpreterError(lines[-1] if lines else f"exit code {result.returncode}")
+    try:
+        info = json.loads(result.stdout)
+    except ValueError as e:
+        raise InterpreterError(f"unreadable answer: {e}") from e
+    if info["installer"] == "unknown" and info["conda"]:
+        info["installer"] = "conda"
+    return info
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stamp(python_path):
+    """Modification time of an interpreter, also one named without a directory"""
+    return _mtime(shutil.which(python_path) or python_path)
+
+
+class InterpreterCache:
+    """Detection results of interpreters, reused until their environment changes"""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(state_dir(), "interpreters.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self._entries = data.get("interpreters", {}) if data.get("format") == _CACHE_FORMAT else {}
+
+    def _fresh(self, entry, stamp):
+        return entry["stamp"] == stamp and all(_mtime(path) == mtime for path, mtime in entry["dirs"].items())
+
+    def cached(self, python_path):
+        """The cached detection result of an interpreter if still valid, else None"""
+        stamp = _stamp(python_path)
+        with self._lock:
+            entry = self._entries.get(python_path)
+        if entry and stamp is not None and self._fresh(entry, stamp):
+            return entry["info"]
+        return None
+
+    def detect(self, python_path):
+        """Detection result of an interpreter (see ``probe``), probing only
+        when the interpreter or its site-packages changed. Raises
+        InterpreterError."""
+        info = self.cached(python_path)
+        if info is not None:
+            return info
+        stamp = _stamp(python_path)
+        if stamp is None:
+            raise InterpreterError("no such file")
+        info = probe(python_path)
+        dirs = {path: _mtime(path) for path in info["site_dirs"]}
+        with self._lock:
+            self._entries[python_path] = {"stamp": stamp, "dirs": dirs, "info": info}
+            self._save()
+        return info
+
+    def _save(self):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": _CACHE_FORMAT, "interpreters": self._entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Only costs a probe next time
+            pass
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def _shared_cache():
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = InterpreterCache()
+    return _default_cache
+
+
+def detect_interpreter(python_path):
+    """``InterpreterCache.detect`` on the cache shared by the process"""
+    return _shared_cache().detect(python_path)
+
+
+def _python_in(env_dir):
+    """The interpreter of an environment or installation directory, or None"""
+    for parts in (("bin", "python3"), ("bin", "python"), ("Scripts", "python.exe"), ("python.exe",)):
+        path = os.path.join(env_dir, *parts)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _subdirs(directory):
+    try:
+        return sorted(entry.path for entry in os.scandir(directory) if entry.is_dir())
+    except OSError:
+        return []
+
+
+def _interpreters_in(env_dirs):
+    return [path for path in map(_python_in, env_dirs) if path]
+
+
+def _project_interpreters(project_dir):
+    """Virtual environments directly below the project directory"""
+    if not project_dir:
+        return []
+    return _interpreters_in(
+        directory for directory in _subdirs(project_dir) if os.path.isfile(os.path.join(directory, "pyvenv.cfg"))
+    )
+
+
+def _pyenv_interpreters():
+    root = os.environ.get("PYENV_ROOT") or os.path.expanduser(os.path.join("~", ".pyenv"))
+    return _interpreters_in(
+        _subdirs(os.path.join(root, "versions")) + _subdirs(os.path.join(root, "pyenv-win", "versions"))
+    )
+
+
+def _conda_interpreters():
+    roots = [os.path.expanduser(os.path.join("~", name)) for name in _CONDA_ROOTS]
+    if os.environ.get("CONDA_EXE"):
+        roots.append(os.path.dirname(os.path.dirname(os.environ["CONDA_EXE"])))
+    envs = []
+    for root in roots:
+        envs += [root] + _subdirs(os.path.join(root, "envs"))
+    if os.environ.get("CONDA_PREFIX"):
+        envs.append(os.environ["CONDA_PREFIX"])
+    # Environments created elsewhere with --prefix
+    try:
+        with open(os.path.expanduser(os.path.join("~", ".conda", "environments.txt")), encoding="utf-8") as f:
+            envs += [line.strip() for line in f if line.strip()]
+    except OSError:
+        pass
+    return _interpreters_in(dict.fromkeys(envs))
+
+
+def _uv_interpreters():
+    base = os.environ.get("UV_PYTHON_INSTALL_DIR")
+    if not base:
+        if sys.platform.startswith("win"):
+            base = os.path.join(os.environ.get("APPDATA") or os.path.expanduser("~"), "uv", "python")
+        else:
+            data = os.environ.get("XDG_DATA_HOME") or os.path.expanduser(os.path.join("~", ".local", "share"))
+            base = os.path.join(data, "uv", "python")
+    return _interpreters_in(_subdirs(base))
+
+
+def _path_interpreters():
+    found = []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        # pyenv shims run whichever version is selected, the Windows Store
+        # aliases open the Store
+        if not directory or os.path.basename(directory) == "shims" or "WindowsApps" in directory:
+            continue
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            continue
+        for name in names:
+            path = os.path.join(directory, name)
+            if _PATH_NAMES.match(name) and os.path.isfile(path) and os.access(path, os.X_OK):
+                found.append(path)
+    return found
+
+
+def _identity(path):
+    """Names of one binary are one interpreter, unless it runs a virtual environment"""
+    env_dir = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+    venv = os.path.isfile(os.path.join(env_dir, "pyvenv.cfg"))
+    return normalize_path(path), normalize_path(env_dir) if venv else None
+
+
+def _index_path():
+    return os.path.join(state_dir(), "interpreter_index.json")
+
+
+def load_index():
+    """The interpreters found by the last discovery whose cached detection is
+    still valid, without starting any process (see ``discover_interpreters``)"""
+    try:
+        with open(_index_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if data.get("format") != _INDEX_FORMAT:
+        return []
+    cache = _shared_cache()
+    entries = []
+    for path, source in data["interpreters"]:
+        info = cache.cached(path)
+        if info is not None:
+            entries.append({"path": path, "source": source, "info": info})
+    return entries
+
+
+def _save_index(entries):
+    tmp_path = f"{_index_path()}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "format": _INDEX_FORMAT,
+                "interpreters": [[entry["path"], entry["source"]] for entry in entries],
+            }, f)
+        os.replace(tmp_path, _index_path())
+    except OSError:
+        pass
+
+
+def _order(entry):
+    """Interpreters with Nuitka first, then by source and newest version"""
+    version = entry["info"]["version"] or ""
+    return (
+        not entry["info"]["nuitka"],
+        SOURCES.index(entry["source"]),
+        [-int(part) for part in version.split(".") if part.isdigit()],
+    )
+
+
+def discover_interpreters(project_dir=None, max_workers=8):
+    """Find the interpreters on this machine and detect what they run
+
+    Every source in SOURCES is listed concurrently, then every interpreter
+    found is probed concurrently through the shared cache, so only new or
+    changed ones start a process. Returns a list of dicts with path, source
+    and info (see ``probe``), in the order of ``_order``; interpreters that
+    cannot be run are left out. The list is saved as the index.
+    """
+    finders = {
+        "project": lambda: _project_interpreters(project_dir),
+        "pyenv": _pyenv_interpreters,
+        "conda": _conda_interpreters,
+        "uv": _uv_interpreters,
+        "path": _path_interpreters,
+    }
+    cache = _shared_cache()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        listings = {source: pool.submit(finder) for source, finder in finders.items()}
+        candidates = []
+        seen = set()
+        for source in SOURCES:
+            for path in listings[source].result():
+                key = _identity(path)
+                if key not in seen:
+                    seen.add(key)
+                    candidates.append((path, source))
+        probes = [(path, source, pool.submit(cache.detect, path)) for path, source in candidates]
+        entries = []
+        for path, source, future in probes:
+            try:
+                entries.append({"path": path, "source": source, "info": future.result()})
+            except InterpreterError:
+                continue
+    entries.sort(key=_order)
+    _save_index(entries)
+    return entries
@@ -0,0 +1,113 @@
+"""Bounded in-memory log tail backed by an on-disk spill file."""
+import os
+import tempfile
+from array import array
+from collections import OrderedDict, deque
+
+# Lines kept in memory for the live tail of the log
+MEMORY_LINES = 5000
+# Every INDEX_STRIDE-th line offset is indexed; older lines are paged in by stride
+INDEX_STRIDE = 256
+# Pages of older lines kept around while the user scrolls
+PAGE_CACHE_SIZE = 16
+
+
+class SpillingLogBuffer:
+    """Append-only line store with a fixed memory footprint
+
+    Every line is written to a spill file; only the last ``memory_lines`` are
+    kept in memory. Older lines are read back on demand in pages of
+    ``INDEX_STRIDE`` lines using a sparse offset index, so memory use stays
+    flat however long the log gets.
+    """
+
+    def __init__(self, path=None, memory_lines=MEMORY_LINES):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="nuitka-packager-log-", suffix=".log")
+            os.close(fd)
+        self.path = path
+        self._writer = open(path, "wb")
+        self._reader = open(path, "rb")
+        self._tail = deque(maxlen=memory_lines)
+        self._index = array("Q")
+        self._pages = OrderedDict()
+        self._count = 0
+        self._offset = 0
+        self._dirty = False
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def closed(self):
+        return self._writer.closed
+
+    def append_lines(self, lines):
+        """Append lines (without trailing newlines) to the log"""
+        chunks = []
+        for line in lines:
+            if self._count % INDEX_STRIDE == 0:
+                self._index.append(self._offset)
+            data = line.encode("utf-8", "replace") + b"\n"
+            chunks.append(data)
+            self._offset += len(data)
+            self._count += 1
+        self._writer.write(b"".join(chunks))
+        self._tail.extend(lines)
+        self._dirty = True
+
+    def line(self, number):
+        """Return line ``number`` (0-based), paging it in from disk if needed"""
+        tail_start = self._count - len(self._tail)
+        if number >= tail_start:
+            return self._tail[number - tail_start]
+        page, row = divmod(number, INDEX_STRIDE)
+        return self._page(page)[row]
+
+    def _page(self, page):
+        lines = self._pages.get(page)
+        if lines is not None:
+            self._pages.move_to_end(page)
+            return lines
+
+        if self._dirty:
+            self._writer.flush()
+            self._dirty = False
+        self._reader.seek(self._index[page])
+        lines = []
+        for _ in range(INDEX_STRIDE):
+            data = self._reader.readline()
+            if not data:
+                break
+            lines.append(data[:-1].decode("utf-8", "replace"))
+
+        self._pages[page] = lines
+        if len(self._pages) > PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+        return lines
+
+    def flush(self):
+        """Flush pending lines to the spill file"""
+        self._writer.flush()
+        self._dirty = False
+
+    def clear(self):
+        """Drop all lines and truncate the spill file"""
+        self._writer.seek(0)
+        self._writer.truncate()
+        self._tail.clear()
+        self._index = array("Q")
+        self._pages.clear()
+        self._count = 0
+        self._offset = 0
+        self._dirty = False
+
+    def close(self, remove=True):
+        """Close the spill file, deleting it unless ``remove`` is False"""
+        self._writer.close()
+        self._reader.close()
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -0,0 +1,102 @@
+"""Coalesce build output into time-budgeted batches for the log view."""
+import queue
+import threading
+import time
+
+# Flush at most once per GUI frame budget, or earlier when a batch gets large
+FLUSH_INTERVAL = 0.05
+MAX_BATCH_LINES = 2000
+# Window over which the lines/second figure is measured
+RATE_WINDOW = 0.5
+
+_EOF = object()
+
+
+class LineBatcher:
+    """Read lines from a text stream on a helper thread and yield them in batches
+
+    Iterating yields a (possibly empty) list of lines every ``flush_interval``
+    seconds, or as soon as ``max_lines`` lines are pending. Empty batches let
+    the consumer react to stop requests and refresh the throughput figure even
+    when the build is silent.
+    """
+
+    def __init__(self, stream, flush_interval=FLUSH_INTERVAL, max_lines=MAX_BATCH_LINES):
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.max_lines = max_lines
+        self.total_lines = 0
+        self.lines_per_second = 0.0
+        self.started_at = None
+        self._queue = queue.Queue()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._window_start = 0.0
+        self._window_lines = 0
+
+    def _read(self):
+        """Reader thread: push every line of the stream into the queue"""
+        try:
+            for line in iter(self.stream.readline, ''):
+                self._queue.put(line.rstrip('\r\n'))
+        except (OSError, ValueError):
+            # Stream closed underneath us (process killed)
+            pass
+        finally:
+            self._queue.put(_EOF)
+
+    def _update_rate(self, now):
+        """Recompute lines/second once per rate window"""
+        elapsed = now - self._window_start
+        if elapsed >= RATE_WINDOW:
+            self.lines_per_second = self._window_lines / elapsed
+            self._window_start = now
+            self._window_lines = 0
+
+    def __iter__(self):
+        self.started_at = self._window_start = time.monotonic()
+        self._reader.start()
+
+        batch = []
+        deadline = self.started_at + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _EOF:
+                self._account(batch, time.monotonic())
+                yield batch
+                return
+            if item is not None:
+                batch.append(item)
+                # Drain whatever else is already waiting without blocking
+                while len(batch) < self.max_lines:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _EOF:
+                        self._queue.put(_EOF)
+                        break
+                    batch.append(item)
+
+            now = time.monotonic()
+            if len(batch) >= self.max_lines or now >= deadline:
+                self._account(batch, now)
+                yield batch
+                batch = []
+                deadline = now + self.flush_interval
+
+    def _account(self, batch, now):
+        self.total_lines += len(batch)
+        self._window_lines += len(batch)
+        self._update_rate(now)
+
+    @property
+    def average_rate(self):
+        """Average lines/second since iteration started"""
+        if self.started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self.started_at
+        return self.total_lines / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,188 @@
+"""Keep C compilation within the memory of the build machine.
+
+Nuitka runs as many compilers as there are cores, and under ``--lto`` each
+of them can take gigabytes. Before a build MemoryGovernor picks ``--jobs``
+so the expected compiler memory fits into what is available, and adds
+``--low-memory`` when not even two compilers fit. While the build runs it
+pauses the most recently started compilers with SIGSTOP when available
+memory drops below a threshold and resumes them with SIGCONT once memory
+has recovered; one compiler always keeps running.
+
+Memory figures come from /proc/meminfo, so the governor only acts on Linux.
+"""
+import os
+import signal
+
+from packager.paths import option_value, uses_lto
+from packager.scheduler import with_jobs
+
+GIB = 1024 ** 3
+MIB = 1024 ** 2
+
+# Assumed compiler memory until a build of the project has been measured
+DEFAULT_COMPILER_RSS = 512 * MIB
+DEFAULT_LTO_COMPILER_RSS = 2 * GIB
+# Nuitka's own front-end process
+DEFAULT_FRONTEND_RSS = 1 * GIB
+# Added on top of measured compiler memory, files differ in size
+HEADROOM = 1.25
+
+DEFAULT_RESERVE = 1 * GIB
+DEFAULT_PAUSE_BELOW = 512 * MIB
+
+
+def read_meminfo():
+    """Return /proc/meminfo in bytes, or None where it is not available"""
+    try:
+        with open("/proc/meminfo") as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    info = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        fields = value.split()
+        if fields and fields[0].isdigit():
+            info[key] = int(fields[0]) * (1024 if fields[1:] == ["kB"] else 1)
+    return info
+
+
+def memory_available():
+    """Bytes the kernel estimates can be allocated without swapping, or None"""
+    info = read_meminfo()
+    return info.get("MemAvailable") if info else None
+
+
+def requested_jobs(command):
+    """The ``--jobs`` of an argv, or the CPU count Nuitka defaults to"""
+    value = option_value(command, "--jobs")
+    if value and value.isdigit():
+        return max(1, int(value))
+    return os.cpu_count() or 1
+
+
+def with_low_memory(command):
+    """Return a copy of ``command`` with ``--low-memory`` before the main file"""
+    if "--low-memory" in command:
+        return list(command)
+    return command[:-1] + ["--low-memory", command[-1]]
+
+
+class MemoryGovernor:
+    """Size and police the C compile parallelism of one build
+
+    ``reserve`` is left to the rest of the system when planning; compilers
+    are paused while available memory is below ``pause_below`` and resumed
+    once it is above twice that. Create one governor per build.
+    """
+
+    def __init__(self, reserve=DEFAULT_RESERVE, pause_below=DEFAULT_PAUSE_BELOW, low_memory=True,
+                 pause=True):
+        self.reserve = reserve
+        self.pause_below = pause_below
+        self.resume_above = pause_below * 2
+        self.low_memory = low_memory
+        self.pause = pause and hasattr(signal, "SIGSTOP")
+        # Paused compilers, oldest pause first: [[(pid, start), ...], ...]
+        self.paused = []
+
+    def plan(self, command, compiler_rss=None, frontend_rss=None, available=None):
+        """Return (command, plan) with ``--jobs`` (and ``--low-memory``) applied
+
+        ``compiler_rss`` is the largest compiler measured in earlier builds of
+        the project. ``plan`` is a dict with jobs, requested, low_memory,
+        available, compiler_rss and measured; it is None (and the command
+        unchanged) where available memory is unknown.
+        """
+        if available is None:
+            available = memory_available()
+        if available is None:
+            return list(command), None
+        measured = compiler_rss is not None
+        if measured:
+            compiler_rss = int(compiler_rss * HEADROOM)
+        else:
+            compiler_rss = DEFAULT_LTO_COMPILER_RSS if uses_lto(command) else DEFAULT_COMPILER_RSS
+        budget = available - self.reserve - (frontend_rss or DEFAULT_FRONTEND_RSS)
+        requested = requested_jobs(command)
+        jobs = max(1, min(requested, budget // compiler_rss))
+        low_memory = self.low_memory and budget < 2 * compiler_rss
+        if jobs != requested:
+            command = with_jobs(command, jobs)
+        if low_memory:
+            command = with_low_memory(command)
+        return list(command), {
+            "jobs": jobs,
+            "requested": requested,
+            "low_memory": low_memory,
+            "available": available,
+            "compiler_rss": compiler_rss,
+            "measured": measured,
+        }
+
+    def throttle(self, monitor):
+        """Pause or resume one compiler depending on available memory
+
+        ``monitor`` is the build's ProcessTreeMonitor right after a sample.
+        Returns ("paused" or "resumed", available bytes, paused count), or
+        None when nothing changed.
+        """
+        if not self.pause:
+            return None
+        available = memory_available()
+        if available is None:
+            return None
+        self.paused = [unit for unit in self.paused if any(key in monitor.processes for key in unit)]
+        paused = {unit[0] for unit in self.paused}
+        running = [unit for unit in self._compile_units(monitor) if unit[0] not in paused]
+        if self.paused and (not running or available > self.resume_above):
+            # Memory recovered, or the last running compiler finished
+            self._signal(self.paused.pop(0), signal.SIGCONT)
+            return "resumed", available, len(self.paused)
+        if available < self.pause_below and len(running) > 1:
+            # The newest compiler has made the least progress
+            unit = max(running, key=lambda unit: unit[0][1])
+            self._signal(unit, signal.SIGSTOP)
+            self.paused.append(unit)
+            return "paused", available, len(self.paused)
+        return None
+
+    def release(self):
+        """Resume every paused compiler (the build ended or is being stopped)"""
+        while self.paused:
+            self._signal(self.paused.pop(0), signal.SIGCONT)
+
+    @staticmethod
+    def _compile_units(monitor):
+        """Compiler process trees started by non-compilers (scons), each as a
+        list of keys with the top-level compiler first"""
+        processes = monitor.processes
+        by_pid = {process.pid: key for key, process in processes.items()}
+        children = {}
+        for key, process in processes.items():
+            children.setdefault(by_pid.get(process.ppid), []).append(key)
+        units = []
+        for key, process in processes.items():
+            parent = by_pid.get(process.ppid)
+            if monitor.category(key) != "compilers" or (parent and monitor.category(parent) == "compilers"):
+                continue
+            if process.state == "Z":
+                # Exited, waiting to be reaped
+                continue
+            unit = []
+            pending = [key]
+            while pending:
+                current = pending.pop()
+                unit.append(current)
+                pending.extend(children.get(current, ()))
+            units.append(unit)
+        return units
+
+    @staticmethod
+    def _signal(unit, signum):
+        for pid, _ in unit:
+            try:
+                os.kill(pid, signum)
+            except OSError:
+                # Already exited
+                pass
@@ -0,0 +1,130 @@
+"""Managed Nuitka cache directory with size accounting and LRU eviction.
+
+Nuitka keeps its caches (bytecode, dll-dependencies, ccache, clcache,
+downloaded tools) below ``NUITKA_CACHE_DIR``, one sub-directory per
+category, and never trims them. A managed cache gives every profile its own
+directory and evicts least-recently-used files down to a quota. Downloaded
+tools stay in the shared cache, and the compiler caches are trimmed by their
+own tools, which keep an index of what they hold.
+"""
+import os
+import time
+
+from packager.ccache import Ccache, find_ccache
+from packager.paths import nuitka_cache_dir, state_dir, tree_size
+
+# Downloaded tools are kept: Nuitka would ask interactively to fetch them again
+PROTECTED_CATEGORIES = {"downloads"}
+# Removing single files would break their configuration and size accounting;
+# ccache is trimmed with ccache itself and clcache keeps to its own limit
+COMPILER_CATEGORIES = {"ccache", "clcache"}
+# Files directly in the cache directory
+OTHER_CATEGORY = "other"
+
+
+class NuitkaCache:
+    """A Nuitka cache directory bounded to ``quota_bytes``"""
+
+    def __init__(self, root, quota_bytes):
+        self.root = root
+        self.quota_bytes = quota_bytes
+
+    @classmethod
+    def for_profile(cls, profile, quota_bytes):
+        """The managed cache directory of a profile (see ``command.profile_name``)"""
+        return cls(state_dir("nuitka-cache", profile), quota_bytes)
+
+    def environment(self, base=None):
+        """Return a build environment pointing Nuitka at this cache
+
+        Downloaded tools keep coming from the shared cache, so a new profile
+        does not fetch them again.
+        """
+        env = dict(os.environ if base is None else base)
+        env["NUITKA_CACHE_DIR_DOWNLOADS"] = nuitka_cache_dir("downloads", env)
+        env["NUITKA_CACHE_DIR"] = self.root
+        return env
+
+    def _files(self):
+        """Yield (category, path, size, last_used) for every cached file"""
+        for dirpath, _, filenames in os.walk(self.root):
+            relative = os.path.relpath(dirpath, self.root)
+            category = OTHER_CATEGORY if relative == "." else relative.split(os.sep)[0]
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.lstat(path)
+                except OSError:
+                    continue
+                yield category, path, stat.st_size, max(stat.st_atime, stat.st_mtime)
+
+    def sizes(self):
+        """Bytes used per category"""
+        sizes = {}
+        for category, _, size, _ in self._files():
+            sizes[category] = sizes.get(category, 0) + size
+        return sizes
+
+    def evict(self):
+        """Trim the cache until it fits its quota
+
+        The ccache directory is shrunk in proportion to its share of the
+        cache (when ccache is installed), then least-recently-used files of
+        the other categories are deleted. Returns a dict with sizes (bytes
+        per category after eviction), total, quota, freed, removed and
+        seconds.
+        """
+        started = time.monotonic()
+        sizes = {}
+        candidates = []
+        for category, path, size, last_used in self._files():
+            sizes[category] = sizes.get(category, 0) + size
+            if category not in PROTECTED_CATEGORIES | COMPILER_CATEGORIES:
+                candidates.append((last_used, size, category, path))
+        total = sum(sizes.values())
+
+        freed = removed = 0
+        if total > self.quota_bytes:
+            freed += self._trim_ccache(sizes, total)
+            candidates.sort()
+            for _, size, category, path in candidates:
+                if total - freed <= self.quota_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                freed += size
+                removed += 1
+                sizes[category] -= size
+            self._remove_empty_dirs()
+
+        return {
+            "sizes": sizes,
+            "total": total - freed,
+            "quota": self.quota_bytes,
+            "freed": freed,
+            "removed": removed,
+            "seconds": time.monotonic() - started,
+        }
+
+    def _trim_ccache(self, sizes, total):
+        """Shrink the ccache directory to its share of the quota; return the
+        bytes freed and update ``sizes``"""
+        size = sizes.get("ccache", 0)
+        binary = find_ccache()
+        if not size or not binary:
+            return 0
+        directory = os.path.join(self.root, "ccache")
+        if not Ccache(binary, directory).trim(size * self.quota_bytes // total):
+            return 0
+        sizes["ccache"] = tree_size(directory)
+        return max(size - sizes["ccache"], 0)
+
+    def _remove_empty_dirs(self):
+        for dirpath, _, _ in os.walk(self.root, topdown=False):
+            if dirpath != self.root:
+                try:
+                    os.rmdir(dirpath)  # Fails unless empty
+                except OSError:
+                    pass
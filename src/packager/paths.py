@@ -0,0 +1,117 @@
+"""Locations of the packager's on-disk state (caches, history, indexes)."""
+import os
+import sys
+
+APP_NAME = "nuitka-gui-packager"
+
+# Directories that never hold project sources
+IGNORED_DIRS = {
+    "__pycache__", ".git", ".hg", ".svn", ".tox", ".nox", ".venv", "venv",
+    "node_modules", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+}
+# Nuitka build and output directories
+BUILD_DIR_SUFFIXES = (".build", ".dist", ".onefile-build")
+
+
+def state_dir(*parts):
+    """Return (and create) a directory below the per-user packager state directory"""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    path = os.path.join(base, APP_NAME, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def nuitka_cache_dir(category=None, env=None):
+    """Directory Nuitka caches into, resolved like Nuitka's utils/AppDirs.py
+
+    ``category`` is a cache name such as "ccache" or "downloads", which may be
+    redirected separately with ``NUITKA_CACHE_DIR_<CATEGORY>``.
+    """
+    env = os.environ if env is None else env
+    if category:
+        override = env.get("NUITKA_CACHE_DIR_" + category.replace("-", "_").upper())
+        if override:
+            return override
+    base = env.get("NUITKA_CACHE_DIR")
+    if base:
+        base = os.path.expanduser(base)
+    elif sys.platform.startswith("win"):
+        local = env.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        base = os.path.join(local, "Nuitka", "Nuitka", "Cache")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches/Nuitka")
+    else:
+        base = os.path.join(env.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "Nuitka")
+    return os.path.join(base, category) if category else base
+
+
+def option_value(command, option):
+    """Return the value of ``--option=value`` in an argv, or None"""
+    prefix = option + "="
+    for arg in command:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return None
+
+
+def option_values(command, option):
+    """Return all values of a repeatable ``--option=value`` in an argv"""
+    prefix = option + "="
+    return [arg[len(prefix):] for arg in command if arg.startswith(prefix)]
+
+
+def uses_lto(command):
+    """Whether an argv asks Nuitka for link-time optimization"""
+    return "--lto" in command or option_value(command, "--lto") == "yes"
+
+
+def normalize_path(path):
+    """Canonical form of a path for comparisons"""
+    return os.path.normcase(os.path.realpath(path))
+
+
+def skip_source_dir(path, exclude=frozenset()):
+    """Whether a directory is not part of a project's sources
+
+    ``exclude`` holds additional directories normalized with ``normalize_path``.
+    """
+    name = os.path.basename(path)
+    return (
+        name in IGNORED_DIRS
+        or name.endswith(BUILD_DIR_SUFFIXES)
+        or os.path.exists(os.path.join(path, "pyvenv.cfg"))
+        or (bool(exclude) and normalize_path(path) in exclude)
+    )
+
+
+def source_files(root, exclude=()):
+    """Yield the project files below ``root`` in a stable order"""
+    if os.path.isfile(root):
+        yield root
+        return
+    exclude = {normalize_path(path) for path in exclude}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            name for name in dirnames if not skip_source_dir(os.path.join(dirpath, name), exclude)
+        )
+        for name in sorted(filenames):
+            yield os.path.join(dirpath, name)
+
+
+def tree_size(path):
+    """Total size in bytes of a file or directory tree"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
@@ -0,0 +1,301 @@
+"""Check a build before it starts.
+
+A build that fails at link time because a data directory vanished, no C
+compiler is installed or the output disk filled up has already cost its
+whole compile time. The pre-flight checks look for those causes up front:
+the paths the command refers to, the compiler and linker it selects, free
+disk space against the expected output size, whether the interpreter's
+Nuitka supports its Python version, and option combinations Nuitka rejects.
+The checks are independent, so they run side by side in a thread pool and
+the slowest one (probing the interpreter, unless its answer is cached) sets
+the time the stage takes.
+
+Findings carry a code and the values to describe it with, which the front
+ends turn into messages (see ``describe_finding``).
+"""
+import glob
+import os
+import shlex
+import shutil
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from packager.interpreter import InterpreterError, detect_interpreter
+from packager.paths import nuitka_cache_dir, option_value, option_values
+from packager.progress import format_size
+from packager.toolchain import compiler_family, selected_linker
+
+# Finding severities; errors stop the build
+OK = "ok"
+WARNING = "warning"
+ERROR = "error"
+
+# Checks in reporting order
+CHECKS = ("paths", "compiler", "disk", "nuitka", "options")
+
+# Output size assumed without a previous build, and how much more the build
+# directory (generated C, object files) takes than the output
+DEFAULT_STANDALONE_SIZE = 1024 ** 3
+DEFAULT_ACCELERATED_SIZE = 256 * 1024 ** 2
+BUILD_DIR_FACTOR = 3
+
+# Expected disk use of a build; ``measured`` when it comes from earlier builds
+# rather than the defaults above
+OutputSize = namedtuple("OutputSize", "size measured")
+
+# Finding values shown as sizes
+SIZE_FIELDS = ("free", "needed")
+
+# Options naming a source path, with the separator of their target part
+PATH_OPTIONS = (
+    ("--windows-icon-from-ico", None),
+    ("--include-data-dir", "="),
+    ("--include-data-files", "="),
+    ("--include-raw-dir", "="),
+)
+
+QT_PLUGINS = ("pyside2", "pyside6", "pyqt5", "pyqt6")
+
+
+def _absolute(path, cwd):
+    return os.path.normpath(os.path.join(cwd, os.path.expanduser(path)))
+
+
+def _existing_ancestor(path):
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def output_dir(command, cwd=None):
+    """Absolute output directory of an argv"""
+    cwd = cwd or os.getcwd()
+    return _absolute(option_value(command, "--output-dir") or ".", cwd)
+
+
+def estimate_output_size(command, history=None):
+    """Disk space a build of ``command`` is expected to need, an OutputSize
+
+    The largest output of the project's last successful builds, or a
+    default for the mode without one, plus the build directory.
+    """
+    sizes = []
+    if history is not None:
+        sizes = [row[2] for row in history.trend(os.path.abspath(command[-1]), 5) if row[2]]
+    if sizes:
+        size = max(sizes)
+    elif "--standalone" in command or "--onefile" in command:
+        size = DEFAULT_STANDALONE_SIZE
+    else:
+        size = DEFAULT_ACCELERATED_SIZE
+    return OutputSize(size * BUILD_DIR_FACTOR, bool(sizes))
+
+
+def check_paths(command, cwd, needed, env):
+    """Interpreter, main file, the sources of path options and the output directory"""
+    findings = []
+    interpreter = command[0]
+    if not (os.path.isfile(interpreter) or shutil.which(interpreter)):
+        findings.append((ERROR, "missing_interpreter", {"path": interpreter}))
+
+    main = _absolute(command[-1], cwd)
+    if not (os.path.isfile(main) or ("--module" in command and os.path.isdir(main))):
+        findings.append((ERROR, "missing_main", {"path": main}))
+
+    count = 2
+    for option, separator in PATH_OPTIONS:
+        for value in option_values(command, option):
+            source = value.split(separator, 1)[0] if separator else value
+            count += 1
+            path = _absolute(source, cwd)
+            if not (os.path.exists(path) or glob.glob(path)):
+                findings.append((ERROR, "missing_path", {"option": option, "path": path}))
+
+    directory = output_dir(command, cwd)
+    ancestor = _existing_ancestor(directory)
+    if not os.path.isdir(ancestor) or not os.access(ancestor, os.W_OK):
+        findings.append((ERROR, "output_not_writable", {"path": directory}))
+    return findings or [(OK, "paths_ok", {"count": count})]
+
+
+def _which_cc(env):
+    """The compiler ``CC`` names, else the first of gcc, clang and cc on PATH"""
+    cc = env.get("CC")
+    if cc:
+        try:
+            name = shlex.split(cc)[0]
+        except (ValueError, IndexError):
+            name = cc
+        return shutil.which(name)
+    for name in ("gcc", "clang", "cc"):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _windows_compiler(env):
+    """A compiler Nuitka can use on Windows with ``env``, or None"""
+    for name in ("cl", "gcc", "clang-cl"):
+        path = shutil.which(name)
+        if path:
+            return path
+    base = env.get("ProgramFiles(x86)") or env.get("ProgramFiles") or ""
+    vswhere = os.path.join(base, "Microsoft Visual Studio", "Installer", "vswhere.exe")
+    if os.path.isfile(vswhere):
+        return vswhere
+    # MinGW64 Nuitka downloaded before
+    mingw = glob.glob(os.path.join(nuitka_cache_dir("downloads", env), "gcc", "*", "*", "mingw64", "bin", "gcc.exe"))
+    return mingw[0] if mingw else None
+
+
+def check_compiler(command, cwd, needed, env):
+    """C compiler and linker, and patchelf for standalone builds on Linux"""
+    env = os.environ if env is None else env
+    if sys.platform.startswith("win"):
+        compiler = _windows_compiler(env)
+        if not compiler:
+            return [(WARNING, "compiler_download", {})]
+        return [(OK, "compiler_ok", {"compiler": compiler, "linker": compiler})]
+
+    findings = []
+    compiler = _which_cc(env)
+    if "--clang" in command and not (compiler and compiler_family(compiler) == "clang"):
+        compiler = shutil.which("clang")
+    if not compiler:
+        findings.append((ERROR, "no_clang" if "--clang" in command else "no_compiler", {}))
+    chosen = selected_linker(env)
+    linker = shutil.which(f"ld.{chosen}") if chosen else shutil.which("ld")
+    if not linker:
+        findings.append((ERROR, "missing_linker", {"linker": chosen}) if chosen else (ERROR, "no_linker", {}))
+    standalone = "--standalone" in command or "--onefile" in command
+    if sys.platform.startswith("linux") and standalone and not shutil.which("patchelf"):
+        findings.append((WARNING, "no_patchelf", {}))
+    if compiler and linker:
+        findings.insert(0, (OK, "compiler_ok", {"compiler": compiler, "linker": linker}))
+    return findings
+
+
+def check_disk(command, cwd, needed, env):
+    """Free space below the output directory against the expected size
+
+    Only a size measured on earlier builds makes a shortfall an error; the
+    defaults assumed without one are generous.
+    """
+    directory = _existing_ancestor(output_dir(command, cwd))
+    try:
+        free = shutil.disk_usage(directory).free
+    except OSError:
+        # Reported by the paths check
+        return []
+    info = {"path": directory, "free": free, "needed": needed.size}
+    if not needed.measured:
+        return [(WARNING, "disk_guess", info)] if free < needed.size else [(OK, "disk_ok", info)]
+    if free < needed.size:
+        return [(ERROR, "disk_full", info)]
+    if free < 2 * needed.size:
+        return [(WARNING, "disk_low", info)]
+    return [(OK, "disk_ok", info)]
+
+
+def check_nuitka(command, cwd, needed, env):
+    """Nuitka installed in the interpreter, and supporting its Python version"""
+    try:
+        info = detect_interpreter(command[0])
+    except InterpreterError as e:
+        return [(ERROR, "probe_failed", {"path": command[0], "error": str(e)})]
+    if not info["nuitka"]:
+        return [(ERROR, "no_nuitka", {"path": command[0]})]
+
+    values = {"nuitka": info["nuitka"], "python": info["python"], "release": info["release"]}
+    findings = []
+    if info["release"] not in ("final", "candidate"):
+        findings.append((ERROR, "python_prerelease", values))
+    if info["python"] in info.get("not_yet_supported", ()):
+        findings.append((ERROR, "python_not_yet_supported", values))
+    elif "supported" in info and info["python"] not in info["supported"]:
+        findings.append((WARNING, "python_unsupported", values))
+    compressed = "--onefile" in command and "--onefile-no-compression" not in command
+    if compressed and info.get("zstandard") is False:
+        findings.append((WARNING, "no_zstandard", values))
+    return findings or [(OK, "nuitka_ok", values)]
+
+
+def check_options(command, cwd, needed, env):
+    """Option combinations Nuitka rejects or ignores"""
+    findings = []
+    if "--module" in command:
+        for option in ("--standalone", "--onefile"):
+            if option in command:
+                findings.append((ERROR, "module_standalone", {"option": option}))
+    if "--onefile" not in command:
+        for arg in command[1:-1]:
+            if arg.startswith("--onefile-"):
+                findings.append((WARNING, "onefile_option", {"option": arg.split("=", 1)[0]}))
+    qt = [plugin for plugin in option_values(command, "--enable-plugin") if plugin in QT_PLUGINS]
+    if len(qt) > 1:
+        findings.append((ERROR, "qt_plugins", {"plugins": ", ".join(qt)}))
+    included = option_values(command, "--include-package") + option_values(command, "--include-module")
+    for name in option_values(command, "--nofollow-import-to"):
+        if any(value == name or value.startswith(name + ".") for value in included):
+            findings.append((WARNING, "include_nofollow", {"name": name}))
+    main = command[-1]
+    if "--module" not in command and not main.lower().endswith((".py", ".pyw")):
+        findings.append((WARNING, "main_suffix", {"path": main}))
+    return findings or [(OK, "options_ok", {})]
+
+
+_CHECK_FUNCTIONS = {
+    "paths": check_paths,
+    "compiler": check_compiler,
+    "disk": check_disk,
+    "nuitka": check_nuitka,
+    "options": check_options,
+}
+
+
+def preflight(command, cwd=None, needed=None, env=None):
+    """Run every check on a Nuitka argv concurrently
+
+    ``needed`` is the disk space the build is expected to take (an
+    OutputSize, see ``estimate_output_size``), ``env`` the environment it runs with (which
+    may select the compiler and linker). Returns a dict with findings
+    (dicts with check, severity, code and info, in CHECKS order), errors
+    and warnings (counts) and seconds.
+    """
+    started = time.monotonic()
+    cwd = cwd or os.getcwd()
+    if needed is None:
+        needed = estimate_output_size(command)
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as pool:
+        futures = {check: pool.submit(_CHECK_FUNCTIONS[check], command, cwd, needed, env) for check in CHECKS}
+        findings = []
+        for check in CHECKS:
+            try:
+                results = futures[check].result()
+            except Exception as e:
+                results = [(ERROR, "check_failed", {"error": f"{type(e).__name__}: {e}"})]
+            findings += [
+                {"check": check, "severity": severity, "code": code, "info": info}
+                for severity, code, info in results
+            ]
+    return {
+        "findings": findings,
+        "errors": sum(finding["severity"] == ERROR for finding in findings),
+        "warnings": sum(finding["severity"] == WARNING for finding in findings),
+        "seconds": time.monotonic() - started,
+    }
+
+
+def describe_finding(finding, messages):
+    """Message of a finding, from ``messages`` ({code: format string})"""
+    info = {
+        key: format_size(value) if key in SIZE_FIELDS else value
+        for key, value in finding["info"].items()
+    }
+    return messages[finding["code"]].format(**info)
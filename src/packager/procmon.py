@@ -0,0 +1,249 @@
+"""Sample CPU, memory and I/O of a build's whole process tree from /proc.
+
+Nuitka runs scons, which runs one compiler process per C file; the
+top-level process alone says little about what a build costs. The monitor
+walks every descendant of the build process on each sample and splits the
+CPU time it sees between the Nuitka front-end, scons, the C compilers and
+anything else.
+
+Linux only: ``procfs_available()`` tells whether a monitor can be used.
+"""
+import os
+import re
+import sys
+import time
+
+SAMPLE_INTERVAL = 1.0
+
+# Categories of build processes, in reporting order
+CATEGORIES = ("nuitka", "scons", "compilers", "other")
+
+# Compiler drivers and the tools they run (cc1, as, ld, lto1, ...)
+_COMPILER_RE = re.compile(
+    r"^(?:ccache|sccache|cc|c\+\+|cpp|cc1\w*|as|ld(?:\.\w+)?|collect2|lto1|lto-wrapper|"
+    r".*gcc(?:-[\d.]+)?|.*g\+\+(?:-[\d.]+)?|.*clang(?:\+\+)?(?:-[\d.]+)?)$"
+)
+
+
+def procfs_available():
+    return sys.platform.startswith("linux") and os.path.isdir("/proc/self")
+
+
+class _Process:
+    """One process of the tree as read from /proc/<pid>"""
+    __slots__ = ("pid", "ppid", "start", "name", "state", "cpu", "child_cpu", "rss", "read_bytes", "write_bytes")
+
+    def __init__(self, pid, stat):
+        # The name is in parentheses and may itself contain spaces and parentheses
+        name_end = stat.rindex(")")
+        fields = stat[name_end + 2:].split()
+        self.pid = pid
+        self.name = stat[stat.index("(") + 1:name_end]
+        self.state = fields[0]
+        self.ppid = int(fields[1])
+        self.cpu = int(fields[11]) + int(fields[12])
+        self.child_cpu = int(fields[13]) + int(fields[14])
+        self.start = int(fields[19])
+        self.rss = int(fields[21])
+        self.read_bytes = 0
+        self.write_bytes = 0
+
+
+class ProcessTreeMonitor:
+    """Aggregate resource usage of ``pid`` and all of its descendants
+
+    Call ``sample()`` about once per ``SAMPLE_INTERVAL`` while the build runs
+    (``due()`` tells when) and ``finish()`` once it has been waited for.
+    Samples are dicts with ``cpu_percent`` (100 per busy core), ``rss`` and
+    ``peak_rss`` (bytes, summed over the tree, so shared pages count more
+    than once), ``read_bytes``/``write_bytes`` (storage I/O so far) and
+    ``processes``.
+
+    CPU time is cumulative: every process's own time plus the time of the
+    children it has reaped, so compilers that start and exit between two
+    samples are still counted. Their time is attributed by the parent that
+    reaped them: children of scons or of a compiler driver count as
+    compilers, others as "other".
+    """
+
+    def __init__(self, pid, interval=SAMPLE_INTERVAL, clock=time.monotonic):
+        self.pid = pid
+        self.interval = interval
+        self.clock = clock
+        self.ticks_per_second = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.cpu_ticks = dict.fromkeys(CATEGORIES, 0)
+        self.peak_rss = 0
+        # Largest resident set of a single process per category
+        self.largest_rss = dict.fromkeys(CATEGORIES, 0)
+        # The tree as of the last sample, {(pid, start): process}
+        self.processes = {}
+        self.read_bytes = 0
+        self.write_bytes = 0
+        # Keyed by (pid, start time) so reused pids are not confused:
+        # (cpu, child_cpu) at the previous sample, parent key, category
+        self._known = {}
+        self._parents = {}
+        self._categories = {}
+        self._last_total = 0
+        self._last_sample = None
+
+    def due(self):
+        return self._last_sample is None or self.clock() - self._last_sample >= self.interval
+
+    def cpu_seconds(self):
+        """CPU seconds per category so far"""
+        return {category: ticks / self.ticks_per_second for category, ticks in self.cpu_ticks.items()}
+
+    def sample(self):
+        """Read the process tree once and return the aggregate sample"""
+        now = self.clock()
+        processes = self._tree()
+        counted = self._forget_exited(processes)
+        for key, process in processes.items():
+            self._account(key, process, counted.get(key, 0))
+
+        total = sum(process.cpu + process.child_cpu for process in processes.values())
+        cpu_percent = 0.0
+        if self._last_sample is not None and now > self._last_sample:
+            cpu_percent = max(0, total - self._last_total) / self.ticks_per_second / (now - self._last_sample) * 100
+        self._last_total = max(total, self._last_total)
+        self._last_sample = now
+
+        self.processes = processes
+        for key, process in processes.items():
+            category = self._categories[key]
+            self.largest_rss[category] = max(self.largest_rss[category], process.rss * self.page_size)
+        rss = sum(process.rss for process in processes.values()) * self.page_size
+        self.peak_rss = max(self.peak_rss, rss)
+        # Like CPU time, I/O of reaped children is added to the reaping parent
+        self.read_bytes = max(self.read_bytes, sum(process.read_bytes for process in processes.values()))
+        self.write_bytes = max(self.write_bytes, sum(process.write_bytes for process in processes.values()))
+        return {
+            "cpu_percent": cpu_percent,
+            "rss": rss,
+            "peak_rss": self.peak_rss,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+            "processes": len(processes),
+        }
+
+    def finish(self, total_cpu_seconds=None):
+        """Return the CPU seconds per category of the finished build
+
+        ``total_cpu_seconds`` is the exact CPU time of the whole tree (from
+        wait4()); what the samples did not see, the last moments of the
+        front-end after the final sample, is added to "nuitka".
+        """
+        if total_cpu_seconds is not None:
+            missing = total_cpu_seconds * self.ticks_per_second - sum(self.cpu_ticks.values())
+            if missing > 0:
+                self.cpu_ticks["nuitka"] += missing
+        return self.cpu_seconds()
+
+    # ----- reading /proc -----
+
+    def _tree(self):
+        """Return {(pid, start): _Process} of the root and its descendants"""
+        processes = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                process = self._read(int(entry))
+                if process is not None:
+                    processes[process.pid] = process
+        children = {}
+        for process in processes.values():
+            children.setdefault(process.ppid, []).append(process)
+        tree = {}
+        pending = [processes[self.pid]] if self.pid in processes else []
+        while pending:
+            process = pending.pop()
+            key = (process.pid, process.start)
+            tree[key] = process
+            for child in children.get(process.pid, ()):
+                self._parents.setdefault((child.pid, child.start), key)
+                pending.append(child)
+        for process in tree.values():
+            self._read_io(process)
+        return tree
+
+    @staticmethod
+    def _read(pid):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                return _Process(pid, f.read())
+        except (OSError, ValueError, IndexError):
+            # Exited while scanning
+            return None
+
+    @staticmethod
+    def _read_io(process):
+        try:
+            with open(f"/proc/{process.pid}/io") as f:
+                for line in f:
+                    key, _, value = line.partition(":")
+                    if key == "read_bytes":
+                        process.read_bytes = int(value)
+                    elif key == "write_bytes":
+                        process.write_bytes = int(value)
+        except (OSError, ValueError):
+            pass
+
+    # ----- CPU attribution -----
+
+    def category(self, key):
+        """Category of a process of the last sample"""
+        return self._categories.get(key, "other")
+
+    def _category(self, key, process):
+        category = self._categories.get(key)
+        if category is None:
+            if process.pid == self.pid:
+                category = "nuitka"
+            elif _COMPILER_RE.match(process.name):
+                category = "compilers"
+            elif process.name.startswith("python"):
+                category = "scons" if "scons" in self._cmdline(process.pid) else "nuitka"
+            else:
+                category = "other"
+            self._categories[key] = category
+        return category
+
+    @staticmethod
+    def _cmdline(pid):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                return os.fsdecode(f.read().replace(b"\0", b" "))
+        except OSError:
+            return ""
+
+    def _forget_exited(self, processes):
+        """Drop processes that exited since the previous sample
+
+        Returns {key: ticks} of the time already counted for them, per
+        nearest live ancestor, whose reaped-children time now includes it.
+        """
+        counted = {}
+        for key in [key for key in self._known if key not in processes]:
+            cpu, child_cpu = self._known[key]
+            ancestor = self._parents.get(key)
+            while ancestor is not None and ancestor not in processes:
+                ancestor = self._parents.get(ancestor)
+            if ancestor is not None:
+                counted[ancestor] = counted.get(ancestor, 0) + cpu + child_cpu
+        for key in [key for key in self._known if key not in processes]:
+            del self._known[key]
+            self._categories.pop(key, None)
+        self._parents = {key: parent for key, parent in self._parents.items() if key in processes}
+        return counted
+
+    def _account(self, key, process, counted):
+        """Add the CPU time a process used since the previous sample"""
+        category = self._category(key, process)
+        previous_cpu, previous_child_cpu = self._known.get(key, (0, 0))
+        self.cpu_ticks[category] += max(0, process.cpu - previous_cpu)
+        # Time of reaped children not already counted while they were alive
+        reaped = process.child_cpu - previous_child_cpu - counted
+        if reaped > 0:
+            self.cpu_ticks["compilers" if category in ("scons", "compilers") else "other"] += reaped
+        self._known[key] = (process.cpu, process.child_cpu)
@@ -0,0 +1,281 @@
+"""Derive real build progress from the Nuitka output stream."""
+import math
+import os
+import re
+import time
+import unicodedata
+
+# Build phases in order, with the share of the progress bar each one covers
+PHASES = (
+    ("starting", 0, 2),
+    ("python", 2, 40),
+    ("codegen", 40, 45),
+    ("c_compile", 45, 88),
+    ("link", 88, 93),
+    ("postprocess", 93, 95),
+    ("onefile", 95, 99),
+    ("done", 100, 100),
+)
+_PHASE_RANGES = {name: (start, end) for name, start, end in PHASES}
+_PHASE_ORDER = {name: index for index, (name, _, _) in enumerate(PHASES)}
+
+# C files Scons compiles besides one per module (constants, helpers, loader, main program ...)
+STATIC_C_FILES = 6
+# Assumed seconds per C file when no per-file output is available (no --show-scons)
+SECONDS_PER_C_FILE = 1.5
+
+_PASS_RE = re.compile(r"^Nuitka-Progress: PASS (\d+):")
+_MODULE_RE = re.compile(r"^Nuitka-Progress: Optimizing module '([^']+)', (\d+) more modules? to go")
+_COUNTER_RE = re.compile(r"(?:\[\s*|\|\s*)(\d+)\s*/\s*(\d+)(?:\s*\]|\s*\[)")
+_LINK_RE = re.compile(r"C linking(?: with (\d+) files)?")
+_JOBS_RE = re.compile(r"run compilation on (\d+) CPUs")
+_COMPILER_RE = re.compile(r"^(?:ccache|sccache|cl|cc|zig|.*gcc(?:-[\d.]+)?|.*clang(?:-[\d.]+)?)(?:\.exe)?$", re.I)
+
+
+def format_duration(seconds):
+    """Format seconds as M:SS or H:MM:SS"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def format_latency(seconds):
+    """Format a short duration in milliseconds, or seconds from ten seconds on"""
+    if seconds >= 10:
+        return f"{seconds:.1f} s"
+    return f"{seconds * 1000:.1f} ms"
+
+
+def format_size(size):
+    """Format a byte count with a binary unit"""
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _display_width(text):
+    """Columns taken by text in a monospace font (CJK characters take two)"""
+    return sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+
+
+def format_table(rows):
+    """Align rows of cells into text lines; the first column is left-aligned, the rest right-aligned"""
+    widths = [max(_display_width(row[column]) for row in rows) for column in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        cells = []
+        for column, (cell, width) in enumerate(zip(row, widths)):
+            padding = " " * (width - _display_width(cell))
+            cells.append(cell + padding if column == 0 else padding + cell)
+        lines.append("  ".join(cells).rstrip())
+    return lines
+
+
+def format_phase_summary(phases, total, labels, headings):
+    """Lines of a table with the time spent per phase
+
+    ``labels`` maps phase names to display names; ``headings`` gives the
+    (phase, time, share, total) captions.
+    """
+    phase_heading, time_heading, share_heading, total_label = headings
+    rows = [(phase_heading, time_heading, share_heading)]
+    # Phases are listed in build order (dicts passed through Qt signals come back sorted by key)
+    for phase in sorted(phases, key=_PHASE_ORDER.get):
+        seconds = phases[phase]
+        share = f"{seconds / total:.0%}" if total else "-"
+        rows.append((labels.get(phase, phase), f"{seconds:.1f} s", share))
+    rows.append((total_label, f"{total:.1f} s", "100%"))
+    return format_table(rows)
+
+
+def is_compile_command(line):
+    """Whether a --show-scons output line is a C compiler invocation for one object file"""
+    if " -c " not in line and " /c " not in line:
+        return False
+    tokens = line.split(None, 2)
+    if not tokens:
+        return False
+    return bool(_COMPILER_RE.match(os.path.basename(tokens[0].strip('"'))))
+
+
+class ProgressTracker:
+    """Map Nuitka output lines to a phase, a percentage and an ETA
+
+    ``feed`` is called for every output line, ``tick`` periodically so that
+    phases without per-item output still advance by elapsed time. Both return
+    True when the visible state changed.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.started_at = clock()
+        self.phase = "starting"
+        self.percent = 0
+        self.eta = None
+        # Seconds spent in each finished phase
+        self.phase_times = {}
+        # Parallel C compile jobs reported by Scons
+        self.jobs = os.cpu_count() or 1
+        self._phase_started = self.started_at
+        self._fraction = 0.0
+        # Python phase state
+        self._pass = 1
+        self._pass1_done = set()
+        self._pass1_total = 0
+        self._pass_done = 0
+        # C phase state
+        self._c_done = 0
+        self._c_total = None
+        self._c_counted = False
+
+    # ----- input -----
+
+    def feed(self, line):
+        line = line.strip()
+        if not line:
+            return False
+
+        if _PASS_RE.match(line):
+            self._enter("python")
+            self._pass = int(_PASS_RE.match(line).group(1))
+            self._pass_done = 0
+            return self._update_python()
+
+        match = _MODULE_RE.match(line)
+        if match:
+            self._enter("python")
+            name, remaining = match.group(1), int(match.group(2))
+            if self._pass == 1:
+                self._pass1_done.add(name)
+                self._pass1_total = max(self._pass1_total, len(self._pass1_done) + remaining)
+            else:
+                self._pass_done += 1
+            return self._update_python()
+
+        if line.startswith("Nuitka: Completed Python level compilation") or \
+                line.startswith("Nuitka: Generating source code for C backend"):
+            return self._enter("codegen")
+
+        if line.startswith("Nuitka: Running C compilation via Scons"):
+            return self._enter("c_compile")
+
+        match = _JOBS_RE.search(line)
+        if match:
+            self.jobs = max(1, int(match.group(1)))
+            return False
+
+        if self.phase in ("codegen", "c_compile"):
+            match = _LINK_RE.search(line)
+            if match and line.startswith("Nuitka-Scons"):
+                if match.group(1):
+                    self._c_done = self._c_total = int(match.group(1))
+                return self._enter("link")
+
+            match = _COUNTER_RE.search(line)
+            if match and int(match.group(2)) > 0:
+                self._enter("c_compile")
+                self._c_done, self._c_total = int(match.group(1)), int(match.group(2))
+                self._c_counted = True
+                return self._set_fraction(self._c_done / self._c_total)
+
+            if is_compile_command(line):
+                self._enter("c_compile")
+                self._c_done += 1
+                self._c_counted = True
+                return self._set_fraction(self._c_done / self._expected_c_files())
+
+        if line.startswith("Nuitka: Successfully created"):
+            return self._enter("done")
+
+        if line.startswith("Nuitka-Onefile"):
+            return self._enter("onefile")
+
+        if self.phase == "link" and (line.startswith("Nuitka-") or line.startswith("Nuitka:")) \
+                and not line.startswith("Nuitka-Scons"):
+            return self._enter("postprocess")
+
+        if line.startswith("Nuitka-Postprocessing"):
+            return self._enter("postprocess")
+
+        return False
+
+    def tick(self):
+        """Advance time-based estimates for phases with no per-item output"""
+        now = self.clock()
+        elapsed = now - self._phase_started
+        if self.phase == "c_compile" and not self._c_counted:
+            # Approach, but never reach, the end of the phase
+            expected = self._expected_c_files() * SECONDS_PER_C_FILE / self.jobs
+            return self._set_fraction(0.95 * (1 - math.exp(-elapsed / max(expected, 1.0))))
+        if self.phase in ("codegen", "link", "postprocess", "onefile"):
+            return self._set_fraction(0.9 * (1 - math.exp(-elapsed / 20.0)))
+        return self._refresh_eta()
+
+    def durations(self):
+        """Seconds spent per phase so far, including the current one"""
+        durations = dict(self.phase_times)
+        if self.phase != "done":
+            durations[self.phase] = durations.get(self.phase, 0.0) + self.clock() - self._phase_started
+        return durations
+
+    # ----- state -----
+
+    def _expected_c_files(self):
+        expected = len(self._pass1_done) + STATIC_C_FILES
+        if self._c_total:
+            expected = self._c_total
+        return max(expected, self._c_done + 1)
+
+    def _update_python(self):
+        if self._pass == 1:
+            fraction = 0.7 * len(self._pass1_done) / max(self._pass1_total, 1)
+        else:
+            # Later passes are cheaper; each one covers half of the remaining share
+            base = 0.7 + 0.3 * (1 - 0.5 ** (self._pass - 2))
+            span = 0.3 * 0.5 ** (self._pass - 1)
+            fraction = base + span * self._pass_done / max(len(self._pass1_done), 1)
+        return self._set_fraction(fraction)
+
+    def _enter(self, phase):
+        if phase == self.phase:
+            return False
+        order = [name for name, _, _ in PHASES]
+        if order.index(phase) < order.index(self.phase):
+            # Never move backwards (e.g. scons output after post-processing started)
+            return False
+        now = self.clock()
+        self.phase_times[self.phase] = self.phase_times.get(self.phase, 0.0) + now - self._phase_started
+        self.phase = phase
+        self._phase_started = now
+        self._fraction = 0.0
+        return self._set_fraction(0.0, force=True)
+
+    def _set_fraction(self, fraction, force=False):
+        fraction = min(max(fraction, self._fraction), 1.0)
+        self._fraction = fraction
+        start, end = _PHASE_RANGES[self.phase]
+        percent = int(start + (end - start) * fraction)
+        changed = force or percent != self.percent
+        self.percent = max(self.percent, percent)
+        return self._refresh_eta() or changed
+
+    def _refresh_eta(self):
+        """Update the ETA from overall progress rate; returns True if it changed"""
+        if self.phase == "done":
+            eta = 0.0
+        elif self.percent < 3:
+            eta = None
+        else:
+            elapsed = self.clock() - self.started_at
+            estimate = elapsed * (100 - self.percent) / self.percent
+            # Smooth out jumps between phases
+            eta = estimate if self.eta is None else 0.8 * self.eta + 0.2 * estimate
+        changed = (eta is None) != (self.eta is None) or \
+            (eta is not None and abs(eta - (self.eta or 0)) >= 1)
+        self.eta = eta
+        return changed
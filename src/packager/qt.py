@@ -0,0 +1,400 @@
+"""Qt widgets shared by the GUI front-ends.
+
+This is the only module in the package that imports PySide6.
+"""
+import os
+import shlex
+import time
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPointF, Qt, QThread, Signal
+from PySide6.QtGui import QColor, QKeySequence, QPainter, QPalette, QPen, QPolygonF
+from PySide6.QtWidgets import QAbstractScrollArea, QApplication, QWidget
+
+from packager.history import ROW_COLUMNS
+from packager.logstore import SpillingLogBuffer
+from packager.progress import format_duration, format_latency, format_size
+
+
+class BackgroundTask(QThread):
+    """Run a function off the GUI thread and emit its result
+
+    ``result_signal`` carries the return value; exceptions are reported as
+    text through ``error_signal``.
+    """
+    result_signal = Signal(object)
+    error_signal = Signal(str)
+
+    def __init__(self, function, *args, parent=None):
+        super().__init__(parent)
+        self.function = function
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.function(*self.args)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+        else:
+            self.result_signal.emit(result)
+
+
+class LogView(QAbstractScrollArea):
+    """Virtualized log view over a SpillingLogBuffer
+
+    Only the lines currently visible are fetched and painted, so appending is
+    O(batch) and memory stays bounded by the buffer's in-memory tail no matter
+    how long the log grows. Lines can be selected with the mouse and copied.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = SpillingLogBuffer()
+        self._max_chars = 0
+        self._anchor = None
+        self._cursor = None
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.verticalScrollBar().setSingleStep(1)
+        self._update_scroll_ranges()
+
+    # ----- content -----
+
+    def append_lines(self, lines):
+        """Append lines, following the tail only if the view is already at the bottom"""
+        if any("\n" in line for line in lines):
+            lines = "\n".join(lines).split("\n")
+        if not lines or self.buffer.closed:
+            # Batches queued before the window closed may arrive after close_buffer
+            return
+        scroll_bar = self.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+        self.buffer.append_lines(lines)
+        self._max_chars = max(self._max_chars, max(len(line) for line in lines))
+        self._update_scroll_ranges()
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+        self.viewport().update()
+
+    def clear(self):
+        self.buffer.clear()
+        self._max_chars = 0
+        self._anchor = self._cursor = None
+        self._update_scroll_ranges()
+        self.viewport().update()
+
+    def close_buffer(self):
+        """Release the spill file backing the view"""
+        self.buffer.close()
+
+    def selected_text(self):
+        if self._anchor is None:
+            return ""
+        first, last = sorted((self._anchor, self._cursor))
+        last = min(last, len(self.buffer) - 1)
+        return "\n".join(self.buffer.line(number) for number in range(first, last + 1))
+
+    # ----- geometry -----
+
+    def _line_height(self):
+        return self.fontMetrics().lineSpacing()
+
+    def _visible_lines(self):
+        return max(1, self.viewport().height() // self._line_height())
+
+    def _update_scroll_ranges(self):
+        self.verticalScrollBar().setRange(0, max(0, len(self.buffer) - self._visible_lines()))
+        self.verticalScrollBar().setPageStep(self._visible_lines())
+        text_width = self._max_chars * self.fontMetrics().horizontalAdvance("M")
+        self.horizontalScrollBar().setRange(0, max(0, text_width - self.viewport().width()))
+        self.horizontalScrollBar().setPageStep(self.viewport().width())
+
+    def _line_at(self, y):
+        return self.verticalScrollBar().value() + max(0, y) // self._line_height()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scroll_ranges()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        self._update_scroll_ranges()
+
+    # ----- painting -----
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        palette = self.palette()
+        line_height = self._line_height()
+        ascent = self.fontMetrics().ascent()
+        x = -self.horizontalScrollBar().value()
+        first = self.verticalScrollBar().value()
+        last = min(len(self.buffer), first + self._visible_lines() + 1)
+        selection = sorted((self._anchor, self._cursor)) if self._anchor is not None else None
+
+        for row, number in enumerate(range(first, last)):
+            y = row * line_height
+            if selection and selection[0] <= number <= selection[1]:
+                painter.fillRect(0, y, self.viewport().width(), line_height, palette.color(QPalette.Highlight))
+                painter.setPen(palette.color(QPalette.HighlightedText))
+            else:
+                painter.setPen(palette.color(QPalette.Text))
+            painter.drawText(x, y + ascent, self.buffer.line(number))
+
+    # ----- selection -----
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and len(self.buffer):
+            line = min(self._line_at(event.position().y()), len(self.buffer) - 1)
+            if not (event.modifiers() & Qt.ShiftModifier) or self._anchor is None:
+                self._anchor = line
+            self._cursor = line
+            self.viewport().update()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton and self._anchor is not None:
+            self._cursor = min(self._line_at(event.position().y()), len(self.buffer) - 1)
+            self.viewport().update()
+        super().mouseMoveEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            QApplication.clipboard().setText(self.selected_text())
+            return
+        if event.matches(QKeySequence.SelectAll) and len(self.buffer):
+            self._anchor, self._cursor = 0, len(self.buffer) - 1
+            self.viewport().update()
+            return
+        super().keyPressEvent(event)
+
+
+class HistoryModel(QAbstractTableModel):
+    """Table of recorded builds, newest first, fetched from a BuildHistory page by page
+
+    Only the row count is queried up front; views pull further rows through
+    ``fetchMore`` as they are scrolled into view, so opening a history with
+    thousands of builds costs one page. ``headers`` are the captions of
+    COLUMNS and ``results`` maps "succeeded", "failed" and "cached" to the
+    text of the result column.
+    """
+    COLUMNS = ("started_at", "project", "duration", "peak_rss", "startup", "artifact_size", "result", "command")
+    PAGE_SIZE = 200
+
+    def __init__(self, history, headers, results, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.headers = headers
+        self.results = results
+        self.project = None
+        self._rows = []
+        self._total = 0
+        self.refresh()
+
+    def set_project(self, project):
+        """Only list the builds of ``project`` (None lists all)"""
+        self.project = project
+        self.refresh()
+
+    def refresh(self):
+        """Drop the fetched rows and start again from the newest build"""
+        self.beginResetModel()
+        self._rows = []
+        self._total = self.history.count(self.project)
+        self.endResetModel()
+
+    def build(self, row):
+        """The record at ``row`` as a dict keyed by ROW_COLUMNS"""
+        return dict(zip(ROW_COLUMNS, self._rows[row]))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        rows = self.history.rows(len(self._rows), self.PAGE_SIZE, self.project)
+        if not rows:
+            # Builds were removed since the count was taken
+            self._total = len(self._rows)
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        build = self.build(index.row())
+        column = self.COLUMNS[index.column()]
+        if role == Qt.DisplayRole:
+            return self._display(build, column)
+        if role == Qt.ToolTipRole and column in ("project", "command"):
+            return build["project"] if column == "project" else shlex.join(build["argv"])
+        if role == Qt.ForegroundRole and column == "result" and build["exit_code"] != 0:
+            return QColor("#d9534f")
+        if role == Qt.TextAlignmentRole and column in ("duration", "peak_rss", "startup", "artifact_size"):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def _display(self, build, column):
+        if column == "started_at":
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(build["started_at"]))
+        if column == "project":
+            return os.path.basename(build["project"])
+        if column == "duration":
+            return format_duration(build["duration"])
+        if column in ("peak_rss", "artifact_size"):
+            return "-" if build[column] is None else format_size(build[column])
+        if column == "startup":
+            return "-" if build["startup"] is None else format_latency(build["startup"])
+        if column == "result":
+            if build["exit_code"] != 0:
+                return f"{self.results['failed']} ({build['exit_code']})"
+            return self.results["cached" if build["cache_hit"] else "succeeded"]
+        return shlex.join(build["argv"])
+
+
+class TrendChart(QWidget):
+    """Line chart of one measurement over successive builds
+
+    ``formatter`` turns a value into the text of the axis labels and
+    ``caption`` is formatted with ``count`` and ``latest`` below the chart.
+    Points without a value (e.g. peak memory of builds recorded before it
+    was measured) are skipped.
+    """
+
+    def __init__(self, title, formatter, caption, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.formatter = formatter
+        self.caption = caption
+        self.values = []
+        self.setMinimumHeight(140)
+
+    def set_values(self, values):
+        self.values = [value for value in values if value is not None]
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        palette = self.palette()
+        metrics = self.fontMetrics()
+        line_height = metrics.lineSpacing()
+        painter.setPen(palette.color(QPalette.Text))
+        painter.drawText(0, metrics.ascent(), self.title)
+        if not self.values:
+            return
+
+        low, high = min(self.values), max(self.values)
+        labels = [self.formatter(high), self.formatter(low)]
+        left = max(metrics.horizontalAdvance(label) for label in labels) + 8
+        top = line_height + 4
+        width = self.width() - left - 8
+        height = self.height() - top - line_height
+        if width <= 0 or height <= 0:
+            return
+
+        painter.setPen(palette.color(QPalette.Mid))
+        painter.drawRect(left, top, width, height)
+        painter.setPen(palette.color(QPalette.Text))
+        painter.drawText(0, top + metrics.ascent(), labels[0])
+        painter.drawText(0, top + height, labels[1])
+        caption = self.caption.format(count=len(self.values), latest=self.formatter(self.values[-1]))
+        painter.drawText(left, top + height + metrics.ascent() + 2, caption)
+
+        span = (high - low) or 1
+        step = width / max(len(self.values) - 1, 1)
+        points = QPolygonF([
+            QPointF(left + index * step, top + height - (value - low) / span * height)
+            for index, value in enumerate(self.values)
+        ])
+        painter.setPen(QPen(palette.color(QPalette.Highlight), 2))
+        painter.drawPolyline(points)
+        if step >= 6:
+            for point in points:
+                painter.drawEllipse(point, 2.5, 2.5)
+
+
+class SizeTableModel(QAbstractTableModel):
+    """Sortable table of size contributors, one dict per row
+
+    ``columns`` are keys of the row dicts. "size" is shown as a size,
+    "share" as the percentage of ``total`` it makes up and "seconds" as a
+    duration; values of the "kind" column, and names of grouped rows named
+    after their kind, are translated through ``labels``.
+    """
+    NUMERIC = ("files", "modules", "importers", "compiled", "size", "share", "seconds")
+
+    def __init__(self, columns, headers, labels=None, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.headers = headers
+        self.labels = labels or {}
+        self.total = 0
+        self._rows = []
+
+    def set_rows(self, rows, total):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.total = total
+        self.endResetModel()
+
+    def row(self, row):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = self.columns[index.column()]
+        if role == Qt.DisplayRole:
+            if column == "size":
+                return format_size(row["size"])
+            if column == "share":
+                return f"{row['size'] / self.total:.1%}" if self.total else "-"
+            if column == "seconds":
+                return f"{row['seconds']:.2f} s"
+            if column == "kind" or (column == "name" and row["name"] == row.get("kind")):
+                return self.labels.get(row[column], row[column])
+            return str(row[column])
+        if role == Qt.ToolTipRole and "path" in row:
+            return row["path"]
+        if role == Qt.TextAlignmentRole and column in self.NUMERIC:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        key = self.columns[column]
+        if key == "share":
+            key = "size"
+
+        def sort_key(row):
+            if key in self.NUMERIC:
+                return row[key]
+            return (self.labels.get(row[key], row[key]) if key == "kind" else str(row[key])).lower()
+
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=sort_key, reverse=order == Qt.DescendingOrder)
+        self.layoutChanged.emit()
@@ -0,0 +1,405 @@
+"""Run one Nuitka build and report its output, throughput and progress."""
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+from packager.artifact_cache import CacheError, build_outputs
+from packager.ccache import build_savings, find_ccache
+from packager.compile_report import C_PHASES, ReportError, build_dir, c_source_sizes, parse_report, with_report
+from packager.logstream import LineBatcher
+from packager.paths import option_value, tree_size, uses_lto
+from packager.procmon import ProcessTreeMonitor, procfs_available
+from packager.progress import ProgressTracker
+from packager.warm_build import BuildDirBusy, warm_command
+
+
+class BuildRunner:
+    """Run a build command, feeding batched output through the progress tracker
+
+    Callbacks are invoked from the thread calling ``run``:
+
+    - ``on_lines(lines)`` for every non-empty output batch
+    - ``on_rate(lines_per_second)`` when the measured throughput changes
+    - ``on_progress(percent, phase, eta)`` when progress changes; ``eta`` is
+      None while unknown
+    - ``on_resources(sample)`` about once a second with the CPU, memory and
+      I/O of the whole build process tree (see ProcessTreeMonitor); only
+      where /proc is available
+    - ``on_event(event, info)`` for notable steps that front-ends describe in
+      their own language; ``info`` is a dict:
+
+      - ``cache_hit``: key, artifacts, size, seconds
+      - ``cache_miss``: key, seconds
+      - ``cache_stored``: size, evicted
+      - ``cache_skipped``: reason
+      - ``ccache_stats``: hits, misses, hit_rate, bytes_saved, seconds_saved
+      - ``nuitka_cache``: sizes, total, quota, freed, removed, seconds
+      - ``memory_plan``: jobs, requested, low_memory, available,
+        compiler_rss, measured (see MemoryGovernor.plan)
+      - ``compilers_paused`` / ``compilers_resumed``: available, paused
+      - ``resource_summary``: cpu_seconds ({category: seconds}, see
+        procmon.CATEGORIES), peak_rss, read_bytes, write_bytes
+      - ``build_summary``: phases ({phase: seconds} in order), total,
+        artifact_size (None unless the build succeeded), peak_rss (bytes,
+        None where unknown), build_id
+      - ``history_skipped``: reason
+      - ``compilation_report``: report (see compile_report.parse_report)
+      - ``report_skipped``: reason
+      - ``build_dir``: directory, warm, reason, cold_seconds (see
+        WarmBuildDirs.prepare), ccache (whether ccache compiles the build)
+      - ``build_dir_summary``: warm, seconds, cold_seconds (of the last
+        build that started cold, None for this one), moved_seconds
+      - ``build_dir_skipped``: reason
+
+    With an ``artifact_cache`` the build is looked up before running and its
+    artifacts stored after a successful run. With a ``ccache`` its statistics
+    are compared before and after the build; ``env`` should then come from
+    ``ccache.environment()``. With a ``nuitka_cache`` it is evicted down to
+    its quota before the build; ``env`` should then point Nuitka at it. With
+    a ``history`` every finished build is recorded. With a ``governor``
+    (a MemoryGovernor) ``--jobs`` is sized to the available memory before
+    the build and compilers are paused while memory runs low. With
+    ``warm_dirs`` (WarmBuildDirs) Nuitka builds in the warm build directory
+    of the output directory and the artifacts are moved into the output
+    directory afterwards.
+
+    Every build asks Nuitka for a compilation report in a temporary file,
+    which is read into ``compilation_report`` and removed afterwards.
+    """
+
+    def __init__(self, command, env=None, cwd=None, on_lines=None, on_rate=None, on_progress=None,
+                 on_event=None, artifact_cache=None, ccache=None, nuitka_cache=None,
+                 history=None, on_resources=None, governor=None, warm_dirs=None):
+        self.command = command
+        self.env = env
+        self.cwd = cwd
+        self.on_lines = on_lines
+        self.on_rate = on_rate
+        self.on_progress = on_progress
+        self.on_event = on_event
+        self.on_resources = on_resources
+        self.artifact_cache = artifact_cache
+        self.ccache = ccache
+        self.nuitka_cache = nuitka_cache
+        self.history = history
+        self.governor = governor
+        self.warm_dirs = warm_dirs
+        # The prepared warm build directory (see WarmBuildDirs.prepare)
+        self.warm_build = None
+        self.cache_hit = False
+        self.artifacts = []
+        self.artifact_size = None
+        # Peak memory: the sampled total of the process tree, or where /proc
+        # is missing that of its largest process as reported by wait4()
+        self.peak_rss = None
+        self.cpu_seconds = None
+        self.monitor = None
+        self.build_id = None
+        self.process = None
+        self.stopped = False
+        self.batcher = None
+        self.tracker = None
+        self.started_at = None
+        self.elapsed = 0.0
+        self.compilation_report = None
+
+    def run(self):
+        """Run the command to completion and return its exit code
+
+        Raises OSError if the command cannot be started.
+        """
+        self.started_at = time.monotonic()
+        cache_key = None
+        if self.artifact_cache is not None:
+            cache_key = self._cache_lookup()
+            if self.cache_hit:
+                self.elapsed = time.monotonic() - self.started_at
+                self._finish(0)
+                return 0
+
+        if self.nuitka_cache is not None:
+            self._event("nuitka_cache", **self.nuitka_cache.evict())
+
+        if self.governor is not None:
+            self._plan_memory()
+
+        command = self.command
+        if self.warm_dirs is not None:
+            command = self._prepare_warm_dir()
+        outputs_before = build_outputs(self._work_dir(), self.command[-1])
+
+        ccache_before = None
+        if self.ccache is not None and "--disable-ccache" not in self.command:
+            ccache_before = self.ccache.stats(self.env)
+
+        # The report option stays out of the command recorded in the history
+        argv, report_path, report_owned = with_report(command)
+        try:
+            return self._run_build(argv, report_path, cache_key, outputs_before, ccache_before)
+        finally:
+            if self.warm_build is not None:
+                self.warm_dirs.finish(self.warm_build["directory"], False, None)
+                self.warm_build = None
+            if report_owned:
+                try:
+                    os.remove(report_path)
+                except OSError:
+                    pass
+
+    def _run_build(self, argv, report_path, cache_key, outputs_before, ccache_before):
+        """Run the Nuitka process of ``run`` and process its results"""
+        self.process = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            env=self.env,
+            cwd=self.cwd,
+        )
+        if self.stopped:
+            self.process.terminate()
+
+        if procfs_available():
+            self.monitor = ProcessTreeMonitor(self.process.pid)
+
+        # Read output in frame-budgeted batches, tracking real progress
+        self.batcher = LineBatcher(self.process.stdout)
+        self.tracker = ProgressTracker()
+        last_rate = None
+        c_sizes = None
+        for batch in self.batcher:
+            if self.stopped:
+                break
+            if self.monitor and self.monitor.due():
+                self._sample_resources()
+                if self.governor is not None:
+                    self._throttle()
+            if batch and self.on_lines:
+                self.on_lines(batch)
+            if self.batcher.lines_per_second != last_rate:
+                last_rate = self.batcher.lines_per_second
+                if self.on_rate:
+                    self.on_rate(last_rate)
+            changed = self.tracker.tick()
+            for line in batch:
+                changed = self.tracker.feed(line) or changed
+            if changed and self.on_progress:
+                self.on_progress(self.tracker.percent, self.tracker.phase, self.tracker.eta)
+            if c_sizes is None and self.tracker.phase in C_PHASES:
+                # All C code is written, and gone again with --remove-output
+                c_sizes = c_source_sizes(build_dir(argv, self.cwd))
+
+        if self.monitor:
+            # The tree just before the front-end exits, counted but not shown
+            self.peak_rss = self.monitor.sample()["peak_rss"]
+        if self.governor is not None:
+            self.governor.release()
+        return_code = self._wait()
+        if self.monitor and not self.stopped:
+            self._event(
+                "resource_summary", cpu_seconds=self.monitor.finish(self.cpu_seconds), peak_rss=self.peak_rss,
+                read_bytes=self.monitor.read_bytes, write_bytes=self.monitor.write_bytes,
+            )
+        moved_seconds = None
+        if return_code == 0:
+            # Artifacts are the outputs created or modified by this build
+            outputs = build_outputs(self._work_dir(), self.command[-1])
+            self.artifacts = [name for name, mtime in outputs.items() if outputs_before.get(name) != mtime]
+            if self.warm_build is not None and not self.stopped:
+                moved_seconds = time.monotonic()
+                try:
+                    self.warm_dirs.deliver(self.warm_build["directory"], self.artifacts, self._output_dir())
+                except OSError as e:
+                    # Without its artifacts in the output directory the build is of no use
+                    self._event("build_dir_skipped", reason=f"cannot move the artifacts: {e}")
+                    return_code = 1
+                moved_seconds = time.monotonic() - moved_seconds
+        if return_code == 0:
+            self.artifact_size = sum(tree_size(os.path.join(self._output_dir(), name)) for name in self.artifacts)
+        if return_code == 0 and cache_key and not self.stopped:
+            self._cache_store(cache_key)
+        if ccache_before is not None and not self.stopped:
+            self._report_ccache(ccache_before)
+        if not self.stopped:
+            if c_sizes is None:
+                c_sizes = c_source_sizes(build_dir(argv, self.cwd))
+            self._read_report(report_path, c_sizes)
+        self.elapsed = time.monotonic() - self.started_at
+        if self.warm_build is not None:
+            self._finish_warm_dir(return_code == 0 and not self.stopped, moved_seconds)
+        self._finish(return_code)
+        return return_code
+
+    def _finish(self, return_code):
+        """Report the phase summary and record the build in the history"""
+        if self.stopped:
+            return
+        phases = self.tracker.durations() if self.tracker else {}
+        compiler_rss = self.monitor.largest_rss["compilers"] if self.monitor else 0
+        if self.history is not None:
+            try:
+                self.build_id = self.history.record(
+                    self.command, return_code, self.elapsed, phases, self.artifact_size, self.cache_hit,
+                    peak_rss=self.peak_rss,
+                    compiler_rss=compiler_rss or None,
+                )
+            except sqlite3.Error as e:
+                self._event("history_skipped", reason=str(e))
+        self._event(
+            "build_summary", phases=phases, total=self.elapsed, artifact_size=self.artifact_size,
+            peak_rss=self.peak_rss, build_id=self.build_id,
+        )
+
+    def _wait(self):
+        """Wait for the build process and return its exit code
+
+        Where wait4() is available the CPU time of the whole build is kept in
+        ``cpu_seconds``. Without a process tree monitor ``peak_rss`` is set to
+        the peak resident set size of its largest process; that figure also
+        includes the launching process's memory at fork time, so sampled
+        values are preferred.
+        """
+        if not hasattr(os, "wait4"):
+            return self.process.wait()
+        try:
+            _, status, usage = os.wait4(self.process.pid, 0)
+        except ChildProcessError:
+            # Already reaped by a concurrent poll() from stop()
+            return self.process.wait()
+        # ru_maxrss is in kilobytes except on macOS
+        if self.peak_rss is None:
+            self.peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+        self.cpu_seconds = usage.ru_utime + usage.ru_stime
+        self.process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+        return self.process.returncode
+
+    def _plan_memory(self):
+        """Size ``--jobs`` to the available memory before launching"""
+        compiler_rss = None
+        if self.history is not None:
+            try:
+                compiler_rss = self.history.compiler_rss(os.path.abspath(self.command[-1]), uses_lto(self.command))
+            except sqlite3.Error:
+                pass
+        self.command, plan = self.governor.plan(self.command, compiler_rss)
+        if plan is not None:
+            self._event("memory_plan", **plan)
+
+    def _prepare_warm_dir(self):
+        """Prepare the warm build directory; return the argv building in it,
+        or the command itself where no directory can be used"""
+        try:
+            self.warm_build = self.warm_dirs.prepare(self.command, self._output_dir(), self.env)
+        except (BuildDirBusy, OSError) as e:
+            self._event("build_dir_skipped", reason=str(e))
+            return self.command
+        # Without ccache the directory saves no compile time
+        ccache = "--disable-ccache" not in self.command and find_ccache() is not None
+        self._event("build_dir", ccache=ccache, **self.warm_build)
+        return warm_command(self.command, self.warm_build["directory"])
+
+    def _finish_warm_dir(self, succeeded, moved_seconds):
+        """Record the build in its warm build directory and compare it with the last cold one"""
+        warm = self.warm_build["warm"]
+        stamp = self.warm_dirs.finish(self.warm_build["directory"], succeeded, self.elapsed)
+        self.warm_build = None
+        if succeeded:
+            self._event(
+                "build_dir_summary", warm=warm, seconds=self.elapsed,
+                cold_seconds=stamp["cold_seconds"] if stamp and warm else None, moved_seconds=moved_seconds,
+            )
+
+    def _read_report(self, path, c_sizes):
+        """Report the compile cost per module from Nuitka's compilation report"""
+        if not os.path.isfile(path) or not os.path.getsize(path):
+            self._event("report_skipped", reason="Nuitka wrote no compilation report")
+            return
+        try:
+            self.compilation_report = parse_report(path, c_sizes)
+        except (OSError, ReportError) as e:
+            self._event("report_skipped", reason=str(e))
+            return
+        self._event("compilation_report", report=self.compilation_report)
+
+    def _throttle(self):
+        action = self.governor.throttle(self.monitor)
+        if action:
+            event, available, paused = action
+            self._event(f"compilers_{event}", available=available, paused=paused)
+
+    def _sample_resources(self):
+        sample = self.monitor.sample()
+        self.peak_rss = sample["peak_rss"]
+        if self.on_resources:
+            self.on_resources(sample)
+
+    def _event(self, event, **info):
+        if self.on_event:
+            self.on_event(event, info)
+
+    def _output_dir(self):
+        output_dir = option_value(self.command, "--output-dir") or "."
+        return os.path.join(self.cwd or os.getcwd(), output_dir)
+
+    def _work_dir(self):
+        """The directory Nuitka writes the artifacts to"""
+        return self.warm_build["directory"] if self.warm_build is not None else self._output_dir()
+
+    def _report_ccache(self, before):
+        """Report what ccache saved during the build that just finished"""
+        after = self.ccache.stats(self.env)
+        if after is None:
+            return
+        compile_seconds = self.tracker.durations().get("c_compile", 0.0)
+        self._event("ccache_stats", **build_savings(before, after, compile_seconds, self.tracker.jobs))
+
+    def _cache_lookup(self):
+        """Restore cached artifacts if possible; return the key to store under, or None"""
+        started = time.monotonic()
+        try:
+            key = self.artifact_cache.key_for(self.command, env=self.env)
+            restored = self.artifact_cache.restore(key, self._output_dir())
+        except (CacheError, OSError) as e:
+            self._event("cache_skipped", reason=str(e))
+            return None
+        seconds = time.monotonic() - started
+        if restored is None:
+            self._event("cache_miss", key=key, seconds=seconds)
+            return key
+        artifacts, size = restored
+        self.cache_hit = True
+        self.artifacts = artifacts
+        self.artifact_size = size
+        self._event("cache_hit", key=key, artifacts=artifacts, size=size, seconds=seconds)
+        if self.on_progress:
+            self.on_progress(100, "done", 0.0)
+        return key
+
+    def _cache_store(self, key):
+        """Store the artifacts of the build that just finished"""
+        if not self.artifacts:
+            self._event("cache_skipped", reason="no artifacts found in the output directory")
+            return
+        try:
+            size, evicted = self.artifact_cache.store(key, self._output_dir(), self.artifacts)
+        except OSError as e:
+            self._event("cache_skipped", reason=str(e))
+            return
+        self._event("cache_stored", size=size, evicted=evicted)
+
+    def stop(self):
+        """Stop reading output and terminate the build process
+
+        Raises OSError if the process cannot be terminated.
+        """
+        self.stopped = True
+        if self.governor is not None:
+            # Paused compilers would never see the termination
+            self.governor.release()
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
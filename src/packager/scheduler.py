@@ -0,0 +1,143 @@
+"""Build queue with a CPU-core-aware scheduler.
+
+Nuitka's Python front-end is single threaded and only the C compilation uses
+``--jobs``, so several builds with a few C jobs each keep a machine busier than
+one build with all cores. The scheduler therefore runs as many builds as the
+core budget allows at ``min_jobs`` each and splits the budget evenly between
+them, never handing out more C jobs in total than the budget.
+"""
+import itertools
+import os
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+def with_jobs(command, jobs):
+    """Return a copy of ``command`` with its ``--jobs`` option set to ``jobs``"""
+    result = []
+    skip_next = False
+    for arg in command:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg.startswith("--jobs=") or (arg.startswith("-j") and arg[2:].isdigit()):
+            continue
+        if arg in ("--jobs", "-j"):
+            skip_next = True
+            continue
+        result.append(arg)
+    # Options go before the main file, which is always the last argument
+    result.insert(max(len(result) - 1, 0), f"--jobs={jobs}")
+    return result
+
+
+class BuildJob:
+    """One queued build: a command snapshot plus its live state"""
+
+    def __init__(self, job_id, name, command, env=None):
+        self.id = job_id
+        self.name = name
+        self.command = list(command)
+        # Environment variables of this build on top of the shared build environment
+        self.env = dict(env or {})
+        self.status = QUEUED
+        self.jobs = None
+        self.percent = 0
+        self.phase = ""
+        self.cancel_requested = False
+        # Id of the job in the build daemon, for builds run there
+        self.daemon_id = None
+
+    @property
+    def launch_command(self):
+        """The command with the allotted ``--jobs`` applied"""
+        return with_jobs(self.command, self.jobs) if self.jobs else list(self.command)
+
+
+class BuildScheduler:
+    """Hand out queued jobs under a global core budget"""
+
+    def __init__(self, core_budget=None, min_jobs=2, max_parallel=None):
+        self.core_budget = core_budget or os.cpu_count() or 1
+        self.min_jobs = min_jobs
+        self.max_parallel = max_parallel
+        self.jobs = []
+        self._ids = itertools.count(1)
+
+    def enqueue(self, name, command, env=None):
+        job = BuildJob(next(self._ids), name, command, env)
+        self.jobs.append(job)
+        return job
+
+    def get(self, job_id):
+        for job in self.jobs:
+            if job.id == job_id:
+                return job
+        return None
+
+    @property
+    def queued(self):
+        return [job for job in self.jobs if job.status == QUEUED]
+
+    @property
+    def running(self):
+        return [job for job in self.jobs if job.status == RUNNING]
+
+    def free_cores(self):
+        return self.core_budget - sum(job.jobs for job in self.running)
+
+    def next_launches(self):
+        """Mark as many queued jobs running as the budget allows and return them
+
+        Each returned job has ``jobs`` set to its share of the core budget.
+        """
+        launches = []
+        waiting = self.queued
+        while waiting:
+            running = len(self.running)
+            slots = min(running + len(waiting), max(1, self.core_budget // self.min_jobs))
+            if self.max_parallel:
+                slots = min(slots, self.max_parallel)
+            if running >= slots:
+                break
+            # Spread the remainder of an uneven split over the first launches
+            share = self.core_budget // slots + (1 if running < self.core_budget % slots else 0)
+            share = min(max(1, share), self.free_cores())
+            if share < 1 or (running and share < self.min_jobs):
+                break
+            job = waiting.pop(0)
+            job.jobs = share
+            job.status = RUNNING
+            launches.append(job)
+        return launches
+
+    def adopt(self, job, jobs):
+        """Mark a queued job as already running elsewhere (e.g. in the build daemon) with ``jobs`` C jobs"""
+        job.jobs = jobs
+        job.status = RUNNING
+
+    def finish(self, job, success):
+        if job.status != RUNNING:
+            return
+        if job.cancel_requested:
+            job.status = CANCELLED
+        else:
+            job.status = SUCCEEDED if success else FAILED
+
+    def cancel(self, job):
+        """Cancel a queued job, or flag a running one to be marked cancelled when it ends"""
+        if job.status == QUEUED:
+            job.status = CANCELLED
+        elif job.status == RUNNING:
+            job.cancel_requested = True
+
+    def remove_finished(self):
+        removed = [job for job in self.jobs if job.status in FINISHED_STATES]
+        self.jobs = [job for job in self.jobs if job.status not in FINISHED_STATES]
+        return removed
@@ -0,0 +1,321 @@
+"""Find the C compilers and linkers a build can use, cached.
+
+Which compiler Nuitka runs changes the compile time and the speed of the
+program, so the toolchain is a build setting: a compiler is selected with
+``CC`` (plus ``--clang``, ``--msvc`` or ``--mingw64`` where Nuitka needs to
+be told), an alternative linker with ``-fuse-ld=`` in ``LDFLAGS``, which
+Nuitka passes on to the link step. Both stay out of the profile's argv
+except for those flags, see ``compiler_options`` and ``toolchain_variables``.
+
+The probe lists the PATH directories for compilers (gcc, clang, cc and
+their versioned names, cl and clang-cl on Windows) and GNU-style linkers
+(ld.bfd, ld.gold, ld.lld, ld.mold), asks each for its version side by side
+and reports ccache with its compiler wrapper directories. Installing or
+removing a compiler changes the modification time of its directory, so the
+result is kept in the state directory with those times and reused until
+one of them, or PATH itself, changes.
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from packager.benchmark import DEFAULT_RUNS, DEFAULT_TIMEOUT
+from packager.ccache import find_ccache
+from packager.paths import state_dir
+from packager.variants import measure_build
+
+PROBE_TIMEOUT = 30
+
+# Compiler families, as reported by the probe
+FAMILIES = ("gcc", "clang", "msvc")
+
+# Linkers ``-fuse-ld=`` selects, by the name of their ld.<name> binary
+LINKERS = ("bfd", "gold", "lld", "mold")
+
+_COMPILER_NAMES = re.compile(r"^(gcc|clang|cc|cl|clang-cl)(-\d+(\.\d+)*)?(\.exe)?$", re.IGNORECASE)
+_LINKER_NAMES = re.compile(r"^ld\.(bfd|gold|lld|mold)(\.exe)?$", re.IGNORECASE)
+_VERSION = re.compile(r"\d+\.\d+(\.\d+)*")
+
+# Directories of compiler names that run ccache, for putting first on PATH
+_CCACHE_WRAPPERS = (
+    "/usr/lib/ccache",
+    "/usr/lib64/ccache",
+    "/usr/lib/ccache/bin",
+    "/usr/local/opt/ccache/libexec",
+    "/opt/homebrew/opt/ccache/libexec",
+)
+
+# Bumped whenever the probe reports something new
+_CACHE_FORMAT = 1
+
+
+def compiler_family(compiler):
+    """Family of a compiler path by its name: "clang", "msvc" or "gcc" """
+    name = os.path.splitext(os.path.basename(compiler))[0].lower()
+    if "clang" in name:
+        return "clang"
+    if name == "cl":
+        return "msvc"
+    return "gcc"
+
+
+def compiler_options(compiler):
+    """Nuitka options selecting ``compiler`` ("" for Nuitka's choice)"""
+    if not compiler:
+        return []
+    family = compiler_family(compiler)
+    if family == "clang":
+        return ["--clang"]
+    if family == "msvc":
+        return ["--msvc=latest"]
+    return ["--mingw64"] if sys.platform.startswith("win") else []
+
+
+def toolchain_variables(config):
+    """Environment variables selecting the compiler and linker of ``config``
+
+    MSVC is found by Nuitka itself and gets no ``CC``. The linker is added
+    to the ``LDFLAGS`` of the packager's own environment.
+    """
+    variables = {}
+    compiler = config.get("compiler")
+    if compiler and compiler_family(compiler) != "msvc":
+        variables["CC"] = compiler
+    linker = config.get("linker")
+    if linker:
+        variables["LDFLAGS"] = " ".join(filter(None, [os.environ.get("LDFLAGS", ""), f"-fuse-ld={linker}"]))
+    return variables
+
+
+def selected_linker(env=None):
+    """Linker named by ``-fuse-ld=`` in the ``LDFLAGS`` of ``env``, or None"""
+    env = os.environ if env is None else env
+    found = re.findall(r"-fuse-ld=(\S+)", env.get("LDFLAGS", ""))
+    return found[-1] if found else None
+
+
+def _version(argv):
+    """(first line, version) of what a tool prints about itself, or None"""
+    try:
+        result = subprocess.run(
+            argv, capture_output=True, text=True, timeout=PROBE_TIMEOUT,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    # cl prints its banner to stderr and exits with 2 without a source file
+    lines = (result.stdout + result.stderr).strip().splitlines()
+    if not lines:
+        return None
+    banner = lines[0].strip()
+    match = re.search(r"version (\d+\.\d+(\.\d+)*)", banner, re.IGNORECASE)
+    if match:
+        return banner, match.group(1)
+    versions = [match.group(0) for match in _VERSION.finditer(banner)]
+    return banner, versions[-1] if versions else None
+
+
+def _probe_compiler(name, path):
+    found = _version([path] if compiler_family(path) == "msvc" else [path, "--version"])
+    if found is None:
+        return None
+    banner, version = found
+    lowered = banner.lower()
+    if "clang" in lowered:
+        family = "clang"
+    elif "microsoft" in lowered:
+        family = "msvc"
+    else:
+        family = "gcc"
+    return {"name": name, "path": path, "family": family, "version": version, "banner": banner}
+
+
+def _probe_linker(name, path):
+    found = _version([path, "--version"])
+    if found is None:
+        return None
+    banner, version = found
+    return {"name": name, "path": path, "version": version, "banner": banner}
+
+
+def _is_ccache(path):
+    return os.path.basename(os.path.realpath(path)).lower().startswith("ccache")
+
+
+def _path_dirs():
+    dirs = []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if directory and directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def _candidates():
+    """(compilers, linkers, wrapper dirs on PATH) found in the PATH directories
+
+    Compilers and linkers are (name, path) pairs; of several names of one
+    binary (cc, gcc and gcc-12) the first is kept, plain family names first.
+    """
+    compilers, linkers, wrappers = [], [], []
+    seen = set()
+    for directory in _path_dirs():
+        try:
+            names = sorted(os.listdir(directory), key=lambda name: (name.lower().startswith("cc"), name))
+        except OSError:
+            continue
+        for name in names:
+            path = os.path.join(directory, name)
+            compiler = _COMPILER_NAMES.match(name)
+            linker = _LINKER_NAMES.match(name)
+            if not (compiler or linker) or not os.path.isfile(path) or not os.access(path, os.X_OK):
+                continue
+            if _is_ccache(path):
+                if directory not in wrappers:
+                    wrappers.append(directory)
+                continue
+            key = os.path.normcase(os.path.realpath(path))
+            if key in seen:
+                continue
+            seen.add(key)
+            if compiler:
+                compilers.append((os.path.splitext(name)[0], path))
+            else:
+                linkers.append((linker.group(1).lower(), path))
+    return compilers, linkers, wrappers
+
+
+def _unique_names(entries):
+    """Tell apart compilers of one name from different directories"""
+    names = set()
+    for entry in entries:
+        name = entry["name"]
+        number = 2
+        while name in names:
+            name = f"{entry['name']}-{number}"
+            number += 1
+        entry["name"] = name
+        names.add(name)
+    return entries
+
+
+def probe_toolchain(max_workers=8):
+    """Find the compilers, linkers and ccache of this machine, uncached
+
+    Returns a dict with compilers (dicts with name, path, family, version
+    and banner, in PATH order), linkers (dicts with name as accepted by
+    ``-fuse-ld=``, path, version and banner), default_linker (what ``ld``
+    is, or None) and ccache (None, or a dict with path, version, wrappers:
+    the wrapper directories installed, and on_path: those on PATH).
+    """
+    compilers, linkers, wrappers_on_path = _candidates()
+    ccache = find_ccache()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        compiler_futures = [pool.submit(_probe_compiler, name, path) for name, path in compilers]
+        linker_futures = [pool.submit(_probe_linker, name, path) for name, path in linkers]
+        ccache_future = pool.submit(_version, [ccache, "--version"]) if ccache else None
+        found_compilers = [future.result() for future in compiler_futures]
+        found_linkers = [future.result() for future in linker_futures]
+        ccache_version = ccache_future.result() if ccache_future else None
+
+    ld = shutil.which("ld")
+    default_linker = None
+    if ld:
+        # ld is often a link to a target-prefixed x86_64-linux-gnu-ld.bfd
+        match = re.search(r"ld\.(bfd|gold|lld|mold)(\.exe)?$", os.path.realpath(ld), re.IGNORECASE)
+        default_linker = match.group(1).lower() if match else "ld"
+    return {
+        "compilers": _unique_names([entry for entry in found_compilers if entry]),
+        "linkers": [entry for entry in found_linkers if entry],
+        "default_linker": default_linker,
+        "ccache": None if not ccache else {
+            "path": ccache,
+            "version": ccache_version[1] if ccache_version else None,
+            "wrappers": [directory for directory in _CCACHE_WRAPPERS if os.path.isdir(directory)],
+            "on_path": wrappers_on_path,
+        },
+    }
+
+
+def _stamp():
+    """PATH and the modification times of its directories"""
+    dirs = {}
+    for directory in _path_dirs() + list(_CCACHE_WRAPPERS):
+        try:
+            dirs[directory] = os.stat(directory).st_mtime_ns
+        except OSError:
+            dirs[directory] = None
+    return {"path": os.environ.get("PATH", ""), "dirs": dirs}
+
+
+def _cache_path():
+    return os.path.join(state_dir(), "toolchain.json")
+
+
+def load_toolchain():
+    """The last probe result if PATH and its directories are unchanged, else
+    None, without starting any process (see ``detect_toolchain``)"""
+    try:
+        with open(_cache_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("format") != _CACHE_FORMAT or data.get("stamp") != _stamp():
+        return None
+    return data["toolchain"]
+
+
+def detect_toolchain(refresh=False):
+    """The toolchain of this machine (see ``probe_toolchain``), probed only
+    when PATH or one of its directories changed, or with ``refresh``"""
+    toolchain = None if refresh else load_toolchain()
+    if toolchain is not None:
+        return toolchain
+    stamp = _stamp()
+    toolchain = probe_toolchain()
+    tmp_path = f"{_cache_path()}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": _CACHE_FORMAT, "stamp": stamp, "toolchain": toolchain}, f)
+        os.replace(tmp_path, _cache_path())
+    except OSError:
+        # Only costs a probe next time
+        pass
+    return toolchain
+
+
+def compiler_configs(config, compilers):
+    """Return {compiler name: config} building with each of ``compilers``
+
+    ``compilers`` are entries of ``probe_toolchain``. Each compiler builds
+    into its own sub-directory of the configured output directory (or of
+    the main file's directory), so the builds can run at the same time.
+    """
+    base = config["output_dir"] or os.path.dirname(os.path.abspath(config["main_file"]))
+    return {
+        compiler["name"]: dict(
+            config, compiler=compiler["path"], output_dir=os.path.join(base, "compilers", compiler["name"]),
+        )
+        for compiler in compilers
+    }
+
+
+def compare_compilers(commands, runs=DEFAULT_RUNS, arguments=(), ready_marker=None, timeout=DEFAULT_TIMEOUT,
+                      stop=None, history=None):
+    """Measure the programs built by ``commands`` ({compiler name: Nuitka argv})
+
+    Returns {compiler name: dict} as returned by ``measure_build`` plus
+    compile_seconds, the duration of the last build of the argv recorded in
+    ``history`` (None without one, or when it came from the artifact cache).
+    """
+    results = {}
+    for name, command in commands.items():
+        if stop is not None and stop.is_set():
+            break
+        measured = measure_build(command, runs, arguments, ready_marker, timeout, stop)
+        measured["compile_seconds"] = history.last_duration(command) if history is not None else None
+        results[name] = measured
+    return results
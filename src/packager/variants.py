@@ -0,0 +1,131 @@
+"""Compare the onefile and standalone builds of one configuration.
+
+Onefile programs unpack their payload into a temporary directory on every
+launch (unless ``--onefile-tempdir-spec`` points at a cached location),
+which standalone folders never pay for. The comparison builds both variants
+of the same configuration into sibling output directories and measures for
+each: the size on disk, the first launch (page cache dropped, see
+``packager.benchmark``), repeated launches and, for onefile, how much the
+extraction writes to the temporary directory.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from packager.benchmark import DEFAULT_RUNS, DEFAULT_TIMEOUT, cold_cache_supported, startup_benchmark
+from packager.paths import tree_size
+
+# In reporting order
+VARIANTS = ("standalone", "onefile")
+
+# Sampling interval of the extraction directory
+EXTRACTION_INTERVAL = 0.01
+
+
+def variant_configs(config):
+    """Return {variant: config} building both variants side by side
+
+    Each variant builds into its own sub-directory of the configured output
+    directory (or of the main file's directory), so the two builds can run
+    at the same time.
+    """
+    base = config["output_dir"] or os.path.dirname(os.path.abspath(config["main_file"]))
+    return {
+        variant: dict(
+            config, standalone=True, onefile=variant == "onefile",
+            output_dir=os.path.join(base, "comparison", variant),
+        )
+        for variant in VARIANTS
+    }
+
+
+def _kill_when_ready(process, ready_marker):
+    marker = ready_marker.encode()
+    for line in process.stdout:
+        if marker in line:
+            process.kill()
+            break
+    process.stdout.close()
+
+
+def extraction_usage(argv, cwd=None, ready_marker=None, timeout=DEFAULT_TIMEOUT, interval=EXTRACTION_INTERVAL):
+    """Launch a onefile program with a private temporary directory
+
+    The program runs until it exits or, with a ``ready_marker``, prints it.
+    Returns (peak bytes, bytes left behind) of the directory, sampled every
+    ``interval`` seconds while the program runs; the peak of programs that
+    exit within one interval may be missed. Extraction only lands there when
+    the tempdir spec starts with ``{TEMP}``, Nuitka's default.
+    """
+    root = tempfile.mkdtemp(prefix="onefile-extraction-")
+    env = dict(os.environ, TMPDIR=root, TEMP=root, TMP=root)
+    try:
+        process = subprocess.Popen(
+            argv, cwd=cwd, env=env,
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE if ready_marker else subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        if ready_marker:
+            threading.Thread(target=_kill_when_ready, args=(process, ready_marker), daemon=True).start()
+        deadline = time.monotonic() + timeout
+        peak = 0
+        while process.poll() is None:
+            peak = max(peak, tree_size(root))
+            if time.monotonic() > deadline:
+                process.kill()
+                process.wait()
+                break
+            time.sleep(interval)
+        left = tree_size(root)
+        return max(peak, left), left
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def measure_build(command, runs=DEFAULT_RUNS, arguments=(), ready_marker=None, timeout=DEFAULT_TIMEOUT, stop=None):
+    """Measure the program built by a Nuitka argv
+
+    Returns a dict with executable, size (the program, or the whole dist
+    folder), first_launch and repeat_launch (results of
+    ``startup_benchmark`` with cold and warm caches; first_launch is None
+    where the page cache cannot be dropped), extraction and extraction_left
+    (bytes, None unless onefile). Raises FileNotFoundError if the program
+    has not been built.
+    """
+    caches = ("warm", "cold") if cold_cache_supported() else ("warm",)
+    benchmark = startup_benchmark(
+        command, runs, caches, compare_python=False, arguments=arguments, ready_marker=ready_marker,
+        timeout=timeout, stop=stop,
+    )
+    executable = benchmark["executable"]
+    results = {result["cache"]: result for result in benchmark["results"]}
+    folder = os.path.dirname(executable)
+    measured = {
+        "executable": executable,
+        "size": tree_size(folder if folder.endswith(".dist") else executable),
+        "first_launch": results.get("cold"),
+        "repeat_launch": results.get("warm"),
+        "extraction": None,
+        "extraction_left": None,
+    }
+    if "--onefile" in command and not (stop is not None and stop.is_set()):
+        cwd = os.path.dirname(os.path.abspath(command[-1]))
+        measured["extraction"], measured["extraction_left"] = extraction_usage(
+            [executable] + list(arguments), cwd, ready_marker, timeout,
+        )
+    return measured
+
+
+def compare_variants(commands, runs=DEFAULT_RUNS, arguments=(), ready_marker=None, timeout=DEFAULT_TIMEOUT,
+                     stop=None):
+    """Measure the built variants of ``commands`` ({variant: Nuitka argv})
+
+    Returns {variant: dict} as returned by ``measure_build``.
+    """
+    return {
+        variant: measure_build(commands[variant], runs, arguments, ready_marker, timeout, stop)
+        for variant in VARIANTS
+    }
@@ -0,0 +1,252 @@
+"""Build directories kept between the builds of a profile.
+
+Nuitka generates its C code and object files in ``<output dir>/<name>.build``
+and, before each build, deletes what an earlier one left there, so the
+directory itself saves no work: a rebuild of unchanged code is only fast
+when ccache returns the objects, and without ccache a warm rebuild takes
+about as long as a cold one. ccache only finds an object again when it is
+compiled from the same path, though: a build directory that moves between
+builds, or that several configurations sharing an output directory take
+turns wiping, compiles everything again.
+
+A warm build directory gives every profile and output directory a fixed
+directory of its own below the packager's state directory, passed to Nuitka
+as ``--output-dir`` without ``--remove-output``. Finished artifacts are
+moved to the configured output directory. A stamp file records the argv,
+interpreter and toolchain of the last build and whether it completed; when
+one of them changed, or the last build was interrupted or failed, the
+directory is emptied first so nothing from it can leak into the new build.
+"""
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+
+from packager.artifact_cache import build_arguments, toolchain_environment
+from packager.interpreter import InterpreterError, detect_interpreter
+from packager.paths import normalize_path, state_dir, tree_size
+
+STAMP_NAME = "warm-build.json"
+
+# Why a build starts from an empty directory, as reported by ``prepare``
+COLD_REASONS = ("new", "clean", "arguments", "interpreter", "toolchain", "incomplete")
+
+# Bumped whenever the stamp records something new
+_STAMP_FORMAT = 1
+
+# Directories of builds running in this process
+_active = set()
+_active_lock = threading.Lock()
+
+
+class BuildDirBusy(Exception):
+    """Raised when another build is using a warm build directory"""
+
+
+def _interpreter(python_path):
+    """What identifies the interpreter of a build: its path, environment and versions"""
+    try:
+        info = detect_interpreter(python_path)
+    except InterpreterError:
+        info = {}
+    return {
+        "executable": os.path.abspath(shutil.which(python_path) or python_path),
+        "prefix": info.get("prefix"),
+        "version": info.get("version"),
+        "nuitka": info.get("nuitka"),
+    }
+
+
+def _running(pid):
+    """Whether another process with ``pid`` runs (not checked on Windows,
+    where signalling it would end it)"""
+    if not pid or pid == os.getpid() or sys.platform.startswith("win"):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _read_stamp(directory):
+    try:
+        with open(os.path.join(directory, STAMP_NAME), encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return stamp if stamp.get("format") == _STAMP_FORMAT else None
+
+
+def _write_stamp(directory, stamp):
+    path = os.path.join(directory, STAMP_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(stamp, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _empty(directory):
+    """Remove everything inside ``directory``"""
+    for entry in os.scandir(directory):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+
+
+def warm_command(command, directory):
+    """The argv building ``command`` in ``directory`` and keeping it"""
+    argv = [arg for arg in command if not arg.startswith("--output-dir=") and arg != "--remove-output"]
+    argv.insert(-1, f"--output-dir={directory}")
+    return argv
+
+
+class WarmBuildDirs:
+    """The warm build directories of one profile, one per output directory
+
+    With ``clean`` every build starts from an empty directory, as after a
+    change of its arguments.
+    """
+
+    def __init__(self, root, clean=False):
+        self.root = root
+        self.clean = clean
+
+    @classmethod
+    def for_profile(cls, profile, clean=False):
+        """The warm build directories of a profile (see ``command.profile_name``)"""
+        return cls(state_dir("build-dirs", profile), clean)
+
+    def directory(self, output_dir):
+        """The build directory of builds into ``output_dir``"""
+        digest = hashlib.sha256(normalize_path(output_dir).encode()).hexdigest()
+        return os.path.join(self.root, digest[:12])
+
+    def prepare(self, command, output_dir, env=None):
+        """Make the build directory of ``output_dir`` ready to build ``command``
+        with ``env``
+
+        Returns a dict with directory, warm, reason (None when warm, else one
+        of COLD_REASONS) and cold_seconds (the duration of the last build
+        that started cold, or None). Raises BuildDirBusy when another build
+        is using the directory, and OSError. Every prepared directory must
+        be handed to ``finish``.
+        """
+        directory = self.directory(output_dir)
+        with _active_lock:
+            if directory in _active:
+                raise BuildDirBusy(f"another build of this process is using {directory}")
+            stamp = _read_stamp(directory)
+            if stamp and stamp["state"] == "building" and _running(stamp["pid"]):
+                raise BuildDirBusy(f"the build in process {stamp['pid']} is using {directory}")
+            _active.add(directory)
+        try:
+            identity = {
+                "arguments": build_arguments(command),
+                "interpreter": _interpreter(command[0]),
+                "toolchain": toolchain_environment(env),
+            }
+            if stamp is None:
+                reason = "new"
+            elif self.clean:
+                reason = "clean"
+            elif stamp["state"] != "complete":
+                reason = "incomplete"
+            else:
+                reason = next((name for name, value in identity.items() if stamp[name] != value), None)
+            os.makedirs(directory, exist_ok=True)
+            if reason is not None:
+                _empty(directory)
+            cold_seconds = stamp["cold_seconds"] if stamp and reason is None else None
+            _write_stamp(directory, dict(
+                identity, format=_STAMP_FORMAT, output_dir=os.path.abspath(output_dir), state="building",
+                pid=os.getpid(), cold=reason is not None, cold_seconds=cold_seconds, seconds=None,
+            ))
+        except BaseException:
+            self._release(directory)
+            raise
+        return {"directory": directory, "warm": reason is None, "reason": reason, "cold_seconds": cold_seconds}
+
+    def finish(self, directory, succeeded, seconds):
+        """Record the end of a build in a directory from ``prepare``
+
+        A build that did not succeed leaves the directory to be emptied by
+        the next one. Returns the updated stamp, or None if it is unreadable.
+        """
+        try:
+            stamp = _read_stamp(directory)
+            if stamp is None:
+                return None
+            stamp.update(state="complete" if succeeded else "failed", pid=None, seconds=seconds)
+            if succeeded and stamp["cold"]:
+                stamp["cold_seconds"] = seconds
+            try:
+                _write_stamp(directory, stamp)
+            except OSError:
+                return None
+            return stamp
+        finally:
+            self._release(directory)
+
+    @staticmethod
+    def _release(directory):
+        with _active_lock:
+            _active.discard(directory)
+
+    @staticmethod
+    def deliver(directory, names, output_dir):
+        """Move the named artifacts of a build directory into ``output_dir``,
+        replacing what is there. Raises OSError."""
+        os.makedirs(output_dir, exist_ok=True)
+        for name in names:
+            target = os.path.join(output_dir, name)
+            if os.path.isdir(target) and not os.path.islink(target):
+                shutil.rmtree(target)
+            elif os.path.lexists(target):
+                os.remove(target)
+            # A rename on one file system, a copy across them
+            shutil.move(os.path.join(directory, name), target)
+
+    def directories(self):
+        """Return a dict per build directory with directory, output_dir,
+        size, state, cold_seconds and seconds (of the last build)"""
+        try:
+            entries = sorted(entry.path for entry in os.scandir(self.root) if entry.is_dir())
+        except OSError:
+            return []
+        directories = []
+        for directory in entries:
+            stamp = _read_stamp(directory) or {}
+            directories.append({
+                "directory": directory,
+                "output_dir": stamp.get("output_dir"),
+                "size": tree_size(directory),
+                "state": stamp.get("state"),
+                "cold_seconds": stamp.get("cold_seconds"),
+                "seconds": stamp.get("seconds"),
+            })
+        return directories
+
+    def clear(self):
+        """Delete the build directories not in use; return the bytes freed"""
+        freed = 0
+        for entry in self.directories():
+            directory = entry["directory"]
+            with _active_lock:
+                stamp = _read_stamp(directory)
+                if directory in _active or (stamp and stamp["state"] == "building" and _running(stamp["pid"])):
+                    continue
+                _active.add(directory)
+            try:
+                shutil.rmtree(directory)
+                freed += entry["size"]
+            except OSError:
+                pass
+            finally:
+                self._release(directory)
+        return freed
@@ -0,0 +1,204 @@
+"""Watch a project's sources and report changes once edits have settled.
+
+Linux uses inotify (through ctypes, no extra dependency); other platforms
+poll file stats. Build outputs written next to the sources are ignored so a
+finished build does not trigger the next one.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from packager.paths import normalize_path, skip_source_dir, source_files
+
+DEFAULT_DEBOUNCE = 1.0
+POLL_INTERVAL = 1.0
+# How often the watcher thread checks for stop requests and settled changes
+WAKE_INTERVAL = 0.2
+
+# Temporary files written by editors while saving
+_EDITOR_SUFFIXES = ("~", ".swp", ".swx", ".tmp", ".pyc", ".pyo")
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal inotify wrapper mapping events back to paths"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches = {}
+
+    def add(self, path):
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = path
+
+    def read(self, timeout):
+        """Return [(path, mask)] for events arriving within ``timeout`` seconds"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is not None or mask & IN_Q_OVERFLOW:
+                path = os.path.join(directory, os.fsdecode(name)) if directory and name else directory
+                events.append((path, mask))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+def inotify_available():
+    return sys.platform.startswith("linux") and ctypes.util.find_library("c") is not None
+
+
+class SourceWatcher:
+    """Call ``on_change(paths)`` once edits to a project have settled
+
+    Watches the directory of ``main_file`` and the given data directories.
+    Changes are collected until no new one arrives for ``debounce`` seconds,
+    then reported together. The callback runs on the watcher thread.
+    """
+
+    def __init__(self, main_file, on_change, data_dirs=(), output_dir=None, debounce=DEFAULT_DEBOUNCE):
+        self.main_file = os.path.abspath(main_file)
+        self.stem = os.path.splitext(os.path.basename(self.main_file))[0]
+        self.roots = [os.path.dirname(self.main_file)]
+        for path in data_dirs:
+            path = os.path.abspath(path)
+            if os.path.isdir(path) and not any(path == root or path.startswith(root + os.sep) for root in self.roots):
+                self.roots.append(path)
+        self.output_dir = os.path.abspath(output_dir) if output_dir else None
+        # An output directory inside the project is not part of its sources
+        self.exclude = []
+        if self.output_dir and self.output_dir not in self.roots:
+            self.exclude.append(self.output_dir)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.backend = "inotify" if inotify_available() else "polling"
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="source-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(2)
+
+    def ignored(self, path):
+        """Whether a changed path is not a source edit"""
+        name = os.path.basename(path)
+        if name.endswith(_EDITOR_SUFFIXES) or name.startswith(".#"):
+            return True
+        if self.output_dir is None or path == self.main_file:
+            return False
+        if any(path == excluded or path.startswith(excluded + os.sep) for excluded in self.exclude):
+            return True
+        # Artifacts written next to the sources (app.bin, app.exe, app.dist, ...)
+        return os.path.dirname(path) == self.output_dir and (name == self.stem or name.startswith(self.stem + "."))
+
+    def _run(self):
+        events = self._inotify_events() if self.backend == "inotify" else self._polling_events()
+        pending = set()
+        deadline = 0.0
+        for changed in events:
+            changed = [path for path in changed if not self.ignored(path)]
+            if changed:
+                pending.update(changed)
+                deadline = time.monotonic() + self.debounce
+            elif pending and time.monotonic() >= deadline:
+                self.on_change(sorted(pending))
+                pending = set()
+
+    def _inotify_events(self):
+        """Yield lists of changed paths (possibly empty) until stopped"""
+        inotify = _Inotify()
+        exclude = {normalize_path(path) for path in self.exclude}
+        try:
+            for root in self.roots:
+                self._watch_tree(inotify, root, exclude)
+            while not self._stop.is_set():
+                changed = []
+                for path, mask in inotify.read(WAKE_INTERVAL):
+                    if mask & IN_Q_OVERFLOW:
+                        changed.append(self.main_file)
+                    elif mask & IN_ISDIR:
+                        if skip_source_dir(path, exclude):
+                            continue
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            self._watch_tree(inotify, path, exclude)
+                        changed.append(path)
+                    else:
+                        changed.append(path)
+                yield changed
+        finally:
+            inotify.close()
+
+    @staticmethod
+    def _watch_tree(inotify, root, exclude):
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not skip_source_dir(os.path.join(dirpath, name), exclude)]
+            inotify.add(dirpath)
+
+    def _polling_events(self):
+        """Yield lists of changed paths by comparing file stats"""
+        snapshot = self._snapshot()
+        last_poll = time.monotonic()
+        while not self._stop.wait(WAKE_INTERVAL):
+            if time.monotonic() - last_poll < POLL_INTERVAL:
+                yield []
+                continue
+            last_poll = time.monotonic()
+            current = self._snapshot()
+            yield [path for path in current.keys() | snapshot.keys() if current.get(path) != snapshot.get(path)]
+            snapshot = current
+
+    def _snapshot(self):
+        stats = {}
+        for root in self.roots:
+            for path in source_files(root, self.exclude):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats